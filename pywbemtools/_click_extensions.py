@@ -2,13 +2,22 @@
 This file contains extensions to Click for pywbemtools.
 """
 
+import sys
+import importlib
+import threading
+
 import click
+import click.shell_completion
 
 # Definitions of the components of the help usage line
 GENERAL_OPTS_TXT = '[GENERAL-OPTIONS]'
 CMD_OPTS_TXT = '[COMMAND-OPTIONS]'
 SUBCMD_HELP_TXT = "COMMAND [ARGS] " + CMD_OPTS_TXT
 
+# Key of the command line arguments in the click context meta dictionary
+# (see PywbemtoolsTopGroup).
+ARGS_META_KEY = 'pywbemtools.args'
+
 
 class PywbemtoolsGroup(click.Group):
     """
@@ -59,13 +68,23 @@ class PywbemtoolsTopGroup(click.Group):
         of the top level cannot be tied to order commands are inserted in list,
         we elected to just move the generic ones to the end of the list.
 
+    2.  Resolve the commands and command groups defined in the __init__
+        argument lazy_commands by importing the module that defines them only
+        when they are needed. The module adds the command to this group when
+        it is imported (e.g. with the @cli.group() decorator).
+
+    3.  Save the command line arguments in the meta dictionary of the click
+        context as item ARGS_META_KEY, e.g. for passing the command on to
+        another process.
+
     This class is used by specifying it for the 'cls' argument on the top
     level group, for example:
 
         @click.group(cls=PywbemtoolsTopGroup, ...)
     """
 
-    def __init__(self, name=None, commands=None, move_to_end=None, **attrs):
+    def __init__(self, name=None, commands=None, move_to_end=None,
+                 lazy_commands=None, **attrs):
         """
         Use OrderedDict to keep order commands inserted into command dict.
         Only required for Python versions that do not order dictionaries.
@@ -77,8 +96,20 @@ class PywbemtoolsTopGroup(click.Group):
           move_to_end (list): List of to level command/group names that will be
             moved to the end of the list after sorting it, or `None` for not
             moving any.
+
+          lazy_commands (dict): Dictionary with the names of the module that
+            defines each top level command/group by command name, or `None`
+            if all commands are added to the group by the caller.
         """
         self.move_to_end = move_to_end or []
+        self.lazy_commands = lazy_commands or {}
+        # Names of the lazy commands whose module has been imported. A
+        # command that has been removed from the group afterwards (e.g. the
+        # repl command in interactive mode) is not loaded again.
+        self._loaded_commands = set()
+        # Serializes the loading of lazy commands for commands that are
+        # executed concurrently (e.g. in batch mode).
+        self._load_lock = threading.RLock()
         super().__init__(name, commands, **attrs)
 
         # Replace Click.Command.format_options with local version
@@ -94,7 +125,13 @@ class PywbemtoolsTopGroup(click.Group):
         class override for click.Group ONLY with the top group.
         """
         # Sort because their is no particular order for the groups
-        cmd_list = sorted(self.commands.keys())
+        cmd_names = set(self.commands)
+        # Lazy commands whose module has been imported are in self.commands
+        # unless they have been removed.
+        cmd_names.update(name for name, module in self.lazy_commands.items()
+                         if name not in self._loaded_commands and
+                         module not in sys.modules)
+        cmd_list = sorted(cmd_names)
         # Reorder commands list so the move_to_end list commands are at bottom
         #  of list. This displays them at the bottom of the list of commands in
         # help output the order of the move_to_end list.
@@ -108,6 +145,28 @@ class PywbemtoolsTopGroup(click.Group):
 
         return cmd_list
 
+    def get_command(self, ctx, cmd_name):
+        """
+        Return the command or command group named cmd_name, importing the
+        module that defines it if it is a lazy command that has not been
+        loaded yet.
+        """
+        with self._load_lock:
+            if cmd_name not in self.commands and \
+                    cmd_name in self.lazy_commands and \
+                    cmd_name not in self._loaded_commands:
+                self._loaded_commands.add(cmd_name)
+                importlib.import_module(self.lazy_commands[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
+    def parse_args(self, ctx, args):
+        """
+        Save the command line arguments in the click context before parsing
+        them.
+        """
+        ctx.meta[ARGS_META_KEY] = list(args)
+        return super().parse_args(ctx, args)
+
     def __call__(self, *args, **kwargs):
         """
         This method is called once for each execution of the pywbemtools
@@ -22,11 +22,27 @@ are common across pywbemtools commands.
 
 import click
 
+from ._startup_profile import profile_startup_callback
+
 
 help_option = [  # pylint: disable=invalid-name
     click.help_option('-h', '--help', help='Show this help message.'),
 ]
 
+# The --profile-startup general option is hidden because it is used only for
+# analyzing the performance of the commands (see tools/startup_benchmark.py).
+# It is eager so that the profile also covers the import of the command
+# modules that are loaded when the command is resolved.
+profile_startup_option = [  # pylint: disable=invalid-name
+    click.option('--profile-startup', metavar='FILE',
+                 type=click.Path(dir_okay=False),
+                 default=None, hidden=True, is_eager=True, expose_value=False,
+                 callback=profile_startup_callback,
+                 help='Record the startup profile of the command (the time '
+                      'of the phases of the command execution and of the '
+                      'module imports) and write it as JSON to FILE.'),
+]
+
 
 def add_options(options):
     """
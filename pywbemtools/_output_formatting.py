@@ -20,6 +20,7 @@ output formatting.
 """
 
 
+import math
 from textwrap import fill
 from operator import itemgetter
 from collections import namedtuple, OrderedDict
@@ -29,6 +30,8 @@ import tabulate
 
 from pywbem import CIMInstanceName
 
+from ._startup_profile import profile_phase
+
 
 DEFAULT_MAX_CELL_WIDTH = 100
 
@@ -343,6 +346,7 @@ def hide_empty_columns(headers, rows):
     return headers, rows
 
 
+@profile_phase('display')
 def format_table(rows, headers, title=None, table_format='simple',
                  sort_columns=None, hide_empty_cols=None, float_fmt=None):
     """
@@ -433,6 +437,231 @@ def format_table(rows, headers, title=None, table_format='simple',
     return result
 
 
+#: Table formats that can be displayed row by row with TableStream.
+STREAM_TABLE_FORMATS = ('table', 'plain', 'simple', 'grid', 'psql')
+
+# Minimum number of blanks between a header and the column border, as in the
+# tabulate package.
+_MIN_HEADER_PADDING = 2
+
+
+def _cell_lines(value):
+    """
+    Return the list of lines of a table cell value.
+    """
+    if value is None:
+        return ['']
+    return f"{value}".split('\n')
+
+
+def _is_number(value):
+    """
+    Return boolean indicating whether a table cell value is a number. This
+    follows the rules of the tabulate package for numeric columns.
+    """
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return False
+    if math.isinf(number) or math.isnan(number):
+        return f"{value}".lower() in ('inf', '-inf', 'nan')
+    return True
+
+
+def table_stream_widths(headers, sample_rows, max_cell_width=None,
+                        cell_widths=None):
+    """
+    Return the list of column widths of a TableStream for the headers and a
+    sample of the rows of the table.
+
+    If cell_widths is not None, the width of each column is the width of its
+    cells in cell_widths, e.g. determined from the types of the values
+    before any rows have been produced. Otherwise, if max_cell_width is None,
+    the width of each column is the width of its widest cell in the sample
+    rows, as the tabulate package determines the width from all rows.
+    Otherwise the width of each column is fixed to max_cell_width,
+    independent of the sample rows. In all cases, each column is at least as
+    wide as its header plus padding.
+
+    Parameters:
+
+      headers (list of :term:`string`):
+        The column headers. A header may consist of multiple lines.
+
+      sample_rows (list of lists):
+        Sample of the rows of the table.
+
+      max_cell_width (:term:`integer`):
+        Fixed width of the columns or None.
+
+      cell_widths (list of :term:`integer`):
+        Widths of the cells of the columns or None.
+
+    Returns:
+        list of :term:`integer`: The widths of the columns
+    """
+    widths = []
+    for column, header in enumerate(headers):
+        width = max(len(line) for line in _cell_lines(header)) + \
+            _MIN_HEADER_PADDING
+        if cell_widths is not None:
+            widths.append(max(width, cell_widths[column]))
+            continue
+        if max_cell_width is not None:
+            widths.append(max(width, max_cell_width))
+            continue
+        for row in sample_rows:
+            width = max([width] + [len(line)
+                                   for line in _cell_lines(row[column])])
+        widths.append(width)
+    return widths
+
+
+class TableStream:
+    """
+    Table whose rows are formatted one at a time, so that the rows of large
+    tables can be displayed as they are produced instead of formatting the
+    complete table at once as format_table() does.
+
+    The column widths are fixed when the table is created (see
+    table_stream_widths()). Cells of subsequent rows that are wider than their
+    column are folded. Columns whose sample cells are all numbers (or that
+    are defined to be numeric) are right aligned, all other columns are left
+    aligned. Within these limits, the output is the same as the output of
+    format_table() for the table formats in STREAM_TABLE_FORMATS.
+
+    Usage:
+
+        table = TableStream(headers, widths, table_format, title, sample_rows)
+        click.echo(table.header())
+        for row in rows:
+            click.echo(table.format_row(row))
+        footer = table.footer()
+        if footer:
+            click.echo(footer)
+    """
+
+    def __init__(self, headers, widths, table_format='simple', title=None,
+                 sample_rows=None, numeric=None):
+        """
+        Parameters:
+
+          headers (list of :term:`string`):
+            The column headers. A header may consist of multiple lines.
+
+          widths (list of :term:`integer`):
+            The column widths, e.g. from table_stream_widths().
+
+          table_format (:term:`string`):
+            One of the table formats in STREAM_TABLE_FORMATS.
+
+          title (:term:`string`):
+            Optional title to be output above the table.
+
+          sample_rows (list of lists):
+            Sample of the rows of the table that determines the alignment of
+            the columns, or None.
+
+          numeric (list of :class:`py:bool`):
+            Booleans indicating for each column whether it is numeric and
+            thus right aligned, or None to determine the alignment from
+            sample_rows.
+
+        Raises:
+            click.ClickException if the table format is not supported
+        """
+        if table_format is None or table_format == 'table':
+            table_format = 'psql'
+        if table_format not in STREAM_TABLE_FORMATS:
+            raise click.ClickException(
+                f'Invalid table format {table_format} for streamed tables.')
+        self.headers = headers
+        self.widths = widths
+        self.table_format = table_format
+        self.title = title
+        self._rows_output = 0
+
+        if numeric is None:
+            numeric = []
+            for column in range(len(headers)):
+                values = [row[column] for row in sample_rows or []
+                          if row[column] not in (None, '')]
+                numeric.append(
+                    bool(values) and all(_is_number(v) for v in values))
+        self._numeric = list(numeric)
+
+    def _border(self, fill_char, edge='+'):
+        """Return a horizontal border line of the psql and grid formats"""
+        cells = [fill_char * (width + 2) for width in self.widths]
+        return f"{edge}{'+'.join(cells)}{edge}"
+
+    def _format_lines(self, row, is_header=False):
+        """
+        Return the output lines of a row, with cells that are wider than their
+        column folded.
+        """
+        cells = []
+        for column, value in enumerate(row):
+            width = self.widths[column]
+            lines = _cell_lines(value)
+            if not is_header and any(len(line) > width for line in lines):
+                lines = fold_strings('\n'.join(lines), width,
+                                     break_long_words=True).split('\n')
+            cells.append(lines)
+        height = max(len(lines) for lines in cells) if cells else 1
+
+        out_lines = []
+        for index in range(height):
+            texts = []
+            for column, lines in enumerate(cells):
+                text = lines[index] if index < len(lines) else ''
+                if self._numeric[column]:
+                    texts.append(text.rjust(self.widths[column]))
+                else:
+                    texts.append(text.ljust(self.widths[column]))
+            if self.table_format in ('psql', 'grid'):
+                out_lines.append(f"| {' | '.join(texts)} |")
+            else:
+                out_lines.append('  '.join(texts).rstrip())
+        return out_lines
+
+    def header(self):
+        """
+        Return the string with the title, if any, and the header lines of the
+        table.
+        """
+        lines = [self.title] if self.title else []
+        if self.table_format in ('psql', 'grid'):
+            lines.append(self._border('-'))
+        lines.extend(self._format_lines(self.headers, is_header=True))
+        if self.table_format == 'simple':
+            lines.append('  '.join('-' * width for width in self.widths))
+        elif self.table_format == 'psql':
+            lines.append(self._border('-', edge='|'))
+        elif self.table_format == 'grid':
+            lines.append(self._border('='))
+        return '\n'.join(lines)
+
+    def format_row(self, row):
+        """
+        Return the string with the output lines of a row of the table.
+        """
+        lines = self._format_lines(row)
+        if self.table_format == 'grid' and self._rows_output:
+            lines.insert(0, self._border('-'))
+        self._rows_output += 1
+        return '\n'.join(lines)
+
+    def footer(self):
+        """
+        Return the string with the closing line of the table, or an empty
+        string if the table format has no closing line.
+        """
+        if self.table_format in ('psql', 'grid'):
+            return self._border('-')
+        return ''
+
+
 def fold_strings(input_strings, max_width, break_long_words=False,
                  break_on_hyphens=False, fold_list_items=False, separator=', ',
                  initial_indent='', subsequent_indent=''):
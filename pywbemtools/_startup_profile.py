@@ -0,0 +1,277 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Startup profile of the pywbemtools commands.
+
+The hidden general option --profile-startup of pywbemcli and pywbemlistener
+records where the time of a command execution goes and writes it to a JSON
+file:
+
+* The time of the phases of the command execution. A phase is defined by
+  using the profile_phase() context manager (or decorator) in the code of
+  the phase. Phases may be nested; the self time of a phase excludes the time
+  of the nested phases.
+
+* The time for importing the modules that are imported while the profile is
+  recorded, in the style of the Python '-X importtime' option. The modules
+  imported before the profile is started (i.e. before the general options
+  are processed) are not recorded; the tools/startup_benchmark.py script
+  runs the commands with '-X importtime' to get these as well.
+
+Phases and imports are recorded only in the thread that started the profile.
+When no profile is recorded, profile_phase() does nothing.
+"""
+
+import sys
+import json
+import time
+import builtins
+import importlib
+import importlib.util
+import threading
+import platform
+from contextlib import contextmanager
+
+import click
+
+from ._version import __version__
+
+__all__ = []
+
+# The startup profile that is currently recorded, or None.
+_PROFILE = None
+
+
+def _us(seconds):
+    """Return the time in seconds as integer microseconds."""
+    return int(round(seconds * 1000000))
+
+
+class StartupProfile:
+    """
+    Recorder for the phase times and module import times of one execution of
+    a pywbemtools command.
+    """
+
+    def __init__(self, tool):
+        """
+        Parameters:
+
+          tool (:term:`string`): Name of the command (e.g. 'pywbemcli').
+        """
+        self.tool = tool
+        # Phase results by phase name, as dictionaries with items 'count',
+        # 'cumulative_us' and 'self_us'. The order is the order in which the
+        # phases were entered first.
+        self.phases = {}
+        # Module import results in the order the imports completed, as
+        # dictionaries with items 'module', 'level', 'self_us' and
+        # 'cumulative_us'.
+        self.imports = []
+        # Stack of the active phases as lists of name, start time and time of
+        # nested phases.
+        self._phase_stack = []
+        # Stack of the time of the nested imports of the active imports.
+        self._import_stack = []
+        self._thread_id = None
+        self._start_time = None
+        self._stop_time = None
+        self._modules_before = None
+        self._saved_import = None
+        self._saved_import_module = None
+
+    def start(self):
+        """
+        Start recording, by replacing the import functions with functions
+        that record the import times.
+        """
+        self._thread_id = threading.get_ident()
+        self._modules_before = len(sys.modules)
+        self._saved_import = builtins.__import__
+        self._saved_import_module = importlib.import_module
+        builtins.__import__ = self._import
+        importlib.import_module = self._import_module
+        self._start_time = time.perf_counter()
+
+    def stop(self):
+        """
+        Stop recording and restore the import functions.
+        """
+        self._stop_time = time.perf_counter()
+        builtins.__import__ = self._saved_import
+        importlib.import_module = self._saved_import_module
+
+    def is_recording(self):
+        """
+        Return True if phases and imports in the current thread are recorded.
+        """
+        return threading.get_ident() == self._thread_id and \
+            self._stop_time is None
+
+    def enter_phase(self, name):
+        """
+        Enter the phase name. Re-entering an active phase is ignored, so that
+        nested uses of the same phase are counted once.
+        """
+        if any(phase[0] == name for phase in self._phase_stack):
+            return False
+        self._phase_stack.append([name, time.perf_counter(), 0.0])
+        return True
+
+    def exit_phase(self):
+        """
+        Exit the innermost active phase and record its times.
+        """
+        name, start, nested = self._phase_stack.pop()
+        elapsed = time.perf_counter() - start
+        if self._phase_stack:
+            self._phase_stack[-1][2] += elapsed
+        result = self.phases.setdefault(
+            name, {'count': 0, 'cumulative_us': 0, 'self_us': 0})
+        result['count'] += 1
+        result['cumulative_us'] += _us(elapsed)
+        result['self_us'] += _us(elapsed - nested)
+
+    def _timed_import(self, module_name, import_func, *args, **kwargs):
+        """
+        Call the import function and record the import time of the module,
+        if the module has not been imported yet.
+        """
+        if module_name in sys.modules or not self.is_recording():
+            return import_func(*args, **kwargs)
+        level = len(self._import_stack)
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return import_func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            self.imports.append({'module': module_name,
+                                 'level': level,
+                                 'self_us': _us(elapsed - nested),
+                                 'cumulative_us': _us(elapsed)})
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # pylint: disable=redefined-builtin
+        """
+        Replacement for builtins.__import__.
+        """
+        module_name = name
+        if level > 0 and globals:
+            package = globals.get('__package__') or globals.get('__name__')
+            try:
+                module_name = importlib.util.resolve_name(
+                    '.' * level + name, package)
+            except (ImportError, ValueError):
+                pass
+        return self._timed_import(module_name, self._saved_import, name,
+                                  globals, locals, fromlist, level)
+
+    def _import_module(self, name, package=None):
+        """
+        Replacement for importlib.import_module().
+        """
+        module_name = name
+        if name.startswith('.') and package:
+            module_name = importlib.util.resolve_name(name, package)
+        return self._timed_import(module_name, self._saved_import_module,
+                                  name, package)
+
+    def to_dict(self):
+        """
+        Return the profile as a dictionary that can be serialized to JSON.
+        """
+        stop_time = self._stop_time or time.perf_counter()
+        return {
+            'tool': self.tool,
+            'version': __version__,
+            'python_version': platform.python_version(),
+            'platform': sys.platform,
+            'total_us': _us(stop_time - self._start_time),
+            'modules_before_profile': self._modules_before,
+            'phases': self.phases,
+            'imports': self.imports,
+        }
+
+
+def start_profile(tool):
+    """
+    Start recording the startup profile of the command tool, and return the
+    StartupProfile object.
+    """
+    global _PROFILE  # pylint: disable=global-statement
+    _PROFILE = StartupProfile(tool)
+    _PROFILE.start()
+    return _PROFILE
+
+
+def stop_profile(file_path):
+    """
+    Stop recording the startup profile and write it as JSON to the file.
+
+    Raises:
+      click.ClickException: The file cannot be written.
+    """
+    global _PROFILE  # pylint: disable=global-statement
+    profile = _PROFILE
+    if profile is None:
+        return
+    _PROFILE = None
+    profile.stop()
+    try:
+        with open(file_path, 'w', encoding='utf-8') as fp:
+            json.dump(profile.to_dict(), fp, indent=2)
+    except OSError as exc:
+        raise click.ClickException(
+            f"Cannot write startup profile file {file_path}: {exc}")
+
+
+@contextmanager
+def profile_phase(name):
+    """
+    Context manager that records the time of its body as phase name in the
+    startup profile, if a profile is recorded. It can also be used as a
+    function decorator.
+    """
+    profile = _PROFILE
+    if profile is None or not profile.is_recording() or \
+            not profile.enter_phase(name):
+        yield
+        return
+    try:
+        yield
+    finally:
+        profile.exit_phase()
+
+
+def profile_startup_callback(ctx, param, value):
+    # pylint: disable=unused-argument
+    """
+    Click callback for the --profile-startup general option: Start recording
+    the startup profile and write it to the file specified in the option value
+    when the command context is closed.
+
+    The option is ignored on the commands in interactive mode, because the
+    profile of the interactive session is already recorded.
+    """
+    if value and ctx.obj is None and _PROFILE is None:
+        start_profile(ctx.info_name)
+        ctx.call_on_close(lambda: stop_profile(value))
+    return value
@@ -24,7 +24,7 @@ import shutil
 import warnings
 import inspect
 from datetime import datetime
-from unittest import mock
+from contextlib import contextmanager
 
 __all__ = []
 
@@ -90,12 +90,27 @@ def _formatwarning(message, category, filename, lineno, line=None):
     return f"{category.__name__}: {message}\n"
 
 
+@contextmanager
+def _replaced_formatwarning():
+    """
+    Context manager that monkey patches warnings.formatwarning() with
+    _formatwarning(). This is used instead of unittest.mock.patch.object()
+    because importing unittest.mock adds significantly to the startup time.
+    """
+    saved_formatwarning = warnings.formatwarning
+    warnings.formatwarning = _formatwarning
+    try:
+        yield
+    finally:
+        warnings.formatwarning = saved_formatwarning
+
+
 def pywbemtools_warn(*args, **kwargs):
     """
     Pywbemtools version of the warnings.warn() function,
     with replaced formatting.
     """
-    with mock.patch.object(warnings, 'formatwarning', _formatwarning):
+    with _replaced_formatwarning():
         warnings.warn(*args, **kwargs)
 
 
@@ -104,7 +119,7 @@ def pywbemtools_warn_explicit(*args, **kwargs):
     Pywbemtools version of the warnings.warn_explicit() function,
     with replaced formatting.
     """
-    with mock.patch.object(warnings, 'formatwarning', _formatwarning):
+    with _replaced_formatwarning():
         warnings.warn_explicit(*args, **kwargs)
 
 
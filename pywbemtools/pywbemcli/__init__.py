@@ -17,40 +17,90 @@
 """
 Pywbemcli is a command line WBEM client that uses pywbem as its communication
 interface with WBEM Servers. It is written in pure Python.
-"""
 
+The public names of the modules listed in _EXPORTING_MODULES are available as
+attributes of this package. The modules are imported when one of their names
+is first accessed, so that the pywbemcli command imports only the modules it
+needs (the command groups are loaded by the PywbemtoolsTopGroup class of the
+top level command group from its registry of command modules).
+"""
 
-from .._utils import *                # noqa: F403,F401
-from .._click_extensions import *     # noqa: F403,F401
-from .._options import *              # noqa: F403,F401
-from .._output_formatting import *    # noqa: F403,F401
-from .._common_cmd_actions import *   # noqa: F403,F401
-
-from ._cmd_namespace import *         # noqa: F403,F401
-from ._common import *                # noqa: F403,F401
-from ._pywbem_server import *         # noqa: F403,F401
-from ._warnings import *              # noqa: F403,F401
-
-from ._connection_file_names import *  # noqa: F403,F401
-from ._cmd_class import *             # noqa: F403,F401
-from ._cmd_instance import *          # noqa: F403,F401
-from ._cmd_qualifier import *         # noqa: F403,F401
-from ._cmd_server import *            # noqa: F403,F401
-from ._cmd_connection import *        # noqa: F403,F401
-from ._cmd_profile import *           # noqa: F403,F401
-from ._cmd_statistics import *        # noqa: F403,F401
-from ._cmd_subscription import *      # noqa: F403,F401
-from ._cmd_help import *              # noqa: F403,F401
-from ._cmd_docs import *              # noqa: F403,F401
-
-from ._context_obj import *           # noqa: F403,F401
-from ._connection_repository import *   # noqa: F403,F401
-from .pywbemcli import *              # noqa: F403,F401
-from .config import *                 # noqa: F403,F401
-from ._pywbemcli_operations import *  # noqa: F403,F401
-from ._association_shrub import *     # noqa: F403,F401
-from ._cimvalueformatter import *     # noqa: F403,F401
-from ._display_cimobjects import *    # noqa: F403,F401
-from ._common_cmd_functions import *  # noqa: F403,F401
+import importlib
+import importlib.util
 
 from .._version import __version__    # noqa: F401
+
+# Modules whose public names are exported by this package. If multiple modules
+# define a name, the name of the last module in the list is exported.
+_EXPORTING_MODULES = [
+    'pywbemtools._utils',
+    'pywbemtools._click_extensions',
+    'pywbemtools._options',
+    'pywbemtools._output_formatting',
+    'pywbemtools._common_cmd_actions',
+    'pywbemtools.pywbemcli._cmd_namespace',
+    'pywbemtools.pywbemcli._common',
+    'pywbemtools.pywbemcli._pywbem_server',
+    'pywbemtools.pywbemcli._warnings',
+    'pywbemtools.pywbemcli._connection_file_names',
+    'pywbemtools.pywbemcli._cmd_class',
+    'pywbemtools.pywbemcli._cmd_instance',
+    'pywbemtools.pywbemcli._cmd_qualifier',
+    'pywbemtools.pywbemcli._cmd_server',
+    'pywbemtools.pywbemcli._cmd_connection',
+    'pywbemtools.pywbemcli._cmd_profile',
+    'pywbemtools.pywbemcli._cmd_statistics',
+    'pywbemtools.pywbemcli._cmd_cache',
+    'pywbemtools.pywbemcli._cmd_subscription',
+    'pywbemtools.pywbemcli._cmd_help',
+    'pywbemtools.pywbemcli._cmd_docs',
+    'pywbemtools.pywbemcli._cmd_repl',
+    'pywbemtools.pywbemcli._context_obj',
+    'pywbemtools.pywbemcli._connection_repository',
+    'pywbemtools.pywbemcli.pywbemcli',
+    'pywbemtools.pywbemcli.config',
+    'pywbemtools.pywbemcli._pywbemcli_operations',
+    'pywbemtools.pywbemcli._pywbemcli_faked_connection',
+    'pywbemtools.pywbemcli._association_shrub',
+    'pywbemtools.pywbemcli._cimvalueformatter',
+    'pywbemtools.pywbemcli._display_cimobjects',
+    'pywbemtools.pywbemcli._common_cmd_functions',
+]
+
+
+def _public_names(module):
+    """
+    Return the names that 'from module import *' imports.
+    """
+    try:
+        return module.__all__
+    except AttributeError:
+        return [name for name in vars(module) if not name.startswith('_')]
+
+
+def __getattr__(name):
+    """
+    Return the public name of the exporting modules, importing them as
+    needed (PEP 562).
+
+    Names of submodules are not searched, so that 'from . import <submodule>'
+    imports the submodule.
+    """
+    if not name.startswith('_') and \
+            importlib.util.find_spec(f'{__name__}.{name}') is None:
+        for module_name in reversed(_EXPORTING_MODULES):
+            module = importlib.import_module(module_name)
+            if name in _public_names(module):
+                return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    Return the names of this package including the public names of the
+    exporting modules, importing all of them.
+    """
+    names = set(globals())
+    for module_name in _EXPORTING_MODULES:
+        names.update(_public_names(importlib.import_module(module_name)))
+    return sorted(names)
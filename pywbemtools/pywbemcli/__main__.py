@@ -0,0 +1,54 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Entry point of the pywbemcli command, also used for
+'python -m pywbemtools.pywbemcli'.
+
+If the --via-daemon general option is specified, the command is sent to the
+pywbemcli daemon without importing the pywbemcli command definitions (and with
+them click and pywbem). Otherwise, and if the daemon is not running, the
+command is executed in this process.
+"""
+
+import sys
+
+from ._daemon import via_daemon_index, run_via_daemon, strip_via_daemon
+
+
+def main():
+    """
+    Execute the pywbemcli command with the command line arguments of this
+    process.
+    """
+    args = sys.argv[1:]
+    if via_daemon_index(args) is not None:
+        exit_code = run_via_daemon(args)
+        if exit_code is not None:
+            return exit_code
+        # The daemon is not running
+        args = strip_via_daemon(args)
+
+    # pylint: disable=import-outside-toplevel
+    from .pywbemcli import cli
+    # Invoked via PywbemtoolsTopGroup.__call__() to disable the wildcard
+    # expansion on Windows. The parameters of cli() are provided by click.
+    # pylint: disable=no-value-for-parameter
+    return cli(args, prog_name='pywbemcli')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
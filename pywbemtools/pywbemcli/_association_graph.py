@@ -0,0 +1,207 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+In-memory graph of the associations of a CIM instance.
+
+Each reference instance of a source instance names the source instance and
+all other instances of the association in its reference properties. The
+AssociationGraph class builds a graph from the reference instances returned
+by one References request for the source instance and answers the
+ReferenceNames and AssociatorNames requests for the source instance from it,
+including the Role, AssocClass/ResultClass and ResultRole filters.
+
+The classes of the reference instances (the association classes) are retrieved
+once to get their reference properties (the roles). No other classes are
+retrieved: When an instance of a class other than the class of an AssocClass
+or ResultClass filter is matched against the filter, the names of the
+subclasses of the filter class are retrieved once with EnumerateClassNames.
+These requests are answered by the class store of the connection when
+repeated.
+"""
+
+
+from collections import OrderedDict
+
+from pywbem._nocasedict import NocaseDict
+
+from ._common import sort_cimobjects
+
+
+class AssociationGraph:
+    """
+    Graph of the associations of a source instance, with the reference
+    instances of the source instance as edges that connect the source
+    instance and the instances referenced by the reference instance in each
+    role.
+
+    The methods that correspond to WBEM operations return the same results
+    as the operations on the server for the source instance.
+    """
+
+    def __init__(self, conn, source_path, reference_instances):
+        """
+        Parameters:
+
+          conn (:class:`~pywbem.WBEMConnection`):
+            The connection used to retrieve the classes.
+
+          source_path (:class:`~pywbem.CIMInstanceName`):
+            Instance path of the source instance, with namespace. The host is
+            ignored.
+
+          reference_instances (list of :class:`~pywbem.CIMInstance`):
+            Reference instances returned by References for the source
+            instance without filters.
+
+        Raises:
+            Error: If retrieving an association class from the server fails.
+        """
+        self.conn = conn
+        self.source_path = source_path.copy()
+        self.source_path.host = None
+        # Lower case names of a class and its subclasses by tuple of lower
+        # case namespace and class name, for the classes of the filters.
+        self._subclasses = {}
+        # Names of the reference properties by association class name.
+        self._roles = NocaseDict()
+        # The edges of the graph as a list of tuples of the reference
+        # instance path and a NocaseDict of the instance paths referenced by
+        # the reference instance, by role.
+        self._edges = []
+
+        for ref_inst in reference_instances:
+            ref_path = ref_inst.path.copy()
+            if ref_path.namespace is None:
+                ref_path.namespace = source_path.namespace
+            if ref_path.classname not in self._roles:
+                klass = self._get_class(ref_path.namespace,
+                                        ref_path.classname)
+                self._roles[ref_path.classname] = \
+                    [pname for pname, prop in klass.properties.items()
+                     if prop.type == 'reference']
+
+            endpoints = NocaseDict()
+            for role in self._roles[ref_path.classname]:
+                prop = ref_inst.properties.get(role)
+                if prop is None or prop.value is None:
+                    continue
+                path = prop.value.copy()
+                if path.namespace is None:
+                    path.namespace = ref_path.namespace
+                if path.host is None:
+                    path.host = ref_path.host
+                endpoints[role] = path
+            self._edges.append((ref_path, endpoints))
+
+    def _get_class(self, namespace, classname):
+        """
+        Return the class from the server, with all properties.
+        """
+        return self.conn.GetClass(classname, namespace=namespace,
+                                  LocalOnly=False, IncludeQualifiers=False)
+
+    def _get_subclasses(self, namespace, classname):
+        """
+        Return the set of lower case names of the class and its subclasses,
+        retrieving the subclass names on first use.
+        """
+        key = (namespace.lower(), classname.lower())
+        if key not in self._subclasses:
+            classnames = self.conn.EnumerateClassNames(
+                ClassName=classname, namespace=namespace,
+                DeepInheritance=True)
+            self._subclasses[key] = \
+                {classname.lower()} | {cln.lower() for cln in classnames}
+        return self._subclasses[key]
+
+    def _is_subclass(self, path, classname):
+        """
+        Return True if classname is None or the class of the instance path is
+        classname or one of its subclasses.
+
+        Raises:
+            Error: If retrieving the subclass names from the server fails.
+        """
+        if classname is None or path.classname.lower() == classname.lower():
+            return True
+        return path.classname.lower() in self._get_subclasses(path.namespace,
+                                                              classname)
+
+    def _is_source(self, path):
+        """
+        Return True if the instance path is the path of the source instance,
+        ignoring the host.
+        """
+        path = path.copy()
+        path.host = None
+        return path == self.source_path
+
+    def _source_edges(self, role, assoc_class):
+        """
+        Generator for the edges of the association class or its subclasses
+        that reference the source instance in the role, or in any role if
+        role is None.
+        """
+        for ref_path, endpoints in self._edges:
+            if not self._is_subclass(ref_path, assoc_class):
+                continue
+            roles = [role] if role else list(endpoints)
+            if any(r in endpoints and self._is_source(endpoints[r])
+                   for r in roles):
+                yield ref_path, endpoints
+
+    def roles(self, assoc_class):
+        """
+        Return the list of the names of the reference properties of the
+        association class.
+        """
+        return self._roles[assoc_class]
+
+    def reference_names(self, role=None, result_class=None):
+        """
+        Return the result of ReferenceNames for the source instance with the
+        Role and ResultClass parameters.
+
+        Raises:
+            Error: If retrieving the subclass names from the server fails.
+        """
+        return [ref_path for ref_path, _ in
+                self._source_edges(role, result_class)]
+
+    def associator_names(self, role=None, assoc_class=None,
+                         result_role=None, result_class=None):
+        """
+        Return the result of AssociatorNames for the source instance with the
+        Role, AssocClass, ResultRole and ResultClass parameters, sorted by
+        instance name.
+
+        Raises:
+            Error: If retrieving the subclass names from the server fails.
+        """
+        assoc_inames = OrderedDict()
+        for _, endpoints in self._source_edges(role, assoc_class):
+            for endpoint_role, path in endpoints.items():
+                if result_role and endpoint_role.lower() != \
+                        result_role.lower():
+                    continue
+                if role:
+                    if endpoint_role.lower() == role.lower():
+                        continue
+                elif self._is_source(path):
+                    continue
+                if self._is_subclass(path, result_class):
+                    assoc_inames[path] = True
+        return sort_cimobjects(list(assoc_inames))
@@ -40,9 +40,12 @@ from collections import defaultdict, OrderedDict, namedtuple
 import click
 
 from asciitree import LeftAligned
+from pywbem import Error
 from pywbem._nocasedict import NocaseDict
 
 from ._common import shorten_path_str, sort_cimobjects, to_wbem_uri_folded
+from ._connection_pool import ConnectionPool
+from ._association_graph import AssociationGraph
 from .._utils import get_terminal_width
 from .._output_formatting import output_format_is_table, format_table, \
     warning_msg
@@ -81,7 +84,7 @@ class AssociationShrub:
 
     def __init__(self, conn, source_path, Role=None, AssocClass=None,
                  ResultRole=None, ResultClass=None, fullpath=True,
-                 verbose=None):
+                 verbose=None, max_parallel=None, client_filtering=True):
         # pylint: disable=invalid-name
         """
         Parameters:
@@ -109,6 +112,18 @@ class AssociationShrub:
           fullpath (:class:`py:bool`):
             If True, the full path of instances is displayed
 
+          max_parallel (:term:`integer`):
+            Maximum number of ReferenceNames and AssociatorNames requests
+            that are executed concurrently. Default: 1.
+
+          client_filtering (:class:`py:bool`):
+            If True, the roles of the reference classes and the
+            ReferenceNames and AssociatorNames requests for the shrub are
+            answered from an association graph built from the result of the
+            References request, if the classes of the reference instances and
+            of the referenced instances can be retrieved from the server.
+            Otherwise, the requests are sent to the server.
+
         Raises:
            Error: If the server returns exceptions
         """
@@ -125,6 +140,8 @@ class AssociationShrub:
 
         self.fullpath = fullpath
         self.verbose = verbose
+        self.max_parallel = max_parallel
+        self.client_filtering = client_filtering
 
         #  Dictionary view of the shrub. This is a dictionary of dictionaries
         #  role:ReferenceClassNames:
@@ -148,8 +165,12 @@ class AssociationShrub:
         if self.full_source_path.namespace is None:
             self.full_source_path.namespace = self.source_namespace
 
-        # Cache the results of conn.ReferenceNames(self.source+path)
-        self.reference_names = None
+        # Reference instances returned by conn.References(self.source_path)
+        self.reference_instances = []
+
+        # AssociationGraph built from the reference instances. None if the
+        # requests are not answered on the client.
+        self.graph = None
 
         # Create the ternary reference dictionary
         self.ternary_ref_classes = OrderedDict()
@@ -180,7 +201,8 @@ class AssociationShrub:
         return sort_cimobjects(reference_instances)
 
     def sorted_associator_names(self, source_path, role=None, assoc_class=None,
-                                result_role=None, result_class=None):
+                                result_role=None, result_class=None,
+                                conn=None):
         """
         Get associated instances from host sorted by instance name.
 
@@ -204,6 +226,10 @@ class AssociationShrub:
             Optional string defining ResutRole parameter of the Associators
             call to the host
 
+          conn (:class:`~pywbem.WBEMConnection`):
+            Optional connection used for the request instead of self.conn,
+            e.g. the connection of a connection pool worker thread.
+
         Returns:
            list of :class:`pywbem:CIMClassNames` returns from host
 
@@ -211,7 +237,8 @@ class AssociationShrub:
             Error if error returned from host webserver
         """
 
-        rtnd_assoc_inames = self.conn.AssociatorNames(
+        conn = conn or self.conn
+        rtnd_assoc_inames = conn.AssociatorNames(
             source_path,
             Role=role,
             AssocClass=assoc_class,
@@ -283,6 +310,9 @@ class AssociationShrub:
         # ref_class_roles dictionary {<cln>:[roles]}
         # Also builds dict of ternary references for use in building shrub
         reference_instances = self.sorted_references(self.source_path)
+        self.reference_instances = reference_instances
+        if self.client_filtering:
+            self._init_client_filtering()
 
         # Build list of reference CIMClassName objects and add to a
         # ref_class_roles dict
@@ -297,11 +327,18 @@ class AssociationShrub:
         # Put the reference classes into ref_class_roles dict
         ref_class_roles = self.build_ref_class_roles_dict(reference_instnames)
 
+        # Get the reference names for each role of each reference class.
+        # The requests are independent, so they are executed together.
+        reference_names = self._get_reference_names(
+            [(role, cln) for cln, roles in ref_class_roles.items()
+             for role in roles])
+
         # Find role parameter for each class and insert into instance_shrub
         # dictionary. The result is dictionary of form:
         #   {<role>:{<ASSOC_CLASSNAME>:[RESULTROLES]}
         for cln, roles in ref_class_roles.items():
-            role_dict = self._get_role_result_roles(roles, cln)
+            role_dict = self._get_role_result_roles(roles, cln,
+                                                    reference_names)
 
             # Insert the role and cln into the shrub_dict
             for role, result_roles in role_dict.items():
@@ -329,76 +366,82 @@ class AssociationShrub:
                 for role in remove_roles:
                     del self.instance_shrub[role]
 
-        # Find associated instances/classes for each role
+        # Replace the temporarily installed result roles in the shrub dict
+        # with the defaultdict that is the basis for the next level and
+        # get the associated instance names for each role, reference class
+        # and result role.
+        result_roles_dict = OrderedDict()
         for role in self.instance_shrub:
             self.assoc_instnames[role] = OrderedDict()
             for ref_classname in self.instance_shrub[role]:
-                # Get temp installed result roles from shrub_dict and
-                # replace with defaultdict that is basis for next level
-                result_roles = self.instance_shrub[role][ref_classname]
-
-                # Create associator result dictionaries with ref_class as key
+                result_roles = [
+                    rr for rr in self.instance_shrub[role][ref_classname]
+                    if not self.result_role or
+                    self.result_role.lower() == rr.lower()]
+                result_roles_dict[(role, ref_classname)] = result_roles
                 self.assoc_instnames[role][ref_classname] = OrderedDict()
                 self.instance_shrub[role][ref_classname] = defaultdict(list)
 
-                # Get Associated class names by AssocClass and ResultRole
-                assoc_clns = []
-                for result_role in result_roles:
-                    # Get the associated instance names from server for
-                    # all result_classes
-                    if self.result_role:
-                        if self.result_role.lower() != result_role.lower():
-                            continue
-
-                    rtnd_assoc_inames = self.sorted_associator_names(
-                        self.source_path,
-                        role=role,
-                        assoc_class=ref_classname,
-                        result_role=result_role)
-
-                    # Build unique associated classnames from returned inames.
-                    rtnd_assoc_clns = list({iname.classname for iname
-                                            in rtnd_assoc_inames})
-
-                    # Discard unwanted assoc classes if --result_class param
-                    # defined
-                    if self.result_class:
-                        rc = self.result_class.lower()
-                        # Define list of unique returned assoc classnames
-                        filtered_clns = list({iname.classname.lower() for iname
-                                              in rtnd_assoc_inames
-                                              if iname.classname.lower() == rc})
-
-                        # Discard unwanted assoc classes
-                        rtnd_assoc_clns = [cln for cln in rtnd_assoc_clns if
-                                           cln.lower() in filtered_clns]
-
-                    assoc_clns.extend(rtnd_assoc_clns)
-
-                    # Extend instance_shrub_dict with returned assoc classnames
-                    # pylint: disable=line-too-long
-                    self.instance_shrub[role][ref_classname][result_role].extend(rtnd_assoc_clns)  # noqa: E501
-                    # pylint: enable=line-too-long
-
-                    # Get associated instance names by AssocClass, role and
-                    # target name using the assoc_clns from above
-                    disp_result_role = result_role or "None"
-                    # Get AssociatorNames for specific ResultClass
-                    for assoc_cln in assoc_clns:
-                        assoc_inames = self.sorted_associator_names(
-                            self.source_path,
-                            role=role,
-                            assoc_class=ref_classname,
-                            result_role=result_role,
-                            result_class=assoc_cln)
-
-                        # Build namedtuple of name, ref_inst  integer.
-                        # This ties each output instance to a particular
-                        # reference instance.
-                        self.build_assoc_name_tuples(
-                            assoc_inames, assoc_cln,
-                            disp_result_role, role, ref_classname,
-                            reference_instances, result_role)
+        all_assoc_inames = self._get_associator_names(
+            [(role, ref_classname, result_role, None)
+             for (role, ref_classname), result_roles in
+             result_roles_dict.items() for result_role in result_roles])
+
+        # Find associated classes for each role, reference class and result
+        # role and define the AssociatorNames requests for each associated
+        # class. These requests are executed together after all of them
+        # are known.
+        assoc_cln_requests = []
+        for (role, ref_classname), result_roles in result_roles_dict.items():
+            # Get Associated class names by AssocClass and ResultRole
+            assoc_clns = []
+            for result_role in result_roles:
+                rtnd_assoc_inames = all_assoc_inames[
+                    (role, ref_classname, result_role, None)]
+
+                # Build unique associated classnames from returned inames.
+                rtnd_assoc_clns = list({iname.classname for iname
+                                        in rtnd_assoc_inames})
+
+                # Discard unwanted assoc classes if --result_class param
+                # defined
+                if self.result_class:
+                    rc = self.result_class.lower()
+                    # Define list of unique returned assoc classnames
+                    filtered_clns = list({iname.classname.lower() for iname
+                                          in rtnd_assoc_inames
+                                          if iname.classname.lower() == rc})
+
+                    # Discard unwanted assoc classes
+                    rtnd_assoc_clns = [cln for cln in rtnd_assoc_clns if
+                                       cln.lower() in filtered_clns]
+
+                assoc_clns.extend(rtnd_assoc_clns)
+
+                # Extend instance_shrub_dict with returned assoc classnames
+                # pylint: disable=line-too-long
+                self.instance_shrub[role][ref_classname][result_role].extend(rtnd_assoc_clns)  # noqa: E501
+                # pylint: enable=line-too-long
+
+                # Define the AssociatorNames requests by AssocClass, role,
+                # result role and the assoc_clns from above
+                for assoc_cln in assoc_clns:
+                    assoc_cln_requests.append(
+                        (role, ref_classname, result_role, assoc_cln))
+
+        assoc_cln_inames = self._get_associator_names(assoc_cln_requests)
+
+        for request in assoc_cln_requests:
+            role, ref_classname, result_role, assoc_cln = request
+            disp_result_role = result_role or "None"
+
+            # Build namedtuple of name, ref_inst  integer.
+            # This ties each output instance to a particular
+            # reference instance.
+            self.build_assoc_name_tuples(
+                assoc_cln_inames[request], assoc_cln,
+                disp_result_role, role, ref_classname,
+                reference_instances, result_role)
 
     def display_shrub(self, output_format, summary=None):
         """
@@ -781,8 +824,9 @@ class AssociationShrub:
     def _get_reference_roles(self, inst_name):
         """
         Internal method to get the list of roles for an association class.
-        Uses instance get rather than class get because some
-        servers may not support class get operation.
+        Uses the association graph if it exists and otherwise the reference
+        instance returned by the References request, because some servers may
+        not support class get operation.
 
         Parameters:
 
@@ -797,24 +841,30 @@ class AssociationShrub:
             CIMError if the GetInstance fails
 
         """
-        ref_inst = self.conn.GetInstance(inst_name, LocalOnly=False)
+        if self.graph is not None:
+            return self.graph.roles(inst_name.classname)
+        for ref_inst in self.reference_instances:
+            if ref_inst.path == inst_name:
+                break
+        else:
+            ref_inst = self.conn.GetInstance(inst_name, LocalOnly=False)
         return [pname for pname, pvalue in ref_inst.properties.items()
                 if pvalue.type == 'reference']
 
-    def _get_role_result_roles(self, roles, ref_classname):
+    def _get_role_result_roles(self, roles, ref_classname, reference_names):
         """
         Given the reference classname, separate the role and result_role
         parameters and return them. This method determines that the role
         is the call to ReferenceNames that returns references. Result roles
         are the roles that do not return references. Note that there are
         cases where this basic algorithm returns multiples
+
+        reference_names is the dictionary of the results of the ReferenceNames
+        requests by tuple of role and reference classname.
         """
         rtn_roles = OrderedDict()
         for tst_role in roles:
-            refs = self.conn.ReferenceNames(self.source_path,
-                                            Role=tst_role,
-                                            ResultClass=ref_classname)
-            self.reference_names = refs
+            refs = reference_names[(tst_role, ref_classname)]
 
             if refs:
                 rtn_roles[tst_role] = [r for r in roles if r != tst_role]
@@ -825,3 +875,78 @@ class AssociationShrub:
                 f'ResultRoles={rtn_roles}')
 
         return rtn_roles
+
+    def _init_client_filtering(self):
+        """
+        Build the association graph from the reference instances, to answer
+        the requests for the shrub on the client.
+
+        If the classes cannot be retrieved, e.g. because the server does not
+        support class operations, the requests are sent to the server.
+        """
+        try:
+            self.graph = AssociationGraph(self.conn, self.full_source_path,
+                                          self.reference_instances)
+        except Error as er:
+            self._disable_client_filtering(er)
+
+    def _disable_client_filtering(self, er):
+        """
+        Send the requests for the shrub to the server because the classes
+        needed by the association graph cannot be retrieved.
+        """
+        if self.verbose:
+            click.echo(f'Shrub requests are sent to the server because '
+                       f'the classes cannot be retrieved: {er}')
+        self.graph = None
+
+    def _get_reference_names(self, requests):
+        """
+        Execute the ReferenceNames requests defined by the list of tuples of
+        role and result class, on the client if possible and otherwise with up
+        to max_parallel requests executing concurrently.
+
+        Returns a dictionary with the results by request tuple.
+        """
+        if self.graph is not None:
+            try:
+                return {req: self.graph.reference_names(*req)
+                        for req in requests}
+            except Error as er:
+                self._disable_client_filtering(er)
+
+        def request_func(conn, req):
+            role, result_class = req
+            return conn.ReferenceNames(self.source_path, Role=role,
+                                       ResultClass=result_class)
+
+        pool = ConnectionPool(self.conn, self.max_parallel)
+        return {req: get_result() for req, get_result in
+                pool.imap(request_func, requests)}
+
+    def _get_associator_names(self, requests):
+        """
+        Execute the AssociatorNames requests defined by the list of tuples of
+        role, association class, result role and result class, on the client
+        if possible and otherwise with up to max_parallel requests executing
+        concurrently. Duplicate requests are executed once.
+
+        Returns a dictionary with the sorted results by request tuple.
+        """
+        requests = list(OrderedDict.fromkeys(requests))
+        if self.graph is not None:
+            try:
+                return {req: self.graph.associator_names(*req)
+                        for req in requests}
+            except Error as er:
+                self._disable_client_filtering(er)
+
+        def request_func(conn, req):
+            role, assoc_class, result_role, result_class = req
+            return self.sorted_associator_names(
+                self.source_path, role=role, assoc_class=assoc_class,
+                result_role=result_role, result_class=result_class, conn=conn)
+
+        pool = ConnectionPool(self.conn, self.max_parallel)
+        return {req: get_result() for req, get_result in
+                pool.imap(request_func, requests)}
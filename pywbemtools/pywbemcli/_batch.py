@@ -0,0 +1,342 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batch mode of pywbemcli (--batch general option): Execution of the commands
+in a command file in one pywbemcli process.
+
+The commands are executed as in interactive mode, i.e. they use the
+connection and the general options of the pywbemcli command line, and general
+options specified on a command apply only to that command. The connection to
+the WBEM server is kept open for all commands.
+
+With --batch-jobs greater than 1, consecutive read-only commands (see
+READ_ONLY_COMMANDS) are executed concurrently by worker threads, each using
+its own copy of the connection (which shares the class store and the mock
+repository with the connection). All other commands are barriers: They are
+executed after all previous commands have completed, and the subsequent
+commands after they have completed, so that the commands see the effects of
+the previous commands as if they were executed sequentially. The output of
+each command is collected and displayed in the order of the commands in the
+file when the command has completed.
+"""
+
+import io
+import os
+import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+
+from .config import BATCH_META_KEY
+from ._context_obj import ContextObj
+from ._daemon import GENERAL_VALUE_OPTIONS
+
+__all__ = []
+
+#: Tuples of the command group and command names of the commands that only
+#: read from the WBEM server and do not depend on the state of pywbemcli that
+#: other commands change. These commands of a batch file may be executed
+#: concurrently with --batch-jobs.
+READ_ONLY_COMMANDS = frozenset([
+    ('class', 'associators'), ('class', 'enumerate'), ('class', 'find'),
+    ('class', 'get'), ('class', 'references'), ('class', 'tree'),
+    ('instance', 'associators'), ('instance', 'count'),
+    ('instance', 'enumerate'), ('instance', 'get'), ('instance', 'query'),
+    ('instance', 'references'), ('instance', 'shrub'),
+    ('namespace', 'interop'), ('namespace', 'list'),
+    ('profile', 'centralinsts'), ('profile', 'list'),
+    ('qualifier', 'enumerate'), ('qualifier', 'get'),
+    ('server', 'brand'), ('server', 'info'), ('server', 'schema'),
+    ('subscription', 'list'), ('subscription', 'list-destinations'),
+    ('subscription', 'list-filters'), ('subscription', 'list-subscriptions'),
+])
+
+
+def read_batch_file(batch_file):
+    """
+    Read the commands of a batch file ('-' for stdin).
+
+    Empty lines and lines starting with '#' are ignored.
+
+    Returns:
+      list of tuple(line number, command line)
+
+    Raises:
+      click.ClickException: The file cannot be read.
+    """
+    try:
+        with click.open_file(batch_file, 'r', encoding='utf-8') as fp:
+            lines = fp.read().splitlines()
+    except OSError as exc:
+        raise click.ClickException(
+            f"Cannot read batch file {batch_file}: {exc}")
+
+    commands = []
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            commands.append((lineno, line))
+    return commands
+
+
+def command_names(args):
+    """
+    Return the tuple of the command group and command names of the pywbemcli
+    command line arguments args, skipping the general options before them.
+    The tuple has fewer items if the command line has no command group or
+    command.
+    """
+    names = []
+    index = 0
+    while index < len(args) and len(names) < 2:
+        arg = args[index]
+        if arg.startswith('-'):
+            if names:
+                # An option of the command group
+                break
+            index += 2 if arg in GENERAL_VALUE_OPTIONS else 1
+            continue
+        names.append(arg)
+        index += 1
+    return tuple(names)
+
+
+def is_read_only_command(line):
+    """
+    Return a boolean indicating whether the command in the batch command line
+    line is in READ_ONLY_COMMANDS.
+    """
+    try:
+        args = shlex.split(line)
+    except ValueError:
+        return False
+    return command_names(args) in READ_ONLY_COMMANDS
+
+
+def execute_batch_command(parent_ctx, line):
+    """
+    Execute the pywbemcli command in the command line line as a child of the
+    click context parent_ctx and return its exit code. Errors are displayed
+    as in command mode.
+    """
+    try:
+        args = shlex.split(line)
+    except ValueError as exc:
+        click.echo(f"Error: Invalid command line: {exc}", err=True)
+        return 1
+
+    # The command of the parent context is the pywbemcli cli group
+    cli = parent_ctx.command
+    try:
+        with cli.make_context(None, args, parent=parent_ctx) as ctx:
+            cli.invoke(ctx)
+        return 0
+    except click.ClickException as exc:
+        exc.show()
+        return exc.exit_code
+    except click.exceptions.Exit as exc:
+        return exc.exit_code
+    except click.Abort:
+        click.echo('Aborted!', err=True)
+        return 1
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else int(bool(exc.code))
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    Text stream that is used as sys.stdout or sys.stderr while batch commands
+    are executed concurrently. The output of a worker thread is written to the
+    buffer of the thread, and the output of other threads to the original
+    stream.
+    """
+
+    def __init__(self, stream, local, name):
+        super().__init__()
+        self._stream = stream
+        self._local = local
+        self._name = name
+
+    @property
+    def encoding(self):
+        """The encoding of the original stream."""
+        return self._stream.encoding
+
+    @property
+    def errors(self):
+        """The error handling mode of the original stream."""
+        return self._stream.errors
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        buffer = getattr(self._local, self._name, None)
+        if buffer is None:
+            return self._stream.write(s)
+        return buffer.write(s)
+
+    def flush(self):
+        self._stream.flush()
+
+
+class _BatchWorkers:
+    """
+    Executes batch commands in worker threads. Each worker thread has its own
+    click context with its own ContextObj and copy of the connection.
+    """
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._servers = []
+
+    def _thread_ctx(self):
+        """
+        Return the click context of the current worker thread, creating it on
+        first use.
+        """
+        ctx = getattr(self._local, 'ctx', None)
+        if ctx is None:
+            obj = self.ctx.obj
+            pywbem_server = None
+            if obj.pywbem_server_exists():
+                pywbem_server = obj.pywbem_server.copy()
+                with self._lock:
+                    self._servers.append(pywbem_server)
+            thread_obj = ContextObj(
+                pywbem_server, obj.output_format, obj.timestats, obj.log,
+                obj.verbose, False, obj.warn, obj.connections_repo, True,
+                False, max_parallel=obj.max_parallel,
+                class_cache=obj.class_cache,
+                class_store=obj.class_store,
+                pull_target_time=obj.pull_target_time)
+            ctx = click.Context(self.ctx.command, info_name=self.ctx.info_name,
+                                obj=thread_obj)
+            ctx.meta.update(self.ctx.meta)
+            self._local.ctx = ctx
+        return ctx
+
+    def execute(self, line):
+        """
+        Execute a batch command in a worker thread and return a tuple of its
+        exit code, stdout output and stderr output.
+        """
+        self._local.stdout = io.StringIO()
+        self._local.stderr = io.StringIO()
+        try:
+            with self._thread_ctx() as ctx:
+                exit_code = execute_batch_command(ctx, line)
+            return (exit_code, self._local.stdout.getvalue(),
+                    self._local.stderr.getvalue())
+        finally:
+            self._local.stdout = None
+            self._local.stderr = None
+
+    def imap(self, commands, jobs):
+        """
+        Generator that executes the batch commands with up to jobs
+        consecutive read-only commands executing concurrently and the other
+        commands as barriers, and yields a tuple of line number, command
+        line, exit code, stdout output and stderr output for each command, in
+        the order of the commands.
+        """
+        obj = self.ctx.obj
+        if obj.pywbem_server_exists():
+            # Connect before the connection is copied, so that the copies
+            # share the class store (and the repository of a mock
+            # environment) of the connection.
+            obj.pywbem_server.wbem_server  # pylint: disable=pointless-statement
+
+        saved_stdout = click.utils.sys.stdout
+        saved_stderr = click.utils.sys.stderr
+        saved_spinner = os.environ.get(ContextObj.spinner_envvar)
+        # The spinners of the commands would write to the same terminal.
+        os.environ[ContextObj.spinner_envvar] = '0'
+        click.utils.sys.stdout = _ThreadOutput(saved_stdout, self._local,
+                                               'stdout')
+        click.utils.sys.stderr = _ThreadOutput(saved_stderr, self._local,
+                                               'stderr')
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        try:
+            # Submitted read-only commands, as tuples of line number, command
+            # line and future.
+            pending = []
+            for lineno, line in commands:
+                if is_read_only_command(line):
+                    pending.append(
+                        (lineno, line, executor.submit(self.execute, line)))
+                    continue
+                for pending_lineno, pending_line, future in pending:
+                    yield (pending_lineno, pending_line) + future.result()
+                pending = []
+                yield (lineno, line) + \
+                    executor.submit(self.execute, line).result()
+            for lineno, line, future in pending:
+                yield (lineno, line) + future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            click.utils.sys.stdout = saved_stdout
+            click.utils.sys.stderr = saved_stderr
+            if saved_spinner is None:
+                del os.environ[ContextObj.spinner_envvar]
+            else:
+                os.environ[ContextObj.spinner_envvar] = saved_spinner
+            for pywbem_server in self._servers:
+                if pywbem_server.connected:
+                    pywbem_server.disconnect()
+
+
+def run_batch(ctx, batch_file, jobs):
+    """
+    Execute the commands of the batch file in the click context of the
+    pywbemcli command line, with up to jobs commands executing concurrently.
+
+    The exit code of each failed command (and with --verbose, of each command)
+    is displayed on stderr.
+
+    Returns:
+      int: The exit code of pywbemcli: 0 if all commands succeeded, or 1.
+    """
+    commands = read_batch_file(batch_file)
+    ctx.meta[BATCH_META_KEY] = True
+
+    if jobs > 1 and len(commands) > 1:
+        results = _BatchWorkers(ctx).imap(commands, jobs)
+    else:
+        results = ((lineno, line, execute_batch_command(ctx, line), None,
+                    None) for lineno, line in commands)
+
+    failed = 0
+    for lineno, line, exit_code, stdout, stderr in results:
+        if stdout:
+            click.echo(stdout, nl=False)
+        if stderr:
+            click.echo(stderr, nl=False, err=True)
+        if exit_code:
+            failed += 1
+        if exit_code or ctx.obj.verbose:
+            click.echo(f"Batch line {lineno}: exit code {exit_code}: {line}",
+                       err=True)
+
+    if failed:
+        click.echo(f"Batch: {failed} of {len(commands)} commands failed",
+                   err=True)
+        return 1
+    return 0
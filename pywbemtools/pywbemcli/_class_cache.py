@@ -0,0 +1,396 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Caches of the class and qualifier declaration requests of a connection.
+
+The ClassStore class is the in-session cache of a connection. It is kept in
+memory for the life of the connection, so in interactive mode it is used by
+all commands executed on the connection. It also keeps the value mappings of
+the properties displayed in table output.
+
+The ClassCache class is the persistent cache of a connection to a real WBEM
+server (--class-cache general option).
+
+The cache of a connection is a directory below CLASSCACHE_ROOT_DIR whose name
+is derived from the URL and user of the connection. It contains one pickle
+file per namespace with the responses of the GetClass, EnumerateClasses,
+EnumerateClassNames, GetQualifier and EnumerateQualifiers requests, keyed by
+the request parameters, and the normalized URL of the connection that created
+it.
+
+The cache of a namespace is used only if it has the current cache format
+version, was created for the same normalized URL, is not older than
+CLASSCACHE_MAX_AGE, and the class names and qualifier declarations in the
+namespace (retrieved once per process with EnumerateClassNames and
+EnumerateQualifiers) are the same as when the cache was created. Requests that
+modify classes or qualifier declarations invalidate the cache of the
+namespace. Changes of class definitions on the server that keep the class
+names and qualifier declarations are not detected, since that would require
+retrieving the classes; the cache must be removed with the 'cache clear'
+command after such changes.
+"""
+
+
+import os
+import time
+import glob
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+
+import pywbem
+
+from .config import CLASSCACHE_MAX_AGE, CLASS_STORE_MAX_OBJECTS
+from .._utils import ensure_bytes, ensure_unicode
+
+#: Version of the format of the class cache files. Cache files with a
+#: different version are discarded.
+CLASSCACHE_VERSION = 2
+
+
+def classcache_cachedir(rootdir, url, user):
+    """
+    Return the directory path of the class cache of the connection to the
+    WBEM server with the url and user.
+
+    The directory name is a hash of the url and user, so that different
+    servers and different users (that may see different classes) use
+    different caches.
+    """
+    md5 = hashlib.md5()
+    md5.update(ensure_bytes(url))
+    md5.update(ensure_bytes(user or ''))
+    return os.path.join(rootdir, ensure_unicode(md5.hexdigest()))
+
+
+def _namespace_filename(namespace):
+    """
+    Return the base file name of the cache file of a namespace.
+    """
+    md5 = hashlib.md5()
+    md5.update(ensure_bytes(namespace.strip('/').lower()))
+    return f'{ensure_unicode(md5.hexdigest())}.pkl'
+
+
+def _namespace_fingerprint(classnames, qualifiers):
+    """
+    Return a hash value of the class names and qualifier declarations of a
+    namespace that is used to detect added, removed and renamed classes and
+    changed qualifier declarations (e.g. by a schema update) on the server.
+    Changes of the class definitions are not reflected in the hash value.
+
+    qualifiers is None if the server does not support retrieving the
+    qualifier declarations.
+    """
+    md5 = hashlib.md5()
+    for classname in sorted(cln.lower() for cln in classnames):
+        md5.update(ensure_bytes(classname))
+        md5.update(b'\n')
+    if qualifiers is not None:
+        md5.update(b'\0')
+        for qualifier in sorted(qualifiers, key=lambda q: q.name.lower()):
+            md5.update(ensure_bytes(qualifier.tomof()))
+    return ensure_unicode(md5.hexdigest())
+
+
+def _response_size(response):
+    """
+    Return the number of CIM objects or names in a request response.
+    """
+    return len(response) if isinstance(response, list) else 1
+
+
+class ClassStore:
+    """
+    In-memory cache of the responses of the class and qualifier declaration
+    requests of a connection, organized by namespace, with least recently used
+    eviction.
+
+    The size of the store is the number of CIM objects and names in the cached
+    responses. When it exceeds max_objects, the least recently used responses
+    are removed. The methods of this class may be called from multiple
+    threads.
+    """
+
+    def __init__(self, max_objects=CLASS_STORE_MAX_OBJECTS):
+        """
+        Parameters:
+
+          max_objects (:term:`integer`):
+            Maximum number of CIM objects and names in the store.
+        """
+        self.max_objects = max_objects
+        # Responses by tuple of lower case namespace name and request key, in
+        # least recently used order.
+        self._responses = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # ValueMapping objects of integer-typed properties (None for
+        # properties without value mapping), by tuple of lower case class name
+        # and property name. They are shared by all namespaces.
+        self.valuemappings = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (f'ClassStore(max_objects={self.max_objects}, '
+                f'size={self._size}, entries={len(self._responses)})')
+
+    @property
+    def size(self):
+        """
+        :term:`integer`: Number of CIM objects and names in the store.
+        """
+        return self._size
+
+    def get(self, namespace, key):
+        """
+        Return a tuple (found, response) for the request defined by key in
+        the namespace.
+        """
+        store_key = (namespace.strip('/').lower(), key)
+        with self._lock:
+            if store_key in self._responses:
+                self._responses.move_to_end(store_key)
+                self.hits += 1
+                return True, self._responses[store_key]
+            self.misses += 1
+        return False, None
+
+    def put(self, namespace, key, response):
+        """
+        Save the response of the request defined by key in the namespace and
+        remove the least recently used responses if the store is too large.
+        A response that is larger than the store is not saved.
+        """
+        size = _response_size(response)
+        if size > self.max_objects:
+            return
+        store_key = (namespace.strip('/').lower(), key)
+        with self._lock:
+            if store_key in self._responses:
+                self._size -= _response_size(self._responses[store_key])
+            self._responses[store_key] = response
+            self._responses.move_to_end(store_key)
+            self._size += size
+            while self._size > self.max_objects:
+                _, evicted = self._responses.popitem(last=False)
+                self._size -= _response_size(evicted)
+                self.evictions += 1
+
+    def invalidate(self, namespace=None):
+        """
+        Remove the responses of the namespace, or of all namespaces if
+        namespace is None. The value mappings are removed in any case, since
+        they are shared by all namespaces.
+        """
+        with self._lock:
+            self.valuemappings.clear()
+            if namespace is None:
+                self._responses.clear()
+                self._size = 0
+                return
+            ns = namespace.strip('/').lower()
+            for store_key in [k for k in self._responses if k[0] == ns]:
+                self._size -= _response_size(self._responses.pop(store_key))
+
+    def namespace_sizes(self):
+        """
+        Return a dictionary with the lower case namespace names as keys and
+        tuples of the number of cached responses and the number of CIM objects
+        and names in them as values.
+        """
+        rtn = {}
+        with self._lock:
+            for (ns, _), response in self._responses.items():
+                responses, objects = rtn.get(ns, (0, 0))
+                rtn[ns] = (responses + 1, objects + _response_size(response))
+        return rtn
+
+
+class ClassCache:
+    """
+    Persistent cache of the responses of the class and qualifier declaration
+    requests of one connection definition, organized by namespace.
+
+    The cache files of a namespace are loaded and validated on the first
+    request for the namespace. Changes are written to the cache files by
+    save(). The methods of this class may be called from multiple threads.
+    """
+
+    def __init__(self, cache_dir, max_age=CLASSCACHE_MAX_AGE):
+        """
+        Parameters:
+
+          cache_dir (:term:`string`):
+            Path name of the cache directory of the connection. It is
+            created when the cache is saved.
+
+          max_age (:term:`integer`):
+            Maximum age in seconds of the cache of a namespace.
+        """
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        # Cache entries by lower case namespace name. Each entry is a
+        # dictionary with the items version, url, created, fingerprint and
+        # responses.
+        self._entries = {}
+        self._dirty = set()
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f'ClassCache(cache_dir={self.cache_dir!r})'
+
+    def _cache_file(self, namespace):
+        return os.path.join(self.cache_dir, _namespace_filename(namespace))
+
+    def _load_entry(self, namespace):
+        """
+        Return the entry of the namespace from its cache file, or None if it
+        does not exist or cannot be used.
+        """
+        try:
+            with open(self._cache_file(namespace), 'rb') as fp:
+                entry = pickle.load(fp)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+                ImportError, IndexError, TypeError, ValueError):
+            return None
+        if not isinstance(entry, dict) or \
+                entry.get('version') != CLASSCACHE_VERSION:
+            return None
+        if time.time() - entry['created'] > self.max_age:
+            return None
+        return entry
+
+    def _entry(self, conn, namespace):
+        """
+        Return the valid cache entry of the namespace, loading and validating
+        it on first use.
+
+        The class names and qualifier declarations of the namespace are
+        retrieved from the server (with the uncached EnumerateClassNames and
+        EnumerateQualifiers of the connection class) to check that the loaded
+        cache is still current.
+
+        Raises:
+          pywbem.Error: Retrieving the class names or qualifier declarations
+            failed.
+        """
+        ns = namespace.strip('/').lower()
+        with self._lock:
+            entry = self._entries.get(ns)
+            if entry is not None:
+                return entry
+
+            classnames = pywbem.WBEMConnection.EnumerateClassNames(
+                conn, namespace=namespace, DeepInheritance=True)
+            try:
+                qualifiers = pywbem.WBEMConnection.EnumerateQualifiers(
+                    conn, namespace=namespace)
+            except pywbem.CIMError as exc:
+                if exc.status_code != pywbem.CIM_ERR_NOT_SUPPORTED:
+                    raise
+                qualifiers = None
+            fingerprint = _namespace_fingerprint(classnames, qualifiers)
+
+            entry = self._load_entry(namespace)
+            if entry is None or entry['url'] != conn.url or \
+                    entry['fingerprint'] != fingerprint:
+                entry = {'version': CLASSCACHE_VERSION,
+                         'url': conn.url,
+                         'created': time.time(),
+                         'fingerprint': fingerprint,
+                         'responses': {}}
+                self._dirty.add(ns)
+            # The class names and qualifier declarations are the responses of
+            # the same requests by pywbemcli.
+            entry['responses'][('EnumerateClassNames', None, True)] = \
+                classnames
+            if qualifiers is not None:
+                entry['responses'][('EnumerateQualifiers',)] = qualifiers
+            self._entries[ns] = entry
+            return entry
+
+    def get(self, conn, namespace, key):
+        """
+        Return a tuple (found, response) for the request defined by key in
+        the namespace.
+
+        Raises:
+          pywbem.Error: Validating the cache of the namespace failed.
+        """
+        entry = self._entry(conn, namespace)
+        with self._lock:
+            if key in entry['responses']:
+                return True, entry['responses'][key]
+        return False, None
+
+    def put(self, namespace, key, response):
+        """
+        Save the response of the request defined by key in the namespace.
+        The namespace must have been accessed with get() before.
+        """
+        ns = namespace.strip('/').lower()
+        with self._lock:
+            entry = self._entries.get(ns)
+            if entry is not None:
+                entry['responses'][key] = response
+                self._dirty.add(ns)
+
+    def invalidate(self, namespace=None):
+        """
+        Remove the cached responses of the namespace, or of all namespaces if
+        namespace is None, including the cache files.
+
+        Raises:
+          OSError: Cache file cannot be deleted.
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._dirty.clear()
+                file_list = glob.glob(os.path.join(self.cache_dir, '*.pkl'))
+            else:
+                ns = namespace.strip('/').lower()
+                self._entries.pop(ns, None)
+                self._dirty.discard(ns)
+                file_list = [self._cache_file(namespace)]
+            for file_path in file_list:
+                if os.path.isfile(file_path):
+                    os.remove(file_path)
+
+    def save(self):
+        """
+        Write the changed namespace entries to their cache files. Each file is
+        written to a temporary file first and then renamed, so that
+        concurrently running pywbemcli processes never see partial files.
+
+        Raises:
+          OSError: Cache directory or file cannot be written.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for ns in sorted(self._dirty):
+                cache_file = self._cache_file(ns)
+                tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+                with open(tmp_file, 'wb') as fp:
+                    pickle.dump(self._entries[ns], fp, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+            self._dirty.clear()
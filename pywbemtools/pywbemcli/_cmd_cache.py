@@ -0,0 +1,209 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Click command definition for the cache command group which includes
+cmds for managing the caches of classes retrieved from the WBEM server.
+
+NOTE: Commands are ordered in help display by their order in this file.
+"""
+
+
+import click
+
+from .pywbemcli import cli
+from ._class_cache import ClassCache
+from .._click_extensions import PywbemtoolsGroup, PywbemtoolsCommand, \
+    CMD_OPTS_TXT, GENERAL_OPTS_TXT, SUBCMD_HELP_TXT
+from .._options import add_options, help_option
+from .._output_formatting import validate_output_format, format_table
+
+
+@cli.group('cache', cls=PywbemtoolsGroup, options_metavar=GENERAL_OPTS_TXT,
+           subcommand_metavar=SUBCMD_HELP_TXT)
+@add_options(help_option)
+def cache_group():
+    """
+    Command group for the class caches.
+
+    This command group defines commands to inspect and clear the caches of the
+    classes and qualifier declarations that pywbemcli retrieved from the
+    current WBEM server.
+
+    Pywbemcli keeps the classes and qualifier declarations retrieved on a
+    connection in an in-session class store with a size limit and least
+    recently used eviction, so that in interactive mode subsequent commands
+    do not retrieve them again. The class store is cleared automatically by
+    the 'class delete', 'server add-mof' and 'server remove-mof' commands.
+    It can be disabled with the '--no-class-store' general option.
+
+    If the '--class-cache' general option is set, the classes and qualifier
+    declarations retrieved from a WBEM server are also cached on disk per
+    connection and namespace, so that subsequent pywbemcli processes do not
+    retrieve them again.
+
+    In addition to the command-specific options shown in this help text, the
+    general options (see 'pywbemcli --help') can also be specified before the
+    'cache' keyword.
+    """
+    pass  # pylint: disable=unnecessary-pass
+
+
+@cache_group.command('show', cls=PywbemtoolsCommand,
+                     options_metavar=CMD_OPTS_TXT)
+@add_options(help_option)
+@click.pass_obj
+def cache_show(context):
+    """
+    Show the class caches of the current server.
+
+    Display the number of cached requests and CIM objects per namespace in
+    the in-session class store of the current connection, the hit and miss
+    counts of the class store, and the directory of the on-disk class cache
+    (see the '--class-cache' general option).
+
+    The in-session class store is empty until the current connection has been
+    used (e.g. by previous commands in interactive mode).
+
+    Example:
+
+      pywbemcli> cache show
+    """
+    context.execute_cmd(lambda: cmd_cache_show(context))
+
+
+@cache_group.command('clear', cls=PywbemtoolsCommand,
+                     options_metavar=CMD_OPTS_TXT)
+@click.option('-n', '--namespace', type=str,
+              required=False, metavar='NAMESPACE',
+              help='Namespace whose cached classes are removed. '
+                   'Default: All namespaces.')
+@add_options(help_option)
+@click.pass_obj
+def cache_clear(context, **options):
+    """
+    Remove the cached classes of the current server.
+
+    Remove the cached classes and qualifier declarations of the current
+    server for the specified namespace (--namespace option) or for all
+    namespaces, from the in-session class store of the current connection
+    and from the on-disk class cache (see the '--class-cache' general option).
+    The next commands retrieve the classes from the WBEM server again.
+
+    Example:
+
+      pywbemcli -s https://srv cache clear -n root/cimv2
+    """
+    context.execute_cmd(lambda: cmd_cache_clear(context, options))
+
+
+####################################################################
+#
+#  Common functions for cmd_cache processing
+#  This includes functions that are common to multiple cmd_cache functions
+#
+#####################################################################
+
+
+def get_class_store(context):
+    """
+    Return the ClassStore object of the current connection, or None if not
+    connected. Does not connect to the server.
+    """
+    if context.is_connected():
+        return context.pywbem_server.class_store
+    return None
+
+
+def get_class_cache(context):
+    """
+    Return the ClassCache object of the current server, or None for mock
+    environments. If connected with the class cache enabled, that is the class
+    cache of the connection, so that its in-memory state is cleared as well.
+    """
+    pywbem_server = context.pywbem_server
+    if pywbem_server.mock_server:
+        return None
+    if context.is_connected():
+        class_cache = getattr(pywbem_server.conn, 'class_cache', None)
+        if class_cache is not None:
+            return class_cache
+    return ClassCache(pywbem_server.class_cache_dir)
+
+
+#####################################################################
+#
+#  cmd_cache_<action> processors for each cmd_cache action
+#
+#####################################################################
+
+
+def cmd_cache_show(context):
+    """
+    Display the class store of the current connection and the directory of
+    the on-disk class cache.
+    """
+    output_fmt = validate_output_format(context.output_format, 'TABLE')
+
+    class_store = get_class_store(context)
+    class_cache = get_class_cache(context)
+
+    rows = []
+    if class_store is None:
+        title = 'Class store: not connected' \
+            if context.class_store else 'Class store: disabled'
+    else:
+        title = (f'Class store: {class_store.size} of '
+                 f'{class_store.max_objects} objects, {class_store.hits} '
+                 f'hits, {class_store.misses} misses, '
+                 f'{class_store.evictions} evictions')
+        for ns, sizes in sorted(class_store.namespace_sizes().items()):
+            rows.append([ns, sizes[0], sizes[1]])
+
+    context.spinner_stop()
+    click.echo(format_table(rows, ['Namespace', 'Requests', 'Objects'],
+                            title=title, table_format=output_fmt))
+    if class_cache is None:
+        click.echo('Class cache: not used for mock environments')
+    else:
+        state = 'enabled' if context.class_cache else 'disabled'
+        click.echo(f'Class cache ({state}): {class_cache.cache_dir}')
+
+
+def cmd_cache_clear(context, options):
+    """
+    Remove the cached classes of the current server for a namespace or for
+    all namespaces from the class store and the on-disk class cache.
+    """
+    namespace = options['namespace']
+
+    class_store = get_class_store(context)
+    if class_store is not None:
+        class_store.invalidate(namespace)
+
+    class_cache = get_class_cache(context)
+    if class_cache is not None:
+        try:
+            class_cache.invalidate(namespace)
+        except OSError as exc:
+            raise click.ClickException(
+                f"Cannot remove class cache in {class_cache.cache_dir}: "
+                f"{exc}")
+
+    if context.verbose:
+        context.spinner_stop()
+        click.echo("Removed class store entries of the connection")
+        if class_cache is not None:
+            click.echo(f"Removed class cache in {class_cache.cache_dir}")
@@ -36,7 +36,7 @@ from ._common import filter_namelist, resolve_propertylist, \
     depending_classnames
 
 from ._common_cmd_functions import get_namespaces, enumerate_classes_filtered, \
-    ResultsHandler
+    ResultsHandler, invalidate_class_store
 
 from ._common_options import propertylist_option, names_only_option, \
     include_classorigin_class_option, namespace_option, summary_option, \
@@ -583,22 +583,25 @@ def cmd_class_get(context, classname, options):
     the class. If the class cannot be found, the server returns a CIMError
     exception.
     """
-    conn = context.pywbem_server.conn
     format_group = get_format_group(context, options)
     output_format = validate_output_format(context.output_format, format_group)
 
     results = ResultsHandler(context, options, output_format, "class",
                              classname)
 
-    for ns in results:
+    def get_request(conn, ns):
+        """Get the class in namespace ns"""
+        return conn.GetClass(
+            classname,
+            namespace=ns,
+            LocalOnly=options['local_only'],
+            IncludeQualifiers=not options['no_qualifiers'],
+            IncludeClassOrigin=options['include_classorigin'],
+            PropertyList=resolve_propertylist(options['propertylist']))
+
+    for ns, get_result in results.execute(get_request):
         try:
-            results.add(conn.GetClass(
-                classname,
-                namespace=ns,
-                LocalOnly=options['local_only'],
-                IncludeQualifiers=not options['no_qualifiers'],
-                IncludeClassOrigin=options['include_classorigin'],
-                PropertyList=resolve_propertylist(options['propertylist'])))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -635,10 +638,14 @@ def cmd_class_enumerate(context, classname, options):
     results = ResultsHandler(context, options, output_format, "class",
                              classname)
 
-    for ns in results:
+    def enumerate_request(conn, ns):
+        """Enumerate the classes or classnames in namespace ns"""
+        return enumerate_classes_filtered(context, ns, classname, options,
+                                          conn=conn)
+
+    for ns, get_result in results.execute(enumerate_request):
         try:
-            results.add(enumerate_classes_filtered(
-                context, ns, classname, options))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -656,29 +663,31 @@ def cmd_class_references(context, classname, options):
     Execute the references request operation to get references for
     the classname defined
     """
-    conn = context.pywbem_server.conn
     format_group = get_format_group(context, options)
     output_format = validate_output_format(context.output_format, format_group)
 
     results = ResultsHandler(context, options, output_format, "class",
                              classname)
 
-    for ns in results:
+    def references_request(conn, ns):
+        """Get the references of the class in namespace ns"""
+        cln = CIMClassName(classname, namespace=ns)
+        if options['names_only']:
+            return conn.ReferenceNames(
+                cln,
+                ResultClass=options['result_class'],
+                Role=options['role'])
+        return conn.References(
+            cln,
+            ResultClass=options['result_class'],
+            Role=options['role'],
+            IncludeQualifiers=not options['no_qualifiers'],
+            IncludeClassOrigin=options['include_classorigin'],
+            PropertyList=resolve_propertylist(options['propertylist']))
+
+    for ns, get_result in results.execute(references_request):
         try:
-            cln = CIMClassName(classname, namespace=ns)
-            if options['names_only']:
-                results.add(conn.ReferenceNames(
-                    cln,
-                    ResultClass=options['result_class'],
-                    Role=options['role']))
-            else:
-                results.add(conn.References(
-                    cln,
-                    ResultClass=options['result_class'],
-                    Role=options['role'],
-                    IncludeQualifiers=not options['no_qualifiers'],
-                    IncludeClassOrigin=options['include_classorigin'],
-                    PropertyList=resolve_propertylist(options['propertylist'])))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -696,34 +705,35 @@ def cmd_class_associators(context, classname, options):
     Execute the references request operation to get references for
     the classname defined
     """
-    conn = context.pywbem_server.conn
-
     format_group = get_format_group(context, options)
     output_format = validate_output_format(context.output_format, format_group)
 
     results = ResultsHandler(context, options, output_format, "class",
                              classname)
 
-    for ns in results:
+    def associators_request(conn, ns):
+        """Get the associators of the class in namespace ns"""
+        cln = CIMClassName(classname, namespace=ns)
+        if options['names_only']:
+            return conn.AssociatorNames(
+                cln,
+                AssocClass=options['assoc_class'],
+                Role=options['role'],
+                ResultClass=options['result_class'],
+                ResultRole=options['result_role'])
+        return conn.Associators(
+            cln,
+            AssocClass=options['assoc_class'],
+            Role=options['role'],
+            ResultClass=options['result_class'],
+            ResultRole=options['result_role'],
+            IncludeQualifiers=not options['no_qualifiers'],
+            IncludeClassOrigin=options['include_classorigin'],
+            PropertyList=resolve_propertylist(options['propertylist']))
+
+    for ns, get_result in results.execute(associators_request):
         try:
-            cln = CIMClassName(classname, namespace=ns)
-            if options['names_only']:
-                results.add(conn.AssociatorNames(
-                    cln,
-                    AssocClass=options['assoc_class'],
-                    Role=options['role'],
-                    ResultClass=options['result_class'],
-                    ResultRole=options['result_role']))
-            else:
-                results.add(conn.Associators(
-                    cln,
-                    AssocClass=options['assoc_class'],
-                    Role=options['role'],
-                    ResultClass=options['result_class'],
-                    ResultRole=options['result_role'],
-                    IncludeQualifiers=not options['no_qualifiers'],
-                    IncludeClassOrigin=options['include_classorigin'],
-                    PropertyList=resolve_propertylist(options['propertylist'])))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -944,4 +954,6 @@ def cmd_class_delete(context, classname, options):
             raise pywbem_error_exception(
                 exc,
                 f"Cannot delete class {classname} in namespace {namespace}")
+        finally:
+            invalidate_class_store(context, namespace)
     click.echo(f'{dry_run_prefix}Deleted class {classname}')
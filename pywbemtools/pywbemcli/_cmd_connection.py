@@ -787,7 +787,11 @@ def cmd_connection_select(context, name, options):
                          context.warn,
                          context.connections_repo,
                          context.interactive_mode,
-                         False)
+                         False,
+                         max_parallel=context.max_parallel,
+                         class_cache=context.class_cache,
+                         class_store=context.class_store,
+                         pull_target_time=context.pull_target_time)
 
     # Update the root context making this context the basis for future
     # commands in the current interactive session
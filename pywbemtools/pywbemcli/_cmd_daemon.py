@@ -0,0 +1,565 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Click command definition for the daemon command group which includes
+cmds for starting, stopping and inspecting the pywbemcli daemon, and the
+implementation of the daemon.
+
+NOTE: Commands are ordered in help display by their order in this file.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import signal
+import traceback
+import subprocess
+import socketserver
+from collections import OrderedDict
+from datetime import datetime
+
+import click
+
+from .pywbemcli import cli
+from .config import DAEMON_MAX_CONNECTIONS, DAEMON_STARTUP_TIMEOUT, \
+    DAEMON_STOP_TIMEOUT
+from ._context_obj import ContextObj
+from ._connection_pool import reset_statistics
+from ._daemon import CLIENT_ENVVAR_PREFIXES, daemon_supported, \
+    daemon_socket_path, daemon_control, send_message, receive_message, \
+    set_daemon
+from .._click_extensions import PywbemtoolsGroup, PywbemtoolsCommand, \
+    CMD_OPTS_TXT, GENERAL_OPTS_TXT, SUBCMD_HELP_TXT
+from .._options import add_options, help_option
+from .._output_formatting import validate_output_format, format_table
+from .._utils import get_terminal_width
+
+
+@cli.group('daemon', cls=PywbemtoolsGroup, options_metavar=GENERAL_OPTS_TXT,
+           subcommand_metavar=SUBCMD_HELP_TXT)
+@add_options(help_option)
+def daemon_group():
+    """
+    Command group for the pywbemcli daemon.
+
+    This command group defines commands to start, stop and inspect the
+    pywbemcli daemon.
+
+    The pywbemcli daemon is a background process that executes the pywbemcli
+    commands that are specified with the '--via-daemon' general option. It
+    keeps the connections to the WBEM servers open between the commands,
+    together with the classes and qualifier declarations retrieved on them
+    and the mock environments, so that repeated invocations of pywbemcli
+    (e.g. from scripts) do not pay for importing pywbemcli, connecting and
+    retrieving the classes again. The connections are identified by their
+    connection definition including the general options, and the least
+    recently used connections are closed when there are more than
+    {max_conn} of them.
+
+    As in interactive mode, changes of a mock environment by a command are
+    seen by the subsequent commands using the same mock environment.
+
+    The daemon executes one command at a time, in the current directory and
+    with the pywbemcli environment variables of the command. It listens on a
+    Unix domain socket that only the user can access, in the directory of
+    the default connections file or as defined in the
+    PYWBEMCLI_DAEMON_SOCKET environment variable.
+
+    In addition to the command-specific options shown in this help text, the
+    general options (see 'pywbemcli --help') can also be specified before the
+    'daemon' keyword.
+    """
+    pass  # pylint: disable=unnecessary-pass
+
+
+# The help text contains the maximum number of connections
+daemon_group.help = daemon_group.help.replace(
+    '{max_conn}', str(DAEMON_MAX_CONNECTIONS))
+
+
+@daemon_group.command('start', cls=PywbemtoolsCommand,
+                      options_metavar=CMD_OPTS_TXT)
+@add_options(help_option)
+@click.pass_obj
+def daemon_start(context):
+    """
+    Start the pywbemcli daemon.
+
+    Start the pywbemcli daemon as a background process and wait until it
+    accepts commands.
+
+    Example:
+
+      pywbemcli daemon start
+
+      pywbemcli --via-daemon -n mysrv class enumerate
+    """
+    context.execute_cmd(lambda: cmd_daemon_start(context))
+
+
+@daemon_group.command('stop', cls=PywbemtoolsCommand,
+                      options_metavar=CMD_OPTS_TXT)
+@add_options(help_option)
+@click.pass_obj
+def daemon_stop(context):
+    """
+    Stop the pywbemcli daemon.
+
+    Stop the pywbemcli daemon after the command it currently executes, and
+    close its connections.
+
+    Example:
+
+      pywbemcli daemon stop
+    """
+    context.execute_cmd(lambda: cmd_daemon_stop(context))
+
+
+@daemon_group.command('status', cls=PywbemtoolsCommand,
+                      options_metavar=CMD_OPTS_TXT)
+@add_options(help_option)
+@click.pass_obj
+def daemon_status(context):
+    """
+    Show the status of the pywbemcli daemon.
+
+    Display whether the pywbemcli daemon is running, and if so, its process
+    ID, the number of commands it executed and its connections.
+
+    Example:
+
+      pywbemcli daemon status
+    """
+    context.execute_cmd(lambda: cmd_daemon_status(context))
+
+
+@daemon_group.command('run', cls=PywbemtoolsCommand,
+                      options_metavar=CMD_OPTS_TXT)
+@add_options(help_option)
+@click.pass_obj
+def daemon_run(context):
+    """
+    Run the pywbemcli daemon in the foreground.
+
+    Run the pywbemcli daemon in this process until it is stopped with the
+    'daemon stop' command, a keyboard interrupt or the SIGTERM signal. This
+    is used by the 'daemon start' command, and can be used for running the
+    daemon under a service manager or for seeing its errors.
+
+    Example:
+
+      pywbemcli daemon run
+    """
+    context.execute_cmd(lambda: cmd_daemon_run(context))
+
+
+####################################################################
+#
+#  Implementation of the pywbemcli daemon
+#
+#####################################################################
+
+
+class _MessageWriter(io.TextIOBase):
+    """
+    Text stream that is used as sys.stdout or sys.stderr of a command executed
+    by the daemon. Each write is sent to the client of the command as a
+    message with the stream name as the item name.
+    """
+    encoding = 'utf-8'
+    errors = 'strict'
+
+    def __init__(self, wfile, stream_name):
+        super().__init__()
+        self._wfile = wfile
+        self._stream_name = stream_name
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        if not isinstance(s, str):
+            raise TypeError(f"write() argument must be str, not "
+                            f"{type(s).__name__}")
+        if s:
+            send_message(self._wfile, {self._stream_name: s})
+        return len(s)
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler for a request from a client of the daemon: A command to be
+    executed or a control request of a daemon command.
+    """
+
+    def handle(self):
+        request = receive_message(self.rfile)
+        if request is None:
+            return
+        if 'control' in request:
+            send_message(self.wfile, self.server.control(request['control']))
+            return
+        exit_code = self.server.execute(
+            request['args'], request['cwd'], request['env'], self.wfile)
+        send_message(self.wfile, {'exit_code': exit_code})
+
+
+def connection_key(pywbem_server, log, class_cache, class_store,
+                   pull_target_time):
+    """
+    Return the key that identifies the connection of the PywbemServer object
+    in the daemon: The connection definition including the general options
+    that are used when connecting, and the modification times of the mock
+    files, so that a changed mock file causes a new mock environment to be
+    built.
+    """
+    definition = pywbem_server.to_dict()
+    mock_files = []
+    for file_path in pywbem_server.mock_server or []:
+        file_path = os.path.abspath(file_path)
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        mock_files.append((file_path, mtime))
+    definition['mock-server'] = mock_files
+    # pylint: disable=protected-access
+    definition['connections-file'] = pywbem_server._connections_file
+    definition['log'] = log
+    definition['class-cache'] = bool(class_cache)
+    definition['class-store'] = class_store is None or bool(class_store)
+    definition['pull-target-time'] = pull_target_time
+    return json.dumps(definition, sort_keys=True)
+
+
+class PywbemcliDaemon(socketserver.UnixStreamServer):
+    """
+    The pywbemcli daemon: A Unix domain socket server that executes the
+    pywbemcli commands sent to it one at a time, and keeps the PywbemServer
+    objects used by the commands, in least recently used order.
+    """
+
+    # Seconds after which handle_request() returns if there is no request,
+    # so that a stop request by a signal is detected.
+    timeout = 0.5
+
+    def __init__(self, socket_path, max_connections=DAEMON_MAX_CONNECTIONS):
+        self.socket_path = socket_path
+        self.max_connections = max_connections
+        self.started = datetime.now()
+        self.commands = 0
+        self.stop_requested = False
+        # PywbemServer objects by connection key, least recently used first.
+        self._servers = OrderedDict()
+        super().__init__(socket_path, _DaemonRequestHandler)
+
+    def server_bind(self):
+        """
+        Create the socket file so that only the user can connect to the
+        daemon, since the daemon executes the commands as the user.
+        """
+        saved_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(saved_umask)
+
+    def handle_error(self, request, client_address):
+        """
+        Ignore clients that disconnect before the command completed (e.g.
+        because of a keyboard interrupt).
+        """
+        if isinstance(sys.exc_info()[1],
+                      (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+    def serve(self):
+        """
+        Execute the requests until the daemon is requested to stop.
+        """
+        while not self.stop_requested:
+            self.handle_request()
+
+    def close(self):
+        """
+        Disconnect the connections of the daemon, close its socket and remove
+        the socket file. Must be called in a click context.
+        """
+        while self._servers:
+            _, pywbem_server = self._servers.popitem(last=False)
+            if pywbem_server.connected:
+                pywbem_server.disconnect()
+        self.server_close()
+        try:
+            os.remove(self.socket_path)
+        except OSError:
+            pass
+
+    def get_server(self, pywbem_server, log, class_cache, class_store,
+                   pull_target_time):
+        """
+        Return the PywbemServer object to be used by a command with the
+        PywbemServer object created from its connection definition and
+        general options: An object from a previous command with the same
+        connection, or pywbem_server which is then kept for subsequent
+        commands.
+
+        The operation statistics of a connection from a previous command are
+        reset, so that they show the operations of the current command as in
+        command mode.
+        """
+        key = connection_key(pywbem_server, log, class_cache, class_store,
+                             pull_target_time)
+        kept_server = self._servers.pop(key, None)
+        if kept_server is not None:
+            self._servers[key] = kept_server
+            if kept_server.connected:
+                reset_statistics(kept_server.conn)
+            return kept_server
+
+        self._servers[key] = pywbem_server
+        while len(self._servers) > self.max_connections:
+            _, old_server = self._servers.popitem(last=False)
+            if old_server.connected:
+                old_server.disconnect()
+        return pywbem_server
+
+    def control(self, control):
+        """
+        Execute a control request of a daemon command and return the
+        response.
+        """
+        if control == 'status':
+            connections = []
+            for pywbem_server in reversed(self._servers.values()):
+                connections.append({
+                    'name': pywbem_server.name,
+                    'server': pywbem_server.server or
+                    ', '.join(pywbem_server.mock_server),
+                    'namespace': pywbem_server.default_namespace,
+                    'connected': pywbem_server.connected})
+            return {'pid': os.getpid(),
+                    'socket': self.socket_path,
+                    'started': self.started.strftime('%Y-%m-%d %H:%M:%S'),
+                    'commands': self.commands,
+                    'connections': connections}
+        if control == 'stop':
+            self.stop_requested = True
+            return {'stopping': True}
+        return {'error': f"Invalid control request: {control}"}
+
+    def execute(self, args, cwd, env, wfile):
+        """
+        Execute the pywbemcli command with the command line arguments args
+        in the directory cwd and with the pywbemcli environment variables in
+        env, sending its output to the client in wfile. Returns the exit code
+        of the command.
+        """
+        self.commands += 1
+        saved_cwd = os.getcwd()
+        saved_environ = dict(os.environ)
+        saved_stdout = sys.stdout
+        saved_stderr = sys.stderr
+        sys.stdout = _MessageWriter(wfile, 'stdout')
+        sys.stderr = _MessageWriter(wfile, 'stderr')
+        try:
+            for name in list(os.environ):
+                if name.startswith(CLIENT_ENVVAR_PREFIXES) or \
+                        name in ('COLUMNS', 'LINES'):
+                    del os.environ[name]
+            os.environ.update(env)
+            # The spinner would be sent to the client as output.
+            os.environ[ContextObj.spinner_envvar] = '0'
+            os.chdir(cwd)
+            cli.main(args, prog_name='pywbemcli',
+                     terminal_width=get_terminal_width())
+            exit_code = 0
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                exit_code = exc.code or 0
+            else:
+                click.echo(exc.code, err=True)
+                exit_code = 1
+        except OSError as exc:
+            click.echo(f"Error: {exc}", err=True)
+            exit_code = 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            # As for pywbemcli in command mode
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout = saved_stdout
+            sys.stderr = saved_stderr
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_environ)
+        return exit_code
+
+
+#####################################################################
+#
+#  cmd_daemon_<action> processors for each cmd_daemon action
+#
+#####################################################################
+
+
+def validate_daemon_supported():
+    """
+    Raise ClickException if the daemon is not supported on this platform.
+    """
+    if not daemon_supported():
+        raise click.ClickException(
+            "The pywbemcli daemon is not supported on this platform")
+
+
+def cmd_daemon_start(context):
+    """
+    Start the daemon as a background process running the 'daemon run'
+    command, and wait until it answers control requests.
+    """
+    validate_daemon_supported()
+    socket_path = daemon_socket_path()
+    if daemon_control('status', socket_path) is not None:
+        raise click.ClickException(
+            f"The pywbemcli daemon is already running on socket {socket_path}")
+
+    context.spinner_stop()
+
+    # pylint: disable=consider-using-with
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'pywbemtools.pywbemcli', 'daemon', 'run'],
+        shell=False,
+        start_new_session=True,
+        close_fds=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL)
+
+    end_time = time.time() + DAEMON_STARTUP_TIMEOUT
+    while True:
+        status = daemon_control('status', socket_path)
+        if status is not None:
+            break
+        exit_code = proc.poll()
+        if exit_code is not None:
+            raise click.ClickException(
+                f"The pywbemcli daemon failed to start with exit code "
+                f"{exit_code}. Use the 'daemon run' command to see the "
+                "error.")
+        if time.time() > end_time:
+            proc.terminate()
+            raise click.ClickException(
+                "The pywbemcli daemon did not start within "
+                f"{DAEMON_STARTUP_TIMEOUT} seconds")
+        time.sleep(0.05)
+
+    click.echo(f"Started pywbemcli daemon (process {status['pid']}) on "
+               f"socket {status['socket']}")
+
+
+def cmd_daemon_stop(context):
+    """
+    Request the daemon to stop and wait until it no longer answers control
+    requests.
+    """
+    validate_daemon_supported()
+    socket_path = daemon_socket_path()
+    if daemon_control('stop', socket_path) is None:
+        raise click.ClickException(
+            f"The pywbemcli daemon is not running on socket {socket_path}")
+
+    context.spinner_stop()
+    end_time = time.time() + DAEMON_STOP_TIMEOUT
+    while os.path.exists(socket_path):
+        if time.time() > end_time:
+            raise click.ClickException(
+                "The pywbemcli daemon did not stop within "
+                f"{DAEMON_STOP_TIMEOUT} seconds. Its socket file "
+                f"{socket_path} still exists.")
+        time.sleep(0.05)
+    click.echo("Stopped pywbemcli daemon")
+
+
+def cmd_daemon_status(context):
+    """
+    Display the status of the daemon and its connections.
+    """
+    validate_daemon_supported()
+    output_fmt = validate_output_format(context.output_format, 'TABLE')
+    socket_path = daemon_socket_path()
+    status = daemon_control('status', socket_path)
+
+    context.spinner_stop()
+    if status is None:
+        click.echo(f"The pywbemcli daemon is not running on socket "
+                   f"{socket_path}")
+        return
+
+    click.echo(f"The pywbemcli daemon is running (process {status['pid']}) "
+               f"on socket {status['socket']} since {status['started']} and "
+               f"executed {status['commands']} commands")
+    rows = [[conn['name'], conn['server'], conn['namespace'],
+             'yes' if conn['connected'] else 'no']
+            for conn in status['connections']]
+    click.echo(format_table(
+        rows, ['Name', 'Server', 'Default\nnamespace', 'Connected'],
+        title='Daemon connections (most recently used first)',
+        table_format=output_fmt))
+
+
+def cmd_daemon_run(context):
+    """
+    Run the daemon in this process until it is requested to stop.
+    """
+    validate_daemon_supported()
+    socket_path = daemon_socket_path()
+    if daemon_control('status', socket_path) is not None:
+        raise click.ClickException(
+            f"The pywbemcli daemon is already running on socket {socket_path}")
+
+    # Remove the socket file of a daemon that did not terminate normally.
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    try:
+        daemon = PywbemcliDaemon(socket_path)
+    except OSError as exc:
+        raise click.ClickException(
+            f"Cannot create the socket {socket_path} of the pywbemcli "
+            f"daemon: {exc}")
+
+    def term_signal_handler(sig, frame):
+        # pylint: disable=unused-argument
+        daemon.stop_requested = True
+
+    context.spinner_stop()
+    saved_handler = signal.signal(signal.SIGTERM, term_signal_handler)
+    set_daemon(daemon)
+    if context.verbose:
+        click.echo(f"pywbemcli daemon (process {os.getpid()}) running on "
+                   f"socket {socket_path}")
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        set_daemon(None)
+        signal.signal(signal.SIGTERM, saved_handler)
+        daemon.close()
+    if context.verbose:
+        click.echo("pywbemcli daemon stopped")
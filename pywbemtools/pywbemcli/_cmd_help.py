@@ -25,6 +25,7 @@ with the particular subject.
 
 
 import click
+import click.shell_completion
 
 from .._click_extensions import GENERAL_OPTS_TXT
 
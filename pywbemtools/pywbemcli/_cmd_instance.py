@@ -25,13 +25,14 @@ import click
 
 from pywbem import CIMInstanceName, CIMClassName, Error, CIMError, \
     CIM_ERR_NOT_FOUND
+from pywbem._nocasedict import NocaseDict
 
 from .pywbemcli import cli
 from ._common import pick_instance, resolve_propertylist, create_ciminstance, \
     filter_namelist, verify_operation, process_invokemethod, \
     pywbem_error_exception, parse_kv_pair
 
-from ._display_cimobjects import display_cim_objects
+from ._display_cimobjects import display_cim_objects, MIN_CELL_WIDTH
 
 from ._common_options import propertylist_option, names_only_option, \
     include_classorigin_instance_option, namespace_option, summary_option, \
@@ -42,8 +43,11 @@ from ._common_options import propertylist_option, names_only_option, \
 from ._cimvalueformatter import mof_escaped
 
 from ._association_shrub import AssociationShrub
+from ._connection_pool import ConnectionPool
+from ._pywbemcli_operations import limited, limit_max_object_count
+from ._where_filter import WhereFilter
 
-from .config import DEFAULT_QUERY_LANGUAGE
+from .config import DEFAULT_QUERY_LANGUAGE, COUNT_MAXPULLCNT
 from ._common_cmd_functions import get_namespaces, enumerate_classes_filtered, \
     ResultsHandler
 from .._click_extensions import PywbemtoolsGroup, PywbemtoolsCommand, \
@@ -149,6 +153,34 @@ filter_query_option = [              # pylint: disable=invalid-name
                       'By default, and when traditional operations are used, '
                       'no such filtering takes place.')]
 
+where_option = [              # pylint: disable=invalid-name
+    click.option('--where', 'where', type=str, metavar='EXPRESSION',
+                 default=None,
+                 help='Filter the instances or instance paths by a boolean '
+                      'expression on their property values, e.g. '
+                      '"IntegerProp >= 5 AND InstanceID =~ \'^CIM_Foo\'". '
+                      'When pull operations are used, the parts of the '
+                      'expression that can be expressed in DMTF:FQL are '
+                      'passed to the server as filter query (combined with '
+                      '--filter-query) and the other parts are evaluated by '
+                      'pywbemcli on the received objects; otherwise the '
+                      'complete expression is evaluated by pywbemcli. The '
+                      'expression is evaluated on the instances before they '
+                      'are reduced to the --propertylist properties or to '
+                      'their paths (--names-only). --verbose shows which '
+                      'parts were passed to the server. '
+                      'Default: No filtering.')]
+
+where_query_option = [              # pylint: disable=invalid-name
+    click.option('--where', 'where', type=str, metavar='EXPRESSION',
+                 default=None,
+                 help='Filter the returned instances by a boolean expression '
+                      'on their property values, as described for the '
+                      '--where option of the instance enumerate command. '
+                      'The expression is evaluated by pywbemcli on the '
+                      'instances as they are received. '
+                      'Default: No filtering.')]
+
 help_instancename_option = [              # pylint: disable=invalid-name
     click.option('--hi', '--help-instancename', 'help_instancename',
                  is_flag=True, required=False, is_eager=True,
@@ -162,6 +194,62 @@ show_null_option = [              # pylint: disable=invalid-name
                       'displayed. Otherwise only properties at least '
                       'one instance has a non-Null property are displayed')]
 
+stream_option = [              # pylint: disable=invalid-name
+    click.option('--stream', 'stream', is_flag=True, required=False,
+                 help='Display the returned objects as they are received '
+                      'from the server instead of after all of them have '
+                      'been received, so that memory usage is bounded by '
+                      'the pull operation chunk size. The next chunk is '
+                      'retrieved while the current chunk is displayed. '
+                      'The objects are not '
+                      'sorted and namespaces are displayed in the order '
+                      'specified. The plain, simple, psql, grid and table '
+                      'output formats display each table row as it is '
+                      'received, with one table per class whose columns '
+                      'and column widths are determined from the class '
+                      'definition; the other table output formats display '
+                      'one table per received chunk. '
+                      'Default: Receive all objects, then sort and display '
+                      'them.')]
+
+limit_option = [              # pylint: disable=invalid-name
+    click.option('--limit', 'limit', type=click.IntRange(min=1),
+                 required=False, metavar='INTEGER',
+                 help='Retrieve only the first INTEGER objects returned by '
+                      'the server in each namespace. When pull operations '
+                      'are used, the enumeration is then closed on the '
+                      'server. The retrieved objects are sorted as usual. '
+                      'Default: Retrieve all objects.')]
+
+partition_by_subclass_option = [              # pylint: disable=invalid-name
+    click.option('--partition-by-subclass', 'partition_by_subclass',
+                 is_flag=True, required=False,
+                 help='Enumerate the instances of each subtree of the '
+                      'subclass hierarchy of CLASSNAME below its abstract '
+                      'classes with a separate request, with up to '
+                      '--max-parallel requests executing concurrently on '
+                      'copies of the connection, so that the providers of '
+                      'the classes can work in parallel on the server. The '
+                      'result is the same as with one request. Since a WBEM '
+                      'server returns the instances of the subclasses with '
+                      'those of a class, a non-abstract class is enumerated '
+                      'together with its subclasses. Requires '
+                      '--deep-inheritance or --names-only. Not allowed with '
+                      '--stream. '
+                      'Default: Enumerate the instances with one request.')]
+
+max_cell_width_option = [              # pylint: disable=invalid-name
+    click.option('--max-cell-width', 'max_cell_width',
+                 type=click.IntRange(min=MIN_CELL_WIDTH), required=False,
+                 metavar='INTEGER',
+                 help='In the TABLE output formats, the maximum width of the '
+                      'cells of the table. Longer values are folded. With '
+                      '--stream, this is also the width of the columns for '
+                      'values without a length limit in the class '
+                      'definition (Default: 30). '
+                      f'Minimum: {MIN_CELL_WIDTH}. Default: Terminal width '
+                      'divided by the number of columns.')]
+
 
 ##########################################################################
 #
@@ -203,8 +291,13 @@ def instance_group():
 @add_options(summary_option)
 @add_options(filter_query_option)
 @add_options(filter_query_language_option)
+@add_options(where_option)
 @add_options(show_null_option)
 @add_options(object_order_option)
+@add_options(limit_option)
+@add_options(stream_option)
+@add_options(partition_by_subclass_option)
+@add_options(max_cell_width_option)
 @add_options(help_option)
 @click.pass_obj
 def instance_enumerate(context, classname, **options):
@@ -217,7 +310,8 @@ def instance_enumerate(context, classname, **options):
     if --names-only was specified. If no namespace was specified, the default
     namespace of the connection is used.
 
-    The instances to be retrieved can be filtered by the --filter-query option.
+    The instances to be retrieved can be filtered by the --filter-query and
+    --where options.
 
     The --local-only, --deep-inheritance, --include-qualifiers,
     --include-classorigin, and --propertylist options determine which parts
@@ -225,6 +319,18 @@ def instance_enumerate(context, classname, **options):
 
     The --names-only option can be used to show only the instance paths.
 
+    The --limit option retrieves only the first instances or instance paths
+    returned by the server.
+
+    The --stream option displays the instances or instance paths as they are
+    received instead of collecting and sorting all of them first. The
+    --max-cell-width option limits the width of the table cells.
+
+    The --partition-by-subclass option splits the enumeration into one request
+    per subtree of the subclass hierarchy of CLASSNAME below its abstract
+    classes, that are executed concurrently if the --max-parallel general
+    option is greater than 1.
+
     In the output, the instances and instance paths will be formatted as
     defined by the --output-format general option. Table formats on instances
     will be replaced with MOF format.
@@ -405,7 +511,9 @@ def instance_modify(context, instancename, **options):
 @add_options(summary_option)
 @add_options(filter_query_option)
 @add_options(filter_query_language_option)
+@add_options(where_option)
 @add_options(show_null_option)
+@add_options(limit_option)
 @add_options(help_instancename_option)
 @add_options(object_order_option)
 @add_options(help_option)
@@ -422,13 +530,16 @@ def instance_associators(context, instancename, **options):
     --key and --namespace options, invoke with --help-instancename.
 
     The instances to be retrieved can be filtered by the --filter-query,
-    --role, --result-role, --assoc-class, and --result-class options.
+    --where, --role, --result-role, --assoc-class, and --result-class options.
 
     The --include-qualifiers, --include-classorigin, and --propertylist options
     determine which parts are included in each retrieved instance.
 
     The --names-only option can be used to show only the instance paths.
 
+    The --limit option retrieves only the first instances or instance paths
+    returned by the server.
+
     In the output, the instances and instance paths will be formatted as
     defined by the --output-format general option. Table formats on instances
     will be replaced with MOF format.
@@ -461,6 +572,8 @@ def instance_associators(context, instancename, **options):
 @add_options(filter_query_option)
 @add_options(show_null_option)
 @add_options(filter_query_language_option)
+@add_options(where_option)
+@add_options(limit_option)
 @add_options(help_instancename_option)
 @add_options(object_order_option)
 @add_options(help_option)
@@ -476,14 +589,17 @@ def instance_references(context, instancename, **options):
     For information on how to specify the instance using INSTANCENAME and the
     --key and --namespace options, invoke with --help-instancename.
 
-    The instances to be retrieved can be filtered by the --filter-query, --role
-    and --result-class options.
+    The instances to be retrieved can be filtered by the --filter-query,
+    --where, --role and --result-class options.
 
     The --include-qualifiers, --include-classorigin, and --propertylist options
     determine which parts are included in each retrieved instance.
 
     The --names-only option can be used to show only the instance paths.
 
+    The --limit option retrieves only the first instances or instance paths
+    returned by the server.
+
     In the output, the instances and instance paths will be formatted as
     defined by the --output-format general option. Table formats on instances
     will be replaced with MOF format.
@@ -556,6 +672,7 @@ def instance_invokemethod(context, instancename, methodname, **options):
               f'Default: {DEFAULT_QUERY_LANGUAGE}.')
 @add_options(namespace_option)
 @add_options(summary_option)
+@add_options(where_query_option)
 @add_options(help_option)
 @click.pass_obj
 def instance_query(context, query, **options):
@@ -566,6 +683,8 @@ def instance_query(context, query, **options):
     namespace (--namespace option), and display the returned instances. If no
     namespace was specified, the default namespace of the connection is used.
 
+    The returned instances can be filtered by the --where option.
+
     In the output, the instances will formatted as defined by the
     --output-format general option.
     """
@@ -625,7 +744,9 @@ def instance_count(context, classname, **options):
     "Not scanned".
 
     This command can take a long time to execute since it potentially
-    enumerates all instance names for all classes in all namespaces.
+    enumerates all instance names for all classes in all namespaces. The
+    --max-parallel general option allows the classes to be scanned
+    concurrently.
     """
     context.execute_cmd(lambda: cmd_instance_count(context, classname, options))
 
@@ -682,6 +803,13 @@ def instance_shrub(context, instancename, **options):
     of all instances that are part of the shrub if one of the cim object
     formats is selected with the global output_format parameter.
 
+    The shrub is built from the reference instances of INSTANCENAME returned
+    by one References request, filtered on the client based on the classes
+    of the instances. If the server does not return these classes, the
+    ReferenceNames and AssociatorNames requests for the shrub are sent to the
+    server, with up to the number of concurrent requests defined by the
+    '--max-parallel' general option.
+
     Results are formatted as defined by the output format global option.
     """
     if options['help_instancename']:
@@ -1015,7 +1143,6 @@ def cmd_instance_get(context, instancename, options):
     instances to the console from which one can be picked to get from the
     server and display.
     """
-    conn = context.pywbem_server.conn
     output_fmt = validate_output_format(context.output_format, ['CIM', 'TABLE'])
 
     # Returns list of namespaces from namespace option
@@ -1027,15 +1154,21 @@ def cmd_instance_get(context, instancename, options):
                              instancepath, instpath=instancepath,
                              property_list=property_list)
 
-    for ns in results:
+    def get_request(conn, ns):
+        """Get the instance in namespace ns"""
+        path = instancepath.copy()
+        path.namespace = ns
+        return conn.GetInstance(
+            path,
+            LocalOnly=options['local_only'],
+            IncludeQualifiers=options['include_qualifiers'],
+            IncludeClassOrigin=options['include_classorigin'],
+            PropertyList=property_list)
+
+    for ns, get_result in results.execute(get_request):
         try:
             instancepath.namespace = ns
-            results.add(conn.GetInstance(
-                instancepath,
-                LocalOnly=options['local_only'],
-                IncludeQualifiers=options['include_qualifiers'],
-                IncludeClassOrigin=options['include_classorigin'],
-                PropertyList=property_list))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -1200,7 +1333,8 @@ def get_filterquerylanguage(options):
 
 
 def enumerate_instances(conn, context, options, namespace, classname,
-                        property_list, return_original_err=False):
+                        property_list, return_original_err=False,
+                        stream=False, where=None):
     """
     Internal method.
 
@@ -1209,15 +1343,65 @@ def enumerate_instances(conn, context, options, namespace, classname,
 
     If the return_original_err is True, reraise any  Error or CIMError
     exception.
+
+    If stream is True, return a generator for the objects of the underlying
+    Iter... operation (see PyWbemcliPrefetch()) instead of a list so that the
+    objects can be processed as they are received. In that case, exceptions
+    are raised when the generator is consumed and must be handled by the
+    caller.
+
+    If the limit option is set, only the first objects are retrieved.
+
+    If where is not None, only the objects that match the WhereFilter object
+    of the --where option are returned.
     """
+    limit = options.get('limit')
     try:
+        if stream:
+            max_object_count = limit_max_object_count(
+                context.pywbem_server.pull_max_cnt, limit)
+
+            def request(req_conn):
+                """Execute the Iter... operation on req_conn"""
+                def iter_request(filter_query, filter_query_language,
+                                 request_property_list):
+                    """Execute the Iter... operation with the filter query"""
+                    if options['names_only'] and where is None:
+                        return req_conn.IterEnumerateInstancePaths(
+                            ClassName=classname,
+                            namespace=namespace,
+                            FilterQuery=filter_query,
+                            FilterQueryLanguage=filter_query_language,
+                            MaxObjectCount=max_object_count)
+                    return req_conn.IterEnumerateInstances(
+                        ClassName=classname,
+                        namespace=namespace,
+                        LocalOnly=options['local_only'],
+                        IncludeQualifiers=options['include_qualifiers'],
+                        DeepInheritance=options['deep_inheritance'],
+                        IncludeClassOrigin=options['include_classorigin'],
+                        FilterQuery=filter_query,
+                        FilterQueryLanguage=filter_query_language,
+                        MaxObjectCount=max_object_count,
+                        PropertyList=request_property_list)
+
+                result = req_conn.PyWbemcliWhere(
+                    where, iter_request, options['filter_query'],
+                    get_filterquerylanguage(options), property_list,
+                    PathsOnly=options['names_only'])
+                return limited(result, limit)
+
+            return conn.PyWbemcliPrefetch(request, max_object_count)
+
         if options['names_only']:
             return conn.PyWbemcliEnumerateInstancePaths(
                 ClassName=classname,
                 namespace=namespace,
                 FilterQuery=options['filter_query'],
                 FilterQueryLanguage=get_filterquerylanguage(options),
-                MaxObjectCount=context.pywbem_server.pull_max_cnt)
+                MaxObjectCount=context.pywbem_server.pull_max_cnt,
+                Limit=limit,
+                Where=where)
 
         return conn.PyWbemcliEnumerateInstances(
             ClassName=classname,
@@ -1229,7 +1413,9 @@ def enumerate_instances(conn, context, options, namespace, classname,
             FilterQuery=options['filter_query'],
             FilterQueryLanguage=get_filterquerylanguage(options),
             MaxObjectCount=context.pywbem_server.pull_max_cnt,
-            PropertyList=property_list)
+            PropertyList=property_list,
+            Limit=limit,
+            Where=where)
 
     except Error as er:
         # Return either the original exception or the ClickException.
@@ -1239,12 +1425,139 @@ def enumerate_instances(conn, context, options, namespace, classname,
 
     # Exception from Enumerate and the FilterQuery.  This exception would
     # apply  to all namespaces so just terminate.
+    except ValueError as ve:
+        raise enumerate_filterquery_exception(context, ve)
+
+
+def get_enumerate_partitions(conn, namespace, classname):
+    """
+    Get the classes whose instances are enumerated with separate requests
+    for the --partition-by-subclass option of instance enumerate: The
+    non-abstract classes in the subclass hierarchy of the classname class
+    (including itself) that have no non-abstract superclass in that
+    hierarchy.
+
+    A WBEM server returns the instances of the subclasses with those of a
+    class, so the enumerate of each of these classes returns the instances of
+    its subtree, and the subtrees are disjoint. Abstract classes have no
+    instances and are not enumerated themselves.
+
+    Returns:
+      list of :term:`string`: The class names, in the order of the class
+      hierarchy.
+
+    Raises:
+      pywbem.Error: Retrieving the classes failed.
+    """
+    # The class and qualifier requests use the class store and class cache,
+    # if enabled. The Abstract qualifier is not inherited, so the local
+    # qualifiers of the classes are sufficient.
+    root_class = conn.GetClass(classname, namespace=namespace, LocalOnly=True,
+                               IncludeQualifiers=True,
+                               IncludeClassOrigin=False)
+    classes = [root_class] + conn.EnumerateClasses(
+        ClassName=classname, namespace=namespace, DeepInheritance=True,
+        LocalOnly=True, IncludeQualifiers=True, IncludeClassOrigin=False)
+
+    superclasses = NocaseDict()
+    abstract_classes = NocaseDict()
+    for cls in classes:
+        superclasses[cls.classname] = cls.superclass
+        abstract = cls.qualifiers.get('Abstract')
+        abstract_classes[cls.classname] = \
+            abstract is not None and bool(abstract.value)
+
+    partitions = []
+    for cls in classes:
+        if abstract_classes[cls.classname]:
+            continue
+        # The superclass of the root class is not in the hierarchy
+        superclass = cls.superclass \
+            if cls.classname.lower() != classname.lower() else None
+        while superclass and abstract_classes[superclass]:
+            superclass = superclasses[superclass] \
+                if superclass.lower() != classname.lower() else None
+        if not superclass:
+            partitions.append(cls.classname)
+    return partitions
+
+
+def enumerate_partitioned(conn, context, options, namespace, classname,
+                          property_list, where=None):
+    """
+    Internal method.
+
+    Enumerate the paths or instances of the classname class in the namespace
+    for the --partition-by-subclass option: Each of the disjoint subtrees of
+    the subclass hierarchy (see get_enumerate_partitions()) is enumerated
+    with a separate request, with up to max_parallel enumerates executing
+    concurrently on copies of the connection. Each instance is retrieved
+    once, and the result is the same as that of one enumerate of classname.
+
+    With the limit option, the enumerates of the subtrees that have not been
+    started when the limit has been reached are cancelled.
+
+    Returns the list of objects in the order of the class hierarchy. Raises
+    the exception of the first enumerate that failed.
+    """
+    partitions = get_enumerate_partitions(conn, namespace, classname)
+    limit = options.get('limit')
+
+    def partition_request(conn, cln):
+        """Enumerate the instances or paths of one subtree"""
+        return enumerate_instances(
+            conn, context, options, namespace, cln, property_list,
+            return_original_err=True, where=where)
+
+    rtn = []
+    pool = ConnectionPool(conn, context.max_parallel)
+    scan = pool.imap(partition_request, partitions)
+    try:
+        for _, get_result in scan:
+            rtn.extend(get_result())
+            if limit is not None and len(rtn) >= limit:
+                break
+    finally:
+        scan.close()
+
+    return rtn if limit is None else rtn[:limit]
+
+
+def enumerate_filterquery_exception(context, exc):
+    """
+    Return the ClickException for a ValueError exception from an enumerate
+    operation that was caused by a FilterQuery with traditional operations.
+    """
+    return click.ClickException(
+        'Instance enumerate failed because FilterQuery not allowed with '
+        'traditional EnumerateInstance. '
+        f'--use-pull: {context.pywbem_server.use_pull}. '
+        f'Exception: {exc.__class__.__name__}: {exc}')
+
+
+def get_where_filter(options):
+    """
+    Return the WhereFilter object for the --where option, or None if the
+    option was not specified.
+    """
+    if not options.get('where'):
+        return None
+    try:
+        return WhereFilter(options['where'])
     except ValueError as ve:
         raise click.ClickException(
-            'Instance enumerate failed because FilterQuery not allowed with '
-            'traditional EnumerateInstance. '
-            f'--use-pull: {context.pywbem_server.use_pull}. '
-            f'Exception: {ve.__class__.__name__}: {ve}')
+            f'Invalid --where expression {options["where"]!r}: {ve}')
+
+
+def display_where_report(context, where):
+    """
+    If the verbose general option is set, display which parts of the --where
+    filter were passed to the WBEM server and which were evaluated by
+    pywbemcli.
+    """
+    if where is not None and context.verbose:
+        for line in where.report():
+            click.echo(line, err=True)
 
 
 def cmd_instance_enumerate(context, classname, options):
@@ -1259,15 +1572,77 @@ def cmd_instance_enumerate(context, classname, options):
     output_fmt = validate_output_format(context.output_format, ['CIM', 'TABLE'])
 
     property_list = resolve_propertylist(options['propertylist'])
+    where = get_where_filter(options)
 
     results = ResultsHandler(context, options, output_fmt, "class", classname,
                              property_list=property_list)
 
-    for ns in results:
+    if options.get('partition_by_subclass'):
+        if options.get('stream'):
+            raise click.ClickException(
+                'The --partition-by-subclass option is not allowed with the '
+                '--stream option.')
+        if not options['deep_inheritance'] and not options['names_only']:
+            raise click.ClickException(
+                'The --partition-by-subclass option requires the '
+                '--deep-inheritance or --names-only option.')
+
+        # The namespaces are processed one after the other, and the requests
+        # for the classes of a namespace concurrently.
+        for ns in results:
+            try:
+                results.add(enumerate_partitioned(
+                    conn, context, options, ns, classname, property_list,
+                    where=where))
+
+            except CIMError as ce:
+                # Process error and continue or generate exception
+                results.handle_exception(ns, ce)
+                continue
+
+            except Error as er:
+                raise pywbem_error_exception(er)
+
+        display_where_report(context, where)
+        results.display()
+        return
+
+    if options.get('stream'):
+        if options['object_order']:
+            raise click.ClickException(
+                'The --object-order option is not allowed with the --stream '
+                'option.')
+        for ns in results:
+            try:
+                results.add_stream(enumerate_instances(
+                    conn, context, options, ns, classname, property_list,
+                    return_original_err=True, stream=True, where=where))
+
+            except CIMError as ce:
+                # Process error and continue or generate exception
+                results.handle_exception(ns, ce)
+                continue
+
+            except Error as er:
+                raise pywbem_error_exception(er)
+
+            # The generator raises this exception when it is consumed.
+            except ValueError as ve:
+                raise enumerate_filterquery_exception(context, ve)
+
+        display_where_report(context, where)
+        results.display_stream_end()
+        return
+
+    def enumerate_request(conn, ns):
+        """Enumerate the instances or paths in namespace ns"""
+        return enumerate_instances(conn, context, options, ns, classname,
+                                   property_list, return_original_err=True,
+                                   where=where)
+
+    for ns, get_result in results.execute(enumerate_request):
         try:
-            results.add(enumerate_instances(conn, context, options, ns,
-                                            classname, property_list,
-                                            return_original_err=True))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -1277,6 +1652,7 @@ def cmd_instance_enumerate(context, classname, options):
         except Error as er:
             raise pywbem_error_exception(er)
 
+    display_where_report(context, where)
     results.display()
 
 
@@ -1290,7 +1666,6 @@ def cmd_instance_references(context, instancename, options):
        If the interactive option is selected, the instancename MUST BE
        a classname.
     """
-    conn = context.pywbem_server.conn
     output_fmt = validate_output_format(context.output_format, ['CIM', 'TABLE'])
 
     instancepath = get_instancename(context, instancename, options)
@@ -1301,28 +1676,39 @@ def cmd_instance_references(context, instancename, options):
                              instancepath, instpath=instancepath,
                              property_list=property_list)
 
-    for ns in results:
+    where = get_where_filter(options)
+
+    def references_request(conn, ns):
+        """Get the references of the instance in namespace ns"""
+        path = instancepath.copy()
+        path.namespace = ns
+        if options['names_only']:
+            return conn.PyWbemcliReferenceInstancePaths(
+                path,
+                ResultClass=options['result_class'],
+                Role=options['role'],
+                FilterQuery=options['filter_query'],
+                FilterQueryLanguage=get_filterquerylanguage(options),
+                MaxObjectCount=context.pywbem_server.pull_max_cnt,
+                Limit=options['limit'],
+                Where=where)
+        return conn.PyWbemcliReferenceInstances(
+            path,
+            ResultClass=options['result_class'],
+            Role=options['role'],
+            IncludeQualifiers=options['include_qualifiers'],
+            IncludeClassOrigin=options['include_classorigin'],
+            FilterQuery=options['filter_query'],
+            FilterQueryLanguage=get_filterquerylanguage(options),
+            MaxObjectCount=context.pywbem_server.pull_max_cnt,
+            PropertyList=property_list,
+            Limit=options['limit'],
+            Where=where)
+
+    for ns, get_result in results.execute(references_request):
         try:
             instancepath.namespace = ns
-            if options['names_only']:
-                results.add(conn.PyWbemcliReferenceInstancePaths(
-                    instancepath,
-                    ResultClass=options['result_class'],
-                    Role=options['role'],
-                    FilterQuery=options['filter_query'],
-                    FilterQueryLanguage=get_filterquerylanguage(options),
-                    MaxObjectCount=context.pywbem_server.pull_max_cnt))
-            else:
-                results.add(conn.PyWbemcliReferenceInstances(
-                    instancepath,
-                    ResultClass=options['result_class'],
-                    Role=options['role'],
-                    IncludeQualifiers=options['include_qualifiers'],
-                    IncludeClassOrigin=options['include_classorigin'],
-                    FilterQuery=options['filter_query'],
-                    FilterQueryLanguage=get_filterquerylanguage(options),
-                    MaxObjectCount=context.pywbem_server.pull_max_cnt,
-                    PropertyList=property_list))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -1338,6 +1724,8 @@ def cmd_instance_references(context, instancename, options):
                 'with traditional References. '
                 f'--use-pull {context.pywbem_server.use_pull}. '
                 f'Exception: {ve.__class__.__name__}: {ve}')
+
+    display_where_report(context, where)
     results.display()
 
 
@@ -1348,7 +1736,6 @@ def cmd_instance_associators(context, instancename, options):
 
     This method allows multiple namespaces.
     """
-    conn = context.pywbem_server.conn
     output_fmt = validate_output_format(context.output_format, ['CIM', 'TABLE'])
 
     instancepath = get_instancename(context, instancename, options)
@@ -1359,32 +1746,43 @@ def cmd_instance_associators(context, instancename, options):
                              instancepath, instpath=instancepath,
                              property_list=property_list)
 
-    for ns in results:
+    where = get_where_filter(options)
+
+    def associators_request(conn, ns):
+        """Get the associators of the instance in namespace ns"""
+        path = instancepath.copy()
+        path.namespace = ns
+        if options['names_only']:
+            return conn.PyWbemcliAssociatorInstancePaths(
+                path,
+                AssocClass=options['assoc_class'],
+                Role=options['role'],
+                ResultClass=options['result_class'],
+                ResultRole=options['result_role'],
+                FilterQuery=options['filter_query'],
+                FilterQueryLanguage=get_filterquerylanguage(options),
+                MaxObjectCount=context.pywbem_server.pull_max_cnt,
+                Limit=options['limit'],
+                Where=where)
+        return conn.PyWbemcliAssociatorInstances(
+            path,
+            AssocClass=options['assoc_class'],
+            Role=options['role'],
+            ResultClass=options['result_class'],
+            ResultRole=options['result_role'],
+            IncludeQualifiers=options['include_qualifiers'],
+            IncludeClassOrigin=options['include_classorigin'],
+            FilterQuery=options['filter_query'],
+            FilterQueryLanguage=get_filterquerylanguage(options),
+            MaxObjectCount=context.pywbem_server.pull_max_cnt,
+            PropertyList=property_list,
+            Limit=options['limit'],
+            Where=where)
+
+    for ns, get_result in results.execute(associators_request):
         try:
             instancepath.namespace = ns
-            if options['names_only']:
-                results.add(conn.PyWbemcliAssociatorInstancePaths(
-                    instancepath,
-                    AssocClass=options['assoc_class'],
-                    Role=options['role'],
-                    ResultClass=options['result_class'],
-                    ResultRole=options['result_role'],
-                    FilterQuery=options['filter_query'],
-                    FilterQueryLanguage=get_filterquerylanguage(options),
-                    MaxObjectCount=context.pywbem_server.pull_max_cnt))
-            else:
-                results.add(conn.PyWbemcliAssociatorInstances(
-                    instancepath,
-                    AssocClass=options['assoc_class'],
-                    Role=options['role'],
-                    ResultClass=options['result_class'],
-                    ResultRole=options['result_role'],
-                    IncludeQualifiers=options['include_qualifiers'],
-                    IncludeClassOrigin=options['include_classorigin'],
-                    FilterQuery=options['filter_query'],
-                    FilterQueryLanguage=get_filterquerylanguage(options),
-                    MaxObjectCount=context.pywbem_server.pull_max_cnt,
-                    PropertyList=property_list))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -1401,14 +1799,48 @@ def cmd_instance_associators(context, instancename, options):
                 f'--use-pull: {context.pywbem_server.use_pull}. '
                 f'Exception: {ve.__class__.__name__}: {ve}')
 
+    display_where_report(context, where)
     results.display()
 
 
+def get_count_scan_parents(classes, classnames):
+    """
+    Get the nearest superclass of each class to be counted that is also to be
+    counted and whose instances are counted together with those of its
+    subclasses.
+
+    Parameters:
+
+      classes (list of :class:`~pywbem.CIMClass`):
+        All classes of the namespace. Only the classname and superclass
+        attributes are used.
+
+      classnames (list of :term:`string`):
+        The names of the classes to be counted.
+
+    Returns:
+      NocaseDict with the names of the classes to be counted as keys and the
+      name of the nearest superclass in classnames, or None, as values.
+    """
+    superclasses = NocaseDict()
+    for cls in classes:
+        superclasses[cls.classname] = cls.superclass
+
+    selected = NocaseDict([(cln, cln) for cln in classnames])
+
+    scan_parents = NocaseDict()
+    for cln in classnames:
+        superclass = superclasses.get(cln, None)
+        while superclass and superclass not in selected:
+            superclass = superclasses.get(superclass, None)
+        scan_parents[cln] = selected[superclass] if superclass else None
+    return scan_parents
+
+
 def cmd_instance_count(context, classname, options):
     """
     Get the number of instances of each class in the namespace
     """
-    conn = context.pywbem_server.conn
     output_fmt = validate_output_format(context.output_format, 'TABLE')
 
     class_ignore_list = []
@@ -1429,6 +1861,10 @@ def cmd_instance_count(context, classname, options):
                               default_all_ns=True)
 
     ns_cln_tuples = []  # a list of tuples of namespace, classname
+    # Nearest superclass of each class to be counted that is also to be
+    # counted, or None, per namespace.
+    scan_parents = {}
+    conn = context.pywbem_server.conn
     for namespace in ns_names:
         # Get all classes in Namespace
         try:
@@ -1440,6 +1876,13 @@ def cmd_instance_count(context, classname, options):
 
             classnames = enumerate_classes_filtered(context, namespace, None,
                                                     options)
+            if classnames:
+                # Class hierarchy of the namespace, without qualifiers and
+                # inherited elements since only the superclasses are used.
+                classes = conn.EnumerateClasses(
+                    namespace=namespace, DeepInheritance=True,
+                    LocalOnly=True, IncludeQualifiers=False,
+                    IncludeClassOrigin=False)
         except Error as er:
             raise pywbem_error_exception(er)
 
@@ -1447,61 +1890,122 @@ def cmd_instance_count(context, classname, options):
             classlist = filter_namelist(classname, classnames, ignore_case=True)
             cl_tup = [(namespace, cln) for cln in classlist]
             ns_cln_tuples.extend(cl_tup)
+            scan_parents[namespace] = get_count_scan_parents(
+                classes,
+                [cln for cln in classlist if cln not in class_ignore_list])
 
     # Sort since normal output for this command is  namespace, classname
     # alphabetic order.
     ns_cln_tuples.sort(key=lambda tup: (tup[0], tup[1]))
 
+    max_cnt = max(context.pywbem_server.pull_max_cnt, COUNT_MAXPULLCNT)
+
+    def count_request(conn, tup):
+        """
+        Count the instances of the class tup[1] and its subclasses in namespace
+        tup[0] by creation class name. Executed in a worker thread of the
+        connection pool. The instance paths are discarded as they are
+        received so that only the counts are kept.
+        """
+        ns, cln = tup
+        tally = NocaseDict()
+        for inst_name in conn.IterEnumerateInstancePaths(
+                cln, namespace=ns, MaxObjectCount=max_cnt):
+            tally[inst_name.classname] = tally.get(inst_name.classname, 0) + 1
+        return tally
+
+    def covered_classnames(tup):
+        """
+        Return the names of the classes to be counted whose instances are
+        returned by enumerating tup[1] in namespace tup[0] and that are not
+        covered by a separate enumerate of one of its subclasses.
+        """
+        ns, cln = tup
+        parents = scan_parents[ns]
+        rtn = []
+        for name in parents:
+            scan_name = name
+            while scan_name and scan_name.lower() != cln.lower():
+                scan_name = parents[scan_name]
+            if scan_name:
+                rtn.append(name)
+        return rtn
+
+    # Enumerate only the classes to be counted that have no superclass that
+    # is also to be counted. Each enumerate returns the instances of the
+    # subclasses as well so that every instance is transferred only once and
+    # the count of each class is the number of instances whose creation class
+    # it is. The instances of ignored classes that are returned by the
+    # enumerate of one of their superclasses are not counted. If the enumerate
+    # of a class fails (e.g. because of the provider of an ignored class), its
+    # subclasses to be counted are enumerated separately.
+    scan_tuples = [tup for tup in ns_cln_tuples
+                   if tup[1] in scan_parents[tup[0]] and
+                   scan_parents[tup[0]][tup[1]] is None]
+
+    # Scan the class/namespace tuples with up to max_parallel enumerates
+    # executing concurrently. The results are returned in the order of
+    # scan_tuples.
+    counts = {}
+    error = None
+    error_tup = None
+    pool = ConnectionPool(conn, context.max_parallel)
+    while scan_tuples and not error:
+        next_scan_tuples = []
+        scan = pool.imap(count_request, scan_tuples)
+        try:
+            for tup, get_tally in scan:
+                ns, cln = tup
+                # Try block allows issues where enumerate does not properly
+                # execute. The totals may be wrong but at least it gets what
+                # it can. This accounts for issues with some servers where
+                # there are providers that return errors from the enumerate.
+                # The subclasses are then scanned separately.
+                try:
+                    tally = get_tally()
+                except CIMError as ce:
+                    warning_msg(f"Server CIMError {ce.status_code_name} with "
+                                f"namepace={ns}, class={cln}. Continuing "
+                                "scan.")
+                    counts[tup] = f"CIMError {ce.status_code_name}"
+                    parents = scan_parents[ns]
+                    next_scan_tuples.extend(
+                        (ns, name) for name in parents
+                        if parents[name] and
+                        parents[name].lower() == cln.lower())
+                    continue
+                # Error exception caused termination of the connection. Add
+                # this item to the display with Server Fail message instead
+                # of count and stop the scan. Enumerates not yet started are
+                # cancelled.
+                except Error as er:
+                    error = er
+                    error_tup = tup
+                    warning_msg(f"Server Error {er} with namepace={ns}, "
+                                f"class={cln}. Terminating scan.")
+                    counts[tup] = "Server Fail"
+                    break
+
+                for name in covered_classnames(tup):
+                    counts[(ns, name)] = tally.get(name, 0)
+        finally:
+            scan.close()
+        scan_tuples = sorted(next_scan_tuples,
+                             key=lambda tup: (tup[0], tup[1]))
+
+    # Build the display in namespace, classname order. If an error has
+    # occurred, the remaining items are displayed with Not scanned msg.
     display_data = []
-    error = 0
-    # Scan all of the class/namespace tuples to get count of instances
-    # of each class.
     for tup in ns_cln_tuples:
-        ns = tup[0]
-        cln = tup[1]
+        ns, cln = tup
         if cln in class_ignore_list:
-            display_tuple = (ns, cln, "ignored")
-            display_data.append(display_tuple)
-            continue
-        # If an error has occurred, just display the remaining items with
-        # Not scanned msg.
-        if error:
-            display_tuple = (ns, cln, "Not scanned")
-            display_data.append(display_tuple)
-            continue
-        # Try block allows issues where enumerate does not properly execute
-        # The totals may be wrong but at least it gets what it can.
-        # This accounts for issues with some servers where there
-        # are providers that return errors from the enumerate.
-        inst_names = None
-        try:
-            inst_names = conn.EnumerateInstanceNames(cln, namespace=ns)
-        except CIMError as ce:
-            warning_msg(f"Server CIMError {ce.status_code_name} with "
-                        f"namepace={ns}, class={cln}. Continuing scan.")
-            display_tuple = (ns, cln, f"CIMError {ce.status_code_name}")
-            display_data.append(display_tuple)
-            continue
-        # Error exception caused termination of the connection. Add this
-        # item to the display with Server Fail message instead of count
-        except Error as er:
-            error = er
-            warning_msg(f"Server Error {er} with namepace={ns}, class={cln}. "
-                        "Terminating scan.")
-            display_tuple = (ns, cln, "Server Fail")
-            display_data.append(display_tuple)
-            continue
-
-        # Sum the number of instances with the defined classname.
-        # this counts only classes with that specific classname and not
-        # subclasses
-        if inst_names:
-            count = sum(1 for inst_name in inst_names
-                        if (inst_name.classname.lower() == cln.lower()))
+            display_data.append((ns, cln, "ignored"))
+        elif tup in counts:
             # Display only non-zero elements
-            if count:
-                display_tuple = (ns, cln, count)
-                display_data.append(display_tuple)
+            if counts[tup]:
+                display_data.append((ns, cln, counts[tup]))
+        elif error:
+            display_data.append((ns, cln, "Not scanned"))
 
     # Post scan processing
     # If sort set, re-sort by count size
@@ -1519,6 +2023,7 @@ def cmd_instance_count(context, classname, options):
                             title='Count of instances per class',
                             table_format=output_fmt))
     if error:
+        ns, cln = error_tup
         raise click.ClickException(
             f"Server Error {error} at namespace={ns}, class:{cln}. "
             "Scan incomplete.")
@@ -1533,14 +2038,17 @@ def cmd_instance_query(context, query, options):
     """
     conn = context.pywbem_server.conn
     output_fmt = validate_output_format(context.output_format, ['CIM', 'TABLE'])
+    where = get_where_filter(options)
 
     try:
         results = conn.PyWbemcliQueryInstances(
             options['query_language'],
             query,
             namespace=options['namespace'],
-            MaxObjectCount=context.pywbem_server.pull_max_cnt)
+            MaxObjectCount=context.pywbem_server.pull_max_cnt,
+            Where=where)
 
+        display_where_report(context, where)
         display_cim_objects(
             context, results, output_fmt, summary=options['summary'])
 
@@ -1568,7 +2076,8 @@ def cmd_instance_shrub(context, instancename, options):
                                  ResultRole=options['result_role'],
                                  ResultClass=options['result_class'],
                                  verbose=context.verbose,
-                                 fullpath=options['fullpath'])
+                                 fullpath=options['fullpath'],
+                                 max_parallel=context.max_parallel)
 
         # display the shrub
         context.spinner_stop()
@@ -134,16 +134,19 @@ def cmd_qualifier_get(context, qualifiername, options):
     Execute the command for get qualifier and display result. Displays the
     instances from single or multiple namespaces based on namespace option.
     """
-    conn = context.pywbem_server.conn
     output_format = validate_output_format(context.output_format, ['CIM',
                                                                    'TABLE'])
 
     results = ResultsHandler(context, options, output_format, "QualDeclName",
                              qualifiername)
 
-    for ns in results:
+    def get_request(conn, ns):
+        """Get the qualifier declaration in namespace ns"""
+        return conn.GetQualifier(qualifiername, namespace=ns)
+
+    for ns, get_result in results.execute(get_request):
         try:
-            results.add(conn.GetQualifier(qualifiername, namespace=ns))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -174,16 +177,19 @@ def cmd_qualifier_enumerate(context, options):
     """
     Execute the command for enumerate qualifiers and desplay the result.
     """
-    conn = context.pywbem_server.conn
     output_format = validate_output_format(context.output_format, ['CIM',
                                                                    'TABLE'])
 
     results = ResultsHandler(context, options, output_format, "QualDeclName",
                              None)
 
-    for ns in results:
+    def enumerate_request(conn, ns):
+        """Enumerate the qualifier declarations in namespace ns"""
+        return sort_cimobjects(conn.EnumerateQualifiers(namespace=ns))
+
+    for ns, get_result in results.execute(enumerate_request):
         try:
-            results.add(sort_cimobjects(conn.EnumerateQualifiers(namespace=ns)))
+            results.add(get_result())
 
         except CIMError as ce:
             # Process error and continue or generate exception
@@ -0,0 +1,103 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Click Command definition for the repl command that enters the interactive
+mode of pywbemcli.
+
+The modules of click_repl and prompt_toolkit are imported only by this module,
+so that they are loaded only when pywbemcli enters the interactive mode.
+"""
+
+
+import os
+
+import click
+import click_repl
+from prompt_toolkit.history import FileHistory
+from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+
+from .pywbemcli import cli
+from .config import PYWBEMCLI_PROMPT, PYWBEMCLI_HISTORY_FILE, USE_AUTOSUGGEST
+from ._warnings import InvalidConnectionFile
+from .._click_extensions import GENERAL_OPTS_TXT
+from .._options import add_options, help_option
+from .._utils import pywbemtools_warn
+
+
+@cli.command('repl', options_metavar=GENERAL_OPTS_TXT)
+@add_options(help_option)
+@click.pass_context
+def repl(ctx):
+    """
+    Enter interactive mode (default).
+
+    Enter the interactive mode where pywbemcli commands can be entered
+    interactively. The prompt is changed to 'pywbemcli>'.
+
+    <COMMAND> <COMMAND OPTIONS> - Execute pywbemcli command COMMAND
+
+    <GENERAL_OPTIONS> <COMMAND> <COMMAND_OPTIONS> - Execute command with
+    general options.  General options set here exist only for the current
+    command.
+
+    -h, --help - Show pywbemcli general help message, including a
+                                  list of pywbemcli commands.
+    COMMAND -h, --help - Show help message for pywbemcli command COMMAND.
+
+    !SHELL-CMD - Execute shell command SHELL-CMD
+
+    Pywbemcli termination - <CTRL-D>, :q, :quit, :exit
+
+    Command history is supported. The command history is stored in a file
+    ~/.pywbemcli_history.
+
+    <UP>, <DOWN> - Scroll through pwbemcli command history.
+
+    <CTRL-r> <search string> - initiate an interactive
+    search of the pywbemcli history file. Can be used with <UP>, <DOWN>
+    to display commands that match the search string.
+    Editing the search string updates the search.
+
+    <TAB> - tab completion for current command line
+    (can be used anywhere in command)
+
+    Interactive mode also includes an autosuggest feature that makes
+    suggestions from the command history as the command the user types in the
+    command and options.
+    """
+
+    history_file = PYWBEMCLI_HISTORY_FILE
+    if history_file.startswith('~'):
+        history_file = os.path.expanduser(history_file)
+
+    click.echo("Enter 'help repl' for help, <CTRL-D> or ':q' "
+               "to exit pywbemcli or <CTRL-r> to search history, ")
+
+    if not ctx.obj.connections_repo.file_exists():
+        pywbemtools_warn(
+            f"Connections file: '{ctx.obj.connections_repo.connections_file}' "
+            "does not exist. Server and connection commands will not work.",
+            InvalidConnectionFile, stacklevel=0)
+
+    prompt_kwargs = {
+        'message': PYWBEMCLI_PROMPT,
+        'history': FileHistory(history_file),
+    }
+
+    if USE_AUTOSUGGEST:
+        prompt_kwargs['auto_suggest'] = AutoSuggestFromHistory()
+
+    click_repl.repl(ctx, prompt_kwargs=prompt_kwargs)
@@ -36,6 +36,7 @@ from .pywbemcli import cli
 from ._common import pywbem_error_exception, parse_version_value, \
     is_experimental_class
 from ._common_options import namespace_option
+from ._common_cmd_functions import invalidate_class_store
 from .._click_extensions import PywbemtoolsGroup, PywbemtoolsCommand, \
     CMD_OPTS_TXT, GENERAL_OPTS_TXT, SUBCMD_HELP_TXT
 from .._options import add_options, help_option
@@ -320,6 +321,11 @@ def cmd_server_add_mof(context, options):
     except Error as exc:
         raise pywbem_error_exception(exc)
 
+    # The MOF may define objects in any namespace
+    finally:
+        if not options['dry_run']:
+            invalidate_class_store(context)
+
 
 def cmd_server_remove_mof(context, options):
     """
@@ -390,6 +396,11 @@ def cmd_server_remove_mof(context, options):
     except Error as exc:
         raise pywbem_error_exception(exc)
 
+    # The MOF may define objects in any namespace
+    finally:
+        if not options['dry_run']:
+            invalidate_class_store(context)
+
 
 def cmd_server_schema(context, options):
     """
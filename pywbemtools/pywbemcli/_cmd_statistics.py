@@ -27,6 +27,7 @@ import click
 from pywbem import Error, ValueMapping, CIMDateTime
 
 from .pywbemcli import cli
+from ._connection_pool import statistics_snapshot, reset_statistics
 from .._click_extensions import PywbemtoolsGroup, PywbemtoolsCommand, \
     CMD_OPTS_TXT, GENERAL_OPTS_TXT, SUBCMD_HELP_TXT
 from .._options import add_options, help_option
@@ -378,7 +379,7 @@ def cmd_statistics_reset(context):
     """
 
     conn = context.pywbem_server.conn
-    conn.statistics.reset()
+    reset_statistics(conn)
 
     context.spinner_stop()
     click.echo("Pywbemcli statistics reset")
@@ -393,7 +394,7 @@ def cmd_statistics_show(context):
     conn = context.pywbem_server.conn
 
     context.spinner_stop()
-    click.echo(context.format_statistics(conn.statistics, context))
+    click.echo(context.format_statistics(statistics_snapshot(conn), context))
 
 
 def cmd_statistics_server_show(context):
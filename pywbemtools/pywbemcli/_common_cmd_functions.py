@@ -32,7 +32,9 @@ from pywbem import Error, CIMError, ModelError, \
 from ._common import pywbem_error_exception, get_subclass_names, \
     get_leafclass_names, parse_version_value
 
-from ._display_cimobjects import display_cim_objects
+from ._connection_pool import ConnectionPool
+from ._display_cimobjects import display_cim_objects, \
+    display_cim_objects_stream, display_cim_objects_summary_counts
 
 from .._output_formatting import output_format_is_table, \
     format_table, warning_msg, output_format_is_cimobject, \
@@ -74,6 +76,19 @@ class ResultsHandler:
             raise pywbem_error_exception(er)
 
       results.display()
+
+    To allow the requests for the namespaces to be executed concurrently
+    (see the --max-parallel general option), the request is defined as a
+    function request(conn, ns) and the loop becomes:
+
+      for ns, get_result in results.execute(request):
+         try:
+            results.add(get_result())
+         ...
+
+    When the objects are to be displayed as they are received (--stream
+    option), add_stream(<request generator>) replaces add() and
+    display_stream_end() replaces display().
     """
     def __init__(self, context, options, output_format, obj_type,
                  target_object, instpath=None, property_list=None):
@@ -120,6 +135,9 @@ class ResultsHandler:
         self.result_errors = {}
         self.results_to_date = 0
 
+        # CIM type of the objects displayed by add_stream()
+        self.stream_cim_type = None
+
     def __contains__(self, key):
         return key in self.results
 
@@ -135,6 +153,22 @@ class ResultsHandler:
         """
         return iter(self.results)
 
+    def execute(self, request):
+        """
+        Generator that executes request(conn, ns) for each namespace to be
+        processed, concurrently on copies of the connection if the
+        max_parallel attribute of the context is greater than 1.
+
+        Yields a tuple of namespace and a function without parameters that
+        returns the result of the request for that namespace or raises the
+        exception raised by the request. The tuples are yielded in namespace
+        order so the results can be processed with add() and
+        handle_exception() just as in the sequential loop.
+        """
+        pool = ConnectionPool(self.context.pywbem_server.conn,
+                              self.context.max_parallel)
+        return pool.imap(request, list(self.results))
+
     def add(self, request_result):
         """
         Adds reguest_result to results dictionary
@@ -142,6 +176,29 @@ class ResultsHandler:
         self.results[self.ns_names[self.results_to_date]] = request_result
         self.results_to_date += 1
 
+    def add_stream(self, request_result):
+        """
+        Display the objects of request_result (an iterable that typically is
+        the generator returned by a pywbem Iter... operation) as they are
+        received and record only the number of objects in the results
+        dictionary.
+
+        Exceptions raised by the iterable are passed through to the caller.
+        """
+        ns = self.ns_names[self.results_to_date]
+        display_ns = ns if len(self.ns_names) > 1 else None
+        count, cim_type = display_cim_objects_stream(
+            self.context, request_result, self.output_format,
+            summary=self.options.get('summary', None),
+            property_list=self.property_list,
+            ignore_null_properties=not self.options.get('show_null', None),
+            namespace=display_ns,
+            ctx_options=self.options)
+        if cim_type:
+            self.stream_cim_type = cim_type
+        self.results[ns] = count
+        self.results_to_date += 1
+
     def handle_exception(self, ns, exc):
         """
         Handle CIM_Error exceptions from multi-namespace requests.  This method
@@ -201,6 +258,23 @@ class ResultsHandler:
             if any(self.result_errors.values()):
                 self.display_errors(terminate=True)
 
+    def display_stream_end(self):
+        """
+        Complete the displays started by add_stream(). This displays the
+        summary if the summary option was set and any result_errors.
+        """
+        if self.options.get('summary', None):
+            display_cim_objects_summary_counts(
+                self.context, self.results, self.stream_cim_type,
+                self.output_format)
+        elif self.context.verbose and not any(self.results.values()):
+            click.echo('No objects returned for namespace(s): '
+                       f'{", ".join(self.results.keys())}')
+
+        if self.result_errors:
+            if any(self.result_errors.values()):
+                self.display_errors(terminate=True)
+
     def display_errors(self, terminate=False):
         """
         Display any errors in an appropriate format consistent with the
@@ -244,6 +318,17 @@ class ResultsHandler:
                 "request(s)")
 
 
+def invalidate_class_store(context, namespace=None):
+    """
+    Remove the responses of the namespace, or of all namespaces if namespace
+    is None, from the in-session class store of the current connection. Used
+    by commands that change classes or qualifier declarations in the server.
+    """
+    class_store = context.pywbem_server.class_store
+    if class_store is not None:
+        class_store.invalidate(namespace)
+
+
 def get_namespaces(context, namespaces, default_all_ns=False):
     """
     Returns either the namespaces defined in --namespaces parameter or if
@@ -329,7 +414,8 @@ def get_namespaces(context, namespaces, default_all_ns=False):
         raise pywbem_error_exception(er)
 
 
-def enumerate_classes_filtered(context, namespace, classname, options):
+def enumerate_classes_filtered(context, namespace, classname, options,
+                               conn=None):
     """
     Execute EnumerateClasses or EnumerateClassNames in a single namespace
     defined in options['namespace'] and return results.
@@ -353,6 +439,9 @@ def enumerate_classes_filtered(context, namespace, classname, options):
       options: Click options dictionary
         Options that form basis for this Enumerate and filter processing.
 
+      conn (:class:`~pywbem.WBEMConnection`):
+        Connection to be used instead of the connection of the context.
+
     Returns:
         List of classes or classnames that satisfy the criteria
 
@@ -360,7 +449,8 @@ def enumerate_classes_filtered(context, namespace, classname, options):
         pywbem Error exceptions generated by EnumerateClassNames and
         enumerateClasses
     """
-    conn = context.pywbem_server.conn
+    if conn is None:
+        conn = context.pywbem_server.conn
     filters = _build_filters_dict(conn, namespace, options)
 
     names_only = options.get('names_only', False)
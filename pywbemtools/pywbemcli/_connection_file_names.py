@@ -22,7 +22,10 @@ user home directory.
 """
 
 import os
-from click import Abort
+
+# click is not imported at the module level, because this module is imported
+# by the pywbemcli entry point also when the command is executed by the
+# pywbemcli daemon (see _daemon.py).
 
 # file suffix to be used for backup files for connection files when they
 # are updated.
@@ -64,6 +67,7 @@ if os.getenv(PYWBEMCLI_ALT_HOME_DIR_ENVVAR):
         alt_home_dir_path = alt_home_dir_path[:-1]
     if os.path.exists(alt_home_dir_path):
         if os.path.isfile(alt_home_dir_path):
+            from click import Abort  # pylint: disable=import-outside-toplevel
             raise Abort(
                 f'Alternate files home path create: {alt_home_dir_path} '
                 f'defined by envvar: {PYWBEMCLI_ALT_HOME_DIR_ENVVAR} failed. '
@@ -74,6 +78,7 @@ if os.getenv(PYWBEMCLI_ALT_HOME_DIR_ENVVAR):
             os.mkdir(alt_home_dir_path)
             DEFAULT_CONNECTIONS_DIR = alt_home_dir_path
         except OSError as oe:
+            from click import Abort  # pylint: disable=import-outside-toplevel
             raise Abort(
                 f'Alternate files home path create: {alt_home_dir_path} '
                 f'defined by envvar: {PYWBEMCLI_ALT_HOME_DIR_ENVVAR} failed. '
@@ -91,8 +96,19 @@ DEFAULT_CONNECTIONS_FILE = os.path.join(DEFAULT_CONNECTIONS_DIR,
 B08_DEFAULT_CONNECTIONS_FILE = os.path.join(DEFAULT_CONNECTIONS_DIR,
                                             B08_CONNECTIONS_FILENAME)
 
-# Directory where mock cache files for named connections defined in the
-# default connection file as mock connections (--mock-server general
-# argument) are saved. In the same directory as default connection file.
+# Directory where mock cache files for mock connections (--mock-server general
+# option), with or without connection definition in a connections file, are
+# saved. In the same directory as default connection file.
 MOCKCACHE_ROOT_DIR = os.path.join(DEFAULT_CONNECTIONS_DIR,
                                   '.pywbemcli_mockcache')
+
+# Directory where the class cache files for real WBEM servers (--class-cache
+# general option) are saved. In the same directory as the mock cache
+# directory.
+CLASSCACHE_ROOT_DIR = os.path.join(DEFAULT_CONNECTIONS_DIR,
+                                   '.pywbemcli_classcache')
+
+# Unix domain socket of the pywbemcli daemon (see 'daemon' command group).
+# In the same directory as the default connections file.
+DAEMON_SOCKET_FILE = os.path.join(DEFAULT_CONNECTIONS_DIR,
+                                  '.pywbemcli_daemon.sock')
@@ -0,0 +1,243 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Execution of independent WBEM server requests concurrently on copies of the
+current connection.
+
+A WBEMConnection object is not safe to be used by multiple threads at the same
+time. The ConnectionPool class therefore gives each worker thread its own copy
+of the connection (see WBEMConnection.copy()) and returns the results in the
+order of the request items so that the displays built from them stay
+deterministic. The operation statistics of the copies are kept with the
+current connection when the copies are closed (see add_copy_statistics()), and
+are aggregated with its own statistics when they are displayed (see
+statistics_snapshot()).
+"""
+
+
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+# Serializes the updates of the statistics of the copies of a connection.
+_STATISTICS_LOCK = threading.Lock()
+
+
+class OperationStatisticSummary:
+    # pylint: disable=too-few-public-methods
+    """
+    Read-only summary of the pywbem OperationStatistic objects for the same
+    operation name of a connection and its copies, with the public properties
+    of OperationStatistic that are used for displaying statistics.
+
+    A statistics container cannot be shared by connections used in different
+    threads, because pywbem times the operations with the same name with the
+    same OperationStatistic object. The statistics of the copies are therefore
+    kept separately and summarized here, using only the public interface of
+    OperationStatistic.
+    """
+
+    def __init__(self, name, stats):
+        """
+        Parameters:
+
+          name (:term:`string`): Name of the operation.
+
+          stats (list of :class:`~pywbem.OperationStatistic`): Statistics of
+            the operation, each with at least one measured operation.
+        """
+        self.name = name
+        self.count = sum(stat.count for stat in stats)
+        self.exception_count = sum(stat.exception_count for stat in stats)
+        self.min_time = min(stat.min_time for stat in stats)
+        self.max_time = max(stat.max_time for stat in stats)
+        self.avg_time = self._avg(stats, 'avg_time')
+        self.min_request_len = min(stat.min_request_len for stat in stats)
+        self.max_request_len = max(stat.max_request_len for stat in stats)
+        self.avg_request_len = self._avg(stats, 'avg_request_len')
+        self.min_reply_len = min(stat.min_reply_len for stat in stats)
+        self.max_reply_len = max(stat.max_reply_len for stat in stats)
+        self.avg_reply_len = self._avg(stats, 'avg_reply_len')
+        # pywbem maintains the server time only if all operations returned
+        # it. Otherwise the minimum remains larger than the maximum.
+        if all(stat.min_server_time <= stat.max_server_time
+               for stat in stats):
+            self.min_server_time = min(stat.min_server_time
+                                       for stat in stats)
+            self.max_server_time = max(stat.max_server_time
+                                       for stat in stats)
+            self.avg_server_time = self._avg(stats, 'avg_server_time')
+        else:
+            self.min_server_time = float('inf')
+            self.max_server_time = float(0)
+            self.avg_server_time = float(0)
+
+    def _avg(self, stats, attr):
+        """
+        Return the average of the averages in attribute attr of the
+        statistics, weighted by their counts.
+        """
+        return sum(getattr(stat, attr) * stat.count for stat in stats) / \
+            self.count
+
+
+def add_copy_statistics(conn, copy_conn):
+    """
+    Keep the operation statistics of the copy copy_conn of the connection conn
+    (that was used by another thread) with conn, so that the operations
+    executed on the copy are included in the statistics of conn that are
+    displayed (e.g. for the --timestats general option).
+
+    Parameters:
+
+      conn (:class:`~pywbem.WBEMConnection`): The original connection.
+
+      copy_conn (:class:`~pywbem.WBEMConnection`): The copy of conn. Its
+        operations must have completed.
+    """
+    with _STATISTICS_LOCK:
+        if getattr(conn, 'copy_statistics', None) is None:
+            conn.copy_statistics = []
+        conn.copy_statistics.append(copy_conn.statistics)
+
+
+def statistics_snapshot(conn):
+    """
+    Return the operation statistics of the connection conn including those of
+    its copies (see add_copy_statistics()), as a list of tuples of operation
+    name and :class:`OperationStatisticSummary` object, like the list
+    returned by :meth:`pywbem.Statistics.snapshot`.
+    """
+    with _STATISTICS_LOCK:
+        containers = [conn.statistics] + \
+            list(getattr(conn, 'copy_statistics', None) or [])
+    stats = {}
+    for container in containers:
+        for name, stat in container.snapshot():
+            if stat.count:
+                stats.setdefault(name, []).append(stat)
+    return [(name, OperationStatisticSummary(name, name_stats))
+            for name, name_stats in stats.items()]
+
+
+def reset_statistics(conn):
+    """
+    Reset the operation statistics of the connection conn, including those of
+    its copies (see add_copy_statistics()).
+    """
+    with _STATISTICS_LOCK:
+        conn.copy_statistics = []
+    conn.statistics.reset()
+
+
+class ConnectionPool:
+    """
+    Pool of worker threads, each using its own copy of a connection, that
+    executes a request function for each of a list of items.
+
+    If max_parallel is 1 or there is only one item, the requests are executed
+    sequentially in the calling thread on the original connection so that
+    the behavior is the same as without the pool.
+
+    The pattern for this class is:
+
+      pool = ConnectionPool(conn, max_parallel)
+      for item, get_result in pool.imap(request_func, items):
+          try:
+              result = get_result()
+          except Error as er:
+              ...
+
+    where request_func(conn, item) executes the server request(s) for one
+    item on the connection conn.
+    """
+
+    def __init__(self, conn, max_parallel):
+        """
+        Parameters:
+
+          conn (:class:`~pywbem.WBEMConnection`):
+            The connection that is copied for each worker thread.
+
+          max_parallel (:term:`integer`):
+            Maximum number of requests that are executed concurrently.
+        """
+        self.conn = conn
+        self.max_parallel = max_parallel or 1
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns = []
+
+    def _thread_conn(self):
+        """
+        Return the connection for the current worker thread, creating it as a
+        copy of the original connection on first use.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self.conn.copy()
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def _execute(self, request_func, item):
+        """
+        Execute request_func for item in a worker thread.
+        """
+        return request_func(self._thread_conn(), item)
+
+    def close(self):
+        """
+        Close the connection copies created by the worker threads, after
+        keeping their operation statistics with the original connection.
+        """
+        with self._lock:
+            conns = self._conns
+            self._conns = []
+        for conn in conns:
+            add_copy_statistics(self.conn, conn)
+            conn.close()
+
+    def imap(self, request_func, items):
+        """
+        Generator that executes request_func(conn, item) for each item in
+        items, with up to max_parallel requests executing concurrently.
+
+        Yields a tuple of item and a function without parameters that returns
+        the result of request_func for that item or raises the exception
+        raised by request_func. The tuples are yielded in the order of items,
+        independent of the order in which the requests complete.
+
+        If the caller stops consuming the generator (e.g. because of an
+        exception), requests that have not been started are cancelled.
+        """
+        items = list(items)
+        if self.max_parallel <= 1 or len(items) <= 1:
+            for item in items:
+                yield item, partial(request_func, self.conn, item)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_parallel, len(items)))
+        try:
+            futures = [executor.submit(self._execute, request_func, item)
+                       for item in items]
+            for item, future in zip(items, futures):
+                yield item, future.result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.close()
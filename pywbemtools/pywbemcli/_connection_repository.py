@@ -33,6 +33,7 @@ from ._pywbem_server import PywbemServer
 from ._pywbemcli_operations import delete_mock_cache
 from ._connection_file_names import DEFAULT_CONNECTIONS_FILE, \
     B08_DEFAULT_CONNECTIONS_FILE, BAK_FILE_SUFFIX
+from .._startup_profile import profile_phase
 
 
 class ConnectionsFileError(Exception):
@@ -467,7 +468,8 @@ class ConnectionRepository:
 
         # Load the existing file.
         try:
-            with open_text_file(self._connections_file, 'r') as _fp:
+            with profile_phase('connections_file_load'), \
+                    open_text_file(self._connections_file, 'r') as _fp:
                 try:
                     dict_ = yaml.safe_load(_fp)
                 except (TypeError, yaml.YAMLError) as exc:
@@ -27,7 +27,11 @@ import os
 import click
 import click_spinner
 
-from .._output_formatting import format_table, validate_output_format
+from .config import DEFAULT_MAX_PARALLEL
+from ._connection_pool import statistics_snapshot
+from .._startup_profile import profile_phase
+from .._output_formatting import format_table, validate_output_format, \
+    warning_msg
 
 
 class ContextObj:
@@ -44,7 +48,9 @@ class ContextObj:
     # pylint: disable=unused-argument
     def __init__(self, pywbem_server, output_format, timestats, log, verbose,
                  pdb, warn, connections_repo, interactive_mode,
-                 close_interactive_server):
+                 close_interactive_server, max_parallel=None,
+                 class_cache=None, class_store=None, pull_target_time=None,
+                 daemon_mode=False):
         """
         Parameters:
 
@@ -80,6 +86,22 @@ class ContextObj:
             Flag that defines interactive command with a server definition
             that must be disconnected after the command
 
+          max_parallel (:term:`integer` or None):
+            See max-parallel general option. None means the default.
+
+          class_cache (:class:`py:bool` or None):
+            See class-cache general option. None means the default.
+
+          class_store (:class:`py:bool` or None):
+            See class-store general option. None means the default.
+
+          pull_target_time (:class:`py:float` or None):
+            See pull-target-time general option. None means no adaptation.
+
+          daemon_mode (:class:`py:bool`):
+            If True, the command is executed by the pywbemcli daemon, which
+            keeps the connection open after the command.
+
         """
 
         self._pywbem_server = pywbem_server
@@ -94,6 +116,11 @@ class ContextObj:
         self._connections_repo = connections_repo
         self.interactive_mode = interactive_mode
         self._close_interactive_server = close_interactive_server
+        self._max_parallel = max_parallel
+        self._class_cache = class_cache
+        self._class_store = class_store
+        self._pull_target_time = pull_target_time
+        self._daemon_mode = daemon_mode
 
         self._spinner_enabled = None  # Deferred init in getter
         self._spinner_obj = click_spinner.Spinner()
@@ -143,6 +170,14 @@ class ContextObj:
         # pylint: disable=attribute-defined-outside-init
         self._interactive_mode = mode
 
+    @property
+    def daemon_mode(self):
+        """
+        :class:`py:bool`: 'True' if the command is executed by the pywbemcli
+        daemon.
+        """
+        return self._daemon_mode
+
     @property
     def log(self):
         """
@@ -164,6 +199,38 @@ class ContextObj:
         """
         return self._warn
 
+    @property
+    def max_parallel(self):
+        """
+        :term:`integer`: Maximum number of server requests that commands
+        execute concurrently.
+        """
+        return self._max_parallel or DEFAULT_MAX_PARALLEL
+
+    @property
+    def class_cache(self):
+        """
+        :class:`py:bool`: Flag indicating that the classes retrieved from a
+        WBEM server are cached on disk.
+        """
+        return bool(self._class_cache)
+
+    @property
+    def class_store(self):
+        """
+        :class:`py:bool`: Flag indicating that the classes retrieved on a
+        connection are kept in its in-session class store.
+        """
+        return self._class_store is None or bool(self._class_store)
+
+    @property
+    def pull_target_time(self):
+        """
+        :class:`py:float`: Target response time in seconds for the adaptive
+        MaxObjectCount of pull operations, or None if it is not adapted.
+        """
+        return self._pull_target_time
+
     @property
     def connections_repo(self):
         """
@@ -314,32 +381,73 @@ class ContextObj:
                 import pdb  # pylint: disable=import-outside-toplevel
                 pdb.set_trace()  # pylint: disable=forgotten-debug-statement
 
-            cmd()  # The pywbemcli command function call.
+            with profile_phase('command'):
+                cmd()  # The pywbemcli command function call.
 
         finally:
             if not self.pdb:
                 self.spinner_stop()
 
+            # Save the classes retrieved by the command in the class cache,
+            # and the adapted MaxObjectCount values.
+            if self.is_connected():
+                self.save_class_cache()
+                self.save_pull_tuner()
+
             # Issue statistics if requested and if the command used a conn.
             if self.timestats and self.is_connected():
                 context = click.get_current_context()
                 click.echo(self.format_statistics(
-                    self.pywbem_server.conn.statistics, context.obj))
+                    statistics_snapshot(self.pywbem_server.conn),
+                    context.obj))
 
             # Close any existing connection if in command mode or if the
-            # close_interactive_server flag is set
-            if not self.interactive_mode or self._close_interactive_server:
+            # close_interactive_server flag is set. The pywbemcli daemon
+            # keeps the connection for subsequent commands.
+            if (not self.interactive_mode or self._close_interactive_server) \
+                    and not self.daemon_mode:
                 if self.is_connected():
                     self.pywbem_server.disconnect()
 
-    def format_statistics(self, statistics, context):
+    def save_class_cache(self):
+        """
+        Save the class cache of the connection, if it is enabled. Failures
+        to write the cache are displayed as a warning since they do not affect
+        the result of the command.
+        """
+        class_cache = getattr(self.pywbem_server.conn, 'class_cache', None)
+        if class_cache is None:
+            return
+        try:
+            class_cache.save()
+        except OSError as exc:
+            warning_msg(f"Class cache cannot be saved in "
+                        f"{class_cache.cache_dir}: {exc}")
+
+    def save_pull_tuner(self):
+        """
+        Save the adapted MaxObjectCount values of the pull operations of the
+        connection, if they are adapted. Failures to write them are displayed
+        as a warning since they do not affect the result of the command.
+        """
+        pull_tuner = getattr(self.pywbem_server.conn, 'pull_tuner', None)
+        if pull_tuner is None:
+            return
+        try:
+            pull_tuner.save()
+        except OSError as exc:
+            warning_msg(f"Pull tuning cannot be saved in "
+                        f"{pull_tuner.tuning_file}: {exc}")
+
+    def format_statistics(self, snapshot, context):
         # pylint: disable=no-self-use
         """
-        Table formatted output of client statistics
+        Table formatted output of client statistics, from a list of tuples
+        of operation name and statistics as returned by statistics_snapshot().
         """
         output_fmt = validate_output_format(context.output_format, 'TABLE')
 
-        snapshot = sorted(statistics.snapshot(),
+        snapshot = sorted(snapshot,
                           key=lambda item: item[1].avg_time,
                           reverse=True)
 
@@ -0,0 +1,233 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client side of the pywbemcli daemon.
+
+The pywbemcli daemon (see the 'daemon' command group) is a background process
+that executes pywbemcli commands and keeps the connections to the WBEM servers
+(and with them the class stores of the connections) open between the
+commands.
+
+With the --via-daemon general option, pywbemcli sends the command line
+arguments, the current directory and the pywbemcli environment variables of
+the command as a JSON line over a Unix domain socket to the daemon. The daemon
+executes the command and sends back the stdout and stderr output of the
+command as JSON lines with an item 'stdout' or 'stderr', followed by a JSON
+line with the item 'exit_code'.
+
+Control requests of the 'daemon' commands are a JSON line with an item
+'control' that is answered by a single JSON line.
+
+This module is imported by the pywbemcli entry point before any other
+pywbemcli module, so that the pywbemcli process of a command executed by the
+daemon does not import click or pywbem. It must import only standard Python
+modules.
+"""
+
+import os
+import sys
+import json
+import shutil
+import socket
+
+from .config import PYWBEMCLI_DAEMON_SOCKET_ENVVAR
+from ._connection_file_names import DAEMON_SOCKET_FILE
+
+__all__ = []
+
+VIA_DAEMON_OPTION = '--via-daemon'
+
+# General options of pywbemcli that take a value as the next argument. They
+# are needed to find the end of the general options without importing the
+# pywbemcli command definitions.
+GENERAL_VALUE_OPTIONS = (
+    '-n', '--name', '-m', '--mock-server', '-s', '--server', '-u', '--user',
+    '-p', '--password', '--ca-certs', '-c', '--certfile', '-k', '--keyfile',
+    '-t', '--timeout', '-U', '--use-pull', '--pull-max-cnt',
+    '--max-parallel', '--pull-target-time', '-d', '--default-namespace',
+    '-o', '--output-format', '-l', '--log', '-C', '--connections-file',
+    '--batch', '--batch-jobs', '--profile-startup')
+
+# Prefixes of the environment variables of the client that are set for the
+# execution of a command in the daemon.
+CLIENT_ENVVAR_PREFIXES = ('PYWBEMCLI_', 'PYWBEMTOOLS_')
+
+# The daemon running in this process, or None. Set by the 'daemon run'
+# command.
+_DAEMON = None
+
+
+def get_daemon():
+    """
+    Return the daemon running in this process, or None if this process is not
+    the pywbemcli daemon.
+    """
+    return _DAEMON
+
+
+def set_daemon(daemon):
+    """
+    Set the daemon running in this process, or None.
+    """
+    global _DAEMON  # pylint: disable=global-statement
+    _DAEMON = daemon
+
+
+def daemon_supported():
+    """
+    Return True if the pywbemcli daemon is supported on this platform, i.e.
+    Unix domain sockets are available.
+    """
+    return hasattr(socket, 'AF_UNIX')
+
+
+def daemon_socket_path():
+    """
+    Return the path name of the Unix domain socket of the pywbemcli daemon.
+    """
+    return os.getenv(PYWBEMCLI_DAEMON_SOCKET_ENVVAR) or DAEMON_SOCKET_FILE
+
+
+def send_message(fp, message):
+    """
+    Send the message (a dictionary) as a JSON line to the binary file object
+    of a socket.
+    """
+    fp.write(json.dumps(message).encode('utf-8') + b'\n')
+    fp.flush()
+
+
+def receive_message(fp):
+    """
+    Receive a message sent with send_message() from the binary file object of
+    a socket, and return it as a dictionary. Returns None if the socket has
+    been closed by the peer.
+    """
+    line = fp.readline()
+    if not line:
+        return None
+    return json.loads(line.decode('utf-8'))
+
+
+def _connect(socket_path):
+    """
+    Connect to the daemon and return the socket, or None if the daemon is not
+    running.
+    """
+    if not daemon_supported():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def daemon_control(control, socket_path=None):
+    """
+    Send the control request to the daemon and return its response as a
+    dictionary, or None if the daemon is not running.
+    """
+    sock = _connect(socket_path or daemon_socket_path())
+    if sock is None:
+        return None
+    with sock, sock.makefile('rwb') as fp:
+        send_message(fp, {'control': control})
+        return receive_message(fp)
+
+
+def via_daemon_index(args):
+    """
+    Return the index of the --via-daemon general option in the command line
+    arguments args, or None if it is not specified.
+
+    Only the general options before the command are searched, so that the
+    option is not found in the value of another option or in the arguments
+    of the command.
+    """
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg == VIA_DAEMON_OPTION:
+            return index
+        if arg in ('--', '-') or not arg.startswith('-'):
+            # The command, or the end of the options
+            return None
+        # The value of an option may also be in the same argument, as in
+        # '--log=all' or '-lall'.
+        index += 2 if arg in GENERAL_VALUE_OPTIONS else 1
+    return None
+
+
+def strip_via_daemon(args):
+    """
+    Return the command line arguments without the --via-daemon general option.
+    """
+    args = list(args)
+    index = via_daemon_index(args)
+    if index is not None:
+        del args[index]
+    return args
+
+
+def run_via_daemon(args):
+    """
+    Execute the pywbemcli command with the command line arguments args in the
+    daemon and write its output to stdout and stderr of this process.
+
+    Returns:
+      int: Exit code of the command, or None if the daemon is not running.
+    """
+    sock = _connect(daemon_socket_path())
+    if sock is None:
+        return None
+
+    env = {name: value for name, value in os.environ.items()
+           if name.startswith(CLIENT_ENVVAR_PREFIXES)}
+    # The terminal size of the client is used for the output of the command
+    # (see shutil.get_terminal_size()).
+    columns, lines = shutil.get_terminal_size()
+    env['COLUMNS'] = str(columns)
+    env['LINES'] = str(lines)
+    request = {'args': strip_via_daemon(args), 'cwd': os.getcwd(), 'env': env}
+
+    with sock, sock.makefile('rwb') as fp:
+        send_message(fp, request)
+        while True:
+            message = receive_message(fp)
+            if message is None:
+                sys.stderr.write("Error: Connection to the pywbemcli daemon "
+                                 "closed before the command completed\n")
+                return 1
+            if 'exit_code' in message:
+                return message['exit_code']
+            try:
+                if 'stdout' in message:
+                    sys.stdout.write(message['stdout'])
+                    sys.stdout.flush()
+                else:
+                    sys.stderr.write(message['stderr'])
+                    sys.stderr.flush()
+            except BrokenPipeError:
+                # The output is no longer read (e.g. by 'head'). As for click
+                # commands, exit with 1 without an error at the exit of
+                # Python when flushing stdout.
+                devnull = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull, sys.stdout.fileno())
+                return 1
@@ -25,26 +25,42 @@ or as text.
 
 
 import re
+from collections import namedtuple
 
 import click
 
 from pywbem import CIMInstanceName, CIMInstance, CIMClass, \
     CIMQualifierDeclaration, CIMClassName, ValueMapping, siunit_obj, \
-    CIMError, CIM_ERR_NOT_SUPPORTED
+    CIMError, CIM_ERR_NOT_SUPPORTED, ModelError
 from pywbem._nocasedict import NocaseDict
 
 from ._common import sort_cimobjects, to_wbem_uri_folded
 from ._cimvalueformatter import cimvalue_to_fmtd_string
 from .._utils import get_terminal_width
 from .._output_formatting import DEFAULT_MAX_CELL_WIDTH, \
-    output_format_is_table, format_table, fold_strings
+    output_format_is_table, format_table, fold_strings, STREAM_TABLE_FORMATS, \
+    TableStream, table_stream_widths
+from .._startup_profile import profile_phase
 
 INT_TYPE_PATTERN = re.compile(r'^[su]int(8|16|32|64)$')
+NUMERIC_TYPE_PATTERN = re.compile(r'^([su]int(8|16|32|64)|real(32|64))$')
 
 # Minimum width for table view cell size. Below this width the columns become
 # unreadable.  Note that this overrides the max_terminal width.
 MIN_CELL_WIDTH = 10
 
+# Width of the table cells of the CIM types with values of limited length,
+# without quotes (see _property_cell_width()).
+_TYPE_CELL_WIDTHS = {
+    'boolean': 5, 'char16': 1, 'datetime': 25, 'real32': 15, 'real64': 24,
+    'uint8': 3, 'sint8': 4, 'uint16': 5, 'sint16': 6, 'uint32': 10,
+    'sint32': 11, 'uint64': 20, 'sint64': 20}
+
+# Width of the table cells of values without limited length (e.g. strings
+# without MaxLen qualifier) in streamed tables, if the max_cell_width command
+# option is not used. Longer values are folded.
+STREAM_CELL_WIDTH = 30
+
 ####################################################################
 #
 #  Display of CIM objects in format defined by output_format
@@ -52,6 +68,7 @@ MIN_CELL_WIDTH = 10
 ####################################################################
 
 
+@profile_phase('display')
 def display_cim_objects(context, cim_objects, output_format, summary=False,
                         property_list=None, quote_strings=True,
                         ignore_null_properties=True, object_order=False,
@@ -191,12 +208,342 @@ def display_cim_objects(context, cim_objects, output_format, summary=False,
     _display_as_cim_objects(cim_objects, output_format, object_order)
 
 
-############################################################################
-#
-# Support methods for displaying CIM objects.  This includes multiple
-# output formats (ie. MOF, TABLE, TEXT), table display and summary display.
-#
-############################################################################
+@profile_phase('display')
+def display_cim_objects_stream(context, cim_objects, output_format,
+                               summary=False, property_list=None,
+                               quote_strings=True, ignore_null_properties=True,
+                               namespace=None, ctx_options=None,
+                               sample_size=None):
+    """
+    Display CIM objects from an iterable as they are received rather than
+    after all of them have been received.
+
+    This is used for requests that may return very large numbers of objects
+    (ex. the generators returned by the pywbem Iter... operations) so that
+    only a limited number of objects is held in memory at any time. The
+    objects are displayed in the order received (i.e. they are not sorted).
+
+    CIM object output formats (mof, xml, repr, txt) display each object when
+    it is received. The table output formats in STREAM_TABLE_FORMATS display
+    the row of each object when it is received, with the columns and column
+    widths determined from the creation class of the objects (see
+    _StreamedTable). The other table output formats display a table for each
+    chunk of up to sample_size objects.
+
+    If summary is True, the objects are only counted and nothing is
+    displayed.  The caller displays the summary with
+    display_cim_objects_summary_counts().
+
+    Parameters:
+
+      context (:class:`ContextObj`):
+        Click context contained in ContextObj object.
+
+      cim_objects (iterable of :class:`~pywbem.CIMInstance` or
+        :class:`~pywbem.CIMInstanceName`):
+        Iterable of zero or more CIM objects to be displayed.
+
+      output_format (:term:`string`):
+        String defining the output format.
+
+      summary (:class:`py:bool`):
+        Count the objects instead of displaying them.
+
+      property_list (iterable of :term:`string`):
+        See display_cim_objects().
+
+      quote_strings (:class:`py.bool`):
+        See display_cim_objects().
+
+      ignore_null_properties (:class:`py.bool`):
+        See display_cim_objects().
+
+      namespace (:term:`string`):
+        Namespace of the objects if the namespace is to be included in the
+        display because the request includes multiple namespaces or None.
+
+      sample_size (:term:`integer`):
+        Number of objects per table for the table output formats that are
+        not in STREAM_TABLE_FORMATS. If None, the pull_max_cnt of the
+        current server is used.
+
+    Returns:
+      tuple of count of objects received and the CIM type name of the
+      objects (or None if no objects were received).
+    """
+    count = 0
+    cim_type = None
+    is_table = output_format_is_table(output_format)
+    if sample_size is None:
+        sample_size = context.pywbem_server.pull_max_cnt
+    if is_table and output_format in STREAM_TABLE_FORMATS:
+        streamed_table = _StreamedTable(
+            context, output_format, property_list=property_list,
+            quote_strings=quote_strings, namespace=namespace,
+            ctx_options=ctx_options)
+    else:
+        streamed_table = None
+    chunk = []
+
+    for cim_object in cim_objects:
+        if count == 0:
+            context.spinner_stop()
+            cim_type = _get_cimtype([cim_object])
+        count += 1
+        if summary:
+            continue
+        if streamed_table:
+            streamed_table.add(cim_object)
+        elif is_table:
+            chunk.append(cim_object)
+            if len(chunk) >= sample_size:
+                _display_list_as_table(context, chunk, output_format,
+                                       property_list, quote_strings,
+                                       ignore_null_properties,
+                                       use_namespace=bool(namespace),
+                                       ctx_options=ctx_options)
+                chunk = []
+        else:
+            _display_one_cim_object(cim_object, output_format,
+                                    namespace=namespace)
+
+    if streamed_table:
+        streamed_table.end()
+    if chunk:
+        _display_list_as_table(context, chunk, output_format, property_list,
+                               quote_strings, ignore_null_properties,
+                               use_namespace=bool(namespace),
+                               ctx_options=ctx_options)
+    return count, cim_type
+
+
+class _StreamedTable:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Table of CIM instances or CIM instance names that is displayed row by row
+    as the objects are added, using TableStream.
+
+    Each object is displayed when it is added. The columns of a table and
+    their widths are determined from the creation class of its first object,
+    as retrieved from the WBEM server (or from the first object itself if the
+    WBEM server does not support class operations): For instances, the
+    columns are the properties of the class (or the properties in
+    property_list); for instance names, the columns are the keys of the
+    first instance name. The widths of the cells are determined from the CIM
+    types and MaxLen qualifiers of the properties, limited to the maximum
+    cell width (see _property_cell_width()). Values without limited length
+    use the max_cell_width command option, or STREAM_CELL_WIDTH. Longer
+    values are folded.
+
+    When an object of a different creation class (or an instance with a
+    non-Null property that is not a column, or an instance name with
+    different key names) is added, the current table is ended and a new
+    table is started for it.
+    """
+
+    def __init__(self, context, output_format, property_list=None,
+                 quote_strings=True, namespace=None, ctx_options=None):
+        self.context = context
+        self.output_format = output_format
+        self.property_list = property_list
+        self.quote_strings = quote_strings
+        self.namespace = namespace
+        self.ctx_options = ctx_options
+        # TableStream of the current table and functions to check whether an
+        # object fits into it and to format its row.
+        self._table = None
+        self._fits = None
+        self._format_row = None
+
+    def add(self, cim_object):
+        """
+        Add an object to the table and display it.
+        """
+        if self._table is None or not self._fits(cim_object):
+            self._end_table()
+            if isinstance(cim_object, CIMInstance):
+                self._start_instances_table(cim_object)
+            else:
+                self._start_instance_names_table(cim_object)
+            click.echo(self._table.header())
+        click.echo(self._table.format_row(self._format_row(cim_object)))
+
+    def end(self):
+        """
+        End the table.
+        """
+        self._end_table()
+
+    def _end_table(self):
+        if self._table is not None:
+            footer = self._table.footer()
+            if footer:
+                click.echo(footer)
+            self._table = None
+
+    def _get_class(self, path):
+        """
+        Return the creation class (with qualifiers) of the object with the
+        instance path path, or None if the WBEM server does not support class
+        operations.
+        """
+        if path is None:
+            return None
+        try:
+            return self.context.pywbem_server.conn.GetClass(
+                path.classname, namespace=path.namespace,
+                IncludeQualifiers=True, LocalOnly=False)
+        except CIMError as exc:
+            if exc.status_code == CIM_ERR_NOT_SUPPORTED:
+                return None
+            raise
+
+    def _default_cell_width(self, max_cell_width):
+        """
+        Return the width of the table cells of values without limited length.
+        """
+        if self.ctx_options and self.ctx_options.get('max_cell_width'):
+            return max_cell_width
+        return min(max_cell_width, STREAM_CELL_WIDTH)
+
+    def _start_table(self, headers, title, cell_widths, numeric):
+        widths = table_stream_widths(headers, None, cell_widths=cell_widths)
+        self._table = TableStream(headers, widths,
+                                  table_format=self.output_format,
+                                  title=title, numeric=numeric)
+
+    def _start_instances_table(self, inst):
+        """
+        Start a table with the layout determined from the creation class of
+        the instance inst.
+        """
+        class_obj = self._get_class(inst.path)
+        if class_obj is not None:
+            props = class_obj.properties
+            key_names = [pn for pn, prop in props.items()
+                         if prop.qualifiers.get('Key') and
+                         prop.qualifiers['Key'].value]
+        else:
+            props = inst.properties
+            key_names = list(inst.path.keybindings) if inst.path else []
+
+        if self.property_list:
+            prop_names = [props[pn].name for pn in self.property_list
+                          if pn in props]
+        else:
+            key_set = NocaseDict((kn, True) for kn in key_names)
+            prop_names = sorted(key_set, key=str.lower) + sorted(
+                (pn for pn in props if pn not in key_set), key=str.lower)
+        columns = NocaseDict((pn, True) for pn in prop_names)
+
+        max_cell_width = _table_max_cell_width(
+            get_terminal_width(), len(prop_names), self.ctx_options)
+        class_objs = NocaseDict([(inst.classname, class_obj)]) \
+            if class_obj is not None else None
+        headers = _instances_table_headers(
+            prop_names, class_objs, max_cell_width, namespace=self.namespace)
+        default_width = self._default_cell_width(max_cell_width)
+        cell_widths = [len(self.namespace)] if self.namespace else []
+        cell_widths.extend(
+            _property_cell_width(props[pn], max_cell_width, default_width,
+                                 quote_strings=self.quote_strings)
+            for pn in prop_names)
+        numeric = [False] if self.namespace else []
+        numeric.extend(_is_numeric_property(props[pn]) for pn in prop_names)
+        classname = inst.classname
+        # All instances of the table have the same creation class
+        valuemappings = _resolve_valuemappings(
+            self.context.pywbem_server.conn, [inst], prop_names)
+
+        def fits(inst):
+            if not isinstance(inst, CIMInstance) or \
+                    inst.classname.lower() != classname.lower():
+                return False
+            return all(propname in columns or prop.value is None
+                       for propname, prop in inst.properties.items())
+
+        def format_row(inst):
+            return _format_instances_as_rows(
+                [inst], max_cell_width, context=self.context,
+                prop_names=prop_names, quote_strings=self.quote_strings,
+                namespace=self.namespace, valuemappings=valuemappings)[0]
+
+        self._fits = fits
+        self._format_row = format_row
+        self._start_table(
+            headers, _instances_table_title(classname, self.ctx_options),
+            cell_widths, numeric)
+
+    def _start_instance_names_table(self, instname):
+        """
+        Start a table for instance names of the creation class and with the
+        key names of the instance name instname.
+        """
+        inst_keys = sorted(instname.keys())
+        key_set = {kn.lower() for kn in inst_keys}
+        classname = instname.classname
+        class_obj = self._get_class(instname)
+
+        max_cell_width = _table_max_cell_width(
+            get_terminal_width(), len(inst_keys), self.ctx_options)
+        default_width = self._default_cell_width(max_cell_width)
+        cell_widths = [len(instname.host or ''),
+                       len(instname.namespace or ''), len(classname)]
+        numeric = [False] * 3
+        for key in inst_keys:
+            if class_obj is not None and key in class_obj.properties:
+                prop = class_obj.properties[key]
+                cell_widths.append(_property_cell_width(
+                    prop, max_cell_width, default_width, quote_strings=False))
+                numeric.append(_is_numeric_property(prop))
+            else:
+                cell_widths.append(default_width)
+                numeric.append(False)
+
+        def fits(instname):
+            return isinstance(instname, CIMInstanceName) and \
+                instname.classname.lower() == classname.lower() and \
+                {kn.lower() for kn in instname.keys()} == key_set
+
+        self._fits = fits
+        self._format_row = lambda instname: _instance_name_row(instname,
+                                                               inst_keys)
+        self._start_table(_instance_name_headers(inst_keys),
+                          f'InstanceNames: {classname}', cell_widths, numeric)
+
+
+def _property_cell_width(prop, max_cell_width, default_width,
+                         quote_strings=True):
+    """
+    Return the width of the table cells of the property prop (a CIMProperty
+    of a class, or of an instance if the class is not available), determined
+    from its CIM type and, for strings, its MaxLen qualifier, limited to
+    max_cell_width. Arrays, strings without MaxLen qualifier, references and
+    properties with value mappings (whose cells also show the mapped values)
+    use default_width.
+    """
+    if prop.is_array or prop.embedded_object or 'Values' in prop.qualifiers:
+        return default_width
+    if prop.type == 'string':
+        maxlen = prop.qualifiers.get('MaxLen')
+        width = maxlen.value if maxlen is not None else None
+    else:
+        width = _TYPE_CELL_WIDTHS.get(prop.type)
+    if not width:
+        return default_width
+    if quote_strings and prop.type in ('string', 'char16', 'datetime'):
+        width += 2
+    return min(width, max_cell_width)
+
+
+def _is_numeric_property(prop):
+    """
+    Return boolean indicating whether the table cells of the property prop
+    are numbers that are right aligned.
+    """
+    return bool(NUMERIC_TYPE_PATTERN.match(prop.type or '')) and \
+        not prop.is_array and 'Values' not in prop.qualifiers
+
 
 def sort_display_objects(cim_objects):
     """
@@ -562,6 +909,52 @@ def _display_cim_objects_summary(context, objects, output_format):
         else:
             rows = [[0, cim_type]]
 
+    _display_summary_rows(rows, headers, cim_type, output_format)
+
+
+@profile_phase('display')
+def display_cim_objects_summary_counts(context, counts, cim_type,
+                                       output_format):
+    """
+    Display a summary of objects that were counted rather than collected,
+    (ex. by display_cim_objects_stream()) in the same form as the summary
+    display of display_cim_objects().
+
+    Parameters:
+
+      context (:class:`ContextObj`):
+        Click context contained in ContextObj object.
+
+      counts (:class:`~pywbem._nocasedict.NocaseDict`):
+        Dictionary where the keys are namespace names and the values are the
+        count of objects in that namespace or None if the request for the
+        namespace failed.
+
+      cim_type (:term:`string`):
+        CIM type name of the counted objects or None if no objects were
+        counted.
+
+      output_format (:term:`string`):
+        String defining the output format.
+    """
+    context.spinner_stop()
+
+    if len(counts) == 1:
+        headers = ['Count', 'CIM Type']
+        count = list(counts.values())[0]
+        rows = [[count or 0, cim_type]]
+    else:
+        headers = ['Namespace', 'Count', 'CIM Type']
+        rows = [[ns, count or 0, cim_type] for ns, count in counts.items()]
+
+    _display_summary_rows(rows, headers, cim_type, output_format)
+
+
+def _display_summary_rows(rows, headers, cim_type, output_format):
+    """
+    Display the rows of a summary of objects either as a table or as
+    text, depending on output_format.
+    """
     title = f'Summary of {cim_type}(s) returned'
     if output_format_is_table(output_format):
         click.echo(format_table(rows, headers, title=title,
@@ -594,6 +987,31 @@ def _display_classes_as_table(classes, table_width, table_format):
         click.echo(class_.tomof())
 
 
+def _instance_name_headers(inst_keys):
+    """
+    Return the column headers of a table of instance names with the key names
+    in inst_keys.
+    """
+    return ['host', 'namespace', 'class'] + \
+        [f"key=\n{kn}" for kn in inst_keys]
+
+
+def _instance_name_row(instname, inst_keys):
+    """
+    Return the table row of an instance name with the values of the keys in
+    inst_keys.
+    """
+    row = [instname.host, instname.namespace, instname.classname]
+    for key in inst_keys:
+        if isinstance(instname[key], CIMInstanceName):
+            # If key is CIMInstanceName, fold the value
+            row.append(to_wbem_uri_folded(
+                instname[key], uri_format='standard', max_len=30))
+        else:
+            row.append(instname[key])
+    return row
+
+
 def _display_paths_as_table(objects, table_width, table_format, namespace=None):
     # pylint: disable=unused-argument
     """
@@ -658,20 +1076,8 @@ def _display_paths_as_table(objects, table_width, table_format, namespace=None):
                 # consistent table output.
                 inst_keys = sorted(original_keys[key_names])
 
-                rows = []
-                for instname in inst_names:
-                    # Build header row for this table
-                    row = [instname.host, instname.namespace,
-                           instname.classname]
-                    for key in inst_keys:
-                        if isinstance(instname[key], CIMInstanceName):
-                            # If key is CIMInstanceName, fold the value
-                            row.append(to_wbem_uri_folded(
-                                instname[key], uri_format='standard',
-                                max_len=30))
-                        else:
-                            row.append(instname[key])
-                    rows.append(row)
+                rows = [_instance_name_row(instname, inst_keys)
+                        for instname in inst_names]
 
                 # If multiple tables, number them as hint to reader that there
                 # are multiples.
@@ -681,8 +1087,7 @@ def _display_paths_as_table(objects, table_width, table_format, namespace=None):
                 else:
                     table_number_str = ''
 
-                headers = ['host', 'namespace', 'class'] + \
-                    [f"key=\n{kn}" for kn in inst_keys]
+                headers = _instance_name_headers(inst_keys)
 
                 title = f'InstanceNames: {inst_names[0].classname}' \
                         f'{table_number_str}'
@@ -757,9 +1162,52 @@ def _display_qual_decls_as_table(qual_decls, table_width, table_format):
                             table_format=table_format))
 
 
+def _resolve_valuemappings(conn, insts, prop_names):
+    """
+    Return the ValueMapping objects of the integer-typed properties in
+    prop_names of the instances in insts, as a dictionary with the tuple of
+    lower case class name and property name as key and the ValueMapping
+    object (or None if the property has no value mapping) as value.
+
+    The creation classes of the instances are retrieved by
+    ValueMapping.for_property() through the class store of the connection,
+    so that each class is retrieved once for all of its properties and for
+    the other uses of the class (e.g. the units in table output).
+
+    The value mappings are kept in the class store of the connection so that
+    they are reused for the instances in other namespaces and by subsequent
+    commands in interactive mode. Classes with the same name in different
+    namespaces are assumed to define the same value mappings.
+    """
+    class_store = getattr(conn, 'class_store', None)
+    valuemappings = class_store.valuemappings if class_store is not None \
+        else {}
+
+    for inst in insts:
+        cln = inst.classname.lower()
+        for name in prop_names:
+            prop = inst.properties.get(name)
+            if prop is None or not INT_TYPE_PATTERN.match(prop.type):
+                continue
+            vm_key = (cln, name.lower())
+            if vm_key in valuemappings:
+                continue
+            try:
+                valuemapping = ValueMapping.for_property(
+                    conn, inst.path.namespace, inst.classname, name)
+            except (KeyError, ValueError, ModelError):
+                # Property not in the class, without Values qualifier, or
+                # with an invalid value mapping.
+                valuemapping = None
+            valuemappings[vm_key] = valuemapping
+
+    return valuemappings
+
+
 def _format_instances_as_rows(insts, max_cell_width, include_classnames=False,
                               context=None, prop_names=None,
-                              quote_strings=True, namespace=None):
+                              quote_strings=True, namespace=None,
+                              valuemappings=None):
     """
     Format the list of instances properties into a list of the property
     values for each instance(a row of the table) gathered into a list of
@@ -780,7 +1228,9 @@ def _format_instances_as_rows(insts, max_cell_width, include_classnames=False,
     The property values are formatted similar to MOF output. Properties that
     have a ValueMap qualifier (effectively, in the creation class of the
     instance) are shown with both the actual property value and the mapped
-    value in parenthesis.
+    value in parenthesis. The value mappings are resolved for all instances
+    before the rows are built (see _resolve_valuemappings()), unless they
+    are passed in valuemappings.
 
     NOTE: This is a separate function to allow testing of the table formatting
     independently of print output.
@@ -801,10 +1251,12 @@ def _format_instances_as_rows(insts, max_cell_width, include_classnames=False,
     if prop_names is None:
         prop_names = _sorted_prop_names(insts)
 
-    # Cache of ValueMapping objects for integer-typed properties.
-    # Key: classname.propertyname, both in lower case.
+    # ValueMapping objects for integer-typed properties.
+    # Key: tuple of classname and propertyname, both in lower case.
     # A value of None indicates the property does not have a value mapping.
-    valuemappings = {}
+    if valuemappings is None:
+        valuemappings = _resolve_valuemappings(conn, insts, prop_names) \
+            if context else {}
 
     for inst in insts:
         assert isinstance(inst, CIMInstance), \
@@ -832,24 +1284,8 @@ def _format_instances_as_rows(insts, max_cell_width, include_classnames=False,
                 value = inst.get(name)
                 prop = inst.properties[name]
 
-                # Cache value mappings for integer-typed properties
-                if INT_TYPE_PATTERN.match(prop.type) and context:
-                    vm_key = f'{inst.classname.lower()}.{name.lower()}'
-                    try:
-                        valuemapping = valuemappings[vm_key]
-                    except KeyError:
-                        try:
-                            valuemapping = ValueMapping.for_property(
-                                conn,
-                                inst.path.namespace,
-                                inst.classname,
-                                name)
-                        except ValueError:
-                            # Property does not have a value mapping.
-                            valuemapping = None
-                        valuemappings[vm_key] = valuemapping
-                else:
-                    valuemapping = None
+                valuemapping = valuemappings.get(
+                    (inst.classname.lower(), name.lower()))
 
                 if value is None:
                     val_str = ''
@@ -864,30 +1300,30 @@ def _format_instances_as_rows(insts, max_cell_width, include_classnames=False,
     return rows
 
 
-def _display_instances_as_table(insts, table_width, table_format,
-                                include_classnames=False, context=None,
-                                property_list=None, quote_strings=True,
-                                ignore_null_properties=True,
-                                namespace=None, ctx_options=None):
-    """
-    Print the properties of the instances defined in insts as a table where
-    each row is an instance and each column is a property value.
+# Layout of an instance table, see _instances_table_layout()
+InstancesTableLayout = namedtuple(
+    'InstancesTableLayout',
+    'prop_names include_classnames max_cell_width headers title')
 
-    All properties in the instance are included.
 
-    The header line consists of the property names.
+def _instances_table_layout(insts, table_width, context=None,
+                            property_list=None, ignore_null_properties=True,
+                            namespace=None, ctx_options=None):
+    """
+    Determine the layout of a table of the instances in insts: the displayed
+    properties, whether a classname column is included, the maximum cell
+    width, the creation classes of the instances (or None if units are not
+    shown), the (folded) column headers and the table title.
 
-    The property values are formatted similar to MOF output. Properties that
-    have a ValueMap qualifier (effectively, in the creation class of the
-    instance) are shown with both the actual property value and the mapped
-    value in parenthesis.
+    The maximum cell width is the max_cell_width command option, if it is
+    defined in ctx_options, or otherwise derived from the table width and the
+    number of properties.
 
+    Returns:
+        InstancesTableLayout: The layout of the table.
     """
     conn = context.pywbem_server.conn if context else None
 
-    if table_width is None:
-        table_width = get_terminal_width()
-
     for inst in insts:
         assert isinstance(inst, CIMInstance)
 
@@ -914,16 +1350,8 @@ def _display_instances_as_table(insts, table_width, table_format,
         # Rebuild prop names from dict in same order as original list
         prop_names = [pn for pn in prop_names if pn in props_with_value_dict]
 
-    # Try to estimate max cell width from number of cols and properties
-    # This allows folding long data. Further, the actual output
-    # width of a column involves the tabulate outputter, output_format
-    # so this is not deterministic.
-    max_cell_width = int(table_width / len(prop_names)) \
-        if prop_names else table_width
-
-    # Sets a minimum size for cells so they are at least readable.
-    # This means we can build tables wider than the terminal width.
-    max_cell_width = max(max_cell_width, MIN_CELL_WIDTH)
+    max_cell_width = _table_max_cell_width(table_width, len(prop_names),
+                                           ctx_options)
 
     # ISSUE #953 Future: Decide whether and how the showing of units should be
     #            controlled. Or are we satisfied with always showing them?
@@ -957,6 +1385,45 @@ def _display_instances_as_table(insts, table_width, table_format,
                     break
             class_objs[classname] = class_obj
 
+    disp_headers = _instances_table_headers(
+        prop_names, class_objs if show_units else None, max_cell_width,
+        namespace=namespace, include_classnames=include_classnames)
+
+    title = _instances_table_title(insts[0].classname, ctx_options)
+
+    return InstancesTableLayout(prop_names, include_classnames,
+                                max_cell_width, disp_headers, title)
+
+
+def _table_max_cell_width(table_width, num_columns, ctx_options):
+    """
+    Return the maximum cell width of a table with num_columns property
+    columns: The max_cell_width command option, if it is defined in
+    ctx_options, or otherwise derived from the table width.
+    """
+    if ctx_options and ctx_options.get('max_cell_width'):
+        max_cell_width = ctx_options['max_cell_width']
+    else:
+        # Try to estimate max cell width from number of cols and properties
+        # This allows folding long data. Further, the actual output
+        # width of a column involves the tabulate outputter, output_format
+        # so this is not deterministic.
+        max_cell_width = int(table_width / num_columns) \
+            if num_columns else table_width
+
+    # Sets a minimum size for cells so they are at least readable.
+    # This means we can build tables wider than the terminal width.
+    return max(max_cell_width, MIN_CELL_WIDTH)
+
+
+def _instances_table_headers(prop_names, class_objs, max_cell_width,
+                             namespace=None, include_classnames=False):
+    """
+    Return the list of the (folded) column headers of a table of instances
+    with the properties in prop_names. If class_objs is not None, it is a
+    NocaseDict of the creation classes of the instances and the units of the
+    properties are shown in the headers.
+    """
     # Construct the header line
     headers = []  # list of header strings
     # If we want to include namespace in table as a row
@@ -966,7 +1433,7 @@ def _display_instances_as_table(insts, table_width, table_format,
         headers.append("classname")
     for pname in prop_names:
         hdr = pname
-        if show_units:
+        if class_objs is not None:
             # In theory, two leaf classes from different vendors could have
             # introduced same-named properties with different unit definitions.
             # We account for that by showing a list of units in that case.
@@ -984,12 +1451,6 @@ def _display_instances_as_table(insts, table_width, table_format,
                 hdr += f" [{siunit}]"
         headers.append(hdr)
 
-    rows = _format_instances_as_rows(
-        insts, max_cell_width,
-        include_classnames=include_classnames,
-        context=context, prop_names=prop_names,
-        quote_strings=quote_strings, namespace=namespace)
-
     # Fold the headers if necessary. Fold on either hypens or single word
     # too long because the headers are all single words
     disp_headers = []
@@ -1001,15 +1462,56 @@ def _display_instances_as_table(insts, table_width, table_format,
                                              break_on_hyphens=True))
         else:
             disp_headers.append(header)
+    return disp_headers
 
-    # Display string if cmd option deep_inheritance exists and is True
 
+def _instances_table_title(classname, ctx_options):
+    """
+    Return the title of a table of instances of the class classname.
+    """
+    # Display string if cmd option deep_inheritance exists and is True
     di = ""
     if ctx_options:   # This is just for test support
         di = "; deep-inheritance" if ctx_options.get('deep_inheritance') else ""
-    title = f'Instances: {insts[0].classname}{di}'
+    return f'Instances: {classname}{di}'
+
+
+def _display_instances_as_table(insts, table_width, table_format,
+                                context=None, property_list=None,
+                                quote_strings=True,
+                                ignore_null_properties=True,
+                                namespace=None, ctx_options=None):
+    """
+    Print the properties of the instances defined in insts as a table where
+    each row is an instance and each column is a property value.
+
+    All properties in the instance are included.
+
+    The header line consists of the property names.
+
+    The property values are formatted similar to MOF output. Properties that
+    have a ValueMap qualifier (effectively, in the creation class of the
+    instance) are shown with both the actual property value and the mapped
+    value in parenthesis.
+
+    The class name column is included if the instances have different
+    classes.
+    """
+    if table_width is None:
+        table_width = get_terminal_width()
+
+    layout = _instances_table_layout(
+        insts, table_width, context=context, property_list=property_list,
+        ignore_null_properties=ignore_null_properties, namespace=namespace,
+        ctx_options=ctx_options)
+
+    rows = _format_instances_as_rows(
+        insts, layout.max_cell_width,
+        include_classnames=layout.include_classnames,
+        context=context, prop_names=layout.prop_names,
+        quote_strings=quote_strings, namespace=namespace)
 
-    click.echo(format_table(rows, disp_headers, title=title,
+    click.echo(format_table(rows, layout.headers, title=layout.title,
                             table_format=table_format))
 
 
@@ -0,0 +1,415 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+File format of the pickle files of the mock cache: the mockenv and layer
+files in the mock cache directory of a connection, and the pickle files of
+the compiled schema caches.
+
+A mock cache file consists of a header, an index and sections that are
+pickled separately:
+
+* The main section contains the pickled object (e.g. the dictionary with the
+  CIM repository and the provider registry of a mock environment), where each
+  object store of a CIM repository is pickled as a reference to a section.
+
+* Each object store, i.e. the CIM classes, CIM instances or CIM qualifier
+  declarations of a namespace, has its own section.
+
+When a mock cache file is loaded, the object stores are unpickled only when
+they are used for the first time, so that a command unpickles only the parts
+of the CIM repository it uses. Except on Windows, a section is also read from
+the mock cache file only when it is unpickled.
+
+In all sections, the CIM objects that are unchanged from a compiled schema
+are pickled as references into the compiled schema cache, so that they are
+stored only once on disk.
+
+This module is imported only when a mock environment is used, so that the
+pywbem_mock package is not imported for connections to real WBEM servers.
+"""
+
+import io
+import os
+import pickle
+import struct
+import weakref
+import threading
+from functools import partial
+
+import pywbem
+import pywbem_mock
+
+from ._connection_file_names import MOCKCACHE_ROOT_DIR
+
+__all__ = []
+
+# First bytes of a mock cache file. Mock cache files without them are a
+# single pickle.
+MOCKCACHE_FILE_MAGIC = b'pywbemcli-mockcache-2\n'
+
+# Format of the length of the index after the magic bytes
+INDEX_LENGTH_FORMAT = '<Q'
+
+# Suffix of the directory names of the compiled schema caches in the mock
+# cache root directory, and file name of the mock cache file in them.
+SCHEMA_CACHE_SUFFIX = '.schema'
+SCHEMA_CACHE_FILE = 'schema.pkl'
+
+# Types of the object stores of a CIM repository, used in the references to
+# the CIM objects of a compiled schema.
+STORE_TYPES = ('class', 'instance', 'qualifier')
+
+
+class SchemaCacheMissing(Exception):
+    """
+    Indicates that a compiled schema cache does not exist.
+    """
+    pass
+
+
+def write_cache_file(file_path, data):
+    """
+    Write the data (bytes) to a file of the mock cache. The data is written to
+    a temporary file first that is then renamed, so that concurrently running
+    pywbemcli processes never see partial files.
+    """
+    tmp_file = f'{file_path}.{os.getpid()}.tmp'
+    with open(tmp_file, 'wb') as fp:
+        fp.write(data)
+    os.replace(tmp_file, file_path)
+
+
+def schema_cache_dir(schema_key):
+    """
+    Return the path name of the directory of a compiled schema cache.
+    """
+    return os.path.join(MOCKCACHE_ROOT_DIR, schema_key + SCHEMA_CACHE_SUFFIX)
+
+
+def iter_repository_objects(cimrepository):
+    """
+    Generator that iterates through the CIM objects in a CIM repository and
+    yields a tuple of the reference and the CIM object, where the reference is
+    a tuple of store type, namespace and object name.
+    """
+    for namespace in cimrepository.namespaces:
+        for store_type in STORE_TYPES:
+            store = getattr(cimrepository, f'get_{store_type}_store')(namespace)
+            for name in store.iter_names():
+                yield ((store_type, namespace, name),
+                       store.get(name, copy=False))
+
+
+class _LazyObjectStore(pywbem_mock.InMemoryObjectStore):
+    """
+    Object store of a CIM repository loaded from a mock cache file, whose
+    CIM objects are unpickled from their section when the object store is
+    used for the first time.
+    """
+
+    def __init__(self, cim_object_type, loader, lock):
+        """
+        Parameters:
+
+          cim_object_type: The pywbem class of the CIM objects.
+
+          loader (callable): Function without parameters that returns the
+            data of the object store.
+
+          lock (threading.Lock): Lock for the loading of the data.
+        """
+        super().__init__(cim_object_type)
+        self._loader = loader
+        self._lock = lock
+
+    @property
+    def _data(self):
+        if self._loader is not None:
+            with self._lock:
+                if self._loader is not None:
+                    self._loaded_data = self._loader()
+                    self._loader = None
+        return self._loaded_data
+
+    @_data.setter
+    def _data(self, data):
+        self._loaded_data = data
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_loaded_data'] = self._data
+        state['_loader'] = None
+        state['_lock'] = None
+        return state
+
+
+class _MockCachePickler(pickle.Pickler):
+    """
+    Pickler for the sections of a mock cache file.
+    """
+
+    def __init__(self, file, writer):
+        super().__init__(file)
+        self._writer = writer
+
+    def persistent_id(self, obj):
+        if isinstance(obj, pywbem_mock.InMemoryObjectStore):
+            # pylint: disable=protected-access
+            return ('section', self._writer.add_section(obj),
+                    obj._cim_object_type.__name__)
+
+        # The CIM repository stores copies of the objects that are created or
+        # modified, so an object that is still in the CIM repository is
+        # unchanged.
+        entry = self._writer.schema_objects.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            self._writer.refs[id(obj)] = entry
+            self._writer.schema_keys.add(entry[1][0])
+            return entry[1]
+        return None
+
+
+class _MockCacheWriter:
+    # pylint: disable=too-few-public-methods
+    """
+    Pickles an object into the sections of a mock cache file.
+    """
+
+    def __init__(self, schema_objects):
+        self.schema_objects = schema_objects
+        self.sections = []
+        self.refs = {}
+        self.schema_keys = set()
+
+    def pickle(self, obj):
+        """
+        Pickle an object and return the pickled data.
+        """
+        buffer = io.BytesIO()
+        _MockCachePickler(buffer, self).dump(obj)
+        return buffer.getvalue()
+
+    def add_section(self, store):
+        """
+        Pickle the data of an object store into a new section and return the
+        index of the section.
+        """
+        index = len(self.sections)
+        self.sections.append(None)
+        # pylint: disable=protected-access
+        self.sections[index] = self.pickle(store._data)
+        return index
+
+
+def write_mockcache_file(file_path, obj, schema_objects):
+    """
+    Write an object to a mock cache file.
+
+    Parameters:
+
+      file_path (string): Path name of the mock cache file.
+
+      obj (object): The object. The object stores of CIM repositories in it
+        are pickled into their own sections.
+
+      schema_objects (dict): The CIM objects of compiled schemas that are
+        pickled as references into the compiled schema caches.
+        Key: id() of the object, value: tuple of the object and its
+        reference, which is a tuple of the key of the compiled schema cache,
+        store type, namespace and object name.
+
+    Returns:
+      dict: The CIM objects that have been pickled as references. Key: id()
+      of the object, value: tuple of the object and its reference.
+    """
+    writer = _MockCacheWriter(schema_objects)
+    main = writer.pickle(obj)
+    sections = []
+    offset = len(main)
+    for section in writer.sections:
+        sections.append((offset, len(section)))
+        offset += len(section)
+    index = pickle.dumps({'schemas': sorted(writer.schema_keys),
+                          'main': (0, len(main)),
+                          'sections': sections})
+    write_cache_file(file_path, b''.join(
+        [MOCKCACHE_FILE_MAGIC, struct.pack(INDEX_LENGTH_FORMAT, len(index)),
+         index, main] + writer.sections))
+    return writer.refs
+
+
+def _open_file(file_path):
+    """
+    Open a file for reading its content at offsets.
+
+    Except on Windows, the file is kept open and its content is read when
+    needed. On Windows, the file is read and closed, because an open file
+    cannot be replaced by concurrently running pywbemcli processes.
+
+    Returns:
+      tuple: Size of the file and function with parameters offset and length
+      that returns the content of the file at the offset as bytes.
+    """
+    if hasattr(os, 'pread'):
+        fd = os.open(file_path, os.O_RDONLY)
+        read = partial(_pread, fd)
+        weakref.finalize(read, os.close, fd)
+        return os.fstat(fd).st_size, read
+
+    with open(file_path, 'rb') as fp:
+        data = fp.read()
+    return len(data), lambda offset, length: data[offset:offset + length]
+
+
+def _pread(fd, offset, length):
+    return os.pread(fd, length, offset)
+
+
+class _MockCacheUnpickler(pickle.Unpickler):
+    """
+    Unpickler for the sections of a mock cache file.
+    """
+
+    def __init__(self, file, reader):
+        super().__init__(file)
+        self._reader = reader
+
+    def persistent_load(self, pid):
+        if pid[0] == 'section':
+            _, index, type_name = pid
+            return _LazyObjectStore(getattr(pywbem, type_name),
+                                    partial(self._reader.load_section, index),
+                                    self._reader.lock)
+        return self._reader.resolve(pid)
+
+
+class MockCacheReader:
+    """
+    Reads a mock cache file.
+
+    The file and the compiled schema caches it references are read when the
+    reader is created, and the sections of the object stores are unpickled
+    when the object stores are used for the first time.
+
+    The CIM objects that have been unpickled from references into compiled
+    schema caches are recorded in the refs attribute (key: id() of the object,
+    value: tuple of the object and its reference).
+    """
+
+    def __init__(self, file_path, schemas=None, objects=None):
+        """
+        Parameters:
+
+          file_path (string): Path name of the mock cache file.
+
+          schemas (dict): The CIM repositories of the compiled schema caches
+            that have already been loaded, by key.
+
+          objects (dict): CIM objects that are used for references, instead
+            of loading them from the compiled schema caches, by reference.
+
+        Raises:
+          OSError: The file cannot be read.
+          SchemaCacheMissing: A compiled schema cache referenced by the file
+            does not exist.
+        """
+        size, self._read = _open_file(file_path)
+        self._schemas = {} if schemas is None else schemas
+        self._objects = objects or {}
+        self.refs = {}
+        self.lock = threading.Lock()
+
+        offset = len(MOCKCACHE_FILE_MAGIC)
+        header = self._read(0, offset + struct.calcsize(INDEX_LENGTH_FORMAT))
+        if header[:offset] != MOCKCACHE_FILE_MAGIC:
+            # Mock cache file written by an older version as a single pickle
+            self._index = {'schemas': [], 'main': (0, size), 'sections': []}
+            self._offset = 0
+            return
+
+        index_length = struct.unpack_from(
+            INDEX_LENGTH_FORMAT, header, offset)[0]
+        self._offset = len(header) + index_length
+        self._index = pickle.loads(self._read(len(header), index_length))
+
+        # The compiled schema caches are loaded now, so that a missing
+        # compiled schema cache is detected when the file is loaded and not
+        # when an object store is used.
+        for schema_key in self._index['schemas']:
+            self._schema(schema_key)
+
+    def _unpickle_section(self, section):
+        offset, length = section
+        data = self._read(self._offset + offset, length)
+        return _MockCacheUnpickler(io.BytesIO(data), self).load()
+
+    def load(self):
+        """
+        Unpickle the object from the mock cache file and return it.
+        """
+        return self._unpickle_section(self._index['main'])
+
+    def load_section(self, index):
+        """
+        Unpickle a section of the mock cache file and return its object.
+        """
+        return self._unpickle_section(self._index['sections'][index])
+
+    def _schema(self, schema_key):
+        """
+        Return the CIM repository of a compiled schema cache, loading it if
+        needed.
+        """
+        cimrepository = self._schemas.get(schema_key)
+        if cimrepository is None:
+            cimrepository = read_schema_cache(schema_key, self._schemas).load()
+            self._schemas[schema_key] = cimrepository
+        return cimrepository
+
+    def resolve(self, pid):
+        """
+        Return the CIM object for a reference into a compiled schema cache.
+        """
+        obj = self._objects.get(pid)
+        if obj is None:
+            schema_key, store_type, namespace, name = pid
+            cimrepository = self._schema(schema_key)
+            store = getattr(cimrepository,
+                            f'get_{store_type}_store')(namespace)
+            obj = store.get(name, copy=False)
+        self.refs[id(obj)] = (obj, pid)
+        return obj
+
+
+def read_schema_cache(schema_key, schemas=None):
+    """
+    Read a compiled schema cache and return a MockCacheReader for it. The use
+    of the cache is recorded for the removal of the least recently used
+    caches.
+
+    Raises:
+      SchemaCacheMissing: The compiled schema cache (or one it references)
+        does not exist.
+    """
+    schema_dir = schema_cache_dir(schema_key)
+    try:
+        reader = MockCacheReader(
+            os.path.join(schema_dir, SCHEMA_CACHE_FILE), schemas)
+        os.utime(schema_dir)
+    except OSError:
+        raise SchemaCacheMissing(
+            f"Compiled schema cache {schema_dir} does not exist")
+    return reader
@@ -0,0 +1,239 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Adaptive MaxObjectCount of the pull operations of a connection to a real WBEM
+server (--pull-target-time general option).
+
+The PullTuner class keeps the MaxObjectCount used for the pull operations of
+each request kind, namespace and class. After each Open... or Pull...
+response, the value is adapted from the response time and reply size so that
+the responses take about the target time, within the bounds
+ADAPTIVE_MAXPULLCNT_MIN and ADAPTIVE_MAXPULLCNT_MAX.
+
+The values are saved in a file in the class cache directory of the connection
+(see classcache_cachedir()), so that later commands on the same connection
+start with them.
+"""
+
+import os
+import json
+import threading
+
+from .config import ADAPTIVE_MAXPULLCNT_MIN, ADAPTIVE_MAXPULLCNT_MAX, \
+    ADAPTIVE_PULL_MAX_REPLY_LEN
+
+#: Version of the format of the pull tuning file. Files with a different
+#: version are ignored.
+PULLTUNING_VERSION = 1
+
+#: File name of the pull tuning file in the class cache directory of a
+#: connection.
+PULLTUNING_FILE = 'pull_tuning.json'
+
+#: Maximum factor by which MaxObjectCount is changed after one response, so
+#: that a single unusually slow or fast response does not cause large changes.
+MAX_CHANGE_FACTOR = 2
+
+
+def pull_tuning_key(operation, namespace, classname):
+    """
+    Return the key of the MaxObjectCount of the pull operations of a request.
+
+    Parameters:
+
+      operation (:term:`string`): Name of the request without the 'Open'
+        prefix, e.g. 'EnumerateInstances'.
+
+      namespace (:term:`string`): Namespace of the request.
+
+      classname (:term:`string`): Class name of the request (the ClassName
+        parameter, or the class name of the InstanceName parameter).
+    """
+    return (operation, namespace.strip('/').lower(), classname.lower())
+
+
+class PullTuner:
+    """
+    Adaptive MaxObjectCount of the pull operations of one connection
+    definition, by request kind, namespace and class.
+
+    The methods of this class may be called from multiple threads.
+    """
+
+    def __init__(self, cache_dir, target_time, default_count,
+                 min_count=ADAPTIVE_MAXPULLCNT_MIN,
+                 max_count=ADAPTIVE_MAXPULLCNT_MAX,
+                 max_reply_len=ADAPTIVE_PULL_MAX_REPLY_LEN):
+        """
+        Parameters:
+
+          cache_dir (:term:`string`):
+            Path name of the class cache directory of the connection. It is
+            created when the tuner is saved.
+
+          target_time (:class:`py:float`):
+            Target response time in seconds of the pull operations.
+
+          default_count (:term:`integer`):
+            MaxObjectCount of the connection (--pull-max-cnt general option).
+            Requests with a smaller MaxObjectCount (e.g. for the --limit
+            command option) are not adapted.
+
+          min_count, max_count (:term:`integer`):
+            Bounds of the adapted MaxObjectCount.
+
+          max_reply_len (:term:`integer`):
+            Maximum size of a response in bytes. MaxObjectCount is reduced
+            for classes with large instances so that the responses do not
+            exceed it.
+        """
+        self.cache_dir = cache_dir
+        self.target_time = target_time
+        self.default_count = default_count
+        self.min_count = min_count
+        self.max_count = max_count
+        self.max_reply_len = max_reply_len
+        # Adapted MaxObjectCount by key (see pull_tuning_key()). Loaded on
+        # first use.
+        self._counts = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (f'PullTuner(cache_dir={self.cache_dir!r}, '
+                f'target_time={self.target_time!r})')
+
+    @property
+    def tuning_file(self):
+        """
+        :term:`string`: Path name of the pull tuning file.
+        """
+        return os.path.join(self.cache_dir, PULLTUNING_FILE)
+
+    def _load(self):
+        """
+        Return the MaxObjectCount values from the pull tuning file, or an
+        empty dictionary if it does not exist or cannot be used.
+        """
+        try:
+            with open(self.tuning_file, encoding='utf-8') as fp:
+                data = json.load(fp)
+            if data['version'] != PULLTUNING_VERSION:
+                return {}
+            return {tuple(item[0:3]): int(item[3])
+                    for item in data['counts']}
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return {}
+
+    def _loaded_counts(self):
+        # Must be called with the lock held
+        if self._counts is None:
+            self._counts = self._load()
+        return self._counts
+
+    def adapts(self, max_object_count):
+        """
+        Return a boolean indicating whether the MaxObjectCount of a request
+        with the MaxObjectCount specified by the caller is adapted.
+        """
+        return max_object_count >= self.default_count
+
+    def max_object_count(self, key, max_object_count):
+        """
+        Return the MaxObjectCount to be used for the next pull operation of
+        the request with the key.
+
+        Parameters:
+
+          key (tuple): Key of the request (see pull_tuning_key()).
+
+          max_object_count (:term:`integer`):
+            MaxObjectCount specified by the caller. It is used until a value
+            has been adapted for the key.
+        """
+        with self._lock:
+            return self._loaded_counts().get(key, max_object_count)
+
+    def update(self, key, max_object_count, objects, elapsed, reply_len):
+        """
+        Adapt the MaxObjectCount of the request with the key from the
+        response of a pull operation.
+
+        Parameters:
+
+          key (tuple): Key of the request (see pull_tuning_key()).
+
+          max_object_count (:term:`integer`):
+            MaxObjectCount of the pull operation.
+
+          objects (:term:`integer`):
+            Number of objects in the response.
+
+          elapsed (:class:`py:float`):
+            Response time of the pull operation in seconds, or None.
+
+          reply_len (:term:`integer`):
+            Size of the response in bytes, or None.
+        """
+        if not objects or not elapsed:
+            return
+        # A response with less objects than requested (e.g. the last one of
+        # an enumeration) does not show the time of a full response, so it
+        # can only shrink MaxObjectCount.
+        if objects < max_object_count and elapsed <= self.target_time:
+            return
+
+        count = self.target_time * objects / elapsed
+        if reply_len:
+            count = min(count, self.max_reply_len * objects / reply_len)
+        count = min(max(int(count), max_object_count // MAX_CHANGE_FACTOR),
+                    max_object_count * MAX_CHANGE_FACTOR)
+        count = min(max(count, self.min_count), self.max_count)
+
+        with self._lock:
+            counts = self._loaded_counts()
+            if counts.get(key) != count:
+                counts[key] = count
+                self._dirty = True
+
+    def counts(self):
+        """
+        Return a dictionary with the adapted MaxObjectCount values by key.
+        """
+        with self._lock:
+            return dict(self._loaded_counts())
+
+    def save(self):
+        """
+        Write the changed MaxObjectCount values to the pull tuning file. The
+        file is written to a temporary file first and then renamed, so that
+        concurrently running pywbemcli processes never see partial files.
+
+        Raises:
+          OSError: Cache directory or file cannot be written.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {'version': PULLTUNING_VERSION,
+                    'counts': [list(key) + [count] for key, count
+                               in sorted(self._counts.items())]}
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = f'{self.tuning_file}.{os.getpid()}.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as fp:
+                json.dump(data, fp, indent=1)
+            os.replace(tmp_file, self.tuning_file)
+            self._dirty = False
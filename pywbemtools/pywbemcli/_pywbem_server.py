@@ -28,8 +28,11 @@ from pywbem import WBEMServer, configure_loggers_from_string
 
 from .config import DEFAULT_URL_SCHEME, DEFAULT_CONNECTION_TIMEOUT, \
     DEFAULT_NAMESPACE, MAX_TIMEOUT, DEFAULT_MAXPULLCNT
-from ._pywbemcli_operations import PYWBEMCLIConnection, \
-    PYWBEMCLIFakedConnection
+from ._pywbemcli_operations import PYWBEMCLIConnection
+from ._class_cache import ClassStore, ClassCache, classcache_cachedir
+from ._pull_tuning import PullTuner
+from ._connection_file_names import CLASSCACHE_ROOT_DIR
+from .._startup_profile import profile_phase
 
 from . import mockscripts
 
@@ -134,6 +137,10 @@ class PywbemServer:
         # WBEMServer object when connected; None when disconnected.
         self._wbem_server = None
 
+        # ClassStore object of the connection when connected; None when
+        # disconnected.
+        self._class_store = None
+
     def __str__(self):
         return 'PywbemServer(url={s._server} name={s.name})'.format(s=self)
 
@@ -414,7 +421,10 @@ class PywbemServer:
             self.connect(
                 log=ctx.obj.log,
                 use_pull=ctx.obj.pywbem_server.use_pull,
-                verbose=ctx.obj.verbose)
+                verbose=ctx.obj.verbose,
+                class_cache=ctx.obj.class_cache,
+                class_store=ctx.obj.class_store,
+                pull_target_time=ctx.obj.pull_target_time)
         return self._wbem_server
 
     @property
@@ -491,6 +501,7 @@ class PywbemServer:
             conn = self._wbem_server.conn.copy()   # WBEMConnection has own copy
             # pylint: disable=protected-access
             cpy._wbem_server = WBEMServer(conn)
+            cpy._class_store = conn.class_store
         return cpy
 
     def get_password(self, ctx):
@@ -564,8 +575,11 @@ class PywbemServer:
 
         self._wbem_server.conn.close()
         self._wbem_server = None
+        self._class_store = None
 
-    def connect(self, log=None, use_pull=None, verbose=None):
+    @profile_phase('connect')
+    def connect(self, log=None, use_pull=None, verbose=None,
+                class_cache=None, class_store=True, pull_target_time=None):
         """
         Connect to the server, using the current attributes of this object.
 
@@ -592,6 +606,21 @@ class PywbemServer:
             The verbose flag to be passed on to other methods including
             build_mockenv
 
+          class_cache (:class:`py:bool` or None):
+            If True and the connection is to a real WBEM server, the class
+            and qualifier declaration requests use the on-disk class cache
+            of the connection.
+
+          class_store (:class:`py:bool`):
+            If True, the class and qualifier declaration requests use an
+            in-session class store that is kept for the life of the
+            connection.
+
+          pull_target_time (:class:`py:float` or None):
+            If not None and the connection is to a real WBEM server, the
+            MaxObjectCount of the pull operations is adapted so that their
+            responses take about this time in seconds.
+
         Raises:
           ClickException: Several issues that cause the command (the whole
             command in command mode, or a single command in interactive mode)
@@ -612,6 +641,10 @@ class PywbemServer:
                 click.echo(f"Connecting to {server_txt}")
 
         if self._mock_server:
+            # Imported here so that pywbem_mock is imported only for mock
+            # environments.
+            # pylint: disable=import-outside-toplevel
+            from ._pywbemcli_faked_connection import PYWBEMCLIFakedConnection
             conn = PYWBEMCLIFakedConnection(
                 default_namespace=self.default_namespace,
                 use_pull_operations=use_pull,
@@ -639,6 +672,19 @@ class PywbemServer:
                 raise ValueError('keyfile option requires certfile option')
 
             self._create_connection(use_pull)
+            if class_cache:
+                self._wbem_server.conn.class_cache = ClassCache(
+                    self.class_cache_dir)
+            if pull_target_time:
+                self._wbem_server.conn.pull_tuner = PullTuner(
+                    self.class_cache_dir, pull_target_time, self.pull_max_cnt)
+
+        # The class store keeps the classes retrieved by the commands for the
+        # life of the connection (e.g. across the commands in interactive
+        # mode).
+        if class_store:
+            self._class_store = ClassStore()
+            self._wbem_server.conn.class_store = self._class_store
 
         if log:
             self.set_logger_config(log)
@@ -650,6 +696,25 @@ class PywbemServer:
                 server_txt = f"WBEM server {self._server}"
             click.echo(f"Connecting to {server_txt}")
 
+    @property
+    def class_store(self):
+        """
+        :class:`ClassStore`: In-session class store of the connection, when
+        connected to the server.
+
+        `None` when disconnected from the server.
+        """
+        return self._class_store
+
+    @property
+    def class_cache_dir(self):
+        """
+        :term:`string`: Path name of the directory of the on-disk class cache
+        of the connection to the WBEM server (see --class-cache general
+        option).
+        """
+        return classcache_cachedir(CLASSCACHE_ROOT_DIR, self.server, self.user)
+
     def set_logger_config(self, log):
         """
         Configure the logging from the log configuration string defined defined
@@ -0,0 +1,927 @@
+# (C) Copyright 2017 IBM Corp.
+# (C) Copyright 2017 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Connection class for the mock environments of pywbemcli.
+
+PYWBEMCLIFakedConnection adds the pywbemcli methods of the
+_pywbemcli_operations module and the ability to build the repository of the
+mock environment (BuildMockenvMixin) to FakeWBEMConnection.
+
+This module is imported only when a mock environment is used, so that the
+pywbem_mock package is not imported for connections to real WBEM servers.
+"""
+
+
+import os
+import re
+import glob
+import json
+import errno
+import pickle
+import hashlib
+import click
+import packaging.version
+import pywbem
+import pywbem_mock
+
+from ._connection_file_names import MOCKCACHE_ROOT_DIR
+from ._pywbemcli_operations import PYWBEMCLIConnectionMixin, \
+    ClassCacheMixin, mockcache_cachedir, cleanup_mock_caches
+from .._utils import ensure_bytes, ensure_unicode
+from .._startup_profile import profile_phase
+from . import mockscripts
+from ._mockcache_file import SCHEMA_CACHE_FILE, SchemaCacheMissing, \
+    MockCacheReader, schema_cache_dir, read_schema_cache, \
+    iter_repository_objects, write_cache_file, write_mockcache_file
+
+PYWBEM_VERSION = packaging.version.parse(pywbem.__version__)
+
+# Include pragma in MOF files
+MOF_INCLUDE_PATTERN = re.compile(
+    r'^\s*#\s*pragma\s+include\s*\(\s*"([^"]+)"\s*\)',
+    re.MULTILINE | re.IGNORECASE)
+
+
+def _mof_include_files(mof_file):
+    """
+    Return the path names of the existing MOF files that are included by a MOF
+    file with include pragmas, directly or indirectly. As in the MOF compiler,
+    an included file is relative to the directory of the including file.
+    """
+    include_files = []
+    todo = [mof_file]
+    while todo:
+        file_path = todo.pop(0)
+        try:
+            with open(file_path, encoding='utf-8', errors='replace') as fp:
+                mof = fp.read()
+        except OSError:
+            continue
+        for file_name in MOF_INCLUDE_PATTERN.findall(mof):
+            include_file = os.path.join(os.path.dirname(file_path), file_name)
+            if os.path.isfile(include_file) and \
+                    include_file not in include_files:
+                include_files.append(include_file)
+                todo.append(include_file)
+    return include_files
+
+
+class BuildMockenvMixin:
+    # pylint: disable=too-few-public-methods
+    """
+    Mixin class for pywbem_mock.FakedWBEMConnection that adds the ability to
+    build the mock environment of a connection from a connection definition in
+    a connections file and input files that define the model and mock setup.
+    """
+
+    # Compiled schema used when building the mock environment, as a tuple of
+    # the compiled schema cache directories and the CIM objects of the
+    # schema (see _schema_objects()), or None.
+    _schema_cache = None
+
+    @profile_phase('mockenv')
+    def build_mockenv(self, server, file_path_list, connections_file,
+                      connection_name, verbose):
+        """
+        Builds the mock environment of the 'self' connection from the input
+        files, or from the mock cache of the connection if it is up to date.
+        If the mock environment was built from the input files, the mock
+        environment of the connection is dumped to its cache.
+
+        The input files for building the mock environment are:
+
+        * MOF files with a suffix of '.mof'.
+
+          These files are compiled into the default namespace of the connection.
+
+        * Python files with a suffix of '.py'.
+
+          These files are mock scripts that are imported and thereby executed.
+          The mock scripts can be used for any kind of setup of the mock
+          environment, for example for creating namespaces, for defining
+          provider classes and registering providers, or for adding CIM objects
+          either directly through add_cimobjects() or by compiling MOF files.
+
+          Mock scripts support two approaches for passing the connection and
+          server objects they should operate on:
+
+          * via a setup() function defined in the mock script. This is the
+            recommended approach, and it supports caching. The setup()
+            function has the following parameters:
+
+              conn (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+              server (pywbem.WBEMServer): The server object for the mock
+                connection.
+
+              verbose (bool): Verbose flag from the command line.
+
+          * via global variables made available to the mock script. This
+            approach prevents caching. The following global variables are
+            made available:
+
+              CONN (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+              SERVER (pywbem.WBEMServer): The server object for the mock
+                connection.
+
+              VERBOSE (bool): Verbose flag from the command line.
+
+        Parameters:
+
+          self (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+          server (pywbem.WBEMServer): The server object for the mock connection.
+
+          file_path_list (list of string): The path names of the input files
+            for building the mock environment, from the connection definition.
+
+          connections_file (string): Path name of the connections file, or
+            None if the connection is not defined in a connections file.
+
+          connection_name (string): The name of the connection definition in
+            the connections file.
+
+          verbose (bool): Verbose flag from the command line.
+
+        Raises:
+          MockFileError: Mock file does not exist.
+          MockMOFCompileError: Mock MOF file fails to compile.
+          MockScriptError: Mock script fails to execute.
+          SetupNotSupportedError (py<3.5): New-style setup in mock script not
+            supported.
+        """
+
+        # Check that the input files exist. Since we loop through them multiple
+        # times, we check that once.
+        for file_path in file_path_list:
+            if not os.path.exists(file_path):
+                raise mockscripts.MockFileError(
+                    f"Mock file does not exist: {file_path}")
+
+        # The mock environment is cached for a connection definition in a
+        # connections file (i.e. when specifying the -n general option) by
+        # connections file and connection name, and without connection
+        # definition (i.e. when specifying the -m general option) by mock
+        # files.
+        cache_dir = mockcache_cachedir(
+            MOCKCACHE_ROOT_DIR, connections_file, connection_name,
+            file_path_list)
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # The mockenv pickle file contains the pickled state of the mock
+        # environment.
+        mockenv_pickle_file = os.path.join(cache_dir, 'mockenv.pkl')
+
+        # The depreg pickle file contains the provider dependents
+        # registry of the connection. It is used to look up the dependent
+        # files of a mock script. The content of these dependent files is
+        # also taken into account when determining whether the cache is up
+        # to date. This needs to go into a separate pickle file because
+        # it needs to be loaded and examined before the mckenv pickle
+        # file is loaded.
+        depreg_pickle_file = os.path.join(cache_dir, 'depreg.pkl')
+
+        # The md5 file contains the MD5 hash value of the content of the
+        # input files for the mock environment, and also taken into account
+        # when determining whether the cache is up to date.
+        md5_file = os.path.join(cache_dir, 'mockfiles.md5')
+
+        # The manifest file contains the file status (size, modification
+        # time, inode) and MD5 hash value of each input file and dependent
+        # file at the time the md5 file was written. It allows
+        # determining whether the cache is up to date without reading the
+        # files and the depreg pickle file, as long as the file status has
+        # not changed.
+        manifest_file = os.path.join(cache_dir, 'mockfiles.manifest')
+
+        # Flag indicating that the mock environment needs to be built
+        # (or re-built). If False, the mock environment cache can be used.
+        need_rebuild = False
+
+        # Determine whether the mock environment needs to be rebuilt based
+        # on the (non-)existence of the cache files.
+        if not os.path.isfile(mockenv_pickle_file) \
+                or not os.path.isfile(depreg_pickle_file) \
+                or not os.path.isfile(md5_file):
+            if verbose:
+                click.echo(f"Mock environment for connection definition "
+                           f"'{connection_name}' will be built because it "
+                           "was not cached.")
+            need_rebuild = True
+
+        manifest = self._load_manifest(manifest_file)
+
+        # Manifest for the current content of the input files, that is used
+        # for finding the cached layers of the mock environment that are
+        # still valid when it needs to be rebuilt.
+        current_manifest = None
+
+        # Determine whether the mock environment needs to be rebuilt based
+        # on the MD5 hash value of the input file content. As long as the
+        # file status of the files in the manifest has not changed, the
+        # MD5 hash value in the manifest is used without reading the files.
+        if not need_rebuild:
+            manifest_changed = not self._manifest_unchanged(
+                manifest, file_path_list, self.default_namespace)
+            if manifest_changed:
+                try:
+                    depreg = self._load_depreg(depreg_pickle_file)
+                except OSError as exc:
+                    if exc.errno == errno.ENOENT:
+                        depreg = pywbem_mock.ProviderDependentRegistry()
+                    else:
+                        raise
+                manifest = self._create_manifest(
+                    file_path_list, depreg, cache_dir,
+                    self.default_namespace, manifest)
+            current_manifest = manifest
+
+            with open(md5_file, encoding='utf-8') as fp:
+                cached_md5_value = fp.read()
+            if manifest['md5'] != cached_md5_value:
+                if verbose:
+                    click.echo(f"Mock environment for connection "
+                               f"definition '{connection_name}' is cached "
+                               "but will be rebuilt because the mock "
+                               "files have changed.")
+                need_rebuild = True
+            elif manifest_changed:
+                # The file status has changed but not the content (e.g.
+                # after a 'touch'). Update the manifest so that the next
+                # command does not need to read the files again.
+                self._dump_manifest(manifest, manifest_file)
+
+        if not need_rebuild:
+            # Record the use of the cache for the removal of the least
+            # recently used caches.
+            os.utime(cache_dir)
+            try:
+                self._load_mockenv(mockenv_pickle_file, file_path_list)
+                if verbose:
+                    click.echo("Mock environment for connection definition "
+                               f"'{connection_name}' has been loaded from "
+                               "cache.")
+            except mockscripts.NotCacheable as exc:
+                if verbose:
+                    click.echo("Mock environment for connection definition "
+                               f"'{connection_name}' will be rebuilt because "
+                               f"it is not cacheable: {exc}.")
+                self._build_mockenv(server, file_path_list, verbose)
+            except SchemaCacheMissing as exc:
+                if verbose:
+                    click.echo("Mock environment for connection definition "
+                               f"'{connection_name}' is cached but will be "
+                               f"rebuilt: {exc}.")
+                need_rebuild = True
+
+        if need_rebuild:
+            try:
+                self._build_mockenv(server, file_path_list, verbose,
+                                    cache_dir, current_manifest)
+            except mockscripts.NotCacheable as exc:
+                if verbose:
+                    click.echo("Mock environment for connection definition "
+                               f"'{connection_name}' will be built because "
+                               f"it is not cacheable: {exc}.")
+            else:
+                # The dependent files registered by the mock scripts during
+                # the build are taken into account for the MD5 hash value.
+                manifest = self._create_manifest(
+                    file_path_list, self.provider_dependent_registry,
+                    cache_dir, self.default_namespace, manifest)
+                self._dump_mockenv(mockenv_pickle_file)
+                self._dump_depreg(
+                    self.provider_dependent_registry, depreg_pickle_file)
+                # The md5 file is written last, because the cache is used
+                # only if it matches.
+                self._dump_manifest(manifest, manifest_file)
+                write_cache_file(md5_file, manifest['md5'].encode('utf-8'))
+                if verbose:
+                    click.echo("Mock environment for connection "
+                               f"definition '{connection_name}' has been "
+                               "written to cache.")
+
+                keep_dirs = [cache_dir]
+                if self._schema_cache:
+                    keep_dirs.extend(self._schema_cache[0])
+                removed = cleanup_mock_caches(MOCKCACHE_ROOT_DIR, keep_dirs)
+                if verbose and removed:
+                    click.echo(f"Removed {len(removed)} least recently used "
+                               "mock caches.")
+
+    @profile_phase('mock_build')
+    def _build_mockenv(self, server, file_path_list, verbose, cache_dir=None,
+                       manifest=None):
+        """
+        Build the mock environment from the input files.
+
+        If a mock cache directory is specified, the state of the mock
+        environment after each input file following the schema MOF files
+        (except the last one) is dumped to a layer file in the mock cache
+        directory, whose name contains a key for the content of the input
+        files up to that file. The build starts after the last input file
+        for which the layer file for the current content exists.
+
+        Parameters:
+
+          self (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+          server (pywbem.WBEMServer): The server object for the mock connection.
+
+          file_path_list (list of string): The path names of the input files
+            for building the mock environment, from the connection definition.
+
+          verbose (bool): Verbose flag from the command line.
+
+          cache_dir (string): Path name of the mock cache directory of the
+            connection, or None for not using layer files.
+
+          manifest (dict): Manifest for the current content of the input
+            files, or None for not loading layer files.
+
+        Raises:
+          NotCacheable (py<3.5): Mock environment is not cacheable.
+          MockMOFCompileError: Mock MOF file fails to compile.
+          MockScriptError: Mock script fails to execute.
+          SetupNotSupportedError (py<3.5): New-style setup in mock script not
+            supported.
+        """
+        # The leading MOF files are the schema of the mock environment. Its
+        # compiled CIM repository is cached by content, so that connections
+        # that share a schema load it instead of compiling it.
+        schema_files = []
+        for file_path in file_path_list:
+            if os.path.splitext(file_path)[1] != '.mof':
+                break
+            schema_files.append(file_path)
+
+        self._schema_cache = None
+        if schema_files:
+            self._setup_schema(server, schema_files, verbose)
+
+        # Index of the first input file that needs to be set up
+        start = len(schema_files)
+        last = len(file_path_list) - 1
+
+        if cache_dir and manifest and 'layers' in manifest:
+            layer_keys = self._layer_keys(manifest)
+            for i in range(last - 1, start - 1, -1):
+                layer_file = os.path.join(
+                    cache_dir, f'layer{i}.{layer_keys[i]}.pkl')
+                if not os.path.isfile(layer_file):
+                    continue
+                try:
+                    self._load_mockenv(layer_file, file_path_list[:i + 1])
+                except (mockscripts.NotCacheable, SchemaCacheMissing):
+                    break
+                start = i + 1
+                if verbose:
+                    click.echo("Mock environment has been loaded from cache "
+                               f"up to mock file {file_path_list[i]}.")
+                break
+
+        for i in range(start, len(file_path_list)):
+            self._setup_mock_file(server, file_path_list[i], verbose)
+            if cache_dir and i < last:
+                # The key of the layer is determined with the dependent files
+                # registered by the mock scripts up to this input file.
+                layer_manifest = self._create_manifest(
+                    file_path_list[:i + 1], self.provider_dependent_registry,
+                    cache_dir, self.default_namespace, manifest)
+                layer_key = self._layer_keys(layer_manifest)[i]
+                self._remove_layer_files(cache_dir, i, i)
+                self._dump_mockenv(
+                    os.path.join(cache_dir, f'layer{i}.{layer_key}.pkl'))
+
+        if cache_dir:
+            # Layer files of input files that are no longer used
+            self._remove_layer_files(cache_dir, 0, len(schema_files) - 1)
+            self._remove_layer_files(cache_dir, last, None)
+
+    @staticmethod
+    def _layer_keys(manifest):
+        """
+        Return the keys of the layers of the mock environment from a
+        manifest, as a list with one item for each input file. The key of a
+        layer is the MD5 hash value of the default namespace and of the
+        content of the input files up to that input file and their dependent
+        files.
+        """
+        md5 = hashlib.md5()
+        md5.update(ensure_bytes(manifest['default_namespace']))
+        layer_keys = []
+        for layer_md5 in manifest['layers']:
+            md5.update(ensure_bytes(layer_md5))
+            layer_keys.append(ensure_unicode(md5.hexdigest()))
+        return layer_keys
+
+    @staticmethod
+    def _remove_layer_files(cache_dir, first, last):
+        """
+        Remove the layer files for the input files with indexes first to last
+        (or to the end, if last is None) from a mock cache directory.
+        """
+        for layer_file in glob.glob(os.path.join(cache_dir, 'layer*.pkl')):
+            index = int(os.path.basename(layer_file)[5:].split('.')[0])
+            if index >= first and (last is None or index <= last):
+                try:
+                    os.remove(layer_file)
+                except OSError:
+                    pass
+
+    def _setup_schema(self, server, schema_files, verbose):
+        """
+        Set up the schema of the mock environment from the compiled schema
+        caches for the content of the schema MOF files, compiling only the
+        schema MOF files for which no compiled schema cache exists and writing
+        their compiled schema caches.
+
+        There is a compiled schema cache for each leading part of the schema
+        MOF files. It contains the CIM objects that are unchanged from the
+        compiled schema cache of the previous schema MOF file as references.
+
+        Parameters:
+
+          self (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+          server (pywbem.WBEMServer): The server object for the mock connection.
+
+          schema_files (list of string): The path names of the leading MOF
+            files of the input files.
+
+          verbose (bool): Verbose flag from the command line.
+
+        Raises:
+          MockMOFCompileError: Mock MOF file fails to compile.
+        """
+        # The key of the compiled schema cache for a leading part of the
+        # schema MOF files is the MD5 hash value of the content of these MOF
+        # files and the MOF files included by them, and of the default
+        # namespace they are compiled into.
+        schema_keys = []
+        md5 = hashlib.md5()
+        md5.update(ensure_bytes(self.default_namespace))
+        for file_path in schema_files:
+            for path in [file_path] + _mof_include_files(file_path):
+                md5.update(ensure_bytes(self._file_md5(path)))
+            schema_keys.append(ensure_unicode(md5.hexdigest()))
+
+        # Load the compiled schema cache for the most schema MOF files
+        schema_objects = {}
+        num_loaded = 0
+        for i in range(len(schema_keys), 0, -1):
+            try:
+                reader = read_schema_cache(schema_keys[i - 1])
+            except SchemaCacheMissing:
+                continue
+            # pylint: disable=protected-access
+            self._cimrepository.load(reader.load())
+            schema_objects = self._schema_objects(
+                schema_keys[i - 1], reader.refs)
+            num_loaded = i
+            if verbose:
+                click.echo("Compiled schema of mock files "
+                           f"{', '.join(schema_files[:i])} has been loaded "
+                           "from cache.")
+            break
+
+        for i in range(num_loaded, len(schema_files)):
+            self._setup_mock_file(server, schema_files[i], verbose)
+            schema_dir = schema_cache_dir(schema_keys[i])
+            os.makedirs(schema_dir, exist_ok=True)
+            refs = write_mockcache_file(
+                os.path.join(schema_dir, SCHEMA_CACHE_FILE),
+                self.cimrepository, schema_objects)
+            schema_objects = self._schema_objects(schema_keys[i], refs)
+
+        self._schema_cache = (
+            [schema_cache_dir(key) for key in schema_keys], schema_objects)
+
+    def _schema_objects(self, schema_key, refs):
+        """
+        Return the CIM objects in the CIM repository of the connection after
+        it has been loaded from or dumped to a compiled schema cache, for
+        writing them as references with write_mockcache_file().
+
+        Parameters:
+
+          schema_key (string): Key of the compiled schema cache.
+
+          refs (dict): The CIM objects that have been unpickled or pickled as
+            references into other compiled schema caches.
+
+        Returns:
+          dict: Key: id() of the object, value: tuple of the object and its
+          reference.
+        """
+        schema_objects = {}
+        for ref, obj in iter_repository_objects(self.cimrepository):
+            entry = refs.get(id(obj))
+            if entry is None or entry[0] is not obj:
+                entry = (obj, (schema_key,) + ref)
+            schema_objects[id(obj)] = entry
+        return schema_objects
+
+    def _setup_mock_file(self, server, file_path, verbose):
+        """
+        Set up the mock environment from one input file, by compiling a MOF
+        file or by executing the setup of a mock script.
+
+        Parameters:
+
+          self (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+          server (pywbem.WBEMServer): The server object for the mock connection.
+
+          file_path (string): The path name of the input file.
+
+          verbose (bool): Verbose flag from the command line.
+
+        Raises:
+          NotCacheable (py<3.5): Mock environment is not cacheable.
+          MockMOFCompileError: Mock MOF file fails to compile.
+          MockScriptError: Mock script fails to execute.
+        """
+        ext = os.path.splitext(file_path)[1]
+        if ext == '.mof':
+            try:
+                # Displays any MOFParseError already
+                self.compile_mof_file(file_path, verbose=verbose)
+            except pywbem.Error as er:
+                # Abort the entire pywbemcli command because the
+                # MOF compilation might have caused inconsistencies in
+                # the mock repository.
+
+                if PYWBEM_VERSION.release >= (1, 0, 0):
+                    # display just the exception.
+                    msg = f"MOF compile failed:\n{er}"
+                else:
+                    # display file name.  Error text displayed already.
+                    if isinstance(er, pywbem.MOFParseError):
+                        msg = f"MOF compile failed: File: '{file_path}'" \
+                            "(see above)"
+                    else:  # not parse error, display exception
+                        msg = f"MOF compile failed: File: '{file_path}' " \
+                            f"Error: {er}"
+                new_exc = mockscripts.MockMOFCompileError(msg)
+                new_exc.__cause__ = None
+                raise new_exc
+        else:
+            assert ext == '.py'  # already checked
+
+            # May raise various mockscripts.MockError exceptions.
+            # NotCacheable will be handled by the caller by building the
+            # mock env.
+            mockscripts.setup_script(file_path, self, server, verbose)
+
+    def _dump_mockenv(self, mockenv_pickle_file):
+        """
+        Dump the mock environment of the connection to the mockenv pickle file.
+
+        Parameters:
+
+          self (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+          mockenv_pickle_file (pywbem.WBEMServer): Path name of the mockenv
+            pickle file.
+        """
+
+        # Save the provider registry and the CIM repository
+
+        # We construct a single object, because the CIM repository is
+        # referenced from each provider, and pickle properly handles
+        # multiple references to the same object.
+        # Mock scripts may also disable the pull operations of the
+        # connection.
+        mockenv = {"cimrepository": self.cimrepository,
+                   # pylint: disable=protected-access
+                   "provider_registry": self._provider_registry,
+                   "provider_dependent_registry":
+                       self._provider_dependent_registry,
+                   "disable_pull_operations": self.disable_pull_operations}
+
+        # The CIM objects of the compiled schema are pickled as references
+        # into the compiled schema caches.
+        # Each object store of the CIM repository is pickled into its own
+        # section of the mockenv pickle file, so that it is unpickled only
+        # when it is used.
+        schema_objects = self._schema_cache[1] if self._schema_cache else {}
+        write_mockcache_file(mockenv_pickle_file, mockenv, schema_objects)
+
+    @profile_phase('mock_cache_load')
+    def _load_mockenv(self, mockenv_pickle_file, file_path_list):
+        """
+        Load the mock environment from the mockenv pickle file.
+
+        This method also imports the Python scripts from the input files in
+        order to re-establish any class definitions that may be needed, for
+        example provider classes.
+
+        Parameters:
+
+          self (pywbem_mock.FakedWBEMConnection): The mock connection.
+
+          mockenv_pickle_file (pywbem.WBEMServer): Path name of the mockenv
+            pickle file.
+
+          file_path_list (list of string): The path names of the input files
+            for building the mock environment, from the connection definition.
+
+        Raises:
+          NotCacheable (py<3.5): Mock environment is not cacheable.
+        """
+
+        # Restore the provider classes
+        for file_path in file_path_list:
+            ext = os.path.splitext(file_path)[1]
+            if ext == '.py':
+                # May raise mockscripts.NotCacheable which will be handled by
+                # the caller by building the mock env.
+                mockscripts.import_script(file_path)
+
+        # Restore the provider registry and the CIM repository
+        # May raise SchemaCacheMissing which will be handled by the caller by
+        # rebuilding the mock env.
+        # The CIM objects of the compiled schema of a build are used for the
+        # references into the compiled schema caches.
+        objects = None
+        if self._schema_cache:
+            objects = {pid: obj
+                       for obj, pid in self._schema_cache[1].values()}
+        mockenv = MockCacheReader(mockenv_pickle_file, objects=objects).load()
+
+        # Others have references to the self._cimrepository object, so we are
+        # not replacing that object, but are rather replacing the state of
+        # that object.
+        cimrepository = mockenv['cimrepository']
+        assert isinstance(cimrepository, pywbem_mock.InMemoryRepository)
+        # pylint: disable=protected-access
+        self._cimrepository.load(cimrepository)
+
+        provider_registry = mockenv['provider_registry']
+        assert isinstance(provider_registry, pywbem_mock.ProviderRegistry)
+        # pylint: disable=protected-access
+        self._provider_registry.load(provider_registry)
+
+        provider_dependent_registry = mockenv.get(
+            'provider_dependent_registry')
+        if provider_dependent_registry is not None:
+            # pylint: disable=protected-access
+            self._provider_dependent_registry.load(
+                provider_dependent_registry)
+
+        disable_pull_operations = mockenv.get('disable_pull_operations')
+        if disable_pull_operations is not None:
+            self.disable_pull_operations = disable_pull_operations
+
+    @staticmethod
+    def _dump_depreg(depreg, depreg_pickle_file):
+        """
+        Dump a provider dependent registry to a pickle file.
+
+        Parameters:
+
+          depreg (pywbem_mock.ProviderDependentRegistry): Provider dependent
+            registry to be dumped.
+
+          depreg_pickle_file (string): Path name of the pickle file.
+        """
+        write_cache_file(depreg_pickle_file, pickle.dumps(depreg))
+
+    @staticmethod
+    def _load_depreg(depreg_pickle_file):
+        """
+        Load a provider dependent registry from a pickle file and return it.
+
+        Parameters:
+
+          depreg_pickle_file (string): Path name of the pickle file to be
+            loaded.
+
+        Returns:
+          pywbem_mock.ProviderDependentRegistry: Provider dependent registry.
+        """
+        with open(depreg_pickle_file, 'rb') as fp:
+            depreg = pickle.load(fp)
+        return depreg
+
+    @staticmethod
+    def _file_status(file_path):
+        """
+        Return the file status of a file that is relevant for detecting a
+        change of the file, as a list of size, modification time in ns and
+        inode number.
+        """
+        st = os.stat(file_path)
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    @staticmethod
+    def _file_md5(file_path):
+        """
+        Return the MD5 hash value of the content of a file, as a hex string.
+        """
+        md5 = hashlib.md5()
+        with open(file_path, 'rb') as fp:
+            md5.update(fp.read())
+        return md5.hexdigest()
+
+    @classmethod
+    def _create_manifest(cls, file_path_list, depreg, cache_dir,
+                         default_namespace, old_manifest=None):
+        """
+        Create the manifest of the input files and their dependent files.
+
+        The MD5 hash value of the content of a file is taken from the old
+        manifest if the file status of the file has not changed, and is
+        calculated otherwise.
+
+        Parameters:
+
+          file_path_list (list of string): The path names of the input files
+            for building the mock environment, from the connection definition.
+
+          depreg (pywbem_mock.ProviderDependentRegistry): Provider dependent
+            registry with the dependent files of the mock scripts.
+
+          cache_dir (string): Path name of the mock cache directory of the
+            connection.
+
+          default_namespace (string): Default namespace of the connection,
+            into which the MOF files are compiled.
+
+          old_manifest (dict): Old manifest, or None.
+
+        Returns:
+          dict: The manifest, with items:
+
+          * 'mock_files': The input files.
+          * 'default_namespace': The default namespace of the connection.
+          * 'files': The input files and their dependent files, as a list of
+            [path, size, mtime_ns, inode, md5].
+          * 'layers': MD5 hash value of the content of each input file and
+            its dependent files.
+          * 'md5': MD5 hash value of the content of all of these files, that
+            is stored in the md5 file of the cache.
+        """
+        old_files = {}
+        if old_manifest:
+            old_files = {entry[0]: entry for entry in old_manifest['files']}
+
+        files = []
+        layers = []
+        md5 = hashlib.md5()
+        for file_path in file_path_list:
+            file_paths = [file_path]
+
+            # For mock scripts, take their dependent files into account
+            if file_path.endswith('.py'):
+                file_paths.extend(depreg.iter_dependents(file_path))
+
+            layer_md5 = hashlib.md5()
+            for path in file_paths:
+                status = cls._file_status(path)
+                old_entry = old_files.get(path)
+                if old_entry and old_entry[1:4] == status:
+                    file_md5 = old_entry[4]
+                else:
+                    file_md5 = cls._file_md5(path)
+                files.append([path] + status + [file_md5])
+                md5.update(ensure_bytes(file_md5))
+                layer_md5.update(ensure_bytes(file_md5))
+            layers.append(ensure_unicode(layer_md5.hexdigest()))
+
+        # Add the cache dir, so that manual tweaks on the cache files
+        # invalidates the cache.
+        md5.update(ensure_bytes(cache_dir))
+
+        # Add the default namespace, because the MOF files are compiled into
+        # it.
+        md5.update(ensure_bytes(default_namespace))
+
+        return {'mock_files': list(file_path_list),
+                'default_namespace': default_namespace,
+                'files': files,
+                'layers': layers,
+                'md5': ensure_unicode(md5.hexdigest())}
+
+    @classmethod
+    def _manifest_unchanged(cls, manifest, file_path_list, default_namespace):
+        """
+        Return a boolean indicating whether the manifest is for the input
+        files and default namespace, and the file status of all files in the
+        manifest is unchanged.
+        """
+        if not manifest or manifest['mock_files'] != list(file_path_list) \
+                or manifest.get('default_namespace') != default_namespace:
+            return False
+        for entry in manifest['files']:
+            try:
+                if cls._file_status(entry[0]) != entry[1:4]:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _dump_manifest(manifest, manifest_file):
+        """
+        Dump a manifest to a JSON file.
+
+        Parameters:
+
+          manifest (dict): Manifest to be dumped.
+
+          manifest_file (string): Path name of the JSON file.
+        """
+        write_cache_file(manifest_file,
+                         json.dumps(manifest).encode('utf-8'))
+
+    @staticmethod
+    def _load_manifest(manifest_file):
+        """
+        Load a manifest from a JSON file and return it.
+
+        Parameters:
+
+          manifest_file (string): Path name of the JSON file to be loaded.
+
+        Returns:
+          dict: Manifest, or None if the file does not exist or is invalid.
+        """
+        try:
+            with open(manifest_file, encoding='utf-8') as fp:
+                manifest = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or \
+                not {'mock_files', 'files', 'md5'}.issubset(manifest):
+            return None
+        return manifest
+
+
+class PYWBEMCLIFakedConnection(BuildMockenvMixin,
+                               PYWBEMCLIConnectionMixin,
+                               ClassCacheMixin,
+                               pywbem_mock.FakedWBEMConnection):
+    """
+    PyWBEMCLIFakedConnection subclass adds the methods added by
+    PYWBEMCLIConnectionMixin, ClassCacheMixin and BuildMockenvMixin. The class
+    cache is not used for mock environments.
+    """
+
+    # The mock WBEM server executes the operations in this process, so there
+    # is no latency that a background thread could overlap.
+    prefetch_pulls = False
+
+    # The mock WBEM server accepts DMTF:FQL filter queries but does not
+    # filter the instances, so --where filters are evaluated by pywbemcli.
+    where_pushdown = False
+
+    def __init__(self, *args, **kwargs):
+        """
+        ctor passes all input parameters to superclass
+        """
+        super().__init__(*args, **kwargs)
+
+    def copy(self):
+        """
+        Return a copy of the connection that uses the same repository and
+        registries, as FakedWBEMConnection.copy() does, but as a
+        PYWBEMCLIFakedConnection so that the copy also includes the methods of
+        PYWBEMCLIConnectionMixin. The operation recorders are copied as
+        WBEMConnection.copy() does.
+        """
+        # pylint: disable=protected-access
+        cpy = PYWBEMCLIFakedConnection(
+            default_namespace=self.default_namespace,
+            use_pull_operations=self.use_pull_operations,
+            stats_enabled=self.stats_enabled,
+            timeout=self.timeout,
+            response_delay=self._response_delay,
+            disable_pull_operations=self._disable_pull_operations,
+            url=self.url)
+        for rec in self.operation_recorders:
+            cpy.add_operation_recorder(rec.copy())
+
+        # Reuse repository and registries of the original object
+        cpy._cimrepository = self._cimrepository
+        cpy._provider_registry = self._provider_registry
+        cpy._provider_dependent_registry = self._provider_dependent_registry
+        cpy._providerdispatcher = self._providerdispatcher
+        cpy._mainprovider = self._mainprovider
+        cpy.class_store = self.class_store
+        return cpy
@@ -22,32 +22,219 @@ the complete iterations so that we can use these as common operations for
 pywbemcli instead of having to execute an algorithm of pull vs non-pull
 everywhere xa WBEMConnection possible pull operation is called.
 
-It also adds a method to FakeWBEMConnection to build the repository.
+The connection class for mock environments (PYWBEMCLIFakedConnection) and the
+methods to build its repository are in the _pywbemcli_faked_connection module,
+so that pywbem_mock is imported only for mock environments.
 """
 
 
 import os
-import errno
 import glob
 import hashlib
-import pickle
-import click
-import packaging.version
+import queue
+import itertools
+import threading
 import pywbem
-import pywbem_mock
+from pywbem import CIMError, CIM_ERR_NOT_SUPPORTED, \
+    CIM_ERR_FILTERED_ENUMERATION_NOT_SUPPORTED, \
+    CIM_ERR_QUERY_LANGUAGE_NOT_SUPPORTED, CIM_ERR_INVALID_QUERY
 
-from ._connection_file_names import DEFAULT_CONNECTIONS_FILE, \
-    MOCKCACHE_ROOT_DIR
-from .config import DEFAULT_MAXPULLCNT
-from .._utils import ensure_bytes, ensure_unicode
-from . import mockscripts
-
-PYWBEM_VERSION = packaging.version.parse(pywbem.__version__)
+from ._connection_file_names import MOCKCACHE_ROOT_DIR
+from ._connection_pool import add_copy_statistics
+from ._pull_tuning import pull_tuning_key
+from .config import DEFAULT_MAXPULLCNT, MOCKCACHE_MAX_SIZE
 
 
 #  __all__ = ['PYWBEMCLIConnection', 'PYWBEMCLIFakedConnection']
 
 
+def limited(result, limit):
+    """
+    Generator that yields the objects of result (the generator returned by a
+    pywbem Iter... operation) and stops after limit objects if limit is not
+    None.
+
+    When it stops, the generator of the Iter... operation is closed, which
+    closes the pull enumeration context on the WBEM server if it is still
+    open. With traditional operations, the remaining objects of the response
+    are not processed.
+    """
+    if limit is None:
+        yield from result
+        return
+    try:
+        yield from itertools.islice(result, limit)
+    finally:
+        result.close()
+
+
+# Marks the end of the objects in the queue of prefetched()
+_END_OF_RESULT = object()
+
+
+def prefetched(request, conn, max_object_count, original_conn=None):
+    """
+    Generator that yields the objects of the generator returned by
+    request(conn), which is consumed by a background thread.
+
+    request is a function that executes a pywbem Iter... operation on the
+    connection conn and returns its generator. conn must not be used by other
+    threads; it is closed when the background thread ends. If original_conn
+    is not None, it is the connection conn is a copy of, and the operation
+    statistics of conn are kept with it when this generator returns (see
+    add_copy_statistics()).
+
+    The background thread retrieves up to max_object_count objects ahead of
+    the objects that have been yielded, so that with pull operations the
+    next pull request is in flight while the caller processes the objects of
+    the current one.
+
+    Exceptions raised by the generator of request are raised by this
+    generator. When this generator is closed before all objects have been
+    yielded, the background thread stops retrieving objects and closes the
+    generator of request (which closes the pull enumeration context on the
+    WBEM server if it is still open) before this generator returns.
+    """
+    objects = queue.Queue(maxsize=max(max_object_count, 1))
+    stop = threading.Event()
+    error = []
+
+    def produce():
+        """Put the objects of request(conn) into the queue"""
+        result = None
+        try:
+            result = request(conn)
+            for obj in result:
+                objects.put(obj)
+                if stop.is_set():
+                    break
+        except Exception as exc:  # pylint: disable=broad-except
+            error.append(exc)
+        finally:
+            if result is not None:
+                result.close()
+            conn.close()
+        if not stop.is_set():
+            objects.put(_END_OF_RESULT)
+
+    thread = threading.Thread(target=produce, name='pywbemcli-prefetch',
+                              daemon=True)
+    thread.start()
+    try:
+        while True:
+            obj = objects.get()
+            if obj is _END_OF_RESULT:
+                break
+            yield obj
+        if error:
+            raise error[0]
+    finally:
+        stop.set()
+        # Unblock the background thread if it waits for space in the queue.
+        # It then puts at most one more object.
+        while True:
+            try:
+                objects.get_nowait()
+            except queue.Empty:
+                break
+        thread.join()
+        if original_conn is not None:
+            add_copy_statistics(original_conn, conn)
+
+
+def limit_max_object_count(max_object_count, limit):
+    """
+    Return the MaxObjectCount for the pull operations of a Iter... operation
+    whose objects are retrieved with limited(), so that the WBEM server does
+    not return more objects than needed in the open operation.
+    """
+    if limit is None:
+        return max_object_count
+    return min(max_object_count, limit)
+
+
+# CIM status codes with which a WBEM server rejects the filter query of a
+# --where filter. The request is then repeated without it.
+WHERE_PUSHDOWN_ERRORS = (CIM_ERR_NOT_SUPPORTED,
+                         CIM_ERR_FILTERED_ENUMERATION_NOT_SUPPORTED,
+                         CIM_ERR_QUERY_LANGUAGE_NOT_SUPPORTED,
+                         CIM_ERR_INVALID_QUERY)
+
+
+def where_filtered(where, request, filter_query, filter_query_language,
+                   pushdown):
+    """
+    Generator that yields the objects of the generator returned by
+    request(filter_query, filter_query_language) that match the --where
+    filter where (a WhereFilter object).
+
+    request is a function that executes a pywbem Iter... operation with the
+    FilterQuery and FilterQueryLanguage parameters and returns its generator.
+
+    If pushdown is True, the parts of the filter that can be expressed in
+    DMTF:FQL are passed to the WBEM server in the filter query (combined with
+    filter_query), and only the other parts are evaluated on the returned
+    objects. If the WBEM server rejects the filter query, or pywbem uses
+    traditional operations that do not support it, the request is repeated
+    with filter_query and the complete filter is evaluated on the returned
+    objects. The outcome is recorded in where.
+
+    When this generator is closed, the generator of request is closed.
+    """
+    query = where.pushdown_query(filter_query, filter_query_language) \
+        if pushdown else None
+    result = None
+    first = _END_OF_RESULT
+    if query is not None:
+        result = request(*query)
+        try:
+            # Executes the Open... operation that gets the filter query
+            first = next(result, _END_OF_RESULT)
+        except (CIMError, ValueError) as exc:
+            # pywbem raises ValueError for a FilterQuery with traditional
+            # operations
+            if isinstance(exc, CIMError) and \
+                    exc.status_code not in WHERE_PUSHDOWN_ERRORS:
+                raise
+            where.record_pushdown(exc)
+            result = None
+
+    if result is None:
+        if query is None:
+            where.record_client_only()
+        predicate = where.match
+        result = request(filter_query, filter_query_language)
+        objects = result
+    else:
+        where.record_pushdown()
+        predicate = where.match_client
+        objects = itertools.chain(
+            () if first is _END_OF_RESULT else (first,), result)
+
+    try:
+        if predicate is None:
+            yield from objects
+        else:
+            for obj in objects:
+                if predicate(obj):
+                    yield obj
+    finally:
+        result.close()
+
+
+def instance_paths(instances):
+    """
+    Generator that yields the paths of the instances of the generator
+    instances. When this generator is closed, the generator instances is
+    closed.
+    """
+    try:
+        for inst in instances:
+            yield inst.path
+    finally:
+        instances.close()
+
+
 # pylint: disable=useless-object-inheritance
 class PYWBEMCLIConnectionMixin:
     """
@@ -63,13 +250,100 @@ class PYWBEMCLIConnectionMixin:
 
     They are a pywbemcli convience to simplify the individual action processing
     methods to a single call.
+
+    The methods for enumerate, references and associators have an additional
+    Limit parameter. If it is not None, they retrieve at most Limit objects
+    (see limited()).
+
+    The methods for enumerate, references, associators and query have an
+    additional Where parameter. If it is not None, it is the WhereFilter
+    object of the --where command option and only the objects that match it
+    are returned (see PyWbemcliWhere()). The objects are filtered as they are
+    received, so that the objects that do not match are not kept.
     """
+
+    #: Whether PyWbemcliPrefetch() retrieves the objects in a background
+    #: thread.
+    prefetch_pulls = True
+
+    #: Whether PyWbemcliWhere() passes the DMTF:FQL parts of --where filters
+    #: to the WBEM server with pull operations.
+    where_pushdown = True
+
+    def PyWbemcliPrefetch(self, request, MaxObjectCount=DEFAULT_MAXPULLCNT):
+        # pylint: disable=invalid-name
+        """
+        Execute a pywbem Iter... operation whose objects are processed by the
+        caller as they are received, and return a generator for its objects.
+
+        request is a function with a connection as parameter that executes
+        the Iter... operation on the connection and returns its generator.
+
+        If prefetch_pulls is True, request is executed in a background thread
+        on a copy of this connection (see prefetched()), so that the next
+        pull request is in flight while the caller processes the objects of
+        the current one. The operation statistics of the copy are kept with
+        this connection when the generator returns. Otherwise,
+        request is executed on this connection when the generator is
+        consumed.
+        """
+        if not self.prefetch_pulls:
+            return request(self)
+        return prefetched(request, self.copy(), MaxObjectCount, self)
+
+    def PyWbemcliWhere(self, Where, request, FilterQuery=None,
+                       FilterQueryLanguage=None, PropertyList=None,
+                       PathsOnly=False):
+        # pylint: disable=invalid-name
+        """
+        Execute a pywbem Iter... operation and return a generator for its
+        objects that match the --where filter Where (a WhereFilter object, or
+        None for no filtering).
+
+        request is a function with the FilterQuery, FilterQueryLanguage and
+        PropertyList parameters of the Iter... operation as parameters that
+        executes it and returns its generator. If Where is None, request is
+        executed with the parameters of this method and its generator is
+        returned.
+
+        If where_pushdown is True and pull operations may be used, the parts
+        of the filter that can be expressed in DMTF:FQL are passed to the
+        WBEM server (see where_filtered()). Otherwise, the complete filter is
+        evaluated on the returned objects.
+
+        The WBEM server evaluates the filter query on the complete instances,
+        so the other parts of the filter are evaluated on the instances before
+        they are projected to the PropertyList: The properties used in the
+        filter are added to the property list of the request and removed
+        from the matching instances. If PathsOnly is True, request is an
+        Iter...Instances operation, which is executed with the properties
+        used in the filter, and the paths of the matching instances are
+        returned.
+        """
+        if Where is None:
+            return request(FilterQuery, FilterQueryLanguage, PropertyList)
+        pushdown = self.where_pushdown and \
+            self.use_pull_operations is not False
+        property_list = Where.property_names if PathsOnly \
+            else Where.request_property_list(PropertyList)
+
+        def filtered_request(filter_query, filter_query_language):
+            """Execute request with the property list of the filter"""
+            return request(filter_query, filter_query_language, property_list)
+
+        result = where_filtered(Where, filtered_request, FilterQuery,
+                                FilterQueryLanguage, pushdown)
+        if PathsOnly:
+            return instance_paths(result)
+        return Where.projected(result, PropertyList)
+
     def PyWbemcliEnumerateInstancePaths(self, ClassName, namespace=None,
                                         FilterQueryLanguage=None,
                                         FilterQuery=None,
                                         OperationTimeout=None,
                                         ContinueOnError=None,
                                         MaxObjectCount=DEFAULT_MAXPULLCNT,
+                                        Limit=None, Where=None,
                                         **extra):
         # pylint: disable=unused-argument
         # pylint: disable=invalid-name
@@ -83,15 +357,33 @@ class PYWBEMCLIConnectionMixin:
         method.
         """
 
-        result = self.IterEnumerateInstancePaths(
-            ClassName,
-            namespace=namespace,
-            FilterQueryLanguage=FilterQueryLanguage,
-            FilterQuery=FilterQuery,
-            OperationTimeout=OperationTimeout,
-            ContinueOnError=ContinueOnError,
-            MaxObjectCount=MaxObjectCount)
-        return list(result)
+        def request(filter_query, filter_query_language, property_list):
+            """Execute IterEnumerateInstancePaths with the filter query"""
+            if Where is None:
+                return self.IterEnumerateInstancePaths(
+                    ClassName,
+                    namespace=namespace,
+                    FilterQueryLanguage=filter_query_language,
+                    FilterQuery=filter_query,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=limit_max_object_count(
+                        MaxObjectCount, Limit))
+
+            # The --where filter is evaluated on the instances
+            return self.IterEnumerateInstances(
+                ClassName,
+                namespace=namespace,
+                PropertyList=property_list,
+                FilterQueryLanguage=filter_query_language,
+                FilterQuery=filter_query,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=limit_max_object_count(MaxObjectCount, Limit))
+
+        result = self.PyWbemcliWhere(Where, request, FilterQuery,
+                                     FilterQueryLanguage, PathsOnly=True)
+        return list(limited(result, Limit))
 
     def PyWbemcliEnumerateInstances(self, ClassName, namespace=None,
                                     LocalOnly=None,
@@ -101,6 +393,7 @@ class PYWBEMCLIConnectionMixin:
                                     FilterQueryLanguage=None, FilterQuery=None,
                                     OperationTimeout=None, ContinueOnError=None,
                                     MaxObjectCount=DEFAULT_MAXPULLCNT,
+                                    Limit=None, Where=None,
                                     **extra):
         # pylint: disable=unused-argument
         # pylint: disable=invalid-name
@@ -114,20 +407,25 @@ class PYWBEMCLIConnectionMixin:
         method.
         """
 
-        result = self.IterEnumerateInstances(
-            ClassName,
-            namespace=namespace,
-            LocalOnly=LocalOnly,
-            DeepInheritance=DeepInheritance,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList,
-            FilterQueryLanguage=FilterQueryLanguage,
-            FilterQuery=FilterQuery,
-            OperationTimeout=OperationTimeout,
-            ContinueOnError=ContinueOnError,
-            MaxObjectCount=MaxObjectCount)
-        return list(result)
+        def request(filter_query, filter_query_language, property_list):
+            """Execute IterEnumerateInstances with the filter query"""
+            return self.IterEnumerateInstances(
+                ClassName,
+                namespace=namespace,
+                LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=property_list,
+                FilterQueryLanguage=filter_query_language,
+                FilterQuery=filter_query,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=limit_max_object_count(MaxObjectCount, Limit))
+
+        result = self.PyWbemcliWhere(Where, request, FilterQuery,
+                                     FilterQueryLanguage, PropertyList)
+        return list(limited(result, Limit))
 
     def PyWbemcliReferenceInstancePaths(self, InstanceName, ResultClass=None,
                                         Role=None,
@@ -136,6 +434,7 @@ class PYWBEMCLIConnectionMixin:
                                         OperationTimeout=None,
                                         ContinueOnError=None,
                                         MaxObjectCount=DEFAULT_MAXPULLCNT,
+                                        Limit=None, Where=None,
                                         **extra):
         # pylint: disable=unused-argument
         # pylint: disable=invalid-name
@@ -149,16 +448,35 @@ class PYWBEMCLIConnectionMixin:
         method.
         """
 
-        result = self.IterReferenceInstancePaths(
-            InstanceName,
-            ResultClass=ResultClass,
-            Role=Role,
-            FilterQueryLanguage=FilterQueryLanguage,
-            FilterQuery=FilterQuery,
-            OperationTimeout=OperationTimeout,
-            ContinueOnError=ContinueOnError,
-            MaxObjectCount=MaxObjectCount)
-        return list(result)
+        def request(filter_query, filter_query_language, property_list):
+            """Execute IterReferenceInstancePaths with the filter query"""
+            if Where is None:
+                return self.IterReferenceInstancePaths(
+                    InstanceName,
+                    ResultClass=ResultClass,
+                    Role=Role,
+                    FilterQueryLanguage=filter_query_language,
+                    FilterQuery=filter_query,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=limit_max_object_count(
+                        MaxObjectCount, Limit))
+
+            # The --where filter is evaluated on the instances
+            return self.IterReferenceInstances(
+                InstanceName,
+                ResultClass=ResultClass,
+                Role=Role,
+                PropertyList=property_list,
+                FilterQueryLanguage=filter_query_language,
+                FilterQuery=filter_query,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=limit_max_object_count(MaxObjectCount, Limit))
+
+        result = self.PyWbemcliWhere(Where, request, FilterQuery,
+                                     FilterQueryLanguage, PathsOnly=True)
+        return list(limited(result, Limit))
 
     def PyWbemcliReferenceInstances(self, InstanceName, ResultClass=None,
                                     Role=None, IncludeQualifiers=None,
@@ -166,6 +484,7 @@ class PYWBEMCLIConnectionMixin:
                                     FilterQueryLanguage=None, FilterQuery=None,
                                     OperationTimeout=None, ContinueOnError=None,
                                     MaxObjectCount=DEFAULT_MAXPULLCNT,
+                                    Limit=None, Where=None,
                                     **extra):
         # pylint: disable=unused-argument
         # pylint: disable=invalid-name
@@ -179,19 +498,24 @@ class PYWBEMCLIConnectionMixin:
         method.
         """
 
-        result = self.IterReferenceInstances(
-            InstanceName,
-            ResultClass=ResultClass,
-            Role=Role,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList,
-            FilterQueryLanguage=FilterQueryLanguage,
-            FilterQuery=FilterQuery,
-            OperationTimeout=OperationTimeout,
-            ContinueOnError=ContinueOnError,
-            MaxObjectCount=MaxObjectCount)
-        return list(result)
+        def request(filter_query, filter_query_language, property_list):
+            """Execute IterReferenceInstances with the filter query"""
+            return self.IterReferenceInstances(
+                InstanceName,
+                ResultClass=ResultClass,
+                Role=Role,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=property_list,
+                FilterQueryLanguage=filter_query_language,
+                FilterQuery=filter_query,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=limit_max_object_count(MaxObjectCount, Limit))
+
+        result = self.PyWbemcliWhere(Where, request, FilterQuery,
+                                     FilterQueryLanguage, PropertyList)
+        return list(limited(result, Limit))
 
     def PyWbemcliAssociatorInstancePaths(self, InstanceName, AssocClass=None,
                                          ResultClass=None,
@@ -201,6 +525,7 @@ class PYWBEMCLIConnectionMixin:
                                          OperationTimeout=None,
                                          ContinueOnError=None,
                                          MaxObjectCount=DEFAULT_MAXPULLCNT,
+                                         Limit=None, Where=None,
                                          **extra):
         # pylint: disable=unused-argument
         # pylint: disable=invalid-name
@@ -214,18 +539,39 @@ class PYWBEMCLIConnectionMixin:
         method.
         """
 
-        result = self.IterAssociatorInstancePaths(
-            InstanceName,
-            AssocClass=AssocClass,
-            ResultClass=ResultClass,
-            Role=Role,
-            ResultRole=ResultRole,
-            FilterQueryLanguage=FilterQueryLanguage,
-            FilterQuery=FilterQuery,
-            OperationTimeout=OperationTimeout,
-            ContinueOnError=ContinueOnError,
-            MaxObjectCount=MaxObjectCount)
-        return list(result)
+        def request(filter_query, filter_query_language, property_list):
+            """Execute IterAssociatorInstancePaths with the filter query"""
+            if Where is None:
+                return self.IterAssociatorInstancePaths(
+                    InstanceName,
+                    AssocClass=AssocClass,
+                    ResultClass=ResultClass,
+                    Role=Role,
+                    ResultRole=ResultRole,
+                    FilterQueryLanguage=filter_query_language,
+                    FilterQuery=filter_query,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=limit_max_object_count(
+                        MaxObjectCount, Limit))
+
+            # The --where filter is evaluated on the instances
+            return self.IterAssociatorInstances(
+                InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                PropertyList=property_list,
+                FilterQueryLanguage=filter_query_language,
+                FilterQuery=filter_query,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=limit_max_object_count(MaxObjectCount, Limit))
+
+        result = self.PyWbemcliWhere(Where, request, FilterQuery,
+                                     FilterQueryLanguage, PathsOnly=True)
+        return list(limited(result, Limit))
 
     def PyWbemcliAssociatorInstances(self, InstanceName, AssocClass=None,
                                      ResultClass=None,
@@ -236,6 +582,7 @@ class PYWBEMCLIConnectionMixin:
                                      OperationTimeout=None,
                                      ContinueOnError=None,
                                      MaxObjectCount=DEFAULT_MAXPULLCNT,
+                                     Limit=None, Where=None,
                                      **extra):
         # pylint: disable=unused-argument
         # pylint: disable=invalid-name
@@ -249,26 +596,32 @@ class PYWBEMCLIConnectionMixin:
         method.
         """
 
-        result = self.IterAssociatorInstances(
-            InstanceName,
-            AssocClass=AssocClass,
-            ResultClass=ResultClass,
-            Role=Role,
-            ResultRole=ResultRole,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList,
-            FilterQueryLanguage=FilterQueryLanguage,
-            FilterQuery=FilterQuery,
-            OperationTimeout=OperationTimeout,
-            ContinueOnError=ContinueOnError,
-            MaxObjectCount=MaxObjectCount)
-        return list(result)
+        def request(filter_query, filter_query_language, property_list):
+            """Execute IterAssociatorInstances with the filter query"""
+            return self.IterAssociatorInstances(
+                InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=property_list,
+                FilterQueryLanguage=filter_query_language,
+                FilterQuery=filter_query,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=limit_max_object_count(MaxObjectCount, Limit))
+
+        result = self.PyWbemcliWhere(Where, request, FilterQuery,
+                                     FilterQueryLanguage, PropertyList)
+        return list(limited(result, Limit))
 
     def PyWbemcliQueryInstances(self, FilterQueryLanguage, FilterQuery,
                                 namespace=None, ReturnQueryResultClass=None,
                                 OperationTimeout=None, ContinueOnError=None,
                                 MaxObjectCount=DEFAULT_MAXPULLCNT,
+                                Where=None,
                                 **extra):
         # pylint: disable=unused-argument
         # pylint: disable=invalid-name
@@ -290,450 +643,548 @@ class PYWBEMCLIConnectionMixin:
             OperationTimeout=OperationTimeout,
             ContinueOnError=ContinueOnError,
             MaxObjectCount=MaxObjectCount)
-        return list(result)
-
-
-class BuildMockenvMixin:
-    # pylint: disable=too-few-public-methods
-    """
-    Mixin class for pywbem_mock.FakedWBEMConnection that adds the ability to
-    build the mock environment of a connection from a connection definition in
-    a connections file and input files that define the model and mock setup.
-    """
-
-    def build_mockenv(self, server, file_path_list, connections_file,
-                      connection_name, verbose):
-        """
-        Builds the mock environment of the 'self' connection from the input
-        files, or from the mock cache of the connection if it is up to date.
-        If the mock environment was built from the input files, the mock
-        environment of the connection is dumped to its cache.
-
-        The input files for building the mock environment are:
-
-        * MOF files with a suffix of '.mof'.
+        if Where is None:
+            return list(result.generator)
 
-          These files are compiled into the default namespace of the connection.
+        # The query is not combined with the DMTF:FQL parts of the filter,
+        # so the complete filter is evaluated on the returned instances.
+        return list(where_filtered(Where, lambda *_: result.generator, None,
+                                   None, pushdown=False))
 
-        * Python files with a suffix of '.py'.
 
-          These files are mock scripts that are imported and thereby executed.
-          The mock scripts can be used for any kind of setup of the mock
-          environment, for example for creating namespaces, for defining
-          provider classes and registering providers, or for adding CIM objects
-          either directly through add_cimobjects() or by compiling MOF files.
-
-          Mock scripts support two approaches for passing the connection and
-          server objects they should operate on:
-
-          * via a setup() function defined in the mock script. This is the
-            recommended approach, and it supports caching. The setup()
-            function has the following parameters:
-
-              conn (pywbem_mock.FakedWBEMConnection): The mock connection.
-
-              server (pywbem.WBEMServer): The server object for the mock
-                connection.
-
-              verbose (bool): Verbose flag from the command line.
-
-          * via global variables made available to the mock script. This
-            approach prevents caching. The following global variables are
-            made available:
-
-              CONN (pywbem_mock.FakedWBEMConnection): The mock connection.
-
-              SERVER (pywbem.WBEMServer): The server object for the mock
-                connection.
-
-              VERBOSE (bool): Verbose flag from the command line.
-
-        Parameters:
-
-          self (pywbem_mock.FakedWBEMConnection): The mock connection.
-
-          server (pywbem.WBEMServer): The server object for the mock connection.
-
-          file_path_list (list of string): The path names of the input files
-            for building the mock environment, from the connection definition.
+class ClassCacheMixin:
+    """
+    Mixin class for WBEMConnection that answers the class and qualifier
+    declaration requests from the in-session class store (ClassStore) and the
+    on-disk class cache (ClassCache) of the connection, if they are set, and
+    invalidates them for requests that modify classes or qualifier
+    declarations.
 
-          connections_file (string): Path name of the connections file.
+    It must precede the WBEMConnection class in the base classes.
+    """
 
-          connection_name (string): The name of the connection definition in
-            the connections file.
+    #: ClassStore object of the connection, or None.
+    class_store = None
 
-          verbose (bool): Verbose flag from the command line.
+    #: ClassCache object of the connection if the --class-cache general
+    #: option is set, or None.
+    class_cache = None
 
-        Raises:
-          MockFileError: Mock file does not exist.
-          MockMOFCompileError: Mock MOF file fails to compile.
-          MockScriptError: Mock script fails to execute.
-          SetupNotSupportedError (py<3.5): New-style setup in mock script not
-            supported.
+    @property
+    def class_caching(self):
         """
+        :class:`py:bool`: Indicates whether the class store or the class cache
+        is enabled for the connection.
+        """
+        return self.class_store is not None or self.class_cache is not None
 
-        # Check that the input files exist. Since we loop through them multiple
-        # times, we check that once.
-        for file_path in file_path_list:
-            if not os.path.exists(file_path):
-                raise mockscripts.MockFileError(
-                    f"Mock file does not exist: {file_path}")
-
-        # The connections file is set if a named connection is used, i.e.
-        # when specifying the -n general option. It is not set when the -s or -m
-        # general options were specified. When no connections file is set, no
-        # caching happens because there is no connection definition context
-        # which is required for caching.
-        if connections_file == DEFAULT_CONNECTIONS_FILE:
-
-            if not os.path.isdir(MOCKCACHE_ROOT_DIR):
-                os.mkdir(MOCKCACHE_ROOT_DIR)
-
-            cache_dir = mockcache_cachedir(
-                MOCKCACHE_ROOT_DIR, connections_file, connection_name)
-            if not os.path.isdir(cache_dir):
-                os.mkdir(cache_dir)
-
-            # The mockenv pickle file contains the pickled state of the mock
-            # environment.
-            mockenv_pickle_file = os.path.join(cache_dir, 'mockenv.pkl')
-
-            # The depreg pickle file contains the provider dependents
-            # registry of the connection. It is used to look up the dependent
-            # files of a mock script. The content of these dependent files is
-            # also taken into account when determining whether the cache is up
-            # to date. This needs to go into a separate pickle file because
-            # it needs to be loaded and examined before the mckenv pickle
-            # file is loaded.
-            depreg_pickle_file = os.path.join(cache_dir, 'depreg.pkl')
+    def _cached_request(self, namespace, key, request):
+        """
+        Return the response of the class or qualifier declaration request
+        defined by key from the class store or the class cache, or execute
+        request() and save its response in both.
 
-            # The md5 file contains the MD5 hash value of the content of the
-            # input files for the mock environment, and also taken into account
-            # when determining whether the cache is up to date.
-            md5_file = os.path.join(cache_dir, 'mockfiles.md5')
+        The responses are copied so that the callers can modify them without
+        changing the cached responses.
+        """
+        found = False
+        if self.class_store is not None:
+            found, response = self.class_store.get(namespace, key)
+        if not found and self.class_cache is not None:
+            found, response = self.class_cache.get(self, namespace, key)
+            if not found:
+                response = request()
+                found = True
+                self.class_cache.put(namespace, key, response)
+        if not found:
+            response = request()
+        if self.class_store is not None:
+            self.class_store.put(namespace, key, response)
+        if isinstance(response, list):
+            return [r if isinstance(r, str) else r.copy() for r in response]
+        return response.copy()
+
+    def _cache_namespace(self, namespace, classname=None):
+        """
+        Return the namespace and lower-cased class name for a class cache key
+        from the namespace and ClassName parameters of a request, in the same
+        way the request determines them.
+        """
+        if namespace is None and isinstance(classname, pywbem.CIMClassName):
+            namespace = classname.namespace
+        namespace = self._iparam_namespace_from_namespace(namespace)
+        if isinstance(classname, pywbem.CIMClassName):
+            classname = classname.classname
+        return namespace, classname.lower() if classname else None
+
+    def GetClass(self, ClassName, namespace=None, LocalOnly=None,
+                 IncludeQualifiers=None, IncludeClassOrigin=None,
+                 PropertyList=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.GetClass() that uses the class store and
+        class cache, if enabled.
+        """
+        def request():
+            return super(ClassCacheMixin, self).GetClass(
+                ClassName, namespace=namespace, LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList)
+
+        if not self.class_caching:
+            return request()
+        ns, classname = self._cache_namespace(namespace, ClassName)
+        pl_key = PropertyList
+        if pl_key is not None:
+            if isinstance(pl_key, str):
+                pl_key = [pl_key]
+            pl_key = tuple(sorted(p.lower() for p in pl_key))
+        key = ('GetClass', classname, LocalOnly, IncludeQualifiers,
+               IncludeClassOrigin, pl_key)
+        return self._cached_request(ns, key, request)
+
+    def EnumerateClasses(self, namespace=None, ClassName=None,
+                         DeepInheritance=None, LocalOnly=None,
+                         IncludeQualifiers=None, IncludeClassOrigin=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.EnumerateClasses() that uses the class store and
+        class cache, if enabled.
+        """
+        def request():
+            return super(ClassCacheMixin, self).EnumerateClasses(
+                namespace=namespace, ClassName=ClassName,
+                DeepInheritance=DeepInheritance, LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin)
+
+        if not self.class_caching:
+            return request()
+        ns, classname = self._cache_namespace(namespace, ClassName)
+        key = ('EnumerateClasses', classname, DeepInheritance, LocalOnly,
+               IncludeQualifiers, IncludeClassOrigin)
+        return self._cached_request(ns, key, request)
+
+    def EnumerateClassNames(self, namespace=None, ClassName=None,
+                            DeepInheritance=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.EnumerateClassNames() that uses the class store and
+        class cache, if enabled.
+        """
+        def request():
+            return super(ClassCacheMixin, self).EnumerateClassNames(
+                namespace=namespace, ClassName=ClassName,
+                DeepInheritance=DeepInheritance)
+
+        if not self.class_caching:
+            return request()
+        ns, classname = self._cache_namespace(namespace, ClassName)
+        key = ('EnumerateClassNames', classname, DeepInheritance)
+        return self._cached_request(ns, key, request)
+
+    def GetQualifier(self, QualifierName, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.GetQualifier() that uses the class store and
+        class cache, if enabled.
+        """
+        def request():
+            return super(ClassCacheMixin, self).GetQualifier(
+                QualifierName, namespace=namespace)
 
-            # Flag indicating that the mock environment needs to be built
-            # (or re-built). If False, the mock environment cache can be used.
-            need_rebuild = False
+        if not self.class_caching:
+            return request()
+        ns, _ = self._cache_namespace(namespace)
+        key = ('GetQualifier', QualifierName.lower())
+        return self._cached_request(ns, key, request)
 
-            # Determine whether the mock environment needs to be rebuilt based
-            # on the (non-)existence of the cache files.
-            if not os.path.isfile(mockenv_pickle_file) \
-                    or not os.path.isfile(depreg_pickle_file) \
-                    or not os.path.isfile(md5_file):
-                if verbose:
-                    click.echo(f"Mock environment for connection definition "
-                               f"'{connection_name}' will be built because it "
-                               "was not cached.")
-                need_rebuild = True
+    def EnumerateQualifiers(self, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.EnumerateQualifiers() that uses the class store and
+        class cache, if enabled.
+        """
+        def request():
+            return super(ClassCacheMixin, self).EnumerateQualifiers(
+                namespace=namespace)
 
-            try:
-                depreg = self._load_depreg(depreg_pickle_file)
-            except OSError as exc:
-                if exc.errno == errno.ENOENT:
-                    depreg = pywbem_mock.ProviderDependentRegistry()
-                else:
-                    raise
-
-            # Calculate the MD5 hash value of the content of the input files
-            md5 = hashlib.md5()
-            for file_path in file_path_list:
-                with open(file_path, 'rb') as fp:
-                    file_source = fp.read()
-                    md5.update(file_source)
-
-                # For mock scripts, take their dependent files into account
-                if file_path.endswith('.py'):
-                    dep_files = depreg.iter_dependents(file_path)
-                    for dep_file in dep_files:
-                        with open(dep_file, 'rb') as fp:
-                            file_source = fp.read()
-                            md5.update(file_source)
-
-            # Add the cache dir, so that manual tweaks on the cache files
-            # invalidates the cache.
-            md5.update(ensure_bytes(cache_dir))
-
-            new_md5_value = ensure_unicode(md5.hexdigest())
-
-            # Determine whether the mock environment needs to be rebuilt based
-            # on the MD5 hash value of the input file content.
-            if not need_rebuild:
-                with open(md5_file, encoding='utf-8') as fp:
-                    cached_md5_value = fp.read()
-                if new_md5_value != cached_md5_value:
-                    if verbose:
-                        click.echo(f"Mock environment for connection "
-                                   f"definition '{connection_name}' is cached "
-                                   "but will be rebuilt because the mock "
-                                   "files have changed.")
-                    need_rebuild = True
-
-            cache_it = True
-
-        elif connections_file:
-            # User-specified connections file used.
-
-            if verbose:
-                click.echo("Mock environment for connection definition "
-                           f"'{connection_name}' will be built because "
-                           "user-specified connections files are not cached.")
-            need_rebuild = True
-            cache_it = False
+        if not self.class_caching:
+            return request()
+        ns, _ = self._cache_namespace(namespace)
+        return self._cached_request(ns, ('EnumerateQualifiers',), request)
 
-        else:
-            # No connections file context.
+    def _invalidate_class_cache(self, namespace, objectname=None):
+        """
+        Invalidate the class cache of the namespace of a request that
+        modifies classes or qualifier declarations.
+        """
+        if self.class_caching:
+            ns, _ = self._cache_namespace(namespace, objectname)
+            if self.class_store is not None:
+                self.class_store.invalidate(ns)
+            if self.class_cache is not None:
+                self.class_cache.invalidate(ns)
+
+    def CreateClass(self, NewClass, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.CreateClass() that invalidates the class store and
+        class cache.
+        """
+        try:
+            return super().CreateClass(NewClass, namespace=namespace)
+        finally:
+            self._invalidate_class_cache(namespace)
 
-            if verbose:
-                click.echo("Mock environment for connection definition "
-                           f"'{connection_name}' will be built because "
-                           "connections file is unknown.")
-            need_rebuild = True
-            cache_it = False
+    def ModifyClass(self, ModifiedClass, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.ModifyClass() that invalidates the class store and
+        class cache.
+        """
+        try:
+            return super().ModifyClass(ModifiedClass, namespace=namespace)
+        finally:
+            self._invalidate_class_cache(namespace)
 
-        if need_rebuild:
-            try:
-                self._build_mockenv(server, file_path_list, verbose)
-            except mockscripts.NotCacheable as exc:
-                if verbose:
-                    click.echo("Mock environment for connection definition "
-                               f"'{connection_name}' will be built because "
-                               f"it is not cacheable: {exc}.")
-            else:
-                if connections_file and cache_it:
-                    self._dump_mockenv(mockenv_pickle_file)
-                    self._dump_depreg(
-                        self.provider_dependent_registry, depreg_pickle_file)
-                    with open(md5_file, 'w', encoding='utf-8') as fp:
-                        fp.write(new_md5_value)
-                    if verbose:
-                        click.echo("Mock environment for connection "
-                                   f"definition '{connection_name}' has been "
-                                   "written to cache.")
-        else:
-            # When no rebuild is needed, there must have been a connections
-            # file set.
-            assert connections_file
-            try:
-                self._load_mockenv(mockenv_pickle_file, file_path_list)
-                if verbose:
-                    click.echo("Mock environment for connection definition "
-                               f"'{connection_name}' has been loaded from "
-                               "cache.")
-            except mockscripts.NotCacheable as exc:
-                if verbose:
-                    click.echo("Mock environment for connection definition "
-                               f"'{connection_name}' will be rebuilt because "
-                               f"it is not cacheable: {exc}.")
-                self._build_mockenv(server, file_path_list, verbose)
+    def DeleteClass(self, ClassName, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.DeleteClass() that invalidates the class store and
+        class cache.
+        """
+        try:
+            return super().DeleteClass(ClassName, namespace=namespace)
+        finally:
+            self._invalidate_class_cache(namespace, ClassName)
 
-    def _build_mockenv(self, server, file_path_list, verbose):
+    def SetQualifier(self, QualifierDeclaration, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.SetQualifier() that invalidates the class store and
+        class cache.
         """
-        Build the mock environment from the input files.
+        try:
+            return super().SetQualifier(QualifierDeclaration,
+                                        namespace=namespace)
+        finally:
+            self._invalidate_class_cache(namespace)
 
-        Parameters:
+    def DeleteQualifier(self, QualifierName, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.DeleteQualifier() that invalidates the class store and
+        class cache.
+        """
+        try:
+            return super().DeleteQualifier(QualifierName, namespace=namespace)
+        finally:
+            self._invalidate_class_cache(namespace)
 
-          self (pywbem_mock.FakedWBEMConnection): The mock connection.
 
-          server (pywbem.WBEMServer): The server object for the mock connection.
+class AdaptivePullMixin:
+    """
+    Mixin class for WBEMConnection that adapts the MaxObjectCount of the pull
+    operations to their response times, if the pull tuner of the connection
+    is set (--pull-target-time general option).
+
+    The Open... requests use the MaxObjectCount adapted for their request
+    kind, namespace and class, and each Pull... request of an enumeration uses
+    the MaxObjectCount as adapted from the previous response. Requests whose
+    MaxObjectCount is less than that of the connection (e.g. for the --limit
+    command option) are not adapted. OpenQueryInstances is not adapted since
+    its result has no class.
+
+    It must precede the WBEMConnection class in the base classes.
+    """
 
-          file_path_list (list of string): The path names of the input files
-            for building the mock environment, from the connection definition.
+    #: PullTuner object of the connection if the --pull-target-time general
+    #: option is set, or None.
+    pull_tuner = None
 
-          verbose (bool): Verbose flag from the command line.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Keys of the adapted open enumerations, by enumeration context
+        self._pull_keys = {}
 
-        Raises:
-          NotCacheable (py<3.5): Mock environment is not cacheable.
-          MockMOFCompileError: Mock MOF file fails to compile.
-          MockScriptError: Mock script fails to execute.
-          SetupNotSupportedError (py<3.5): New-style setup in mock script not
-            supported.
+    def _adaptive_open(self, request, operation, objectname, namespace,
+                       max_object_count):
         """
-        for file_path in file_path_list:
-            ext = os.path.splitext(file_path)[1]
-            if ext == '.mof':
-                try:
-                    # Displays any MOFParseError already
-                    self.compile_mof_file(file_path, verbose=verbose)
-                except pywbem.Error as er:
-                    # Abort the entire pywbemcli command because the
-                    # MOF compilation might have caused inconsistencies in
-                    # the mock repository.
-
-                    if PYWBEM_VERSION.release >= (1, 0, 0):
-                        # display just the exception.
-                        msg = f"MOF compile failed:\n{er}"
-                    else:
-                        # display file name.  Error text displayed already.
-                        if isinstance(er, pywbem.MOFParseError):
-                            msg = f"MOF compile failed: File: '{file_path}'" \
-                                "(see above)"
-                        else:  # not parse error, display exception
-                            msg = f"MOF compile failed: File: '{file_path}' " \
-                                f"Error: {er}"
-                    new_exc = mockscripts.MockMOFCompileError(msg)
-                    new_exc.__cause__ = None
-                    raise new_exc
-            else:
-                assert ext == '.py'  # already checked
-
-                # May raise various mockscripts.MockError exceptions.
-                # NotCacheable will be handled by the caller by building the
-                # mock env.
-                mockscripts.setup_script(file_path, self, server, verbose)
+        Execute the Open... request with the adapted MaxObjectCount for the
+        operation, namespace and class name of the objectname parameter
+        (ClassName or InstanceName), and adapt it from the response.
 
-    def _dump_mockenv(self, mockenv_pickle_file):
+        request is a function that executes the request with the
+        MaxObjectCount parameter.
         """
-        Dump the mock environment of the connection to the mockenv pickle file.
-
-        Parameters:
-
-          self (pywbem_mock.FakedWBEMConnection): The mock connection.
-
-          mockenv_pickle_file (pywbem.WBEMServer): Path name of the mockenv
-            pickle file.
+        tuner = self.pull_tuner
+        if tuner is None or max_object_count is None or \
+                not tuner.adapts(max_object_count):
+            return request(max_object_count)
+        if isinstance(objectname, (pywbem.CIMClassName,
+                                   pywbem.CIMInstanceName)):
+            namespace = namespace or objectname.namespace
+            objectname = objectname.classname
+        key = pull_tuning_key(operation, namespace or self.default_namespace,
+                              objectname)
+        count = tuner.max_object_count(key, max_object_count)
+        result = request(count)
+        self._adapt_pull(key, count, result)
+        return result
+
+    def _adaptive_pull(self, request, context, max_object_count):
         """
-
-        # Save the provider registry and the CIM repository
-
-        # We construct a single object, because the CIM repository is
-        # referenced from each provider, and pickle properly handles
-        # multiple references to the same object.
-        mockenv = {"cimrepository": self.cimrepository,
-                   # pylint: disable=protected-access
-                   "provider_registry": self._provider_registry}
-
-        with open(mockenv_pickle_file, 'wb') as fp:
-            pickle.dump(mockenv, fp)
-
-    def _load_mockenv(self, mockenv_pickle_file, file_path_list):
+        Execute the Pull... request of an open enumeration with the adapted
+        MaxObjectCount, if the enumeration is adapted.
         """
-        Load the mock environment from the mockenv pickle file.
-
-        This method also imports the Python scripts from the input files in
-        order to re-establish any class definitions that may be needed, for
-        example provider classes.
-
-        Parameters:
+        key = self._pull_keys.pop(context[0], None) if context else None
+        if key is None:
+            return request(context, MaxObjectCount=max_object_count)
+        count = self.pull_tuner.max_object_count(key, max_object_count)
+        result = request(context, MaxObjectCount=count)
+        self._adapt_pull(key, count, result)
+        return result
+
+    def _adapt_pull(self, key, count, result):
+        """
+        Adapt the MaxObjectCount for the key from the response time and size
+        of the last request, whose result is the pull result tuple result.
+        """
+        self.pull_tuner.update(key, count, len(result[0]),
+                               self.last_operation_time, self.last_reply_len)
+        if not result.eos:
+            self._pull_keys[result.context[0]] = key
+
+    def OpenEnumerateInstances(self, ClassName, namespace=None,
+                               MaxObjectCount=None, **kwargs):
+        # pylint: disable=invalid-name,arguments-differ
+        """
+        WBEMConnection.OpenEnumerateInstances() with adapted MaxObjectCount.
+        """
+        def request(max_object_count):
+            return super(AdaptivePullMixin, self).OpenEnumerateInstances(
+                ClassName, namespace=namespace,
+                MaxObjectCount=max_object_count, **kwargs)
 
-          self (pywbem_mock.FakedWBEMConnection): The mock connection.
+        return self._adaptive_open(request, 'EnumerateInstances', ClassName,
+                                   namespace, MaxObjectCount)
 
-          mockenv_pickle_file (pywbem.WBEMServer): Path name of the mockenv
-            pickle file.
+    def OpenEnumerateInstancePaths(self, ClassName, namespace=None,
+                                   MaxObjectCount=None, **kwargs):
+        # pylint: disable=invalid-name,arguments-differ
+        """
+        WBEMConnection.OpenEnumerateInstancePaths() with adapted
+        MaxObjectCount.
+        """
+        def request(max_object_count):
+            return super(AdaptivePullMixin, self).OpenEnumerateInstancePaths(
+                ClassName, namespace=namespace,
+                MaxObjectCount=max_object_count, **kwargs)
 
-          file_path_list (list of string): The path names of the input files
-            for building the mock environment, from the connection definition.
+        return self._adaptive_open(request, 'EnumerateInstancePaths',
+                                   ClassName, namespace, MaxObjectCount)
 
-        Raises:
-          NotCacheable (py<3.5): Mock environment is not cacheable.
+    def OpenReferenceInstances(self, InstanceName, MaxObjectCount=None,
+                               **kwargs):
+        # pylint: disable=invalid-name,arguments-differ
         """
+        WBEMConnection.OpenReferenceInstances() with adapted MaxObjectCount.
+        """
+        def request(max_object_count):
+            return super(AdaptivePullMixin, self).OpenReferenceInstances(
+                InstanceName, MaxObjectCount=max_object_count, **kwargs)
 
-        # Restore the provider classes
-        for file_path in file_path_list:
-            ext = os.path.splitext(file_path)[1]
-            if ext == '.py':
-                # May raise mockscripts.NotCacheable which will be handled by
-                # the caller by building the mock env.
-                mockscripts.import_script(file_path)
-
-        # Restore the provider registry and the CIM repository
-        with open(mockenv_pickle_file, 'rb') as fp:
-            mockenv = pickle.load(fp)
+        return self._adaptive_open(request, 'ReferenceInstances',
+                                   InstanceName, None, MaxObjectCount)
 
-        # Others have references to the self._cimrepository object, so we are
-        # not replacing that object, but are rather replacing the state of
-        # that object.
-        cimrepository = mockenv['cimrepository']
-        assert isinstance(cimrepository, pywbem_mock.InMemoryRepository)
-        # pylint: disable=protected-access
-        self._cimrepository.load(cimrepository)
+    def OpenReferenceInstancePaths(self, InstanceName, MaxObjectCount=None,
+                                   **kwargs):
+        # pylint: disable=invalid-name,arguments-differ
+        """
+        WBEMConnection.OpenReferenceInstancePaths() with adapted
+        MaxObjectCount.
+        """
+        def request(max_object_count):
+            return super(AdaptivePullMixin, self).OpenReferenceInstancePaths(
+                InstanceName, MaxObjectCount=max_object_count, **kwargs)
 
-        provider_registry = mockenv['provider_registry']
-        assert isinstance(provider_registry, pywbem_mock.ProviderRegistry)
-        # pylint: disable=protected-access
-        self._provider_registry.load(provider_registry)
+        return self._adaptive_open(request, 'ReferenceInstancePaths',
+                                   InstanceName, None, MaxObjectCount)
 
-    @staticmethod
-    def _dump_depreg(depreg, depreg_pickle_file):
+    def OpenAssociatorInstances(self, InstanceName, MaxObjectCount=None,
+                                **kwargs):
+        # pylint: disable=invalid-name,arguments-differ
         """
-        Dump a provider dependent registry to a pickle file.
-
-        Parameters:
+        WBEMConnection.OpenAssociatorInstances() with adapted MaxObjectCount.
+        """
+        def request(max_object_count):
+            return super(AdaptivePullMixin, self).OpenAssociatorInstances(
+                InstanceName, MaxObjectCount=max_object_count, **kwargs)
 
-          depreg (pywbem_mock.ProviderDependentRegistry): Provider dependent
-            registry to be dumped.
+        return self._adaptive_open(request, 'AssociatorInstances',
+                                   InstanceName, None, MaxObjectCount)
 
-          depreg_pickle_file (string): Path name of the pickle file.
+    def OpenAssociatorInstancePaths(self, InstanceName, MaxObjectCount=None,
+                                    **kwargs):
+        # pylint: disable=invalid-name,arguments-differ
         """
-        with open(depreg_pickle_file, 'wb') as fp:
-            pickle.dump(depreg, fp)
-
-    @staticmethod
-    def _load_depreg(depreg_pickle_file):
+        WBEMConnection.OpenAssociatorInstancePaths() with adapted
+        MaxObjectCount.
         """
-        Load a provider dependent registry from a pickle file and return it.
-
-        Parameters:
+        def request(max_object_count):
+            return super(AdaptivePullMixin, self).OpenAssociatorInstancePaths(
+                InstanceName, MaxObjectCount=max_object_count, **kwargs)
 
-          depreg_pickle_file (string): Path name of the pickle file to be
-            loaded.
+        return self._adaptive_open(request, 'AssociatorInstancePaths',
+                                   InstanceName, None, MaxObjectCount)
 
-        Returns:
-          pywbem_mock.ProviderDependentRegistry: Provider dependent registry.
+    def PullInstancesWithPath(self, context, MaxObjectCount):
+        # pylint: disable=invalid-name
         """
-        with open(depreg_pickle_file, 'rb') as fp:
-            depreg = pickle.load(fp)
-        return depreg
-
+        WBEMConnection.PullInstancesWithPath() with adapted MaxObjectCount.
+        """
+        return self._adaptive_pull(super().PullInstancesWithPath, context,
+                                   MaxObjectCount)
 
-class PYWBEMCLIConnection(pywbem.WBEMConnection, PYWBEMCLIConnectionMixin):
-    """
-    PyWBEMCLIConnection subclass adds the methods added by
-    PYWBEMCLIConnectionMixin
-    """
+    def PullInstancePaths(self, context, MaxObjectCount):
+        # pylint: disable=invalid-name
+        """
+        WBEMConnection.PullInstancePaths() with adapted MaxObjectCount.
+        """
+        return self._adaptive_pull(super().PullInstancePaths, context,
+                                   MaxObjectCount)
 
-    def __init__(self, *args, **kwargs):
+    def CloseEnumeration(self, context):
+        # pylint: disable=invalid-name
         """
-        ctor passes all input parameters to superclass
+        WBEMConnection.CloseEnumeration() that forgets the adapted
+        enumeration.
         """
-        super().__init__(*args, **kwargs)
+        if context:
+            self._pull_keys.pop(context[0], None)
+        return super().CloseEnumeration(context)
 
 
-class PYWBEMCLIFakedConnection(BuildMockenvMixin,
-                               PYWBEMCLIConnectionMixin,
-                               pywbem_mock.FakedWBEMConnection):
+class PYWBEMCLIConnection(ClassCacheMixin, AdaptivePullMixin,
+                          pywbem.WBEMConnection, PYWBEMCLIConnectionMixin):
     """
-    PyWBEMCLIFakedConnection subclass adds the methods added by
-    PYWBEMCLIConnectionMixin and BuildMockenvMixin
+    PyWBEMCLIConnection subclass adds the methods added by
+    PYWBEMCLIConnectionMixin and ClassCacheMixin, and adapts the
+    MaxObjectCount of the pull operations with AdaptivePullMixin
     """
-    def __init__(self, *args, **kwargs):
+
+    def copy(self):
         """
-        ctor passes all input parameters to superclass
+        Return a copy of the connection with internal state reset, as
+        WBEMConnection.copy() does, but as a PYWBEMCLIConnection so that the
+        copy also includes the methods of PYWBEMCLIConnectionMixin. The copy
+        shares the class store, class cache and pull tuner of the
+        connection.
         """
-        super().__init__(*args, **kwargs)
-
-
-def mockcache_cachedir(rootdir, connections_file, connection_name):
+        cpy = PYWBEMCLIConnection(
+            url=self.url,
+            creds=self.creds,
+            default_namespace=self.default_namespace,
+            x509=self.x509,
+            ca_certs=self.ca_certs,
+            no_verification=self.no_verification,
+            timeout=self.timeout,
+            use_pull_operations=self.use_pull_operations,
+            stats_enabled=self.stats_enabled,
+            proxies=self.proxies)
+        for rec in self.operation_recorders:
+            cpy.add_operation_recorder(rec.copy())
+        cpy.class_store = self.class_store
+        cpy.class_cache = self.class_cache
+        cpy.pull_tuner = self.pull_tuner
+        return cpy
+
+
+def mockcache_cachedir(rootdir, connections_file, connection_name,
+                       mock_files=None):
     """
     Return the directory path of the mock cache directory for a connection.
+
+    For a connection definition in a connections file, the cache is identified
+    by the absolute path name of the connections file and the connection
+    name. Without connections file (i.e. for the --mock-server general
+    option), it is identified by the absolute path names of the mock files.
     """
-    # Construct a (reproducible) cache ID from connections file path and
-    # connection definition name.
+    # Construct a (reproducible) cache ID from connections file path (or the
+    # mock file paths) and connection definition name.
     # Example: 6048a3da1a34a3ec605825a1493c7bb5.simple
-    try:
-        connections_file = os.path.relpath(
-            connections_file, os.path.expanduser('~'))
-    except ValueError:
-        # On Windows, os.path.relpath() raises ValueError when the paths
-        # are on different drives
-        pass
+    if connections_file:
+        cache_key = os.path.abspath(connections_file)
+        try:
+            cache_key = os.path.relpath(cache_key, os.path.expanduser('~'))
+        except ValueError:
+            # On Windows, os.path.relpath() raises ValueError when the paths
+            # are on different drives
+            pass
+    else:
+        cache_key = '\n'.join(os.path.abspath(fn) for fn in mock_files or [])
     md5 = hashlib.md5()
-    md5.update(connections_file.encode("utf-8"))
+    md5.update(cache_key.encode("utf-8"))
     cache_id = f"{md5.hexdigest()}.{connection_name}"
     dir_path = os.path.join(rootdir, cache_id)
     return dir_path
 
 
+def cleanup_mock_caches(rootdir, keep_dirs, max_size=MOCKCACHE_MAX_SIZE):
+    """
+    Remove the least recently used mock caches in the mock cache root
+    directory, until the total size of the mock caches does not exceed
+    max_size.
+
+    The time of last use of a mock cache is the modification time of its
+    directory, which is updated when the mock cache is used.
+
+    Parameters:
+
+      rootdir (string): Path name of the mock cache root directory.
+
+      keep_dirs (list of string): Path names of the mock cache directories
+        used by the current connection, that are not removed.
+
+      max_size (int): Maximum total size in bytes of the mock caches.
+
+    Returns:
+      list of string: Path names of the removed mock cache directories.
+    """
+    # Mock caches may be used or removed concurrently by other pywbemcli
+    # processes, so files that disappear are ignored.
+    caches = []
+    total_size = 0
+    for entry in os.scandir(rootdir):
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            size = sum(os.path.getsize(fn)
+                       for fn in glob.glob(os.path.join(entry.path, '*')))
+            mtime = entry.stat().st_mtime_ns
+        except OSError:
+            continue
+        total_size += size
+        if entry.path not in keep_dirs:
+            caches.append((mtime, entry.path, size))
+
+    removed = []
+    for _, dir_path, size in sorted(caches):
+        if total_size <= max_size:
+            break
+        try:
+            for _file in glob.glob(os.path.join(dir_path, '*')):
+                os.remove(_file)
+            os.rmdir(dir_path)
+        except OSError:
+            continue
+        total_size -= size
+        removed.append(dir_path)
+    return removed
+
+
 def delete_mock_cache(connections_file, connection_name):
     """
     Delete the mock cache of the connection, if it exists.
@@ -0,0 +1,801 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Filter expressions of the --where command option of the instance commands.
+
+A filter expression is a boolean expression on the property values of the
+instances (or the key bindings of the instance paths), for example:
+
+    IntegerProp >= 5 AND NOT (InstanceID =~ '^CIM_Foo_sub')
+
+It consists of comparisons of a property with a literal value (=, <>, !=, <,
+<=, >, >=), Null tests (IS NULL, IS NOT NULL) and regular expression matches
+(=~, !~) combined with AND, OR, NOT and parentheses. Literal values are
+strings in single or double quotes, integer or real numbers, and TRUE or
+FALSE. Keywords and property names are case-insensitive.
+
+Except for the regular expression matches, this is a subset of the DMTF
+Filter Query Language (DMTF:FQL, DSP0212). The WhereFilter class splits an
+expression at its top-level AND operators into the parts that are passed to
+the WBEM server as DMTF:FQL filter query of the pull operations, and the
+parts that are evaluated by pywbemcli.
+
+The expressions are evaluated with the three-valued logic of DMTF:FQL:
+Comparisons with Null values are unknown, and only objects for which the
+expression is true are selected.
+
+An expression is compiled into a Python function for each class of the
+objects it is evaluated on, when the first object of the class is
+evaluated: The CIM types of the properties are determined from that
+object, and the literal values are converted to them, so that the
+evaluation of the objects does not need to repeat these steps.
+"""
+
+import re
+import operator
+import threading
+
+from pywbem import CIMInstance, CIMInstanceName, CIMDateTime, cimtype
+from pywbem._nocasedict import NocaseDict
+
+__all__ = []
+
+# Tokens of filter expressions. Names include keywords.
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+      (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<number>[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)
+    | (?P<op><=|>=|<>|!=|=~|!~|=|<|>)
+    | (?P<paren>[()])
+    | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )""", re.VERBOSE)
+
+_KEYWORDS = ('AND', 'OR', 'NOT', 'IS', 'NULL', 'TRUE', 'FALSE')
+
+# Comparison operators and their DMTF:FQL representation. The regular
+# expression matches have no DMTF:FQL representation.
+_COMPARISON_OPS = {
+    '=': '=',
+    '<>': '<>',
+    '!=': '<>',
+    '<': '<',
+    '<=': '<=',
+    '>': '>',
+    '>=': '>=',
+    '=~': None,
+    '!~': None,
+}
+
+# Python functions of the comparison operators
+_OPERATORS = {
+    '=': operator.eq,
+    '<>': operator.ne,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+_INTEGER_TYPES = ('uint8', 'sint8', 'uint16', 'sint16', 'uint32', 'sint32',
+                  'uint64', 'sint64')
+_REAL_TYPES = ('real32', 'real64')
+
+# Converted literal value that cannot be compared with the values of a
+# property
+_INCOMPARABLE = object()
+
+_STRING_ESCAPE = re.compile(r'\\(.)')
+
+
+def _literal_text(value):
+    """
+    Return the representation of a literal value in a filter expression and
+    in DMTF:FQL.
+    """
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, str):
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+        return f'"{escaped}"'
+    return repr(value)
+
+
+def typed_literal(literal, cim_type):
+    """
+    Return the literal value of a comparison converted to the CIM type of the
+    compared property, or _INCOMPARABLE if it cannot be compared with values
+    of that type. If cim_type is None (unknown type), the literal value is
+    returned unchanged.
+    """
+    if cim_type is None:
+        return literal
+    try:
+        if cim_type in _INTEGER_TYPES:
+            if isinstance(literal, bool):
+                return _INCOMPARABLE
+            return int(literal) if isinstance(literal, str) else literal
+        if cim_type in _REAL_TYPES:
+            if isinstance(literal, bool):
+                return _INCOMPARABLE
+            return float(literal)
+        if cim_type == 'boolean':
+            if isinstance(literal, bool):
+                return literal
+            if isinstance(literal, str) and \
+                    literal.lower() in ('true', 'false'):
+                return literal.lower() == 'true'
+            return _INCOMPARABLE
+        if not isinstance(literal, str):
+            return _INCOMPARABLE
+        if cim_type == 'datetime':
+            return CIMDateTime(literal)
+        if cim_type == 'reference':
+            return CIMInstanceName.from_wbem_uri(literal)
+        if cim_type in ('string', 'char16'):
+            return literal
+    except (ValueError, TypeError):
+        pass
+    return _INCOMPARABLE
+
+
+def value_type(value):
+    """
+    Return the CIM type of a key binding value, or None if it is unknown.
+    """
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'sint64'
+    if isinstance(value, float):
+        return 'real64'
+    try:
+        return cimtype(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _datetime_key(value):
+    """
+    Return the orderable representation of a CIMDateTime value.
+    """
+    if not isinstance(value, CIMDateTime):
+        return value
+    return value.timedelta if value.is_interval else value.datetime
+
+
+def _untyped_compare(op, value, literal):
+    """
+    Compare a property value of unknown CIM type with a literal value and
+    return True, False, or None if the values cannot be compared.
+    """
+    if not isinstance(value, (str, int, float)):
+        # Other values (e.g. embedded instances) are compared in their
+        # string representation.
+        if not isinstance(literal, str):
+            return None
+        value = str(value)
+    try:
+        return _OPERATORS[op](value, literal)
+    except TypeError:
+        return None
+
+
+class _Resolver:
+    # pylint: disable=too-few-public-methods
+    """
+    Resolves the properties of a filter expression for the objects of one
+    class, from the first object of the class.
+    """
+
+    def __init__(self, sample):
+        self.sample = sample
+
+    def resolve(self, name):
+        """
+        Return a tuple of a function that returns the value of the property
+        name of an object of the class (None if it does not exist), the CIM
+        type of the property (None if unknown), and a boolean indicating
+        whether the property is an array (None if unknown).
+        """
+        if isinstance(self.sample, CIMInstance):
+            def get_value(obj):
+                prop = obj.properties.get(name)
+                return None if prop is None else prop.value
+
+            prop = self.sample.properties.get(name)
+            if prop is None:
+                return get_value, None, None
+            cim_type = None if prop.embedded_object else prop.type
+            return get_value, cim_type, prop.is_array
+
+        # The properties of instance paths are their key bindings
+        def get_value(obj):  # pylint: disable=function-redefined
+            return obj.keybindings.get(name)
+
+        value = self.sample.keybindings.get(name)
+        if value is None:
+            return get_value, None, None
+        return get_value, value_type(value), False
+
+
+class _Comparison:
+    """Comparison of a property with a literal value"""
+
+    def __init__(self, name, op, literal):
+        self.name = name
+        self.op = op
+        self.literal = literal
+        if op in ('=~', '!~'):
+            try:
+                self._pattern = re.compile(literal)
+            except re.error as exc:
+                raise ValueError(
+                    f"Invalid regular expression {literal!r}: {exc}")
+        else:
+            self._pattern = literal
+
+    @property
+    def pushable(self):
+        """Whether the comparison can be expressed in DMTF:FQL"""
+        return _COMPARISON_OPS[self.op] is not None
+
+    def text(self, fql=False):
+        """Return the representation of the comparison"""
+        op = _COMPARISON_OPS[self.op] if fql else self.op
+        return f'{self.name} {op} {_literal_text(self.literal)}'
+
+    def _test(self, cim_type):
+        """
+        Return a function that compares a single property value with the
+        literal value, for a property of the CIM type.
+        """
+        if self.op in ('=~', '!~'):
+            search = self._pattern.search
+            negated = self.op == '!~'
+
+            def test(value):
+                if not isinstance(value, str):
+                    value = str(value)
+                return (search(value) is not None) != negated
+            return test
+
+        if cim_type is None:
+            op = self.op
+            literal = self.literal
+
+            def test(value):  # pylint: disable=function-redefined
+                return _untyped_compare(op, value, literal)
+            return test
+
+        literal = typed_literal(self.literal, cim_type)
+        if literal is _INCOMPARABLE:
+            return None
+        compare = _OPERATORS[self.op]
+
+        if cim_type == 'datetime':
+            # CIMDateTime does not support ordering, so point in time values
+            # are compared as datetime and interval values as timedelta
+            # objects. Comparing one with the other is unknown.
+            literal = _datetime_key(literal)
+
+            def test(value):  # pylint: disable=function-redefined
+                try:
+                    return compare(_datetime_key(value), literal)
+                except TypeError:
+                    return None
+            return test
+
+        def test(value):  # pylint: disable=function-redefined
+            try:
+                return compare(value, literal)
+            except TypeError:
+                return None
+        return test
+
+    def compile(self, resolver):
+        """
+        Return a function that evaluates the comparison for an object of the
+        class of the resolver.
+        """
+        get_value, cim_type, is_array = resolver.resolve(self.name)
+        test = self._test(cim_type)
+        if test is None:
+            return lambda obj: None
+
+        def evaluate_array(values):
+            # Array properties match if one of their elements matches
+            results = [test(v) for v in values if v is not None]
+            if any(results):
+                return True
+            return None if None in results or not results else False
+
+        if is_array:
+            def evaluate(obj):
+                values = get_value(obj)
+                return None if values is None else evaluate_array(values)
+        elif is_array is None:
+            def evaluate(obj):  # pylint: disable=function-redefined
+                value = get_value(obj)
+                if value is None:
+                    return None
+                if isinstance(value, list):
+                    return evaluate_array(value)
+                return test(value)
+        else:
+            def evaluate(obj):  # pylint: disable=function-redefined
+                value = get_value(obj)
+                return None if value is None else test(value)
+        return evaluate
+
+
+class _NullTest:
+    """IS NULL or IS NOT NULL test of a property"""
+
+    pushable = True
+
+    def __init__(self, name, negated):
+        self.name = name
+        self.negated = negated
+
+    def text(self, fql=False):  # pylint: disable=unused-argument
+        """Return the representation of the test"""
+        return f'{self.name} IS {"NOT " if self.negated else ""}NULL'
+
+    def compile(self, resolver):
+        """
+        Return a function that evaluates the test for an object of the class
+        of the resolver.
+        """
+        get_value = resolver.resolve(self.name)[0]
+        negated = self.negated
+
+        def evaluate(obj):
+            return (get_value(obj) is None) != negated
+        return evaluate
+
+
+class _Not:
+    """NOT operator"""
+
+    def __init__(self, operand):
+        self.operand = operand
+
+    @property
+    def pushable(self):
+        """Whether the operation can be expressed in DMTF:FQL"""
+        return self.operand.pushable
+
+    def text(self, fql=False):
+        """Return the representation of the operation"""
+        return f'NOT {_operand_text(self.operand, fql)}'
+
+    def compile(self, resolver):
+        """
+        Return a function that evaluates the operation for an object of the
+        class of the resolver.
+        """
+        operand = self.operand.compile(resolver)
+
+        def evaluate(obj):
+            result = operand(obj)
+            return None if result is None else not result
+        return evaluate
+
+
+class _Junction:
+    """AND or OR operator with two or more operands"""
+
+    def __init__(self, keyword, operands):
+        self.keyword = keyword
+        self.operands = operands
+
+    @property
+    def pushable(self):
+        """Whether the operation can be expressed in DMTF:FQL"""
+        return all(operand.pushable for operand in self.operands)
+
+    def text(self, fql=False):
+        """Return the representation of the operation"""
+        return f' {self.keyword} '.join(
+            _operand_text(operand, fql) for operand in self.operands)
+
+    def compile(self, resolver):
+        """
+        Return a function that evaluates the operation for an object of the
+        class of the resolver.
+        """
+        operands = [operand.compile(resolver) for operand in self.operands]
+        decisive = self.keyword == 'OR'
+
+        def evaluate(obj):
+            # The result is decisive if one operand has it, and unknown if no
+            # operand has it but one is unknown.
+            unknown = False
+            for operand in operands:
+                result = operand(obj)
+                if result is None:
+                    unknown = True
+                elif result == decisive:
+                    return decisive
+            return None if unknown else not decisive
+        return evaluate
+
+
+def _property_names(node, names):
+    """
+    Add the names of the properties used in the expression of node to the
+    NocaseDict names, in the order of their first use.
+    """
+    if isinstance(node, _Junction):
+        for operand in node.operands:
+            _property_names(operand, names)
+    elif isinstance(node, _Not):
+        _property_names(node.operand, names)
+    elif node.name not in names:
+        names[node.name] = node.name
+
+
+def _operand_text(operand, fql):
+    """
+    Return the representation of an operand of an operator, in parentheses
+    if needed.
+    """
+    if isinstance(operand, _Junction):
+        return f'({operand.text(fql)})'
+    return operand.text(fql)
+
+
+class _Parser:
+    # pylint: disable=too-few-public-methods
+    """
+    Recursive descent parser for filter expressions.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = self._tokenize(expression)
+        self.index = 0
+
+    @staticmethod
+    def _tokenize(expression):
+        """
+        Return the list of tokens of the expression as tuples of kind, value
+        and position.
+        """
+        tokens = []
+        pos = 0
+        end = len(expression.rstrip())
+        while pos < end:
+            m = _TOKEN_PATTERN.match(expression, pos)
+            if m is None or m.end() == pos:
+                pos = len(expression) - len(expression[pos:].lstrip())
+                raise ValueError(
+                    f"Invalid character at position {pos + 1}: "
+                    f"{expression[pos:end]!r}")
+            kind = m.lastgroup
+            value = m.group(kind)
+            start = m.start(kind)
+            if kind == 'name' and value.upper() in _KEYWORDS:
+                kind, value = 'keyword', value.upper()
+            tokens.append((kind, value, start))
+            pos = m.end()
+        return tokens
+
+    def _peek(self):
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return (None, None, len(self.expression))
+
+    def _next(self):
+        token = self._peek()
+        self.index += 1
+        return token
+
+    @staticmethod
+    def _error(expected, token):
+        kind, value, pos = token
+        found = 'end of expression' if kind is None else repr(value)
+        return ValueError(
+            f"Expected {expected} at position {pos + 1} but found {found}")
+
+    def _accept_keyword(self, keyword):
+        kind, value, _ = self._peek()
+        if kind == 'keyword' and value == keyword:
+            self.index += 1
+            return True
+        return False
+
+    def parse(self):
+        """Parse the expression and return its root node"""
+        node = self._parse_or()
+        if self._peek()[0] is not None:
+            raise self._error('AND, OR or end of expression', self._peek())
+        return node
+
+    def _parse_or(self):
+        operands = [self._parse_and()]
+        while self._accept_keyword('OR'):
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else \
+            _Junction('OR', operands)
+
+    def _parse_and(self):
+        operands = [self._parse_not()]
+        while self._accept_keyword('AND'):
+            operands.append(self._parse_not())
+        return operands[0] if len(operands) == 1 else \
+            _Junction('AND', operands)
+
+    def _parse_not(self):
+        if self._accept_keyword('NOT'):
+            return _Not(self._parse_not())
+        token = self._peek()
+        if token[0] == 'paren' and token[1] == '(':
+            self.index += 1
+            node = self._parse_or()
+            token = self._next()
+            if token[0] != 'paren' or token[1] != ')':
+                raise self._error("')'", token)
+            return node
+        return self._parse_comparison()
+
+    def _parse_comparison(self):
+        token = self._next()
+        if token[0] != 'name':
+            raise self._error('property name', token)
+        name = token[1]
+
+        if self._accept_keyword('IS'):
+            negated = self._accept_keyword('NOT')
+            if not self._accept_keyword('NULL'):
+                raise self._error('NULL', self._peek())
+            return _NullTest(name, negated)
+
+        token = self._next()
+        if token[0] != 'op':
+            raise self._error('comparison operator or IS', token)
+        op = token[1]
+
+        literal = self._parse_literal()
+        if op in ('=~', '!~') and not isinstance(literal, str):
+            raise ValueError(
+                f"The {op} operator requires a string with a regular "
+                f"expression but found {_literal_text(literal)}")
+        return _Comparison(name, op, literal)
+
+    def _parse_literal(self):
+        kind, value, pos = token = self._next()
+        if kind == 'string':
+            return _STRING_ESCAPE.sub(r'\1', value[1:-1])
+        if kind == 'number':
+            try:
+                return int(value)
+            except ValueError:
+                return float(value)
+        if kind == 'keyword' and value in ('TRUE', 'FALSE'):
+            return value == 'TRUE'
+        if kind == 'keyword' and value == 'NULL':
+            raise ValueError(
+                f"Comparison with NULL at position {pos + 1}; use IS NULL "
+                "or IS NOT NULL")
+        raise self._error('string, number, TRUE or FALSE', token)
+
+
+class WhereFilter:
+    """
+    Filter expression of the --where command option.
+
+    The expression is split at its top-level AND operators into the parts
+    that can be expressed in DMTF:FQL and are passed to the WBEM server as
+    filter query (see pushdown_query()), and the other parts that are
+    evaluated by pywbemcli (see match_client). If the filter query is not
+    used, the complete expression is evaluated by pywbemcli (see match).
+
+    The outcome of the requests that used the filter is recorded for
+    report(). The methods of this class may be called from multiple threads.
+    """
+
+    def __init__(self, expression):
+        """
+        Parameters:
+
+          expression (:term:`string`): The filter expression.
+
+        Raises:
+          ValueError: Invalid filter expression.
+        """
+        self.expression = expression
+        self._root = _Parser(expression).parse()
+
+        if isinstance(self._root, _Junction) and self._root.keyword == 'AND':
+            conjuncts = self._root.operands
+        else:
+            conjuncts = [self._root]
+        self._pushed = [c for c in conjuncts if c.pushable]
+        self._client = [c for c in conjuncts if not c.pushable]
+
+        #: Function that returns a boolean indicating whether an object
+        #: (a CIMInstance or CIMInstanceName) matches the complete
+        #: expression.
+        self.match = self._compiled(self._root)
+
+        #: Function that returns a boolean indicating whether an object
+        #: matches the parts of the expression that are evaluated by
+        #: pywbemcli when the filter query is used, or None if the filter
+        #: query covers the complete expression.
+        self.match_client = None
+        if len(self._client) == 1:
+            self.match_client = self._compiled(self._client[0])
+        elif self._client:
+            self.match_client = self._compiled(
+                _Junction('AND', self._client))
+
+        names = NocaseDict()
+        _property_names(self._root, names)
+
+        #: List of the names of the properties used in the expression, in
+        #: the order of their first use.
+        self.property_names = list(names.values())
+
+        self._lock = threading.Lock()
+        self._pushdown_used = False
+        self._pushdown_errors = []
+        self._client_only = False
+
+    def __repr__(self):
+        return f'WhereFilter({self.expression!r})'
+
+    @staticmethod
+    def _compiled(node):
+        """
+        Return a function that returns a boolean indicating whether an object
+        matches the expression of node. The expression is compiled for each
+        class when the first object of the class is evaluated.
+        """
+        compiled = {}
+
+        def match(obj):
+            key = (obj.__class__, obj.classname)
+            evaluate = compiled.get(key)
+            if evaluate is None:
+                evaluate = node.compile(_Resolver(obj))
+                compiled[key] = evaluate
+            return evaluate(obj) is True
+        return match
+
+    @staticmethod
+    def _text(conjuncts, fql=False):
+        if not conjuncts:
+            return None
+        if len(conjuncts) == 1:
+            return conjuncts[0].text(fql)
+        return _Junction('AND', conjuncts).text(fql)
+
+    @property
+    def fql(self):
+        """
+        :term:`string`: The parts of the expression that can be passed to the
+        WBEM server, as DMTF:FQL filter query, or None.
+        """
+        return self._text(self._pushed, fql=True)
+
+    @property
+    def client_expression(self):
+        """
+        :term:`string`: The parts of the expression that are evaluated by
+        pywbemcli when the filter query is used, or None.
+        """
+        return self._text(self._client)
+
+    def request_property_list(self, property_list):
+        """
+        Return the property list for a request whose instances are filtered,
+        so that the filter is evaluated on the same properties as by the WBEM
+        server: The property list of the --propertylist command option with
+        the properties used in the expression added. Return None if
+        property_list is None (all properties).
+        """
+        if property_list is None:
+            return None
+        names = NocaseDict([(name, name) for name in property_list])
+        return list(property_list) + \
+            [name for name in self.property_names if name not in names]
+
+    def projected(self, instances, property_list):
+        """
+        Generator that yields the instances of the generator instances without
+        the properties that were added to property_list by
+        request_property_list(). When this generator is closed, the
+        generator instances is closed.
+        """
+        names = NocaseDict([(name, name) for name in property_list or []])
+        added = [name for name in self.property_names if name not in names]
+        try:
+            for inst in instances:
+                if property_list is not None:
+                    for name in added:
+                        if name in inst.properties:
+                            del inst.properties[name]
+                yield inst
+        finally:
+            instances.close()
+
+    def pushdown_query(self, filter_query, filter_query_language):
+        """
+        Return a tuple of the FilterQuery and FilterQueryLanguage parameters
+        of a pull operation that pass the DMTF:FQL parts of the expression to
+        the WBEM server, combined with the filter query of the
+        --filter-query command option, if any. Return None if no part of the
+        expression can be passed.
+
+        Parameters:
+
+          filter_query (:term:`string`): The filter query of the
+            --filter-query command option, or None.
+
+          filter_query_language (:term:`string`): The filter query language
+            of the filter query, or None.
+        """
+        fql = self.fql
+        if fql is None:
+            return None
+        if filter_query:
+            if (filter_query_language or 'DMTF:FQL').upper() != 'DMTF:FQL':
+                return None
+            fql = f'({filter_query}) AND ({fql})'
+        return fql, 'DMTF:FQL'
+
+    def record_pushdown(self, error=None):
+        """
+        Record that the filter query was used by a request, or that the WBEM
+        server rejected it with the exception error.
+        """
+        with self._lock:
+            if error is None:
+                self._pushdown_used = True
+            else:
+                self._pushdown_errors.append(error)
+
+    def record_client_only(self):
+        """
+        Record that a request did not use the filter query, because the
+        connection or the operations do not support it.
+        """
+        with self._lock:
+            self._client_only = True
+
+    def report(self):
+        """
+        Return a list of text lines that describe which parts of the
+        expression were passed to the WBEM server and which were evaluated
+        by pywbemcli in the requests that used the filter.
+        """
+        lines = []
+        with self._lock:
+            if self._pushdown_used:
+                lines.append('--where: Passed to the WBEM server as DMTF:FQL '
+                             f'filter query: {self.fql}')
+                if self._client:
+                    lines.append('--where: Evaluated by pywbemcli: '
+                                 f'{self.client_expression}')
+            for error in self._pushdown_errors[:1]:
+                lines.append('--where: The WBEM server rejected the filter '
+                             f'query: {error}')
+            if self._pushdown_errors or self._client_only:
+                lines.append('--where: Evaluated by pywbemcli: '
+                             f'{self._root.text()}')
+        return lines
@@ -43,7 +43,8 @@ However, they should be used from the ``pywbemcli`` namespace.
 
 __all__ = ['DEFAULT_CONNECTION_TIMEOUT',
            'DEFAULT_NAMESPACE', 'PYWBEMCLI_PROMPT', 'PYWBEMCLI_HISTORY_FILE',
-           'DEFAULT_MAXPULLCNT', 'MAX_TIMEOUT', 'DEFAULT_URL_SCHEME']
+           'DEFAULT_MAXPULLCNT', 'MAX_TIMEOUT', 'DEFAULT_URL_SCHEME',
+           'DEFAULT_MAX_PARALLEL', 'MAX_PARALLEL', 'COUNT_MAXPULLCNT']
 
 #: Default value in seconds for a WBEMConnection to timeout if the value
 #: is not set by an input parameter.
@@ -80,6 +81,59 @@ DEFAULT_URL_SCHEME = 'https'
 #: etc. Set to the same default as used by pywbem.
 DEFAULT_MAXPULLCNT = 1000
 
+#: Minimum pull MaxObjectCount used by the instance count command. The
+#: instance paths are only counted and then discarded, so large responses
+#: reduce the number of requests without increasing the memory used.
+COUNT_MAXPULLCNT = 10000
+
+#: Default maximum number of server requests that are executed concurrently
+#: by commands that issue independent requests (ex. the same request for
+#: multiple namespaces). 1 means that requests are executed sequentially.
+DEFAULT_MAX_PARALLEL = 1
+
+#: Maximum allowed value for the --max-parallel general option.
+MAX_PARALLEL = 64
+
+#: Bounds of the MaxObjectCount of pull operations that is adapted to the
+#: --pull-target-time general option.
+ADAPTIVE_MAXPULLCNT_MIN = 10
+ADAPTIVE_MAXPULLCNT_MAX = 100000
+
+#: Maximum size in bytes of a pull operation response for the adapted
+#: MaxObjectCount (--pull-target-time general option).
+ADAPTIVE_PULL_MAX_REPLY_LEN = 32 * 1024 * 1024
+
+#: Maximum age in seconds of the class cache of a namespace (--class-cache
+#: general option). Older caches are discarded and rebuilt even if the class
+#: names in the namespace are unchanged.
+CLASSCACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+#: Maximum number of CIM objects and names in the responses that are kept in
+#: the in-session class store of a connection. The least recently used
+#: responses are removed when it is exceeded.
+CLASS_STORE_MAX_OBJECTS = 20000
+
+#: Maximum total size in bytes of the mock caches in the mock cache
+#: directory. The least recently used mock caches are removed when it is
+#: exceeded.
+MOCKCACHE_MAX_SIZE = 500 * 1024 * 1024
+
+#: Key in the click context meta data that indicates batch mode (--batch
+#: general option).
+BATCH_META_KEY = 'pywbemcli.batch'
+
+#: Maximum number of connections that the pywbemcli daemon keeps open. The
+#: least recently used connection is closed when it is exceeded.
+DAEMON_MAX_CONNECTIONS = 16
+
+#: Maximum time in seconds the 'daemon start' command waits for the pywbemcli
+#: daemon to accept commands.
+DAEMON_STARTUP_TIMEOUT = 30
+
+#: Maximum time in seconds the 'daemon stop' command waits for the pywbemcli
+#: daemon to remove its socket file.
+DAEMON_STOP_TIMEOUT = 30
+
 #: Maximum allowed connection timeout in seconds.  The environment will not
 #: allow a connection timeout value larger than this on the command line or
 #: internal option for timeout.
@@ -107,7 +161,12 @@ PYWBEMCLI_CA_CERTS_ENVVAR = 'PYWBEMCLI_CA_CERTS'
 PYWBEMCLI_TIMESTATS_ENVVAR = 'PYWBEMCLI_TIMESTATS'
 PYWBEMCLI_USE_PULL_ENVVAR = 'PYWBEMCLI_USE_PULL'
 PYWBEMCLI_PULL_MAX_CNT_ENVVAR = 'PYWBEMCLI_PULL_MAX_CNT'
+PYWBEMCLI_MAX_PARALLEL_ENVVAR = 'PYWBEMCLI_MAX_PARALLEL'
+PYWBEMCLI_CLASS_CACHE_ENVVAR = 'PYWBEMCLI_CLASS_CACHE'
+PYWBEMCLI_CLASS_STORE_ENVVAR = 'PYWBEMCLI_CLASS_STORE'
+PYWBEMCLI_PULL_TARGET_TIME_ENVVAR = 'PYWBEMCLI_PULL_TARGET_TIME'
 PYWBEMCLI_MOCK_SERVER_ENVVAR = 'PYWBEMCLI_MOCK_SERVER'
 PYWBEMCLI_LOG_ENVVAR = 'PYWBEMCLI_LOG'
 PYWBEMCLI_PDB_ENVVAR = 'PYWBEMCLI_PDB'
 PYWBEMCLI_CONNECTIONS_FILE_ENVVAR = 'PYWBEMCLI_CONNECTIONS_FILE'
+PYWBEMCLI_DAEMON_SOCKET_ENVVAR = 'PYWBEMCLI_DAEMON_SOCKET'
@@ -21,13 +21,11 @@ the pywbemcli click tool
 
 import os
 import sys
+import importlib
 import warnings
 import traceback
 
 import click
-import click_repl
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 
 from pywbem import LOGGER_SIMPLE_NAMES, \
     LOG_DESTINATIONS, DEFAULT_LOG_DESTINATION, LOG_DETAIL_LEVELS, \
@@ -44,24 +42,26 @@ from .config import PYWBEMCLI_NAME_ENVVAR, PYWBEMCLI_SERVER_ENVVAR, \
     PYWBEMCLI_CA_CERTS_ENVVAR, PYWBEMCLI_TIMEOUT_ENVVAR, \
     PYWBEMCLI_USE_PULL_ENVVAR, PYWBEMCLI_CONNECTIONS_FILE_ENVVAR, \
     PYWBEMCLI_PULL_MAX_CNT_ENVVAR, PYWBEMCLI_TIMESTATS_ENVVAR, \
-    PYWBEMCLI_LOG_ENVVAR, PYWBEMCLI_PDB_ENVVAR
+    PYWBEMCLI_LOG_ENVVAR, PYWBEMCLI_PDB_ENVVAR, PYWBEMCLI_MAX_PARALLEL_ENVVAR, \
+    PYWBEMCLI_CLASS_CACHE_ENVVAR, PYWBEMCLI_CLASS_STORE_ENVVAR, \
+    PYWBEMCLI_PULL_TARGET_TIME_ENVVAR
 from ._context_obj import ContextObj, display_click_context
 from ._pywbem_server import PywbemServer
-from .config import DEFAULT_NAMESPACE, PYWBEMCLI_PROMPT, \
-    PYWBEMCLI_HISTORY_FILE, DEFAULT_MAXPULLCNT, DEFAULT_CONNECTION_TIMEOUT, \
-    MAX_TIMEOUT, USE_AUTOSUGGEST
+from .config import DEFAULT_NAMESPACE, DEFAULT_MAXPULLCNT, \
+    DEFAULT_CONNECTION_TIMEOUT, MAX_TIMEOUT, DEFAULT_MAX_PARALLEL, \
+    MAX_PARALLEL, BATCH_META_KEY
 from ._connection_file_names import CONNECTIONS_FILENAME, \
     DEFAULT_CONNECTIONS_FILE
 from ._connection_repository import ConnectionRepository, \
     ConnectionsFileError
+from ._daemon import get_daemon, run_via_daemon
 from .._click_extensions import PywbemtoolsTopGroup, GENERAL_OPTS_TXT, \
-    SUBCMD_HELP_TXT, MutuallyExclusiveOption, click_completion_item
-from .._utils import pywbemtools_warn, get_terminal_width, debug_log
-from .._options import add_options, help_option
+    SUBCMD_HELP_TXT, MutuallyExclusiveOption, click_completion_item, \
+    pywbemtools_format_usage, ARGS_META_KEY
+from .._utils import get_terminal_width, debug_log
+from .._options import add_options, help_option, profile_startup_option
 from .._output_formatting import OUTPUT_FORMAT_GROUPS, OUTPUT_FORMATS
 
-from ._warnings import InvalidConnectionFile
-
 
 __all__ = ['cli']
 
@@ -77,6 +77,41 @@ USE_PULL_OPTIONS = ('yes', 'no', 'either')
 DEFAULT_PULL_CHOICE = 'either'
 USE_PULL_CHOICE = {'either': None, 'yes': True, 'no': False, 'default': None}
 
+# Static registry of the commands and command groups of pywbemcli. The value
+# is the name of the module that defines the command or command group. The
+# module is imported only when the command is invoked or listed in help, so
+# that a command does not pay for importing the modules of all the others.
+PYWBEMCLI_COMMANDS = {
+    'cache': 'pywbemtools.pywbemcli._cmd_cache',
+    'class': 'pywbemtools.pywbemcli._cmd_class',
+    'connection': 'pywbemtools.pywbemcli._cmd_connection',
+    'daemon': 'pywbemtools.pywbemcli._cmd_daemon',
+    'docs': 'pywbemtools.pywbemcli._cmd_docs',
+    'help': 'pywbemtools.pywbemcli._cmd_help',
+    'instance': 'pywbemtools.pywbemcli._cmd_instance',
+    'namespace': 'pywbemtools.pywbemcli._cmd_namespace',
+    'profile': 'pywbemtools.pywbemcli._cmd_profile',
+    'qualifier': 'pywbemtools.pywbemcli._cmd_qualifier',
+    'repl': 'pywbemtools.pywbemcli._cmd_repl',
+    'server': 'pywbemtools.pywbemcli._cmd_server',
+    'statistics': 'pywbemtools.pywbemcli._cmd_statistics',
+    'subscription': 'pywbemtools.pywbemcli._cmd_subscription',
+}
+
+# The command groups replace click.Command.format_usage when their module is
+# imported (see PywbemtoolsGroup). Since the modules are imported only when
+# needed, this is also done here, so that the usage of the commands that are
+# not in a command group (e.g. docs, repl) has the same format in any case.
+click.core.Command.format_usage = pywbemtools_format_usage
+
+# Commands that cannot be executed by the pywbemcli daemon. None is
+# interactive mode without a command.
+NO_DAEMON_COMMANDS = (None, 'repl', 'daemon')
+
+# Commands that cannot be executed in batch mode (--batch general option).
+# None is interactive mode without a command.
+NO_BATCH_COMMANDS = (None, 'repl')
+
 # Save for general opiton log parameter from the interactive
 # command before the current command in some cases.
 PREV_LOG_OPTION = None
@@ -181,6 +216,25 @@ def connection_name_completer(ctx, param, incomplete):
 ###########################################################################
 
 
+def _via_daemon_callback(ctx, param, value):
+    # pylint: disable=unused-argument
+    """
+    Click callback for the --via-daemon general option: Execute the command
+    in the pywbemcli daemon and exit with its exit code, if the daemon is
+    running. Otherwise, the command is executed in this process.
+
+    The pywbemcli entry point (see __main__.py) already handles the option
+    before importing this module. This callback handles it when the cli
+    function is invoked otherwise. The option is ignored in interactive mode
+    and in the daemon.
+    """
+    if value and ctx.obj is None and get_daemon() is None:
+        exit_code = run_via_daemon(ctx.meta[ARGS_META_KEY])
+        if exit_code is not None:
+            ctx.exit(exit_code)
+    return value
+
+
 def _validate_connection_name(connections_repo, connection_name):
     """
     Validate that connection name exists in the connection_repo and that
@@ -482,6 +536,7 @@ def _create_server_instance(
 @click.group(invoke_without_command=True, cls=PywbemtoolsTopGroup,
              # Reorders help list of commands with following at bottom
              move_to_end=('connection', 'repl', 'help', 'docs'),
+             lazy_commands=PYWBEMCLI_COMMANDS,
              context_settings=CONTEXT_SETTINGS,
              options_metavar=GENERAL_OPTS_TXT,
              subcommand_metavar=SUBCMD_HELP_TXT)
@@ -624,6 +679,60 @@ def _create_server_instance(
                    'external behavior of the commands. '
                    f'Default: EnvVar {PYWBEMCLI_PULL_MAX_CNT_ENVVAR}, or '
                    f'{DEFAULT_MAXPULLCNT}')
+@click.option('--max-parallel', type=click.IntRange(1, MAX_PARALLEL),
+              metavar='INT',
+              default=None,  # defaulted in code
+              envvar=PYWBEMCLI_MAX_PARALLEL_ENVVAR,
+              help='Maximum number of server requests that are executed '
+                   'concurrently, each on its own copy of the connection, by '
+                   'commands that issue independent requests (ex. the same '
+                   'request in multiple namespaces). The results are '
+                   'displayed in the same order as with sequential '
+                   'execution. '
+                   f'Default: EnvVar {PYWBEMCLI_MAX_PARALLEL_ENVVAR}, or '
+                   f'{DEFAULT_MAX_PARALLEL}. Min/max: ')
+@click.option('--class-cache/--no-class-cache',
+              default=None,  # defaulted in code
+              envvar=PYWBEMCLI_CLASS_CACHE_ENVVAR,
+              help='Cache the classes and qualifier declarations retrieved '
+                   'from a WBEM server on disk, per server URL, user and '
+                   'namespace, so that subsequent commands do not retrieve '
+                   'them again. The cache of a namespace is rebuilt when the '
+                   'class names or the qualifier declarations in the '
+                   'namespace change or it is older than one week. Changes '
+                   'of class definitions that keep the class names and '
+                   'qualifier declarations are not detected, so after such '
+                   'changes on the server the cache must be removed with the '
+                   '"cache clear" command. Ignored for mock environments. '
+                   f'Default: EnvVar {PYWBEMCLI_CLASS_CACHE_ENVVAR}, or '
+                   'no-class-cache.')
+@click.option('--class-store/--no-class-store',
+              default=None,  # defaulted in code
+              envvar=PYWBEMCLI_CLASS_STORE_ENVVAR,
+              help='Keep the classes and qualifier declarations retrieved on '
+                   'a connection in memory for the life of the connection, '
+                   'so that subsequent requests (e.g. by subsequent commands '
+                   'in interactive mode) do not retrieve them again. Changes '
+                   'of class definitions on the server by other clients are '
+                   'not detected while the connection is open, so '
+                   'no-class-store retrieves the classes from the server for '
+                   'each request. In interactive mode, this option for a '
+                   'command uses a new connection for that command. '
+                   f'Default: EnvVar {PYWBEMCLI_CLASS_STORE_ENVVAR}, or '
+                   'class-store.')
+@click.option('--pull-target-time', type=click.FloatRange(0, min_open=True),
+              metavar='SECONDS',
+              default=None,  # defaulted in code
+              envvar=PYWBEMCLI_PULL_TARGET_TIME_ENVVAR,
+              help='Adapt the maximum number of objects returned by each '
+                   'pull operation to the response times of the WBEM server, '
+                   'so that the responses take about SECONDS. The adaptation '
+                   'starts with the --pull-max-cnt value and the adapted '
+                   'values are saved on disk per connection, namespace and '
+                   'class for subsequent commands. Ignored for mock '
+                   'environments. '
+                   f'Default: EnvVar {PYWBEMCLI_PULL_TARGET_TIME_ENVVAR}, or '
+                   'no adaptation.')
 @click.option('-T', '--timestats/--no-timestats',
               default=None,
               envvar=PYWBEMCLI_TIMESTATS_ENVVAR,
@@ -699,15 +808,48 @@ def _create_server_instance(
                    'interactive mode, but can be specified on each '
                    'interactive command. '
                    f'Default: EnvVar {PYWBEMCLI_PDB_ENVVAR}, or false.')
+@click.option('--via-daemon', is_flag=True, default=False,
+              is_eager=True, expose_value=False,
+              callback=_via_daemon_callback,
+              help='Execute the command in the pywbemcli daemon (see the '
+                   '"daemon" command group), which keeps the connections to '
+                   'the WBEM servers open between commands. If the daemon is '
+                   'not running, the command is executed by pywbemcli itself. '
+                   'Ignored in interactive mode.')
+@click.option('--batch', 'batch_file', metavar='FILE',
+              type=click.Path(dir_okay=False, allow_dash=True),
+              default=None,
+              help='Execute the pywbemcli commands in the specified file '
+                   '("-" for stdin) in this pywbemcli process, one command '
+                   '(with optional general options, as in interactive mode) '
+                   'per line. Empty lines and lines starting with "#" are '
+                   'ignored. The connection to the WBEM server is kept open '
+                   'for all commands. The exit code of each failed command '
+                   'is displayed, and pywbemcli exits with 1 if any command '
+                   'failed. Not allowed with a command.')
+@click.option('--batch-jobs', type=click.IntRange(1, MAX_PARALLEL),
+              metavar='INT',
+              default=1,
+              help='Maximum number of consecutive read-only commands of the '
+                   '--batch file (e.g. "instance get") that are executed '
+                   'concurrently, each on its own copy of the connection. '
+                   'Other commands are executed after the previous commands '
+                   'have completed and before the subsequent commands are '
+                   'started. The output of each command is displayed in the '
+                   'order of the commands when the command has completed. '
+                   'Default: 1. Min/max: ')
 @click.version_option(
     message=f'%(prog)s, version %(version)s\npywbem, version {pywbem_version}',
     help='Show the version of this command and the pywbem package.')
 @add_options(help_option)
+@add_options(profile_startup_option)
 @click.pass_context
 def cli(ctx, server, connection_name, default_namespace, user, password,
         timeout, verify, certfile, keyfile, ca_certs, output_format, use_pull,
         pull_max_cnt, mock_server, verbose=None, connections_file=None,
-        timestats=None, log=None, pdb=None, warn=None):
+        timestats=None, log=None, pdb=None, warn=None, max_parallel=None,
+        class_cache=None, class_store=None, pull_target_time=None,
+        batch_file=None, batch_jobs=1):
     """
     Pywbemcli is a command line WBEM client that uses the DMTF CIM-XML protocol
     to communicate with WBEM servers. Pywbemcli can:
@@ -814,6 +956,23 @@ def cli(ctx, server, connection_name, default_namespace, user, password,
                                           timeout, verify, certfile, keyfile,
                                           ca_certs)
 
+        # In the pywbemcli daemon, the connection of a previous command with
+        # the same connection definition is used.
+        daemon = get_daemon()
+        if daemon:
+            if batch_file is not None:
+                raise click.ClickException(
+                    "Batch mode is not supported in the pywbemcli daemon")
+            if ctx.invoked_subcommand in NO_DAEMON_COMMANDS:
+                cmd_txt = ctx.invoked_subcommand or 'interactive mode'
+                raise click.ClickException(
+                    f"'{cmd_txt}' is not supported in the pywbemcli daemon")
+            if pywbem_server:
+                pywbem_server = daemon.get_server(pywbem_server, log,
+                                                  class_cache,
+                                                  class_store,
+                                                  pull_target_time)
+
     # Interactive mode cmd line processing (ctx not None)
     # In interactive mode, general options specified in cmd line are used
     # to modify the pywbem_server object and the general options
@@ -826,6 +985,16 @@ def cli(ctx, server, connection_name, default_namespace, user, password,
     # env variables or the command line pywbemcli startup
 
     else:  # ctx.obj exists. Processing an interactive command.
+        if batch_file is not None:
+            raise click.ClickException(
+                "The --batch general option is not allowed in interactive "
+                "mode or in batch mode")
+        if ctx.meta.get(BATCH_META_KEY) and \
+                ctx.invoked_subcommand in NO_BATCH_COMMANDS:
+            cmd_txt = ctx.invoked_subcommand or 'interactive mode'
+            raise click.ClickException(
+                f"'{cmd_txt}' is not supported in batch mode")
+
         # If connection file general option exists, get the new connection_repo.
         # This overrides the existing ctx defined repo only for current command.
         if connections_file:
@@ -925,6 +1094,11 @@ def cli(ctx, server, connection_name, default_namespace, user, password,
                 pywbem_server.keyfile = _set_default_if_empty_str(keyfile)
                 modified_server = True
                 close_interactive_server = True
+            if class_store is not None:
+                # The class store is attached to the connection when
+                # connecting.
+                modified_server = True
+                close_interactive_server = True
 
             # If modified, disconnect the just fixed connection. This will
             # cause the modified connection to be initialized. Otherwise
@@ -1006,6 +1180,14 @@ def cli(ctx, server, connection_name, default_namespace, user, password,
             pdb = ctx.obj.pdb
         if warn is None:
             warn = ctx.obj.warn
+        if max_parallel is None:
+            max_parallel = ctx.obj.max_parallel
+        if class_cache is None:
+            class_cache = ctx.obj.class_cache
+        if class_store is None:
+            class_store = ctx.obj.class_store
+        if pull_target_time is None:
+            pull_target_time = ctx.obj.pull_target_time
 
     # Conditionally set the flag to enable warnings
     if warn:
@@ -1024,7 +1206,12 @@ def cli(ctx, server, connection_name, default_namespace, user, password,
                          warn,
                          connections_repo,
                          interactive_mode,
-                         close_interactive_server)
+                         close_interactive_server,
+                         max_parallel=max_parallel,
+                         class_cache=class_cache,
+                         class_store=class_store,
+                         pull_target_time=pull_target_time,
+                         daemon_mode=get_daemon() is not None)
 
     # Env.var PYWBEMCLI_DIAGNOSTICS turns on diagnostic prints for developer
     # use and is therefore not documented.
@@ -1032,9 +1219,29 @@ def cli(ctx, server, connection_name, default_namespace, user, password,
         display_click_context(ctx, msg="DIAGNOSTICS-NEWCTX: Initial context:",
                               display_attrs=True)
 
+    # Batch mode executes the commands in the batch file like interactive
+    # commands.
+    if batch_file is not None:
+        if ctx.invoked_subcommand is not None:
+            raise click.ClickException(
+                "The --batch general option is not allowed with a command")
+        # pylint: disable=import-outside-toplevel
+        from ._batch import run_batch
+        ctx.obj.interactive_mode = True
+        exit_code = run_batch(ctx, batch_file, batch_jobs)
+
+        # Disconnect any connected server.
+        if ctx.obj.is_connected():
+            ctx.obj.pywbem_server.disconnect()
+        ctx.exit(exit_code)
+
     # If no invoked_subcommand, there is no command to execute this flag
     # causes us to start interactive mode
     if ctx.invoked_subcommand is None:
+        # The repl command is not looked up in the group, because it is
+        # removed from the group while in interactive mode. Its module is
+        # imported like the lazy commands, since it imports this module.
+        repl = importlib.import_module(PYWBEMCLI_COMMANDS['repl']).repl
         ctx.obj.interactive_mode = True
         ctx.invoke(repl)
 
@@ -1042,70 +1249,3 @@ def cli(ctx, server, connection_name, default_namespace, user, password,
         # server.
         if ctx.obj.is_connected():
             ctx.obj.pywbem_server.disconnect()
-
-
-# FUTURE: Move repl to its own module in pywbemcli.
-@cli.command('repl', options_metavar=GENERAL_OPTS_TXT)
-@add_options(help_option)
-@click.pass_context
-def repl(ctx):
-    """
-    Enter interactive mode (default).
-
-    Enter the interactive mode where pywbemcli commands can be entered
-    interactively. The prompt is changed to 'pywbemcli>'.
-
-    <COMMAND> <COMMAND OPTIONS> - Execute pywbemcli command COMMAND
-
-    <GENERAL_OPTIONS> <COMMAND> <COMMAND_OPTIONS> - Execute command with
-    general options.  General options set here exist only for the current
-    command.
-
-    -h, --help - Show pywbemcli general help message, including a
-                                  list of pywbemcli commands.
-    COMMAND -h, --help - Show help message for pywbemcli command COMMAND.
-
-    !SHELL-CMD - Execute shell command SHELL-CMD
-
-    Pywbemcli termination - <CTRL-D>, :q, :quit, :exit
-
-    Command history is supported. The command history is stored in a file
-    ~/.pywbemcli_history.
-
-    <UP>, <DOWN> - Scroll through pwbemcli command history.
-
-    <CTRL-r> <search string> - initiate an interactive
-    search of the pywbemcli history file. Can be used with <UP>, <DOWN>
-    to display commands that match the search string.
-    Editing the search string updates the search.
-
-    <TAB> - tab completion for current command line
-    (can be used anywhere in command)
-
-    Interactive mode also includes an autosuggest feature that makes
-    suggestions from the command history as the command the user types in the
-    command and options.
-    """
-
-    history_file = PYWBEMCLI_HISTORY_FILE
-    if history_file.startswith('~'):
-        history_file = os.path.expanduser(history_file)
-
-    click.echo("Enter 'help repl' for help, <CTRL-D> or ':q' "
-               "to exit pywbemcli or <CTRL-r> to search history, ")
-
-    if not ctx.obj.connections_repo.file_exists():
-        pywbemtools_warn(
-            f"Connections file: '{ctx.obj.connections_repo.connections_file}' "
-            "does not exist. Server and connection commands will not work.",
-            InvalidConnectionFile, stacklevel=0)
-
-    prompt_kwargs = {
-        'message': PYWBEMCLI_PROMPT,
-        'history': FileHistory(history_file),
-    }
-
-    if USE_AUTOSUGGEST:
-        prompt_kwargs['auto_suggest'] = AutoSuggestFromHistory()
-
-    click_repl.repl(ctx, prompt_kwargs=prompt_kwargs)
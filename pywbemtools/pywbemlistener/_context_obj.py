@@ -21,6 +21,8 @@ Click context object for the pybemlistener command.
 import os
 import click_spinner
 
+from .._startup_profile import profile_phase
+
 
 class ContextObj:
     # pylint: disable=useless-object-inheritance, too-many-instance-attributes
@@ -174,7 +176,8 @@ class ContextObj:
                 import pdb  # pylint: disable=import-outside-toplevel
                 pdb.set_trace()  # pylint: disable=forgotten-debug-statement
 
-            cmd()  # The command function for the pywbemlistener command
+            with profile_phase('command'):
+                cmd()  # The command function for the pywbemlistener command
 
         finally:
             if not self.pdb:
@@ -29,7 +29,7 @@ from . import _config
 from .._click_extensions import PywbemtoolsTopGroup, GENERAL_OPTS_TXT, \
     SUBCMD_HELP_TXT
 from .._utils import get_terminal_width
-from .._options import add_options, help_option
+from .._options import add_options, help_option, profile_startup_option
 from .._output_formatting import OUTPUT_FORMAT_GROUPS, OUTPUT_FORMATS
 
 __all__ = ['cli']
@@ -99,6 +99,7 @@ CONTEXT_SETTINGS = {
     message=f'%(prog)s, version %(version)s\npywbem, version {pywbem_version}',
     help='Show the version of this command and the pywbem package.')
 @add_options(help_option)
+@add_options(profile_startup_option)
 @click.pass_context
 def cli(ctx, output_format, logdir, verbose, pdb, warn):
     """
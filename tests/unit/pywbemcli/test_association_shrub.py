@@ -0,0 +1,244 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the requests executed by the AssociationShrub class of the
+_association_shrub module and for the AssociationGraph class of the
+_association_graph module.
+"""
+
+import os
+import pytest
+
+from pywbem import CIMInstanceName, CIMError, CIM_ERR_NOT_SUPPORTED
+import pywbem_mock
+
+from pywbemtools.pywbemcli._association_shrub import AssociationShrub
+from pywbemtools.pywbemcli._association_graph import AssociationGraph
+from pywbemtools.pywbemcli._common import sort_cimobjects
+from pywbemtools.pywbemcli._connection_pool import statistics_snapshot, \
+    reset_statistics
+
+TEST_DIR = os.path.dirname(__file__)
+ASSOC_MOCK_FILE = 'simple_assoc_mock_model.mof'
+COMPLEX_ASSOC_MODEL = 'complex_assoc_model.mof'
+
+
+class FailingFakedConnection(pywbem_mock.FakedWBEMConnection):
+    # pylint: disable=too-many-ancestors
+    """
+    FakedWBEMConnection that records the class names of the GetClass requests
+    and optionally fails the GetClass and EnumerateClassNames requests
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_get_class = False
+        self.fail_enumerate_class_names = False
+        self.get_class_names = []
+
+    # pylint: disable=invalid-name
+    def GetClass(self, ClassName, namespace=None, **kwargs):
+        if self.fail_get_class:
+            raise CIMError(CIM_ERR_NOT_SUPPORTED)
+        self.get_class_names.append(ClassName)
+        return super().GetClass(ClassName, namespace=namespace, **kwargs)
+
+    # pylint: disable=invalid-name
+    def EnumerateClassNames(self, namespace=None, ClassName=None, **kwargs):
+        if self.fail_enumerate_class_names:
+            raise CIMError(CIM_ERR_NOT_SUPPORTED)
+        return super().EnumerateClassNames(namespace=namespace,
+                                           ClassName=ClassName, **kwargs)
+
+
+def create_connection(mof_file):
+    """
+    Return a FailingFakedConnection with the model in mof_file and enabled
+    statistics.
+    """
+    conn = FailingFakedConnection()
+    conn.compile_mof_file(os.path.join(TEST_DIR, mof_file),
+                          namespace='root/cimv2')
+    conn.statistics.enable()
+    return conn
+
+
+def request_counts(conn):
+    """
+    Return the numbers of requests by operation name since the last call and
+    reset the statistics of the connection.
+    """
+    counts = {name: stats.count for name, stats in
+              statistics_snapshot(conn)}
+    reset_statistics(conn)
+    return counts
+
+
+def shrub_result(shrub):
+    """Return the shrub dictionaries and the tree display of a shrub"""
+    return (repr(shrub.instance_shrub), repr(shrub.assoc_instnames),
+            shrub.build_ascii_display_tree(False))
+
+
+@pytest.mark.parametrize(
+    "mof_file, source, kwargs", [
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"', {}),
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"',
+         {'Role': 'parent'}),
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"',
+         {'ResultRole': 'child', 'ResultClass': 'TST_Person'}),
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Sofi"',
+         {'AssocClass': 'TST_MemberOfFamilyCollection'}),
+        (COMPLEX_ASSOC_MODEL, 'root/cimv2:TST_EP.InstanceID=1', {}),
+        (COMPLEX_ASSOC_MODEL, 'root/cimv2:TST_EP.InstanceID=1',
+         {'ResultRole': 'LogicalUnit'}),
+    ]
+)
+def test_shrub_client_filtering(mof_file, source, kwargs):
+    """
+    Test that the shrub built by filtering the References result on the
+    client is the same as the shrub built from server requests, and that it
+    needs only the References request, the GetClass requests for the
+    association classes and the EnumerateClassNames requests for the filter
+    classes.
+    """
+    conn = create_connection(mof_file)
+    shrub = AssociationShrub(conn, CIMInstanceName.from_wbem_uri(source),
+                             **kwargs)
+    client_requests = request_counts(conn)
+
+    server_shrub = AssociationShrub(
+        conn, CIMInstanceName.from_wbem_uri(source), client_filtering=False,
+        **kwargs)
+
+    assert shrub_result(shrub) == shrub_result(server_shrub)
+    assert set(client_requests) <= \
+        {'References', 'GetClass', 'EnumerateClassNames'}
+    assert client_requests['References'] == 1
+    assert 'AssociatorNames' in request_counts(conn)
+
+
+@pytest.mark.parametrize(
+    "mof_file, source", [
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"'),
+        (COMPLEX_ASSOC_MODEL, 'root/cimv2:TST_EP.InstanceID=1'),
+    ]
+)
+def test_association_graph_classes(mof_file, source):
+    """
+    Test that the association graph retrieves only the association classes,
+    each one once, and no classes without filters.
+    """
+    conn = create_connection(mof_file)
+    source_path = CIMInstanceName.from_wbem_uri(source)
+    ref_insts = conn.References(source_path)
+    request_counts(conn)
+
+    graph = AssociationGraph(conn, source_path, ref_insts)
+    graph.associator_names(None, None, None, None)
+    graph.reference_names(None, None)
+
+    assert sorted(conn.get_class_names) == \
+        sorted({inst.classname for inst in ref_insts})
+    assert set(request_counts(conn)) == {'GetClass'}
+
+
+def test_shrub_server_fallback_subclasses():
+    """
+    Test that the shrub requests are sent to the server if the subclass names
+    of a filter class cannot be retrieved.
+    """
+    source = 'root/cimv2:TST_Person.name="Sofi"'
+    kwargs = {'AssocClass': 'TST_MemberOfFamilyCollection'}
+    conn = create_connection(ASSOC_MOCK_FILE)
+    exp_result = shrub_result(
+        AssociationShrub(conn, CIMInstanceName.from_wbem_uri(source),
+                         client_filtering=False, **kwargs))
+
+    conn.fail_enumerate_class_names = True
+    shrub = AssociationShrub(conn, CIMInstanceName.from_wbem_uri(source),
+                             **kwargs)
+    assert shrub.graph is None
+    assert shrub_result(shrub) == exp_result
+
+
+def test_shrub_server_fallback():
+    """
+    Test that the shrub requests are sent to the server, also on a
+    connection pool, if the server does not support GetClass.
+    """
+    source = 'root/cimv2:TST_EP.InstanceID=1'
+    conn = create_connection(COMPLEX_ASSOC_MODEL)
+    exp_result = shrub_result(
+        AssociationShrub(conn, CIMInstanceName.from_wbem_uri(source)))
+
+    conn.fail_get_class = True
+    request_counts(conn)
+    shrub = AssociationShrub(conn, CIMInstanceName.from_wbem_uri(source))
+    assert shrub.graph is None
+    assert shrub_result(shrub) == exp_result
+    assert request_counts(conn)['ReferenceNames'] == 3
+
+    shrub = AssociationShrub(conn, CIMInstanceName.from_wbem_uri(source),
+                             max_parallel=4)
+    assert shrub_result(shrub) == exp_result
+    # The statistics of the copies of the connection are merged back
+    assert request_counts(conn)['ReferenceNames'] == 3
+
+
+@pytest.mark.parametrize(
+    "mof_file, source, kwargs", [
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"', {}),
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"',
+         {'Role': 'parent'}),
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"',
+         {'Role': 'PARENT', 'ResultRole': 'child'}),
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Mike"',
+         {'ResultClass': 'TST_Person'}),
+        (ASSOC_MOCK_FILE, 'root/cimv2:TST_Person.name="Sofi"',
+         {'AssocClass': 'TST_MemberOfFamilyCollection'}),
+        (COMPLEX_ASSOC_MODEL, 'root/cimv2:TST_EP.InstanceID=1', {}),
+        (COMPLEX_ASSOC_MODEL, 'root/cimv2:TST_EP.InstanceID=1',
+         {'ResultClass': 'TST_ME'}),
+        (COMPLEX_ASSOC_MODEL, 'root/cimv2:TST_EP.InstanceID=1',
+         {'Role': 'Initiator', 'ResultRole': 'LogicalUnit'}),
+    ]
+)
+def test_association_graph(mof_file, source, kwargs):
+    """
+    Test that the association graph returns the same results as the
+    ReferenceNames and AssociatorNames requests.
+    """
+    conn = create_connection(mof_file)
+    source_path = CIMInstanceName.from_wbem_uri(source)
+    graph = AssociationGraph(conn, source_path, conn.References(source_path))
+
+    exp_assoc_names = sort_cimobjects(conn.AssociatorNames(source_path,
+                                                           **kwargs))
+    assoc_names = graph.associator_names(
+        role=kwargs.get('Role'), assoc_class=kwargs.get('AssocClass'),
+        result_role=kwargs.get('ResultRole'),
+        result_class=kwargs.get('ResultClass'))
+    assert assoc_names == exp_assoc_names
+
+    ref_kwargs = {'Role': kwargs.get('Role'),
+                  'ResultClass': kwargs.get('AssocClass')}
+    exp_ref_names = sort_cimobjects(conn.ReferenceNames(source_path,
+                                                        **ref_kwargs))
+    ref_names = graph.reference_names(role=ref_kwargs['Role'],
+                                      result_class=ref_kwargs['ResultClass'])
+    assert sort_cimobjects(ref_names) == exp_ref_names
@@ -0,0 +1,252 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the --batch and --batch-jobs general options of pywbemcli.
+"""
+
+import os
+import sys
+import shlex
+import subprocess
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pywbemtools.pywbemcli._batch import _BatchWorkers, command_names, \
+    is_read_only_command
+
+TEST_DIR = os.path.dirname(__file__)
+SIMPLE_MOCK_FILE = 'simple_mock_model.mof'
+
+BATCH_COMMANDS = """\
+# Commands for the batch tests
+
+class enumerate --no
+-o mof class get CIM_Foo --no-qualifiers
+class get CIM_Blah
+instance count CIM_Foo
+"""
+
+# Output of the commands in BATCH_COMMANDS when executed with pywbemcli
+# individually
+EXP_CLASS_ENUMERATE = """\
+CIM_BaseEmb
+CIM_BaseRef
+CIM_Foo
+CIM_FooAssoc
+"""
+
+
+def run_pywbemcli(args, stdin=None):
+    """
+    Run pywbemcli with the arguments in the test directory and return the
+    CompletedProcess object.
+    """
+    return subprocess.run(
+        [sys.executable, '-m', 'pywbemtools.pywbemcli'] + args,
+        cwd=TEST_DIR, input=stdin, stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE, text=True, check=False)
+
+
+@pytest.fixture(name='batch_file')
+def fixture_batch_file(tmp_path):
+    """
+    Path name of a batch file with the commands in BATCH_COMMANDS.
+    """
+    path = tmp_path / 'commands.txt'
+    path.write_text(BATCH_COMMANDS, encoding='utf-8')
+    return str(path)
+
+
+def expected_output():
+    """
+    Return the stdout and stderr output of the commands in BATCH_COMMANDS when
+    executed by pywbemcli individually.
+    """
+    stdout = stderr = ''
+    for line in BATCH_COMMANDS.splitlines():
+        if line and not line.startswith('#'):
+            proc = run_pywbemcli(['-m', SIMPLE_MOCK_FILE] + line.split())
+            stdout += proc.stdout
+            stderr += proc.stderr
+    return stdout, stderr
+
+
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_batch(batch_file, jobs):
+    """
+    Test executing the commands of a batch file sequentially and concurrently.
+    """
+    proc = run_pywbemcli(['-m', SIMPLE_MOCK_FILE, '--batch', batch_file,
+                          '--batch-jobs', str(jobs)])
+    assert proc.returncode == 1
+
+    exp_stdout, exp_stderr = expected_output()
+    assert proc.stdout == exp_stdout
+    assert proc.stdout.startswith(EXP_CLASS_ENUMERATE)
+    assert proc.stderr == (
+        exp_stderr +
+        "Batch line 5: exit code 1: class get CIM_Blah\n"
+        "Batch: 1 of 4 commands failed\n")
+
+
+def test_batch_stdin_verbose():
+    """
+    Test reading the batch commands from stdin and displaying the exit code
+    of each command with --verbose.
+    """
+    proc = run_pywbemcli(['-m', SIMPLE_MOCK_FILE, '-v', '--batch', '-'],
+                         stdin='class enumerate --no\n')
+    assert proc.returncode == 0, proc.stderr
+    assert EXP_CLASS_ENUMERATE in proc.stdout
+    assert "Batch line 1: exit code 0: class enumerate --no\n" in proc.stderr
+
+
+@pytest.mark.parametrize(
+    "args, stdin, exp_stderr",
+    [
+        (['--batch', '-', 'class', 'enumerate'], '',
+         'not allowed with a command'),
+        (['--batch', 'nonexistent.txt'], None,
+         'Cannot read batch file nonexistent.txt'),
+        (['--batch', '-'], 'repl\n',
+         "'repl' is not supported in batch mode"),
+        (['--batch', '-'], '-v\n',
+         "'interactive mode' is not supported in batch mode"),
+        (['--batch', '-'], '--batch - class enumerate\n',
+         'not allowed in interactive mode or in batch mode'),
+        (['--batch', '-'], 'class enumerate "CIM_Foo\n',
+         'Invalid command line'),
+    ]
+)
+def test_batch_errors(args, stdin, exp_stderr):
+    """
+    Test errors in batch mode.
+    """
+    proc = run_pywbemcli(['-m', SIMPLE_MOCK_FILE] + args, stdin=stdin)
+    assert proc.returncode == 1
+    assert exp_stderr in proc.stderr
+
+
+def test_batch_barriers():
+    """
+    Test that with --batch-jobs, the commands that are not read-only see the
+    effects of the previous commands and the subsequent commands see their
+    effects.
+    """
+    stdin = 'instance create CIM_Foo --property InstanceID=batch1\n' \
+        'instance get CIM_Foo.InstanceID=\\"batch1\\" --pl InstanceID\n' \
+        'instance delete CIM_Foo.InstanceID=\\"batch1\\"\n' \
+        'instance get CIM_Foo.InstanceID=\\"batch1\\"\n'
+    proc = run_pywbemcli(['-m', SIMPLE_MOCK_FILE, '--batch', '-',
+                          '--batch-jobs', '4'], stdin=stdin)
+    assert proc.returncode == 1
+    assert proc.stdout.startswith(
+        'root/cimv2:CIM_Foo.InstanceID="batch1"\n'
+        'instance of CIM_Foo {\n'
+        '   InstanceID = "batch1";\n'
+        '};\n')
+    assert proc.stderr.endswith(
+        'Batch line 4: exit code 1: '
+        'instance get CIM_Foo.InstanceID=\\"batch1\\"\n'
+        'Batch: 1 of 4 commands failed\n')
+
+
+@pytest.mark.parametrize(
+    "line, exp_names, exp_read_only",
+    [
+        ('class enumerate --no', ('class', 'enumerate'), True),
+        ('-o mof -n conn1 instance get CIM_Foo.InstanceID=\\"a\\"',
+         ('instance', 'get'), True),
+        ('--output-format=table --verbose instance count CIM_Foo',
+         ('instance', 'count'), True),
+        ('instance create CIM_Foo', ('instance', 'create'), False),
+        ('-m model.mof class delete CIM_Foo', ('class', 'delete'), False),
+        ('statistics show', ('statistics', 'show'), False),
+        ('connection --help', ('connection',), False),
+        ('help', ('help',), False),
+        ('-v', (), False),
+        ('class enumerate "CIM_Foo', None, False),
+    ]
+)
+def test_read_only_commands(line, exp_names, exp_read_only):
+    """
+    Test the detection of the read-only commands of a batch file.
+    """
+    if exp_names is not None:
+        assert command_names(shlex.split(line)) == exp_names
+    assert is_read_only_command(line) == exp_read_only
+
+
+class RecordingWorkers(_BatchWorkers):
+    """
+    _BatchWorkers that records the start and end of the commands instead of
+    executing them. The read-only commands wait until all of them have
+    started, so they fail if they are not executed concurrently.
+    """
+
+    def __init__(self, ctx, num_read_only):
+        super().__init__(ctx)
+        self.events = []
+        self.read_only_barrier = threading.Barrier(num_read_only, timeout=10)
+
+    def execute(self, line):
+        self.events.append(('start', line))
+        if is_read_only_command(line):
+            self.read_only_barrier.wait()
+        self.events.append(('end', line))
+        return 0, '', ''
+
+
+def test_batch_workers_barriers():
+    """
+    Test that _BatchWorkers executes consecutive read-only commands
+    concurrently and the other commands after the previous commands have
+    completed and before the subsequent commands are started.
+    """
+    commands = list(enumerate([
+        'instance create CIM_Foo',
+        'instance get CIM_Foo.InstanceID=\\"a\\"',
+        'class get CIM_Foo',
+        'instance delete CIM_Foo.InstanceID=\\"a\\"',
+        'instance count CIM_Foo',
+        'qualifier enumerate',
+        'class delete CIM_Foo',
+        'instance enumerate CIM_Foo',
+        'class enumerate --no',
+    ], 1))
+    ctx = SimpleNamespace(obj=SimpleNamespace(pywbem_server_exists=bool))
+    # Each group of read-only commands is executed concurrently
+    workers = RecordingWorkers(ctx, 2)
+
+    results = list(workers.imap(commands, 4))
+
+    assert [result[:2] for result in results] == commands
+    for _, line in commands:
+        if not is_read_only_command(line):
+            index = workers.events.index(('start', line))
+            assert workers.events[index + 1] == ('end', line)
+    assert workers.events[2:6] in (
+        [('start', commands[1][1]), ('start', commands[2][1]),
+         ('end', commands[1][1]), ('end', commands[2][1])],
+        [('start', commands[1][1]), ('start', commands[2][1]),
+         ('end', commands[2][1]), ('end', commands[1][1])],
+        [('start', commands[2][1]), ('start', commands[1][1]),
+         ('end', commands[1][1]), ('end', commands[2][1])],
+        [('start', commands[2][1]), ('start', commands[1][1]),
+         ('end', commands[2][1]), ('end', commands[1][1])])
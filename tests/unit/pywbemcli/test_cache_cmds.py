@@ -0,0 +1,199 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests the commands in the cache command group.
+"""
+
+
+import os
+import pytest
+
+from .cli_test_extensions import CLITestsBase
+
+from .common_options_help_lines import CMD_OPTION_HELP_HELP_LINE
+
+# pylint: disable=use-dict-literal
+
+TEST_DIR = os.path.dirname(__file__)
+SIMPLE_MOCK_FILE = 'simple_mock_model.mof'
+
+CACHE_HELP_LINES = [
+    'Usage: pywbemcli [GENERAL-OPTIONS] cache COMMAND [ARGS] '
+    '[COMMAND-OPTIONS]',
+    "Command group for the class caches.",
+    CMD_OPTION_HELP_HELP_LINE,
+    'show   Show the class caches of the current server.',
+    'clear  Remove the cached classes of the current server.',
+]
+
+CACHE_SHOW_HELP_LINES = [
+    'Usage: pywbemcli [GENERAL-OPTIONS] cache show [COMMAND-OPTIONS]',
+    'Show the class caches of the current server.',
+    CMD_OPTION_HELP_HELP_LINE,
+]
+
+CACHE_CLEAR_HELP_LINES = [
+    'Usage: pywbemcli [GENERAL-OPTIONS] cache clear [COMMAND-OPTIONS]',
+    'Remove the cached classes of the current server.',
+    '-n, --namespace NAMESPACE Namespace whose cached classes are removed.',
+    CMD_OPTION_HELP_HELP_LINE,
+]
+
+OK = True     # mark tests OK when they execute correctly
+RUN = True    # Mark OK = False and current test case being created RUN
+FAIL = False  # Any test currently FAILING or not tested yet
+
+TEST_CASES = [
+    # List of testcases.
+    # Each testcase is a list with the following items:
+    # * desc: Description of testcase.
+    # * inputs: String, or tuple/list of strings, or dict of 'env', 'args',
+    #     'general', cmdgrp, and 'stdin'. See the 'inputs' parameter of
+    #     CLITestsBase.command_test() in cli_test_extensions.py for detailed
+    #     documentation.
+    # * exp_response: Dictionary of expected responses (stdout, stderr, rc) and
+    #     test definition (test: <testname>). See the 'exp_response' parameter
+    #     of CLITestsBase.command_test() in cli_test_extensions.py for
+    #     detailed documentation.
+    # * mock: None, name of file (.mof or .py), or list thereof.
+    # * condition: If True the test is executed, if 'pdb' the test breaks in the
+    #     the debugger, if 'verbose' print verbose messages, if False the test
+    #     is skipped.
+
+    #
+    #   cache --help
+    #
+    ['Verify cache command --help response',
+     {'general': [],
+      'cmdgrp': 'cache',
+      'args': ['--help']},
+     {'stdout': CACHE_HELP_LINES,
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify cache command -h response',
+     {'general': [],
+      'cmdgrp': 'cache',
+      'args': ['-h']},
+     {'stdout': CACHE_HELP_LINES,
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify cache show command --help response',
+     {'general': [],
+      'cmdgrp': 'cache',
+      'args': ['show', '--help']},
+     {'stdout': CACHE_SHOW_HELP_LINES,
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify cache clear command --help response',
+     {'general': [],
+      'cmdgrp': 'cache',
+      'args': ['clear', '--help']},
+     {'stdout': CACHE_CLEAR_HELP_LINES,
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    #
+    #   cache clear
+    #
+    ['Verify cache clear for a server without cache',
+     {'general': ['-s', 'http://blah', '--class-cache', '-v'],
+      'cmdgrp': 'cache',
+      'args': ['clear']},
+     {'stdout': ['Removed class cache in', '.pywbemcli_classcache'],
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify cache clear for one namespace',
+     {'general': ['-s', 'http://blah'],
+      'cmdgrp': 'cache',
+      'args': ['clear', '-n', 'root/cimv2']},
+     {'stdout': "",
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify cache clear with mock environment',
+     {'general': ['-v'],
+      'cmdgrp': 'cache',
+      'args': ['clear']},
+     {'stdout': ['Removed class store entries of the connection'],
+      'rc': 0,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    #
+    #   cache show
+    #
+    ['Verify cache show without connection',
+     {'general': ['-s', 'http://blah'],
+      'cmdgrp': 'cache',
+      'args': ['show']},
+     {'stdout': ['Class store: not connected',
+                 'Class cache (disabled):', '.pywbemcli_classcache'],
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify cache show (interactive) after class requests',
+     {'stdin': ['class tree',
+                'class tree',
+                'cache show']},
+     {'stdout': ['Class store: 12 of 20000 objects, 1 hits, 1 misses, '
+                 '0 evictions',
+                 'Namespace Requests Objects',
+                 'root/cimv2 1 12',
+                 'Class cache: not used for mock environments'],
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify cache show (interactive) after class delete and cache clear',
+     {'stdin': ['class tree',
+                'class delete CIM_Foo_sub_sub --include-instances',
+                'cache show',
+                'class get CIM_Foo',
+                'cache clear',
+                'cache show']},
+     {'stdout': ['Deleted class CIM_Foo_sub_sub',
+                 'Class store: 0 of 20000 objects, 1 hits, 1 misses',
+                 'Class store: 0 of 20000 objects, 1 hits, 2 misses'],
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+]
+
+
+class TestSubcmd(CLITestsBase):  # pylint: disable=too-few-public-methods
+    """
+    Test all of the cache command variations.
+    """
+    @pytest.mark.parametrize(
+        "desc, inputs, exp_response, mock, condition", TEST_CASES)
+    def test_execute_pywbemcli(self, desc, inputs, exp_response, mock,
+                               condition):
+        """
+        Execute pybemcli with the defined input and test output.
+        """
+        cmd_grp = inputs['cmdgrp'] if 'cmdgrp' in inputs else ''
+        self.command_test(desc, cmd_grp, inputs, exp_response,
+                          mock, condition)
@@ -0,0 +1,288 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _class_cache module and the use of the class cache by
+PYWBEMCLIConnection.
+"""
+
+import os
+import pickle
+
+from pywbem import CIMError, CIM_ERR_NOT_SUPPORTED
+import pywbem_mock
+
+from pywbemtools.pywbemcli._class_cache import ClassCache, ClassStore, \
+    classcache_cachedir
+from pywbemtools.pywbemcli._pywbemcli_operations import PYWBEMCLIConnection
+
+MOF = """
+Qualifier Key : boolean = false,
+    Scope(property, reference),
+    Flavor(DisableOverride, ToSubclass);
+
+class CIM_Foo {
+    [Key] string InstanceID;
+};
+
+class CIM_Foo_sub : CIM_Foo {
+    string cimfoo_sub;
+};
+"""
+
+
+def create_connection(tmp_path, fake, requests, url='http://blah'):
+    """
+    Return a PYWBEMCLIConnection to url with a class cache in tmp_path whose
+    requests are executed by the mock connection fake and recorded in the
+    list requests.
+    """
+    conn = PYWBEMCLIConnection(url)
+
+    def imethodcall(methodname, *args, **kwargs):
+        requests.append(methodname)
+        # pylint: disable=protected-access
+        return fake._imethodcall(methodname, *args, **kwargs)
+
+    # pylint: disable=protected-access
+    conn._imethodcall = imethodcall
+    conn.class_cache = ClassCache(str(tmp_path / 'cache'))
+    return conn
+
+
+def create_fake():
+    """Return a mock connection with the classes of MOF"""
+    fake = pywbem_mock.FakedWBEMConnection()
+    fake.compile_mof_string(MOF, namespace='root/cimv2')
+    return fake
+
+
+def test_classcache_cachedir():
+    """Test that the cache directory depends on url and user"""
+    dir1 = classcache_cachedir('root', 'http://blah', None)
+    dir2 = classcache_cachedir('root', 'http://blah', 'fred')
+    dir3 = classcache_cachedir('root', 'http://blah2', None)
+
+    assert os.path.dirname(dir1) == 'root'
+    assert len({dir1, dir2, dir3}) == 3
+    assert dir1 == classcache_cachedir('root', 'http://blah', None)
+
+
+def test_class_cache_requests(tmp_path):
+    """
+    Test that repeated class requests, also in a new process (simulated by a
+    new connection and ClassCache object), are answered from the cache.
+    """
+    fake = create_fake()
+    requests = []
+    conn = create_connection(tmp_path, fake, requests)
+
+    cls1 = conn.GetClass('CIM_Foo_sub', LocalOnly=False)
+    cls2 = conn.GetClass('cim_foo_sub', LocalOnly=False)
+    assert cls1 == cls2
+    assert cls1 is not cls2
+    conn.EnumerateClasses(DeepInheritance=True)
+    conn.EnumerateClasses(DeepInheritance=True)
+    names = conn.EnumerateClassNames(DeepInheritance=True)
+    conn.EnumerateQualifiers()
+    conn.EnumerateQualifiers()
+
+    assert sorted(names) == ['CIM_Foo', 'CIM_Foo_sub']
+    # EnumerateClassNames and EnumerateQualifiers are the freshness check of
+    # the namespace
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers',
+                        'GetClass', 'EnumerateClasses']
+
+    conn.class_cache.save()
+
+    requests2 = []
+    conn2 = create_connection(tmp_path, fake, requests2)
+    assert conn2.GetClass('CIM_Foo_sub', LocalOnly=False) == cls1
+    conn2.EnumerateClasses(DeepInheritance=True)
+    assert requests2 == ['EnumerateClassNames', 'EnumerateQualifiers']
+
+
+def test_class_cache_freshness(tmp_path):
+    """
+    Test that the cache is discarded if the class names or the qualifier
+    declarations change, if it was created for a different server URL, if it
+    is too old, or if it has a different version.
+    """
+    fake = create_fake()
+    conn = create_connection(tmp_path, fake, [])
+    conn.GetClass('CIM_Foo')
+    conn.class_cache.save()
+
+    # Unchanged namespace
+    requests = []
+    conn1 = create_connection(tmp_path, fake, requests)
+    conn1.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers']
+
+    # New class on the server
+    fake.compile_mof_string("class CIM_Bar { string x; };",
+                            namespace='root/cimv2')
+    requests = []
+    conn2 = create_connection(tmp_path, fake, requests)
+    conn2.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers',
+                        'GetClass']
+    conn2.class_cache.save()
+
+    # New qualifier declaration on the server
+    fake.compile_mof_string(
+        "Qualifier Description : string = null, Scope(any), "
+        "Flavor(EnableOverride, ToSubclass, Translatable);",
+        namespace='root/cimv2')
+    requests = []
+    conn2 = create_connection(tmp_path, fake, requests)
+    conn2.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers',
+                        'GetClass']
+    conn2.class_cache.save()
+
+    # Cache directory used for a different server URL
+    requests = []
+    conn3 = create_connection(tmp_path, fake, requests, url='http://blah2')
+    conn3.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers',
+                        'GetClass']
+    conn3.class_cache.save()
+    requests = []
+    conn3 = create_connection(tmp_path, fake, requests)
+    conn3.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers',
+                        'GetClass']
+    conn3.class_cache.save()
+
+    # Cache too old
+    requests = []
+    conn3 = create_connection(tmp_path, fake, requests)
+    conn3.class_cache.max_age = -1
+    conn3.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers',
+                        'GetClass']
+
+    # Different cache version
+    cache_files = os.listdir(str(tmp_path / 'cache'))
+    assert len(cache_files) == 1
+    cache_file = str(tmp_path / 'cache' / cache_files[0])
+    with open(cache_file, 'rb') as fp:
+        entry = pickle.load(fp)
+    entry['version'] = 0
+    with open(cache_file, 'wb') as fp:
+        pickle.dump(entry, fp)
+    requests = []
+    conn4 = create_connection(tmp_path, fake, requests)
+    conn4.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'EnumerateQualifiers',
+                        'GetClass']
+
+
+def test_class_cache_no_qualifiers(tmp_path):
+    """
+    Test that the cache is used with a server that does not support
+    retrieving the qualifier declarations.
+    """
+    fake = create_fake()
+    requests = []
+    conn = create_connection(tmp_path, fake, requests)
+    imethodcall = conn._imethodcall  # pylint: disable=protected-access
+
+    def no_qualifiers(methodname, *args, **kwargs):
+        if methodname == 'EnumerateQualifiers':
+            raise CIMError(CIM_ERR_NOT_SUPPORTED)
+        return imethodcall(methodname, *args, **kwargs)
+
+    # pylint: disable=protected-access
+    conn._imethodcall = no_qualifiers
+    conn.GetClass('CIM_Foo')
+    conn.class_cache.save()
+    conn.GetClass('CIM_Foo')
+    assert requests == ['EnumerateClassNames', 'GetClass']
+
+
+def test_class_cache_invalidate(tmp_path):
+    """
+    Test that modifying requests and invalidate() remove the cache of the
+    namespace.
+    """
+    fake = create_fake()
+    requests = []
+    conn = create_connection(tmp_path, fake, requests)
+    conn.EnumerateClassNames(DeepInheritance=True)
+    conn.class_cache.save()
+    assert len(os.listdir(str(tmp_path / 'cache'))) == 1
+
+    conn.DeleteClass('CIM_Foo_sub')
+    assert os.listdir(str(tmp_path / 'cache')) == []
+    assert conn.EnumerateClassNames(DeepInheritance=True) == ['CIM_Foo']
+
+    conn.class_cache.save()
+    conn.class_cache.invalidate()
+    assert os.listdir(str(tmp_path / 'cache')) == []
+
+
+def test_class_store_lru():
+    """
+    Test that the class store evicts the least recently used responses and
+    that invalidate() removes the responses of a namespace.
+    """
+    store = ClassStore(max_objects=4)
+    store.put('root/cimv2', 'a', ['x', 'y'])
+    store.put('/root/cimv2', 'b', 'z')
+    store.put('root/other', 'c', 'z')
+    assert store.size == 4
+    assert store.get('ROOT/cimv2', 'a') == (True, ['x', 'y'])
+
+    # 'b' is the least recently used response now
+    store.put('root/other', 'd', 'z')
+    assert store.get('root/cimv2', 'b') == (False, None)
+    assert store.evictions == 1
+    assert (store.hits, store.misses) == (1, 1)
+
+    # Responses larger than the store are not saved
+    store.put('root/cimv2', 'e', ['1', '2', '3', '4', '5'])
+    assert store.get('root/cimv2', 'e') == (False, None)
+    assert store.namespace_sizes() == {'root/cimv2': (1, 2),
+                                       'root/other': (2, 2)}
+
+    store.invalidate('root/other')
+    assert store.namespace_sizes() == {'root/cimv2': (1, 2)}
+    store.invalidate()
+    assert store.size == 0
+
+
+def test_class_store_requests(tmp_path):
+    """
+    Test that the class store answers repeated requests before the class cache
+    and is invalidated by modifying requests.
+    """
+    fake = create_fake()
+    requests = []
+    conn = create_connection(tmp_path, fake, requests)
+    conn.class_cache = None
+    conn.class_store = ClassStore()
+
+    conn.GetClass('CIM_Foo_sub', LocalOnly=False)
+    conn.GetClass('CIM_Foo_sub', LocalOnly=False)
+    conn.EnumerateClassNames(DeepInheritance=True)
+    assert requests == ['GetClass', 'EnumerateClassNames']
+    assert conn.class_store.hits == 1
+
+    conn.DeleteClass('CIM_Foo_sub')
+    assert conn.class_store.size == 0
+    assert conn.EnumerateClassNames(DeepInheritance=True) == ['CIM_Foo']
@@ -0,0 +1,263 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _connection_pool module.
+"""
+
+import os
+import threading
+from types import SimpleNamespace
+import pytest
+
+from pywbem import CIMError, CIM_ERR_NOT_FOUND, LogOperationRecorder, \
+    Statistics
+
+from pywbemtools.pywbemcli._connection_pool import ConnectionPool, \
+    add_copy_statistics, statistics_snapshot, reset_statistics
+from pywbemtools.pywbemcli._pywbemcli_faked_connection import \
+    PYWBEMCLIFakedConnection
+
+from ..pytest_extensions import simplified_test_function
+
+# pylint: disable=use-dict-literal
+
+OK = True
+RUN = True
+FAIL = False
+PDB = "pdb"
+
+
+def _request(conn, item):
+    """
+    Request function for the tests. Returns the item, the id of the connection
+    and the thread name, or raises CIMError for items that are negative.
+    """
+    if item < 0:
+        raise CIMError(CIM_ERR_NOT_FOUND, f"item {item}")
+    return item, id(conn), threading.current_thread().name
+
+
+TESTCASES_CONNECTION_POOL_IMAP = [
+    # Testcases for ConnectionPool.imap()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * max_parallel: max_parallel parameter of the pool.
+    #   * items: list of items for imap().
+    #   * exp_orig_conn: True if the original connection must be used.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "max_parallel 1 uses original connection in calling thread",
+        dict(max_parallel=1, items=[1, 2, 3], exp_orig_conn=True),
+        None, None, OK
+    ),
+    (
+        "single item uses original connection in calling thread",
+        dict(max_parallel=4, items=[1], exp_orig_conn=True),
+        None, None, OK
+    ),
+    (
+        "No items",
+        dict(max_parallel=4, items=[], exp_orig_conn=True),
+        None, None, OK
+    ),
+    (
+        "max_parallel 4 uses connection copies, results in item order",
+        dict(max_parallel=4, items=list(range(20)), exp_orig_conn=False),
+        None, None, OK
+    ),
+    (
+        "max_parallel 3 with failing items, results in item order",
+        dict(max_parallel=3, items=[1, -2, 3, -4, 5], exp_orig_conn=False),
+        None, None, OK
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CONNECTION_POOL_IMAP)
+@simplified_test_function
+def test_connection_pool_imap(testcase, max_parallel, items, exp_orig_conn):
+    """
+    Test function for ConnectionPool.imap()
+    """
+    conn = PYWBEMCLIFakedConnection()
+    pool = ConnectionPool(conn, max_parallel)
+
+    # The code to be tested
+    results = []
+    for item, get_result in pool.imap(_request, items):
+        try:
+            results.append((item, get_result()))
+        except CIMError as ce:
+            results.append((item, ce))
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert [r[0] for r in results] == items
+
+    for item, result in results:
+        if item < 0:
+            assert isinstance(result, CIMError)
+            continue
+        assert result[0] == item
+        if exp_orig_conn:
+            assert result[1] == id(conn)
+            assert result[2] == threading.current_thread().name
+        else:
+            assert result[1] != id(conn)
+
+    # The connection copies are closed and released
+    # pylint: disable=protected-access
+    assert not pool._conns
+
+
+def test_connection_copy_type():
+    """
+    Test that copies of pywbemcli connections keep the pywbemcli methods and
+    share the mock repository.
+    """
+    conn = PYWBEMCLIFakedConnection(default_namespace='root/blah')
+
+    cpy = conn.copy()
+
+    assert isinstance(cpy, PYWBEMCLIFakedConnection)
+    assert cpy is not conn
+    assert cpy.default_namespace == 'root/blah'
+    # pylint: disable=protected-access
+    assert cpy._cimrepository is conn._cimrepository
+
+
+def test_connection_copy_recorders():
+    """
+    Test that copies of mock connections have copies of the operation
+    recorders, so that --log includes the requests executed on them.
+    """
+    conn = PYWBEMCLIFakedConnection()
+    conn.add_operation_recorder(LogOperationRecorder('test'))
+
+    cpy = conn.copy()
+
+    assert len(cpy.operation_recorders) == 1
+    assert isinstance(cpy.operation_recorders[0], LogOperationRecorder)
+    assert cpy.operation_recorders[0] is not conn.operation_recorders[0]
+
+
+def _count_request(conn, classname):
+    """Request function that counts the instances of a class"""
+    return len(list(conn.IterEnumerateInstancePaths(classname,
+                                                    MaxObjectCount=2)))
+
+
+@pytest.mark.parametrize("max_parallel", [1, 4])
+def test_connection_pool_statistics(max_parallel):
+    """
+    Test that the operations executed on the connection copies are included
+    in the statistics of the original connection.
+    """
+    conn = PYWBEMCLIFakedConnection(stats_enabled=True)
+    conn.compile_mof_file(os.path.join(os.path.dirname(__file__),
+                                       'simple_mock_model.mof'))
+    conn.statistics.reset()
+    pool = ConnectionPool(conn, max_parallel)
+    classnames = ['CIM_Foo', 'CIM_Foo_sub', 'CIM_Foo_sub2', 'CIM_FooRef1']
+
+    counts = [get_result() for _, get_result in
+              pool.imap(_count_request, classnames)]
+
+    assert counts == [12, 7, 0, 1]
+    stats = {name: (stat.count, stat.exception_count)
+             for name, stat in statistics_snapshot(conn)}
+    assert stats == {'EnumerateInstanceNames': (4, 0)}
+
+    reset_statistics(conn)
+    assert statistics_snapshot(conn) == []
+
+
+def _timed_statistics(operations):
+    """
+    Return an enabled pywbem Statistics container with the operations
+    recorded through its public interface. operations is a list of tuples
+    of operation name, request length, reply length, server time and
+    exception flag.
+    """
+    statistics = Statistics(enable=True)
+    for name, request_len, reply_len, server_time, exception in operations:
+        stat = statistics.start_timer(name)
+        stat.stop_timer(request_len, reply_len, server_time, exception)
+    return statistics
+
+
+@pytest.mark.parametrize(
+    "operations, other_operations, exp_server_time",
+    [
+        (
+            [('GetClass', 10, 100, 0.5, False)],
+            [('GetClass', 30, 50, 0.25, True),
+             ('GetClass', 20, 300, 1.0, False)],
+            True
+        ),
+        (
+            [('GetClass', 10, 100, 0.5, False)],
+            [('GetClass', 30, 50, None, False)],
+            False
+        ),
+        (
+            [],
+            [('GetClass', 30, 50, 0.25, False)],
+            True
+        ),
+    ]
+)
+def test_statistics_snapshot(operations, other_operations, exp_server_time):
+    """
+    Test that statistics_snapshot() of a connection with the statistics of a
+    copy added by add_copy_statistics() results in the statistics of executing
+    all operations on one connection.
+    """
+    conn = SimpleNamespace(statistics=_timed_statistics(operations))
+    copy_conn = SimpleNamespace(statistics=_timed_statistics(other_operations))
+    exp = _timed_statistics(operations + other_operations)
+
+    # The code to be tested
+    add_copy_statistics(conn, copy_conn)
+    snapshot = statistics_snapshot(conn)
+
+    assert [name for name, _ in snapshot] == ['GetClass']
+    stat = snapshot[0][1]
+    exp_stat = exp.get_op_statistic('GetClass')
+    assert stat.count == exp_stat.count
+    assert stat.exception_count == exp_stat.exception_count
+    for prop in ('min_request_len', 'max_request_len',
+                 'min_reply_len', 'max_reply_len',
+                 'min_server_time', 'max_server_time'):
+        assert getattr(stat, prop) == getattr(exp_stat, prop), prop
+    for prop in ('avg_request_len', 'avg_reply_len', 'avg_server_time'):
+        assert getattr(stat, prop) == \
+            pytest.approx(getattr(exp_stat, prop)), prop
+    if exp_server_time:
+        assert stat.max_server_time == max(
+            op[3] for op in operations + other_operations)
+    else:
+        assert stat.max_server_time == 0
@@ -0,0 +1,218 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the daemon command group and the --via-daemon general option of
+pywbemcli. The daemon is started on a socket in a temporary directory.
+"""
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+from pywbemtools.pywbemcli._daemon import daemon_supported, \
+    via_daemon_index, strip_via_daemon, GENERAL_VALUE_OPTIONS
+
+TEST_DIR = os.path.dirname(__file__)
+SIMPLE_MOCK_FILE = 'simple_mock_model.mof'
+
+pytestmark = pytest.mark.skipif(
+    not daemon_supported(), reason="Unix domain sockets not supported")
+
+
+# Python code that invokes the cli function of pywbemcli instead of the
+# pywbemcli entry point.
+CLI_CODE = 'from pywbemtools.pywbemcli.pywbemcli import cli; cli()'
+
+
+def run_pywbemcli(args, env, entry_point=True):
+    """
+    Run pywbemcli with the arguments in the test directory and return the
+    CompletedProcess object. If entry_point is False, the cli function is
+    invoked instead of the pywbemcli entry point.
+    """
+    python_args = ['-m', 'pywbemtools.pywbemcli'] if entry_point \
+        else ['-c', CLI_CODE]
+    return subprocess.run(
+        [sys.executable] + python_args + args,
+        cwd=TEST_DIR, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, check=False)
+
+
+@pytest.fixture(name='daemon_env')
+def fixture_daemon_env(tmp_path):
+    """
+    Environment variables for running pywbemcli with the daemon socket in a
+    temporary directory. Stops the daemon at the end of the test if it is
+    running.
+    """
+    env = dict(os.environ)
+    env['PYWBEMCLI_DAEMON_SOCKET'] = str(tmp_path / 'daemon.sock')
+    yield env
+    if os.path.exists(env['PYWBEMCLI_DAEMON_SOCKET']):
+        run_pywbemcli(['daemon', 'stop'], env)
+
+
+def test_daemon_not_running(daemon_env):
+    """
+    Test the daemon commands and the --via-daemon general option when the
+    daemon is not running.
+    """
+    proc = run_pywbemcli(['daemon', 'status'], daemon_env)
+    assert proc.returncode == 0
+    assert 'daemon is not running' in proc.stdout
+
+    proc = run_pywbemcli(['daemon', 'stop'], daemon_env)
+    assert proc.returncode == 1
+    assert 'daemon is not running' in proc.stderr
+
+    # The command is executed by pywbemcli itself
+    proc = run_pywbemcli(['--via-daemon', '-m', SIMPLE_MOCK_FILE,
+                          'class', 'enumerate', '--no'], daemon_env)
+    assert proc.returncode == 0, proc.stderr
+    assert 'CIM_Foo' in proc.stdout.splitlines()
+
+
+def test_daemon_commands(daemon_env):
+    """
+    Test executing commands in the daemon.
+    """
+    proc = run_pywbemcli(['daemon', 'start'], daemon_env)
+    assert proc.returncode == 0, proc.stderr
+    assert 'Started pywbemcli daemon' in proc.stdout
+
+    proc = run_pywbemcli(['daemon', 'start'], daemon_env)
+    assert proc.returncode == 1
+    assert 'already running' in proc.stderr
+
+    # The --via-daemon general option is handled by the entry point and by
+    # the cli function
+    for entry_point in (True, False):
+        proc = run_pywbemcli(['--via-daemon', '-m', SIMPLE_MOCK_FILE,
+                              'class', 'enumerate', '--no'], daemon_env,
+                             entry_point)
+        assert proc.returncode == 0, proc.stderr
+        assert 'CIM_Foo' in proc.stdout.splitlines()
+        assert proc.stderr == ''
+
+    # The output and exit code of a failing command are the same as when
+    # executed by pywbemcli itself
+    args = ['-m', SIMPLE_MOCK_FILE, 'class', 'get', 'CIM_Blah']
+    proc = run_pywbemcli(['--via-daemon'] + args, daemon_env)
+    local_proc = run_pywbemcli(args, daemon_env)
+    assert proc.returncode == local_proc.returncode == 1
+    assert proc.stdout == local_proc.stdout
+    assert proc.stderr == local_proc.stderr
+    assert 'CIM_ERR_NOT_FOUND' in proc.stderr
+
+    # Interactive mode is not supported in the daemon
+    proc = run_pywbemcli(['--via-daemon', '-m', SIMPLE_MOCK_FILE],
+                         daemon_env)
+    assert proc.returncode == 1
+    assert 'not supported' in proc.stderr
+
+    # The mock environment is kept between the commands
+    proc = run_pywbemcli(['-o', 'simple', 'daemon', 'status'], daemon_env)
+    assert proc.returncode == 0, proc.stderr
+    assert 'executed 4 commands' in proc.stdout
+    assert SIMPLE_MOCK_FILE in proc.stdout
+    assert len([line for line in proc.stdout.splitlines()
+                if SIMPLE_MOCK_FILE in line]) == 1
+
+    proc = run_pywbemcli(['daemon', 'stop'], daemon_env)
+    assert proc.returncode == 0, proc.stderr
+    assert 'Stopped pywbemcli daemon' in proc.stdout
+    assert not os.path.exists(daemon_env['PYWBEMCLI_DAEMON_SOCKET'])
+
+
+class _StopContext:
+    # pylint: disable=too-few-public-methods
+    """Context object with the interface used by cmd_daemon_stop()"""
+
+    def spinner_stop(self):
+        """Do nothing, since there is no spinner"""
+
+
+def test_daemon_stop_timeout(daemon_env, monkeypatch):
+    """
+    Test that 'daemon stop' fails instead of waiting forever when the socket
+    file of a daemon that accepted the stop request is not removed.
+    """
+    # pylint: disable=import-outside-toplevel
+    import click
+    from pywbemtools.pywbemcli import _cmd_daemon
+
+    socket_path = daemon_env['PYWBEMCLI_DAEMON_SOCKET']
+    with open(socket_path, 'w', encoding='utf-8'):
+        pass
+    monkeypatch.setenv('PYWBEMCLI_DAEMON_SOCKET', socket_path)
+    monkeypatch.setattr(_cmd_daemon, 'daemon_control',
+                        lambda request, path: {})
+    monkeypatch.setattr(_cmd_daemon, 'DAEMON_STOP_TIMEOUT', 0.2)
+
+    with pytest.raises(click.ClickException) as exc_info:
+        _cmd_daemon.cmd_daemon_stop(_StopContext())
+    assert 'did not stop within 0.2 seconds' in exc_info.value.message
+
+    os.remove(socket_path)
+
+
+@pytest.mark.parametrize(
+    "args, exp_index",
+    [
+        (['--via-daemon', 'class', 'enumerate'], 0),
+        (['-m', 'x.mof', '--via-daemon', 'class', 'enumerate'], 2),
+        (['-o', 'table', '-v', '--via-daemon', 'class', 'enumerate'], 3),
+        (['--log=all', '-otable', '--via-daemon', 'class'], 2),
+        # Value of a general option
+        (['-l', '--via-daemon', 'class', 'enumerate'], None),
+        # Arguments of the command
+        (['class', 'enumerate', '--via-daemon'], None),
+        (['instance', 'enumerate', 'CIM_Foo', '--where', '--via-daemon'],
+         None),
+        (['--', '--via-daemon'], None),
+        ([], None),
+    ]
+)
+def test_via_daemon_index(args, exp_index):
+    """
+    Test that the --via-daemon general option is found only in the general
+    options before the command.
+    """
+    assert via_daemon_index(args) == exp_index
+    exp_args = list(args)
+    if exp_index is not None:
+        del exp_args[exp_index]
+    assert strip_via_daemon(args) == exp_args
+
+
+def test_general_value_options():
+    """
+    Test that GENERAL_VALUE_OPTIONS are the general options of pywbemcli that
+    take a value.
+    """
+    # pylint: disable=import-outside-toplevel
+    import click
+    from pywbemtools.pywbemcli.pywbemcli import cli
+
+    exp_opts = [opt for param in cli.params
+                if isinstance(param, click.Option) and not param.is_flag and
+                not param.count
+                for opt in param.opts]
+
+    assert sorted(GENERAL_VALUE_OPTIONS) == sorted(exp_opts)
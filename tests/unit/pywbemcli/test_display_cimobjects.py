@@ -22,13 +22,18 @@ API, not a test of pywbemcli commands.
 
 from datetime import datetime
 from collections import OrderedDict
+from types import SimpleNamespace
 import pytest
 
-from pywbem import CIMProperty, CIMInstance, CIMInstanceName, Uint32, Uint64, \
-    Sint32, CIMDateTime
+from pywbem import CIMProperty, CIMInstance, CIMInstanceName, Uint16, \
+    Uint32, Uint64, Sint32, CIMDateTime
 
 from pywbemtools.pywbemcli._display_cimobjects import \
-    _format_instances_as_rows, _display_instances_as_table
+    _format_instances_as_rows, _display_instances_as_table, \
+    _resolve_valuemappings, display_cim_objects_stream
+from pywbemtools.pywbemcli._class_cache import ClassStore
+from pywbemtools.pywbemcli._pywbemcli_faked_connection import \
+    PYWBEMCLIFakedConnection
 
 from pywbemtools._output_formatting import DEFAULT_MAX_CELL_WIDTH
 
@@ -754,3 +759,175 @@ def test_display_instances_as_table(
         f"{stdout}\n" \
         "Expected:\n" \
         f"{exp_stdout}\n"
+
+
+VALUEMAPPING_MOF = """
+Qualifier Values : string[],
+    Scope(property, method, parameter);
+Qualifier ValueMap : string[],
+    Scope(property, method, parameter);
+
+class TST_VM {
+    [Values {"zero", "one"}] uint16 P1;
+    [ValueMap {"1", "2"}, Values {"a", "b"}] uint32 P2;
+    uint32 P3;
+    string P4;
+};
+
+class TST_VM_sub : TST_VM {
+    [Values {"x"}] uint8 P5;
+};
+"""
+
+
+class CountingFakedConnection(PYWBEMCLIFakedConnection):
+    # pylint: disable=too-many-ancestors
+    """
+    PYWBEMCLIFakedConnection that records the GetClass requests that are
+    executed by the mock WBEM server (i.e. not returned from the class store)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.getclass_requests = []
+
+    def _imeth_GetClass(self, namespace, **params):
+        # pylint: disable=invalid-name
+        self.getclass_requests.append(
+            (namespace, params['ClassName'].classname))
+        return super()._imeth_GetClass(namespace, **params)
+
+
+def test_resolve_valuemappings():
+    """
+    Test that _resolve_valuemappings() retrieves each creation class once
+    and reuses the value mappings across namespaces and calls.
+    """
+    conn = CountingFakedConnection()
+    for ns in ('root/ns1', 'root/ns2'):
+        conn.add_namespace(ns)
+        conn.compile_mof_string(VALUEMAPPING_MOF, namespace=ns)
+    conn.class_store = ClassStore()
+
+    prop_names = ['P1', 'P2', 'P3', 'P4', 'P5']
+    insts = []
+    for ns in ('root/ns1', 'root/ns2'):
+        for cln in ('TST_VM', 'TST_VM_sub', 'TST_VM'):
+            inst = CIMInstance(cln, path=CIMInstanceName(cln, namespace=ns))
+            inst['P1'] = Uint32(1)
+            inst['P2'] = Uint32(2)
+            inst['P3'] = Uint32(3)
+            inst['P4'] = 'abc'
+            if cln == 'TST_VM_sub':
+                inst['P5'] = Uint32(0)
+            insts.append(inst)
+
+    valuemappings = _resolve_valuemappings(conn, insts, prop_names)
+
+    assert conn.getclass_requests == [('root/ns1', 'TST_VM'),
+                                      ('root/ns1', 'TST_VM_sub')]
+    assert valuemappings[('tst_vm', 'p1')].tovalues(1) == 'one'
+    assert valuemappings[('tst_vm', 'p2')].tovalues(2) == 'b'
+    assert valuemappings[('tst_vm', 'p3')] is None
+    assert ('tst_vm', 'p4') not in valuemappings
+    assert valuemappings[('tst_vm_sub', 'p5')].tovalues(0) == 'x'
+
+    # The value mappings are kept in the class store of the connection. When
+    # they are invalidated, they are resolved again from the classes in the
+    # class store that are still valid.
+    _resolve_valuemappings(conn, insts, prop_names)
+    assert len(conn.getclass_requests) == 2
+    conn.class_store.invalidate('root/ns2')
+    _resolve_valuemappings(conn, insts[:1], prop_names)
+    assert len(conn.getclass_requests) == 2
+    assert valuemappings[('tst_vm', 'p1')].tovalues(1) == 'one'
+    conn.class_store.invalidate('root/ns1')
+    _resolve_valuemappings(conn, insts[:1], prop_names)
+    assert len(conn.getclass_requests) == 3
+
+
+STREAM_MOF = """
+Qualifier Key : boolean = false,
+    Scope(property, reference),
+    Flavor(DisableOverride, ToSubclass);
+Qualifier MaxLen : uint32 = null,
+    Scope(property, method, parameter);
+
+class TST_Stream {
+    [Key, MaxLen(8)] string Name;
+    uint16 Count;
+    boolean Flag;
+    string Text;
+};
+
+class TST_Stream_sub : TST_Stream {
+    uint32 Extra;
+};
+"""
+
+
+def test_display_cim_objects_stream(capsys):
+    """
+    Test that display_cim_objects_stream() displays each table row when its
+    instance is received, with the column widths determined from the class
+    of the instances, and a new table for instances of another class.
+    """
+    conn = CountingFakedConnection()
+    conn.compile_mof_string(STREAM_MOF, namespace='root/cimv2')
+    conn.class_store = ClassStore()
+    context = SimpleNamespace(
+        pywbem_server=SimpleNamespace(conn=conn, pull_max_cnt=1000),
+        spinner_stop=lambda: None)
+
+    def instance(classname, name, count, text=None, **props):
+        inst = CIMInstance(
+            classname,
+            properties=dict(Name=name, Count=Uint16(count), Flag=True,
+                            Text=CIMProperty('Text', text, type='string'),
+                            **props),
+            path=CIMInstanceName(classname, keybindings=dict(Name=name),
+                                 namespace='root/cimv2'))
+        return inst
+
+    received = []
+
+    def instances():
+        """Generator that records the output before each instance"""
+        for inst in [instance('TST_Stream', 'a', 1, 'short'),
+                     instance('TST_Stream', 'bb', 22,
+                              'a text that is longer than its column'),
+                     instance('TST_Stream_sub', 'ccc', 333,
+                              Extra=Uint32(7))]:
+            received.append(capsys.readouterr()[0])
+            yield inst
+
+    count, cim_type = display_cim_objects_stream(
+        context, instances(), 'psql', ctx_options={'max_cell_width': 20})
+
+    assert (count, cim_type) == (3, 'CIMInstance')
+    output = received + [capsys.readouterr()[0]]
+    assert output == [
+        '',
+        """\
+Instances: TST_Stream
++------------+---------+--------+----------------------+
+| Name       |   Count | Flag   | Text                 |
+|------------+---------+--------+----------------------|
+| "a"        |       1 | true   | "short"              |
+""",
+        """\
+| "bb"       |      22 | true   | "a text that is "    |
+|            |         |        | "longer than its "   |
+|            |         |        | "column"             |
+""",
+        """\
++------------+---------+--------+----------------------+
+Instances: TST_Stream_sub
++------------+---------+------------+--------+----------------------+
+| Name       |   Count |      Extra | Flag   | Text                 |
+|------------+---------+------------+--------+----------------------|
+| "ccc"      |     333 |          7 | true   |                      |
++------------+---------+------------+--------+----------------------+
+"""]
+    assert conn.getclass_requests == [('root/cimv2', 'TST_Stream'),
+                                      ('root/cimv2', 'TST_Stream_sub')]
@@ -149,6 +149,10 @@ GENERAL_HELP_LINES = [
     "-t, --timeout INT  Client-side timeout (seconds) on data read for",
     "-U, --use-pull [yes|no|either] Determines whether pull operations are ",
     "--pull-max-cnt INT  Maximum number of instances to be returned by",
+    "--max-parallel INT  Maximum number of server requests that are",
+    "--class-cache / --no-class-cache",
+    "--class-store / --no-class-store",
+    "--pull-target-time SECONDS  Adapt the maximum number of objects",
     "-T, --timestats / --no-timestats",
     "-d, --default-namespace NAMESPACE Default namespace, to be used when ",
     "-o, --output-format FORMAT Output format for the command result. The",
@@ -159,9 +163,14 @@ GENERAL_HELP_LINES = [
     "-v, --verbose / --no-verbose Display extra information about the",
     "--warn / --no-warn",
     "--pdb    Pause execution in the built-in pdb debugger",
+    "--via-daemon  Execute the command in the pywbemcli daemon",
+    "--batch FILE  Execute the pywbemcli commands in the specified file",
+    "--batch-jobs INT  Maximum number of consecutive read-only commands",
     "--version   Show the version of this command and the",
     """Commands:
+      cache       Command group for the class caches.
       class       Command group for CIM classes.
+      daemon      Command group for the pywbemcli daemon.
       instance    Command group for CIM instances.
       namespace   Command group for CIM namespaces.
       profile     Command group for WBEM management profiles.
@@ -428,6 +437,42 @@ TEST_CASES = [
       'test': 'innows'},
      None, OK],  # Only tests that the option is accepted
 
+    ['Verify valid --max-parallel option parameter with single command.',
+     {'general': ['-s', 'http://blah', '--max-parallel', '4'],
+      'cmdgrp': 'connection',
+      'args': ['show']},
+     {'stdout': ['pull-max-cnt 1000'],
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify valid --pull-target-time option parameter.',
+     {'general': ['-s', 'http://blah', '--pull-target-time', '0.5'],
+      'cmdgrp': 'connection',
+      'args': ['show']},
+     {'stdout': ['pull-max-cnt 1000'],
+      'rc': 0,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify invalid --pull-target-time option parameter fails.',
+     {'general': ['-s', 'http://blah', '--pull-target-time', '0'],
+      'cmdgrp': 'connection',
+      'args': ['show']},
+     {'stderr': ["Invalid value for '--pull-target-time'"],
+      'rc': 2,
+      'test': 'innows'},
+     None, OK],
+
+    ['Verify invalid --max-parallel option parameter fails.',
+     {'general': ['-s', 'http://blah', '--max-parallel', '0'],
+      'cmdgrp': 'connection',
+      'args': ['show']},
+     {'stderr': ["Invalid value for '--max-parallel'"],
+      'rc': 2,
+      'test': 'innows'},
+     None, OK],
+
     ['Verify --no-warn general option included.',
      {'general': ['-s', 'http://blah', '--no-warn'],
       'cmdgrp': 'connection',
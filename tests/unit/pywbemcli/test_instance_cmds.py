@@ -139,6 +139,8 @@ INSTANCE_ASSOCIATORS_HELP_LINES = [
     CMD_OPTION_SUMMARY_HELP_LINE,
     CMD_OPTION_FILTER_QUERY_LINE,
     CMD_OPTION_FILTER_QUERY_LANGUAGE_LINE,
+    '--where EXPRESSION Filter the instances or instance paths by a boolean',
+    '--limit INTEGER Retrieve only the first INTEGER objects returned by',
     CMD_OPTION_KEYS_HELP_LINE,
     CMD_OPTION_HELP_INSTANCENAME_HELP_LINE,
     CMD_OPTION_HELP_HELP_LINE,
@@ -193,7 +195,12 @@ INSTANCE_ENUMERATE_HELP_LINES = [
     CMD_OPTION_SUMMARY_HELP_LINE,
     CMD_OPTION_FILTER_QUERY_LINE,
     CMD_OPTION_FILTER_QUERY_LANGUAGE_LINE,
+    '--where EXPRESSION Filter the instances or instance paths by a boolean',
     CMD_OPTION_SHOW_NULL_HELP_LINE,
+    '--limit INTEGER Retrieve only the first INTEGER objects returned by',
+    '--stream Display the returned objects as they are received',
+    '--partition-by-subclass Enumerate the instances of each subtree of the',
+    '--max-cell-width INTEGER In the TABLE output formats, the maximum width',
     CMD_OPTION_HELP_HELP_LINE,
 ]
 
@@ -242,6 +249,7 @@ INSTANCE_QUERY_HELP_LINES = [
     '-ql, --query-language QUERY-LANGUAGE The query language to be used',
     CMD_OPTION_NAMESPACE_HELP_LINE,
     CMD_OPTION_SUMMARY_HELP_LINE,
+    '--where EXPRESSION Filter the returned instances by a boolean',
     CMD_OPTION_HELP_HELP_LINE,
 ]
 
@@ -259,6 +267,8 @@ INSTANCE_REFERENCES_HELP_LINES = [
     CMD_OPTION_SUMMARY_HELP_LINE,
     CMD_OPTION_FILTER_QUERY_LINE,
     CMD_OPTION_FILTER_QUERY_LANGUAGE_LINE,
+    '--where EXPRESSION Filter the instances or instance paths by a boolean',
+    '--limit INTEGER Retrieve only the first INTEGER objects returned by',
     CMD_OPTION_KEYS_HELP_LINE,
     CMD_OPTION_HELP_INSTANCENAME_HELP_LINE,
     CMD_OPTION_HELP_HELP_LINE,
@@ -986,6 +996,364 @@ TEST_CASES = [
       'test': 'lines'},
      SIMPLE_MOCK_FILE, OK],
 
+    ['Verify instance command enumerate CIM_Foo --stream',
+     ['enumerate', 'CIM_Foo', '--stream'],
+     {'stdout': ENUM_INSTANCE_RESP,
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate names CIM_Foo --no --stream',
+     ['enumerate', 'CIM_Foo', '--no', '--stream'],
+     {'stdout': ['root/cimv2:CIM_Foo.InstanceID="CIM_Foo1"',
+                 'root/cimv2:CIM_Foo.InstanceID="CIM_Foo2"',
+                 'root/cimv2:CIM_Foo.InstanceID="CIM_Foo3"',
+                 'root/cimv2:CIM_Foo.InstanceID="CIM_Foo30"',
+                 'root/cimv2:CIM_Foo.InstanceID="CIM_Foo31"',
+                 'root/cimv2:CIM_Foo_sub.InstanceID="CIM_Foo_sub1"',
+                 'root/cimv2:CIM_Foo_sub.InstanceID="CIM_Foo_sub2"',
+                 'root/cimv2:CIM_Foo_sub.InstanceID="CIM_Foo_sub3"',
+                 'root/cimv2:CIM_Foo_sub.InstanceID="CIM_Foo_sub4"',
+                 'root/cimv2:CIM_Foo_sub_sub.InstanceID="CIM_Foo_sub_sub1"',
+                 'root/cimv2:CIM_Foo_sub_sub.InstanceID="CIM_Foo_sub_sub2"',
+                 'root/cimv2:CIM_Foo_sub_sub.InstanceID="CIM_Foo_sub_sub3"', ],
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate names CIM_Foo --no -s --stream',
+     ['enumerate', 'CIM_Foo', '--no', '--summary', '--stream'],
+     {'stdout': ['12 CIMInstanceName(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --stream, table rows',
+     {'args': ['enumerate', 'CIM_Foo', '--stream', '--pl', 'InstanceID'],
+      'general': ['--output-format', 'simple', '--pull-max-cnt', '10']},
+     {'stdout': """Instances: CIM_Foo
+InstanceID
+------------------------------
+"CIM_Foo1"
+"CIM_Foo2"
+"CIM_Foo3"
+"CIM_Foo30"
+"CIM_Foo31"
+Instances: CIM_Foo_sub
+InstanceID
+------------------------------
+"CIM_Foo_sub1"
+"CIM_Foo_sub2"
+"CIM_Foo_sub3"
+"CIM_Foo_sub4"
+Instances: CIM_Foo_sub_sub
+InstanceID
+------------------------------
+"CIM_Foo_sub_sub1"
+"CIM_Foo_sub_sub2"
+"CIM_Foo_sub_sub3"
+""",
+      'rc': 0,
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --stream, new table per class',
+     {'args': ['enumerate', 'CIM_Foo', '--stream', '--pl', 'InstanceID'],
+      'general': ['--output-format', 'psql', '--pull-max-cnt', '3']},
+     {'stdout': """Instances: CIM_Foo
++--------------------------------+
+| InstanceID                     |
+|--------------------------------|
+| "CIM_Foo1"                     |
+| "CIM_Foo2"                     |
+| "CIM_Foo3"                     |
+| "CIM_Foo30"                    |
+| "CIM_Foo31"                    |
++--------------------------------+
+Instances: CIM_Foo_sub
++--------------------------------+
+| InstanceID                     |
+|--------------------------------|
+| "CIM_Foo_sub1"                 |
+| "CIM_Foo_sub2"                 |
+| "CIM_Foo_sub3"                 |
+| "CIM_Foo_sub4"                 |
++--------------------------------+
+Instances: CIM_Foo_sub_sub
++--------------------------------+
+| InstanceID                     |
+|--------------------------------|
+| "CIM_Foo_sub_sub1"             |
+| "CIM_Foo_sub_sub2"             |
+| "CIM_Foo_sub_sub3"             |
++--------------------------------+
+""",
+      'rc': 0,
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --stream --max-cell-width',
+     {'args': ['enumerate', 'CIM_Foo_sub_sub', '--stream',
+               '--max-cell-width', '14'],
+      'general': ['--output-format', 'grid']},
+     {'stdout': """Instances: CIM_Foo_sub_sub
++----------------+----------------+----------------+------------------+---------------+
+| InstanceID     | cimfoo_emb3    | cimfoo_sub     | cimfoo_sub_sub   |   IntegerProp |
++================+================+================+==================+===============+
+| "CIM_Foo_sub_" |                |                |                  |             8 |
+| "sub1"         |                |                |                  |               |
++----------------+----------------+----------------+------------------+---------------+
+| "CIM_Foo_sub_" |                |                |                  |             9 |
+| "sub2"         |                |                |                  |               |
++----------------+----------------+----------------+------------------+---------------+
+| "CIM_Foo_sub_" |                |                |                  |            10 |
+| "sub3"         |                |                |                  |               |
++----------------+----------------+----------------+------------------+---------------+
+""",  # noqa: E501
+      'rc': 0,
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --stream --max-cell-width too small',
+     ['enumerate', 'CIM_Foo', '--stream', '--max-cell-width', '5'],
+     {'stderr': ["Invalid value for '--max-cell-width'"],
+      'rc': 2,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --stream, summary, 2 namespaces',
+     {'args': ['enumerate', 'CIM_Foo', '--stream', '--summary',
+               '-n', 'root/cimv2', '-n', 'root/blah'],
+      'general': ['--output-format', 'simple']},
+     {'stdout': ['Summary of CIMInstance(s) returned',
+                 'root/cimv2 12 CIMInstance',
+                 'root/blah 0 CIMInstance',
+                 'root/blah CIM_ERR_INVALID_NAMESPACE'],
+      'stderr': ['Errors encountered on 1 server request(s)'],
+      'rc': 1,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate names CIM_Foo --no -s --limit',
+     {'args': ['enumerate', 'CIM_Foo', '--no', '--summary', '--limit', '3'],
+      'general': ['--pull-max-cnt', '2']},
+     {'stdout': ['3 CIMInstanceName(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo -s --limit, traditional '
+     'operations',
+     {'args': ['enumerate', 'CIM_Foo', '--summary', '--limit', '3'],
+      'general': ['--use-pull', 'no']},
+     {'stdout': ['3 CIMInstance(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --limit larger than result',
+     ['enumerate', 'CIM_Foo', '--summary', '--limit', '100'],
+     {'stdout': ['12 CIMInstance(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --stream -s --limit',
+     {'args': ['enumerate', 'CIM_Foo', '--stream', '--summary', '--limit',
+               '5'],
+      'general': ['--pull-max-cnt', '2']},
+     {'stdout': ['5 CIMInstance(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --limit 0 fails',
+     ['enumerate', 'CIM_Foo', '--limit', '0'],
+     {'stderr': ["Invalid value for '--limit'"],
+      'rc': 2,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --stream --object-order fails',
+     ['enumerate', 'CIM_Foo', '--stream', '--object-order'],
+     {'stderr': ['The --object-order option is not allowed with the '
+                 '--stream option'],
+      'rc': 1,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --di --partition-by-subclass',
+     {'args': ['enumerate', 'CIM_Foo', '--di', '--partition-by-subclass'],
+      'general': ['--timestats']},
+     {'stdout': ['instance of CIM_Foo {',
+                 'InstanceID = "CIM_Foo31";',
+                 'instance of CIM_Foo_sub {',
+                 'InstanceID = "CIM_Foo_sub4";',
+                 'instance of CIM_Foo_sub_sub {',
+                 'InstanceID = "CIM_Foo_sub_sub3";',
+                 # CIM_Foo is not abstract, so its subtree is one request
+                 'OpenEnumerateInstances 1 0'],
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --no --partition-by-subclass '
+     '-s, --max-parallel 3',
+     {'args': ['enumerate', 'CIM_Foo', '--no', '--partition-by-subclass',
+               '--summary'],
+      'general': ['--max-parallel', '3']},
+     {'stdout': ['12 CIMInstanceName(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass without '
+     'abstract class',
+     ['enumerate', 'CIM_BaseRef', '--no', '--partition-by-subclass'],
+     {'stdout': ['root/cimv2:CIM_FooRef1.InstanceID="CIM_FooRef11"',
+                 'root/cimv2:CIM_FooRef2.InstanceID="CIM_FooRef21"'],
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass enumerates '
+     'the subclasses of an abstract class separately',
+     {'args': ['enumerate', 'CIM_BaseRef', '--no', '--partition-by-subclass'],
+      'general': ['--log', 'api=stderr', '--max-parallel', '2']},
+     {'stderr': ["OpenEnumerateInstancePaths(ClassName='CIM_FooRef1',",
+                 "OpenEnumerateInstancePaths(ClassName='CIM_FooRef2',"],
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass does not '
+     'enumerate an abstract class',
+     {'args': ['enumerate', 'CIM_BaseRef', '--no', '--partition-by-subclass'],
+      'general': ['--log', 'api=stderr']},
+     {'stderr': ["OpenEnumerateInstancePaths(ClassName='CIM_BaseRef',"],
+      'test': 'not-innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass enumerates '
+     'a non-abstract class with its subclasses',
+     {'args': ['enumerate', 'CIM_Foo', '--no', '--partition-by-subclass'],
+      'general': ['--log', 'api=stderr']},
+     {'stderr': ["OpenEnumerateInstancePaths(ClassName='CIM_Foo_sub"],
+      'test': 'not-innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass --limit',
+     ['enumerate', 'CIM_Foo', '--no', '--partition-by-subclass', '--summary',
+      '--limit', '7'],
+     {'stdout': ['7 CIMInstanceName(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass --limit '
+     'does not enumerate subtrees after the limit has been reached',
+     {'args': ['enumerate', 'CIM_BaseRef', '--no', '--partition-by-subclass',
+               '--limit', '1'],
+      'general': ['--log', 'api=stderr']},
+     {'stderr': ["OpenEnumerateInstancePaths(ClassName='CIM_FooRef2'"],
+      'test': 'not-innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass requires '
+     '--di',
+     ['enumerate', 'CIM_Foo', '--partition-by-subclass'],
+     {'stderr': ['The --partition-by-subclass option requires the '
+                 '--deep-inheritance or --names-only option'],
+      'rc': 1,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass --stream '
+     'fails',
+     ['enumerate', 'CIM_Foo', '--no', '--partition-by-subclass', '--stream'],
+     {'stderr': ['The --partition-by-subclass option is not allowed with the '
+                 '--stream option'],
+      'rc': 1,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate --partition-by-subclass invalid '
+     'class fails',
+     ['enumerate', 'CIM_Blah', '--no', '--partition-by-subclass'],
+     {'stderr': ['CIM_ERR_NOT_FOUND'],
+      'rc': 1,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --where',
+     ['enumerate', 'CIM_Foo', '--where',
+      "IntegerProp >= 5 AND NOT InstanceID =~ 'sub_sub'", '--summary'],
+     {'stdout': ['3 CIMInstance(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --where with Null values',
+     ['enumerate', 'CIM_Foo', '--where',
+      "IntegerProp IS NULL OR NOT IntegerProp > 1", '--pl', 'IntegerProp'],
+     {'stdout': ['instance of CIM_Foo {',
+                 'IntegerProp = 1;',
+                 '};',
+                 'instance of CIM_Foo {',
+                 '};',
+                 'instance of CIM_Foo {',
+                 '};',
+                 'instance of CIM_Foo {',
+                 '};'],
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --no --where on keys',
+     ['enumerate', 'CIM_Foo', '--no', '--where',
+      "InstanceID = 'CIM_Foo_sub2' or instanceid =~ '3$'"],
+     {'stdout': ['root/cimv2:CIM_Foo.InstanceID="CIM_Foo3"',
+                 'root/cimv2:CIM_Foo_sub.InstanceID="CIM_Foo_sub2"',
+                 'root/cimv2:CIM_Foo_sub.InstanceID="CIM_Foo_sub3"',
+                 'root/cimv2:CIM_Foo_sub_sub.InstanceID="CIM_Foo_sub_sub3"'],
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --where --stream',
+     ['enumerate', 'CIM_Foo', '--where', 'IntegerProp > 7', '--stream',
+      '--summary'],
+     {'stdout': ['3 CIMInstance(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --where --limit limits the '
+     'matching instances',
+     ['enumerate', 'CIM_Foo', '--where', 'IntegerProp > 1', '--limit', '2',
+      '--stream', '--pl', 'IntegerProp'],
+     {'stdout': ['instance of CIM_Foo {',
+                 'IntegerProp = 2;',
+                 '};',
+                 'instance of CIM_Foo_sub {',
+                 'IntegerProp = 4;',
+                 '};'],
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --where '
+     '--partition-by-subclass',
+     {'args': ['enumerate', 'CIM_Foo', '--di', '--partition-by-subclass',
+               '--where', 'IntegerProp < 2 OR IntegerProp > 9', '--summary'],
+      'general': ['--max-parallel', '3']},
+     {'stdout': ['2 CIMInstance(s) returned'],
+      'test': 'lines'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --where, --verbose reports '
+     'the evaluation',
+     {'args': ['enumerate', 'CIM_Foo', '--where',
+               "IntegerProp = 1 AND InstanceID =~ 'Foo'"],
+      'general': ['--verbose']},
+     {'stderr': ['--where: Evaluated by pywbemcli: IntegerProp = 1 AND '
+                 'InstanceID =~ "Foo"'],
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command enumerate CIM_Foo --where invalid expression '
+     'fails',
+     ['enumerate', 'CIM_Foo', '--where', 'IntegerProp = NULL'],
+     {'stderr': ["Invalid --where expression 'IntegerProp = NULL': "
+                 "Comparison with NULL at position 15; use IS NULL or IS "
+                 "NOT NULL"],
+      'rc': 1,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
     ['Verify instance command enumerate names CIM_Foo --no --namespace',
      ['enumerate', 'CIM_Foo', '--no', '--namespace', 'root/cimv2'],
      {'stdout': ['root/cimv2:CIM_Foo.InstanceID="CIM_Foo1"',
@@ -2944,6 +3312,37 @@ InstanceID      IntegerProp
       'test': 'linesnows'},
      ASSOC_MOCK_FILE, OK],
 
+    ['Verify instance command references --no --limit returns first path',
+     ['references', 'TST_Person.name="Mike"', '--no', '--summary',
+      '--rc', 'TST_Lineage', '--limit', '1'],
+     {'stdout': ['1 CIMInstanceName(s) returned'],
+      'rc': 0,
+      'test': 'lines'},
+     ASSOC_MOCK_FILE, OK],
+
+    ['Verify instance command references --no --where on keys',
+     ['references', 'TST_Person.name="Mike"', '--no', '--where',
+      "InstanceID =~ 'Gabi$' OR member IS NOT NULL"],
+     {'stdout': [FAKEURL_STR + '/root/cimv2:TST_Lineage.InstanceID="MikeGabi"',
+                 FAKEURL_STR + '/root/cimv2:TST_MemberOfFamilyCollection.family'
+                 '="root/cimv2:TST_FamilyCollection.name=\\"Family2\\"",member'
+                 '="root/cimv2:TST_Person.name=\\"Mike\\""'],
+      'rc': 0,
+      'test': 'in'},
+     ASSOC_MOCK_FILE, OK],
+
+    ['Verify instance command references --where on a reference property, '
+     '--verbose reports the evaluation',
+     {'args': ['references', 'TST_Person.name="Mike"', '--summary', '--where',
+               'child = \'/root/cimv2:TST_Person.name="Sofi"\''],
+      'general': ['--verbose']},
+     {'stdout': ['1 CIMInstance(s) returned'],
+      'stderr': ['--where: Evaluated by pywbemcli: child = '
+                 '"/root/cimv2:TST_Person.name=\\"Sofi\\""'],
+      'rc': 0,
+      'test': 'innows'},
+     ASSOC_MOCK_FILE, OK],
+
     ['Verify instance command references -s, returns paths with result '
      'class short form valid returns paths',
      ['references', 'TST_Person.name="Mike"', '-s',
@@ -3121,6 +3520,45 @@ InstanceID      IntegerProp
       'test': 'innows'},
      None, OK],
 
+    ['Verify instance command associators --no -s --limit, returns first '
+     'path',
+     ['associators', 'TST_Person.name="Mike"', '--no', '--summary',
+      '--limit', '1'],
+     {'stdout': ['1 CIMInstanceName(s) returned'],
+      'rc': 0,
+      'test': 'lines'},
+     ASSOC_MOCK_FILE, OK],
+
+    ['Verify instance command associators --where',
+     ['associators', 'TST_Person.name="Mike"', '--where',
+      "name >= 'Q' AND gender = 1"],
+     {'stdout': ['instance of TST_Person {',
+                 'name = "Sofi";',
+                 'gender = 1;',
+                 '};'],
+      'rc': 0,
+      'test': 'linesnows'},
+     ASSOC_MOCK_FILE, OK],
+
+    # The --where filter is evaluated on the instances, whose paths are
+    # returned by the mock WBEM server without host
+    ['Verify instance command associators --no --where',
+     ['associators', 'TST_Person.name="Mike"', '--no', '--where',
+      "name < 'Q'"],
+     {'stdout': ['root/cimv2:TST_FamilyCollection.name="Family2"',
+                 'root/cimv2:TST_Person.name="Gabi"'],
+      'rc': 0,
+      'test': 'in'},
+     ASSOC_MOCK_FILE, OK],
+
+    ['Verify instance command associators --no --where --summary',
+     ['associators', 'TST_Person.name="Mike"', '--no', '--where',
+      "name < 'Q'", '--summary'],
+     {'stdout': ['2 CIMInstanceName(s) returned'],
+      'rc': 0,
+      'test': 'lines'},
+     ASSOC_MOCK_FILE, OK],
+
     ['Verify instance command associators, returns instances',
      ['associators', 'TST_Person.name="Mike"'],
      {'stdout': ASSOC_INSTS,
@@ -3451,6 +3889,80 @@ interop      TST_Personsub                       ignored
       'test': 'linesnows'},
      ASSOC_MOCK_FILE, OK],
 
+    ['Verify instance command count *, assoc model, format plain, '
+     '--ignore-class, --max-parallel 4',
+     {'args': ['count', '*', '--ignore-class', 'TST_Lineage'],
+      'general': ['--default-namespace', 'interop', '--output-format',
+                  'plain', '--max-parallel', '4']},
+     {'stdout': """Count of instances per class
+Namespace    Class                           count
+interop      TST_FamilyCollection                2
+interop      TST_Lineage                         ignored
+interop      TST_MemberOfFamilyCollection        3
+interop      TST_Person                          4
+interop      TST_Personsub                       4
+""",
+      'rc': 0,
+      'test': 'linesnows'},
+     ASSOC_MOCK_FILE, OK],
+
+    ['Verify instance command count CIM_Foo*, --ignore-class subclass, '
+     'instances of ignored class not counted, fmt plain',
+     {'args': ['count', 'CIM_Foo*', '--ignore-class', 'CIM_Foo_sub'],
+      'general': ['--output-format', 'plain']},
+     {'stdout': """Count of instances per class
+Namespace    Class            count
+root/cimv2   CIM_Foo          5
+root/cimv2   CIM_FooAssoc     1
+root/cimv2   CIM_FooRef1      1
+root/cimv2   CIM_FooRef2      1
+root/cimv2   CIM_Foo_sub      ignored
+root/cimv2   CIM_Foo_sub_sub  3
+""",
+      'rc': 0,
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command count CIM_Foo*, --ignore-class subclass, '
+     'subtree with ignored class enumerated once',
+     {'args': ['count', 'CIM_Foo*', '--ignore-class', 'CIM_Foo_sub'],
+      'general': ['--log', 'api=stderr']},
+     {'stderr': ["OpenEnumerateInstancePaths(ClassName='CIM_Foo',"],
+      'rc': 0,
+      'test': 'innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command count CIM_Foo*, --ignore-class subclass, '
+     'subclasses of superclass are not enumerated separately',
+     {'args': ['count', 'CIM_Foo*', '--ignore-class', 'CIM_Foo_sub'],
+      'general': ['--log', 'api=stderr']},
+     {'stderr': ["ClassName='CIM_Foo_sub_sub',"],
+      'rc': 0,
+      'test': 'not-innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command count CIM_Foo*, --ignore-class subclass, '
+     'ignored class is not requested by itself',
+     {'args': ['count', 'CIM_Foo*', '--ignore-class', 'CIM_Foo_sub'],
+      'general': ['--log', 'api=stderr']},
+     {'stderr': ["ClassName='CIM_Foo_sub',"],
+      'rc': 0,
+      'test': 'not-innows'},
+     SIMPLE_MOCK_FILE, OK],
+
+    ['Verify instance command count CIM_Foo_sub*, subclass counted with '
+     'superclass scan, fmt plain',
+     {'args': ['count', 'CIM_Foo_sub*'],
+      'general': ['--output-format', 'plain']},
+     {'stdout': """Count of instances per class
+Namespace    Class              count
+root/cimv2   CIM_Foo_sub            4
+root/cimv2   CIM_Foo_sub_sub        3
+""",
+      'rc': 0,
+      'test': 'linesnows'},
+     SIMPLE_MOCK_FILE, OK],
+
     ['Verify instance command count *Person*, assoc model, default format',
      {'args': ['count', '*Person*'],
       'general': ['--default-namespace', 'interop']},
@@ -4748,6 +5260,42 @@ instance of CIM_FooAssoc {
       'test': 'innows'},
      THREE_NS_MOCK_FILE, OK],
 
+    ['Verify instance enumerate two namespaces --summary, --max-parallel 2',
+     {'args': ['enumerate', 'CIM_Foo', '--summary',
+               '--namespace', 'root/cimv2,root/INV,root/cimv3'],
+      'general': ['--output-format', 'table', '--max-parallel', '2']},
+     {'stdout': """Summary of CIMInstance(s) returned
++-------------+---------+-------------+
+| Namespace   |   Count | CIM Type    |
+|-------------+---------+-------------|
+| root/cimv2  |      12 | CIMInstance |
+| root/INV    |       0 | CIMInstance |
+| root/cimv3  |      13 | CIMInstance |
++-------------+---------+-------------+
+""",
+      'stderr': ["namespace:root/INV", "CIM_ERR_INVALID_NAMESPACE"],
+      'rc': 1,
+      'test': 'innows'},
+     THREE_NS_MOCK_FILE, OK],
+
+    ['Verify instance get from two namespaces, --max-parallel 2',
+     {'args': ['get', 'CIM_Foo.InstanceID="CIM_Foo1"',
+               '--namespace', 'root/cimv2,root/cimv3'],
+      'general': ['--max-parallel', '2']},
+     {'stdout': ['#pragma namespace ("root/cimv2")',
+                 "instance of CIM_Foo {",
+                 'InstanceID = "CIM_Foo1";',
+                 "IntegerProp = 1;",
+                 "};",
+                 '#pragma namespace ("root/cimv3")',
+                 "instance of CIM_Foo {",
+                 'InstanceID = "CIM_Foo1";',
+                 "IntegerProp = 1;",
+                 "};"],
+      'rc': 0,
+      'test': 'linesnows'},
+     THREE_NS_MOCK_FILE, OK],
+
     ['Verify instance get from one namespace, invalid namespace',
      {'args': ['get', 'CIM_Foo', '--key', 'InstanceID=CIM_Foo1',
                '--namespace', 'root/InvalidNamespace']},
@@ -14,9 +14,12 @@
 Tests the namespace creation behavior.
 """
 
+import shutil
 
 import pytest
 
+from pywbemtools.pywbemcli._connection_file_names import MOCKCACHE_ROOT_DIR
+
 from .cli_test_extensions import CLITestsBase
 
 # pylint: disable=use-dict-literal
@@ -431,6 +434,15 @@ TEST_CASES = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def remove_mockcache():
+    """
+    Remove the mock cache before each testcase, because the testcases verify
+    the output of building the mock environment.
+    """
+    shutil.rmtree(MOCKCACHE_ROOT_DIR, ignore_errors=True)
+
+
 class TestNamespaceCreation(CLITestsBase):
     # pylint: disable=too-few-public-methods
     """
@@ -0,0 +1,228 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _pull_tuning module and the adaptive MaxObjectCount of the
+pull operations of PYWBEMCLIConnection.
+"""
+
+import json
+
+import pytest
+import pywbem
+import pywbem_mock
+from pywbem import _statistics
+
+from pywbemtools.pywbemcli._pull_tuning import PullTuner, pull_tuning_key
+from pywbemtools.pywbemcli._pywbemcli_operations import PYWBEMCLIConnection
+
+MOF = """
+Qualifier Key : boolean = false,
+    Scope(property, reference),
+    Flavor(DisableOverride, ToSubclass);
+
+class CIM_Foo {
+    [Key] string InstanceID;
+};
+"""
+
+KEY = pull_tuning_key('EnumerateInstances', 'root/cimv2', 'CIM_Foo')
+
+
+def create_tuner(tmp_path, target_time=1.0, default_count=100, **kwargs):
+    """Return a PullTuner with its file in tmp_path"""
+    return PullTuner(str(tmp_path / 'cache'), target_time, default_count,
+                     **kwargs)
+
+
+class FakeClock:
+    # pylint: disable=too-few-public-methods
+    """Replaces the time module of the pywbem operation statistics"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        """Return the simulated time"""
+        return self.now
+
+
+def create_connection(monkeypatch, tmp_path, instances, per_object_time,
+                      requests):
+    """
+    Return a PYWBEMCLIConnection with a pull tuner in tmp_path whose requests
+    are executed by a mock connection with the number of CIM_Foo instances
+    in instances. The response time of each request is simulated as
+    per_object_time per requested object. The operation name and
+    MaxObjectCount of each request is recorded in the list requests.
+    """
+    clock = FakeClock()
+    monkeypatch.setattr(_statistics, 'time', clock)
+
+    fake = pywbem_mock.FakedWBEMConnection()
+    fake.compile_mof_string(MOF, namespace='root/cimv2')
+    for i in range(instances):
+        inst = pywbem.CIMInstance(
+            'CIM_Foo', properties={'InstanceID': f'foo{i}'},
+            path=pywbem.CIMInstanceName(
+                'CIM_Foo', keybindings={'InstanceID': f'foo{i}'}))
+        fake.add_cimobjects(inst, namespace='root/cimv2')
+
+    conn = PYWBEMCLIConnection('http://blah', use_pull_operations=True,
+                               stats_enabled=True)
+
+    def imethodcall(methodname, *args, **kwargs):
+        max_object_count = kwargs.get('MaxObjectCount')
+        requests.append((methodname, max_object_count))
+        # pylint: disable=protected-access
+        clock.now += per_object_time * (max_object_count or 0)
+        conn._last_reply_len = 100 * (max_object_count or 0)
+        return fake._imethodcall(methodname, *args, **kwargs)
+
+    # pylint: disable=protected-access
+    conn._imethodcall = imethodcall
+    conn.pull_tuner = create_tuner(tmp_path)
+    return conn
+
+
+def test_pull_tuning_key():
+    """Test that the key is independent of the case of the names"""
+    assert pull_tuning_key('EnumerateInstances', '/root/CIMv2', 'CIM_FOO') == \
+        ('EnumerateInstances', 'root/cimv2', 'cim_foo')
+
+
+@pytest.mark.parametrize(
+    "count, objects, elapsed, reply_len, exp_count", [
+        # Fast responses grow by at most MAX_CHANGE_FACTOR
+        (100, 100, 0.01, None, 200),
+        # Slow responses shrink by at most MAX_CHANGE_FACTOR
+        (100, 100, 10.0, None, 50),
+        # Within the change limits, the count that hits the target time
+        (100, 100, 0.8, None, 125),
+        (100, 100, 1.25, None, 80),
+        # Large objects limit the count by the reply size
+        (100, 100, 0.01, 100 * 1024, 100),
+        # Fast partial responses do not grow the count
+        (100, 10, 0.01, None, None),
+        # Slow partial responses shrink the count
+        (100, 10, 2.0, None, 50),
+        # Empty responses and missing times are ignored
+        (100, 0, 1.0, None, None),
+        (100, 100, None, None, None),
+        # Bounds
+        (12, 12, 10.0, None, 10),
+        (900, 900, 0.01, None, 1000),
+    ])
+def test_pull_tuner_update(tmp_path, count, objects, elapsed, reply_len,
+                           exp_count):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Test the adaptation of MaxObjectCount from one response"""
+    tuner = create_tuner(tmp_path, max_count=1000, max_reply_len=100 * 1024)
+    tuner.update(KEY, count, objects, elapsed, reply_len)
+    if exp_count is None:
+        assert tuner.counts() == {}
+        assert tuner.max_object_count(KEY, count) == count
+    else:
+        assert tuner.counts() == {KEY: exp_count}
+        assert tuner.max_object_count(KEY, count) == exp_count
+
+
+def test_pull_tuner_save(tmp_path):
+    """
+    Test that the adapted values are used by a new PullTuner object (as in a
+    new process), and that invalid files are ignored.
+    """
+    tuner = create_tuner(tmp_path)
+    tuner.save()
+    assert not (tmp_path / 'cache').exists()
+
+    tuner.update(KEY, 100, 100, 0.01, None)
+    tuner.save()
+
+    tuner2 = create_tuner(tmp_path)
+    assert tuner2.counts() == {KEY: 200}
+    assert tuner2.max_object_count(KEY, 100) == 200
+
+    with open(tuner.tuning_file, encoding='utf-8') as fp:
+        data = json.load(fp)
+    data['version'] = 0
+    with open(tuner.tuning_file, 'w', encoding='utf-8') as fp:
+        json.dump(data, fp)
+    assert create_tuner(tmp_path).counts() == {}
+
+    with open(tuner.tuning_file, 'w', encoding='utf-8') as fp:
+        fp.write('{')
+    assert create_tuner(tmp_path).counts() == {}
+
+
+def test_adaptive_pull(monkeypatch, tmp_path):
+    """
+    Test that the pull operations of an enumeration use the adapted
+    MaxObjectCount, and that later enumerations start with it.
+    """
+    requests = []
+    conn = create_connection(monkeypatch, tmp_path, 1000, 0.001, requests)
+
+    paths = [inst.path.keybindings['InstanceID'] for inst in
+             conn.IterEnumerateInstances('CIM_Foo', namespace='root/cimv2',
+                                         MaxObjectCount=100)]
+    assert len(paths) == 1000
+    assert requests == [('OpenEnumerateInstances', 100),
+                        ('PullInstancesWithPath', 200),
+                        ('PullInstancesWithPath', 400),
+                        ('PullInstancesWithPath', 800)]
+    # The last response had less objects than requested
+    assert conn.pull_tuner.counts() == {KEY: 800}
+    # pylint: disable=protected-access
+    assert conn._pull_keys == {}
+
+    # A copy of the connection (e.g. for concurrent requests) uses the same
+    # adapted values
+    conn2 = conn.copy()
+    assert conn2.pull_tuner is conn.pull_tuner
+
+    # Requests with a smaller MaxObjectCount (e.g. for --limit) are not
+    # adapted.
+    del requests[:]
+    insts = conn.IterEnumerateInstances('CIM_Foo', namespace='root/cimv2',
+                                        MaxObjectCount=5)
+    assert len(list(insts)) == 1000
+    assert requests[0] == ('OpenEnumerateInstances', 5)
+    assert {count for _, count in requests} == {5}
+
+    del requests[:]
+    insts = conn.IterEnumerateInstances('CIM_Foo', namespace='root/cimv2',
+                                        MaxObjectCount=100)
+    assert len(list(insts)) == 1000
+    assert requests == [('OpenEnumerateInstances', 800),
+                        ('PullInstancesWithPath', 1000)]
+
+
+def test_adaptive_pull_close(monkeypatch, tmp_path):
+    """Test that an enumeration that is closed early is forgotten"""
+    requests = []
+    conn = create_connection(monkeypatch, tmp_path, 1000, 0.02, requests)
+
+    insts = conn.IterEnumerateInstances('CIM_Foo', namespace='root/cimv2',
+                                        MaxObjectCount=100)
+    next(insts)
+    # pylint: disable=protected-access
+    assert len(conn._pull_keys) == 1
+    insts.close()
+    assert conn._pull_keys == {}
+    assert requests == [('OpenEnumerateInstances', 100),
+                        ('CloseEnumeration', None)]
+    assert conn.pull_tuner.counts() == {KEY: 50}
@@ -15,21 +15,29 @@
 # limitations under the License.
 
 """
-Unit tests for _pywbemcli_operations module.
+Unit tests for _pywbemcli_operations and _pywbemcli_faked_connection modules.
 """
 
 import sys
 import os
 import glob
 import re
+import time
+import pickle
 import warnings
 import packaging.version
 import urllib3
 import pytest
 import pywbem
 
-from pywbemtools.pywbemcli._pywbemcli_operations import PYWBEMCLIFakedConnection
+from pywbemtools.pywbemcli import _pywbemcli_faked_connection, \
+    _mockcache_file
+from pywbemtools.pywbemcli._pywbemcli_faked_connection import \
+    PYWBEMCLIFakedConnection, BuildMockenvMixin
+from pywbemtools.pywbemcli._pywbemcli_operations import cleanup_mock_caches, \
+    prefetched
 from pywbemtools._utils import ensure_unicode
+from pywbemtools.pywbemcli._connection_pool import statistics_snapshot
 from pywbemtools.pywbemcli._connection_file_names import \
     MOCKCACHE_ROOT_DIR, DEFAULT_CONNECTIONS_DIR, DEFAULT_CONNECTIONS_FILE, \
     BAK_FILE_SUFFIX
@@ -789,31 +797,92 @@ TESTCASES_BUILD_MOCKENV = [
         DeprecationWarning if RETRY_DEPRECATION else None, OK
     ),
 
-    # Testcases with non-cacheable user-specified connections file
+    # Testcases with user-specified connections file
     (
-        "Mock env with user-specified connections file",
+        "Mock env with user-specified connections file, "
+        "cache does not exist",
         dict(
             test_mode='build',
             verbose=True,
             connections_file=USER_CONNECTIONS_FILE,
-            default_namespace=SIMPLE_V1_OLD_NAMESPACE,
-            mock_files=SIMPLE_V1_OLD_MOCK_FILES,
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE,
+            mock_files=SIMPLE_V1_NEW_MOCK_FILES,
             exp_dep_files=[],
-            exp_classes=SIMPLE_V1_OLD_EXP_CLASSES,
-            exp_providers=SIMPLE_V1_OLD_EXP_PROVIDERS,
+            exp_classes=SIMPLE_V1_NEW_EXP_CLASSES,
+            exp_providers=SIMPLE_V1_NEW_EXP_PROVIDERS,
             exp_stdout_lines=[
-                "Mock environment .* will be built because user-specified "
-                "connections files are not cached",
-            ] if NEWSTYLE_SUPPORTED else [
-                "Mock environment .* will be built because user-specified "
-                "connections files are not cached",
-                "Mock environment .* will be built because it is not "
-                "cacheable",
+                "Mock environment .* will be built because it was not cached.",
+                "Mock environment .* has been written to cache.",
             ],
             exp_stdout_lines_all=False,
             exp_stderr_lines=[],
         ),
-        None, DeprecatedSetupWarning, OK
+        None if NEWSTYLE_SUPPORTED else SetupNotSupportedError,
+        DeprecationWarning if RETRY_DEPRECATION else None, OK
+    ),
+    (
+        "Mock env with user-specified connections file, "
+        "cache exists, and load succeeds",
+        dict(
+            test_mode='load',
+            verbose=True,
+            connections_file=USER_CONNECTIONS_FILE,
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE,
+            mock_files=SIMPLE_V1_NEW_MOCK_FILES,
+            exp_dep_files=[],
+            exp_classes=SIMPLE_V1_NEW_EXP_CLASSES,
+            exp_providers=SIMPLE_V1_NEW_EXP_PROVIDERS,
+            exp_stdout_lines=[
+                "Mock environment .* has been loaded from cache.",
+            ],
+            exp_stdout_lines_all=True,
+            exp_stderr_lines=[],
+        ),
+        None if NEWSTYLE_SUPPORTED else SetupNotSupportedError,
+        DeprecationWarning if RETRY_DEPRECATION else None, OK
+    ),
+
+    # Testcases without connections file (--mock-server general option)
+    (
+        "Mock env without connections file, cache does not exist",
+        dict(
+            test_mode='build',
+            verbose=True,
+            connections_file=None,
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE,
+            mock_files=SIMPLE_V1_NEW_MOCK_FILES,
+            exp_dep_files=[],
+            exp_classes=SIMPLE_V1_NEW_EXP_CLASSES,
+            exp_providers=SIMPLE_V1_NEW_EXP_PROVIDERS,
+            exp_stdout_lines=[
+                "Mock environment .* will be built because it was not cached.",
+                "Mock environment .* has been written to cache.",
+            ],
+            exp_stdout_lines_all=False,
+            exp_stderr_lines=[],
+        ),
+        None if NEWSTYLE_SUPPORTED else SetupNotSupportedError,
+        DeprecationWarning if RETRY_DEPRECATION else None, OK
+    ),
+    (
+        "Mock env without connections file, cache exists, and load succeeds",
+        dict(
+            test_mode='load',
+            verbose=True,
+            connections_file=None,
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE,
+            mock_files=SIMPLE_V1_NEW_MOCK_FILES,
+            exp_dep_files=[],
+            exp_classes=SIMPLE_V1_NEW_EXP_CLASSES,
+            exp_providers=SIMPLE_V1_NEW_EXP_PROVIDERS,
+            exp_stdout_lines=[
+                "Mock environment .* has been loaded from cache.",
+            ],
+            exp_stdout_lines_all=True,
+            exp_stderr_lines=[],
+        ),
+        None if NEWSTYLE_SUPPORTED else SetupNotSupportedError,
+        DeprecationWarning if RETRY_DEPRECATION else None, OK
     ),
 
     # Testcases with standalone mock script that has dependents
@@ -907,9 +976,6 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
 
         elif test_mode == 'load':
 
-            # This test only makes sense when caching is possible
-            assert connections_file == DEFAULT_CONNECTIONS_FILE
-
             conn = PYWBEMCLIFakedConnection(default_namespace=default_namespace)
             server = pywbem.WBEMServer(conn)
             conn.build_mockenv(server, mock_files, connections_file,
@@ -926,9 +992,6 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
 
         elif test_mode == 'load_rebuild_missing_pklfile':
 
-            # This test only makes sense when caching is possible
-            assert connections_file == DEFAULT_CONNECTIONS_FILE
-
             conn = PYWBEMCLIFakedConnection(default_namespace=default_namespace)
             server = pywbem.WBEMServer(conn)
             conn.build_mockenv(server, mock_files, connections_file,
@@ -949,9 +1012,6 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
 
         elif test_mode == 'load_rebuild_missing_md5file':
 
-            # This test only makes sense when caching is possible
-            assert connections_file == DEFAULT_CONNECTIONS_FILE
-
             conn = PYWBEMCLIFakedConnection(default_namespace=default_namespace)
             server = pywbem.WBEMServer(conn)
             conn.build_mockenv(server, mock_files, connections_file,
@@ -972,9 +1032,6 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
 
         elif test_mode == 'load_rebuild_missing_depfile':
 
-            # This test only makes sense when caching is possible
-            assert connections_file == DEFAULT_CONNECTIONS_FILE
-
             conn = PYWBEMCLIFakedConnection(default_namespace=default_namespace)
             server = pywbem.WBEMServer(conn)
             conn.build_mockenv(server, mock_files, connections_file,
@@ -995,9 +1052,6 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
 
         elif test_mode == 'load_rebuild_changed_moffile':
 
-            # This test only makes sense when caching is possible
-            assert connections_file == DEFAULT_CONNECTIONS_FILE
-
             conn = PYWBEMCLIFakedConnection(default_namespace=default_namespace)
             server = pywbem.WBEMServer(conn)
             conn.build_mockenv(server, mock_files, connections_file,
@@ -1025,9 +1079,6 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
 
         elif test_mode == 'load_rebuild_changed_pyfile':
 
-            # This test only makes sense when caching is possible
-            assert connections_file == DEFAULT_CONNECTIONS_FILE
-
             conn = PYWBEMCLIFakedConnection(default_namespace=default_namespace)
             server = pywbem.WBEMServer(conn)
             conn.build_mockenv(server, mock_files, connections_file,
@@ -1055,9 +1106,6 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
 
         elif test_mode == 'load_rebuild_changed_depfile':
 
-            # This test only makes sense when caching is possible
-            assert connections_file == DEFAULT_CONNECTIONS_FILE
-
             conn = PYWBEMCLIFakedConnection(default_namespace=default_namespace)
             server = pywbem.WBEMServer(conn)
             conn.build_mockenv(server, mock_files, connections_file,
@@ -1164,3 +1212,459 @@ def test_build_mockenv(testcase, test_mode, verbose, connections_file,
             "---- Expected (regexp):\n" \
             f"{regexp}\n" \
             "---- End\n"
+
+
+def test_build_mockenv_manifest(monkeypatch):
+    """
+    Test that BuildMockenvMixin.build_mockenv() validates the mock cache from
+    the file status in the manifest without reading the mock files, and reads
+    a mock file again only when its file status has changed.
+    """
+    connection_name = 'test_build_mockenv_manifest'
+    mock_files = SIMPLE_V1_NEW_MOCK_FILES
+    mof_file = mock_files[0]
+
+    # Files whose MD5 hash value is calculated
+    md5_files = []
+    orig_file_md5 = BuildMockenvMixin._file_md5
+
+    def file_md5(file_path):
+        md5_files.append(file_path)
+        return orig_file_md5(file_path)
+
+    monkeypatch.setattr(BuildMockenvMixin, '_file_md5',
+                        staticmethod(file_md5))
+
+    def build_mockenv():
+        """Build the mock env and return the stdout lines"""
+        conn = PYWBEMCLIFakedConnection(
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE)
+        server = pywbem.WBEMServer(conn)
+        del md5_files[:]
+        with captured_output() as captured:
+            conn.build_mockenv(server, mock_files, DEFAULT_CONNECTIONS_FILE,
+                               connection_name, True)
+        return captured.stdout
+
+    remove_mockcache(connection_name)
+    save_default_connections_file()
+    try:
+        assert 'has been written to cache' in build_mockenv()
+        assert set(md5_files) == set(mock_files)
+
+        assert 'has been loaded from cache' in build_mockenv()
+        assert md5_files == []
+
+        # Change the modification time but not the content of the MOF file
+        st = os.stat(mof_file)
+        os.utime(mof_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        try:
+            assert 'has been loaded from cache' in build_mockenv()
+            assert md5_files == [mof_file]
+
+            assert 'has been loaded from cache' in build_mockenv()
+            assert md5_files == []
+        finally:
+            os.utime(mof_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    finally:
+        remove_mockcache(connection_name)
+        restore_default_connections_file()
+
+
+def patch_mockcache_root_dir(monkeypatch, root_dir):
+    """
+    Set the mock cache root directory of the pywbemcli modules to root_dir.
+    """
+    for module in (_pywbemcli_faked_connection, _mockcache_file):
+        monkeypatch.setattr(module, 'MOCKCACHE_ROOT_DIR', root_dir)
+
+
+def test_build_mockenv_schema_cache(monkeypatch, tmp_path):
+    """
+    Test that BuildMockenvMixin.build_mockenv() shares the compiled schema of
+    the leading MOF files between mock environments, and that the mock cache
+    of a connection references the CIM objects of the compiled schema.
+    """
+    patch_mockcache_root_dir(monkeypatch, str(tmp_path / 'mockcache'))
+    mof_file, script_file = SIMPLE_V1_NEW_MOCK_FILES
+    extra_mof_file = str(tmp_path / 'extra.mof')
+    with open(extra_mof_file, 'w', encoding='utf-8') as fp:
+        fp.write('class CIM_Extra : CIM_Foo {};\n')
+
+    # MOF files that are compiled
+    compiled_files = []
+    orig_compile_mof_file = PYWBEMCLIFakedConnection.compile_mof_file
+
+    def compile_mof_file(self, mof_file, *args, **kwargs):
+        compiled_files.append(mof_file)
+        return orig_compile_mof_file(self, mof_file, *args, **kwargs)
+
+    monkeypatch.setattr(PYWBEMCLIFakedConnection, 'compile_mof_file',
+                        compile_mof_file)
+
+    def build_mockenv(mock_files):
+        """Build the mock env and return the connection and stdout"""
+        conn = PYWBEMCLIFakedConnection(
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE)
+        server = pywbem.WBEMServer(conn)
+        del compiled_files[:]
+        with captured_output() as captured:
+            conn.build_mockenv(server, mock_files, None, 'not-saved', True)
+        return conn, captured.stdout
+
+    def class_exists(conn, classname):
+        """Return whether the class exists in the mock repository"""
+        return conn.cimrepository.get_class_store(
+            SIMPLE_V1_NEW_NAMESPACE).object_exists(classname)
+
+    def schema_files():
+        """Return the pickle files of the compiled schema caches"""
+        return glob.glob(os.path.join(
+            str(tmp_path / 'mockcache'), '*.schema', 'schema.pkl'))
+
+    _, stdout = build_mockenv([mof_file, script_file])
+    assert 'has been written to cache' in stdout
+    assert compiled_files == [mof_file]
+    assert len(schema_files()) == 1
+
+    # A mock environment with the same schema does not compile it
+    conn, stdout = build_mockenv([mof_file])
+    assert 'Compiled schema of mock files' in stdout
+    assert compiled_files == []
+    assert class_exists(conn, 'CIM_Foo')
+    mockenv_file = glob.glob(os.path.join(
+        str(tmp_path / 'mockcache'), '*.not-saved', 'mockenv.pkl'))[0]
+    assert os.path.getsize(mockenv_file) < \
+        os.path.getsize(schema_files()[0]) / 2
+
+    # An additional MOF file is compiled on top of the compiled schema
+    conn, stdout = build_mockenv([mof_file, extra_mof_file])
+    assert compiled_files == [extra_mof_file]
+    assert class_exists(conn, 'CIM_Extra')
+    assert len(schema_files()) == 2
+
+    conn, stdout = build_mockenv([mof_file, extra_mof_file])
+    assert 'has been loaded from cache' in stdout
+    assert compiled_files == []
+    assert class_exists(conn, 'CIM_Foo')
+    assert class_exists(conn, 'CIM_Extra')
+
+    # The mock environment is rebuilt when the compiled schema cache has
+    # been removed
+    for schema_file in schema_files():
+        os.remove(schema_file)
+    conn, stdout = build_mockenv([mof_file, extra_mof_file])
+    assert 'is cached but will be rebuilt' in stdout
+    assert compiled_files == [mof_file, extra_mof_file]
+    assert class_exists(conn, 'CIM_Extra')
+
+
+def test_build_mockenv_layers(monkeypatch, tmp_path):
+    """
+    Test that BuildMockenvMixin.build_mockenv() rebuilds a mock environment
+    from the cached layer of the last unchanged mock file, and that the
+    providers registered by the mock scripts of the cached layers are
+    restored.
+    """
+    patch_mockcache_root_dir(monkeypatch, str(tmp_path / 'mockcache'))
+    mof_file, provider_script = SIMPLE_V1_NEW_MOCK_FILES
+    layer_provider_script = str(tmp_path / 'layer_provider_script.py')
+    with open(provider_script, encoding='utf-8') as fp:
+        provider_script_content = fp.read()
+    with open(layer_provider_script, 'w', encoding='utf-8') as fp:
+        fp.write(provider_script_content)
+    layer_extra_script = str(tmp_path / 'layer_extra_script.py')
+    extra_script_content = (
+        'def setup(conn, server, verbose):\n'
+        '    conn.compile_mof_string("class CIM_Extra : CIM_Foo {};")\n')
+    with open(layer_extra_script, 'w', encoding='utf-8') as fp:
+        fp.write(extra_script_content)
+    mock_files = [mof_file, layer_provider_script, layer_extra_script]
+
+    # Mock scripts whose setup is performed
+    setup_scripts = []
+    orig_setup_script = _pywbemcli_faked_connection.mockscripts.setup_script
+
+    def setup_script(file_path, *args):
+        setup_scripts.append(file_path)
+        return orig_setup_script(file_path, *args)
+
+    monkeypatch.setattr(_pywbemcli_faked_connection.mockscripts,
+                        'setup_script', setup_script)
+
+    def build_mockenv():
+        """Build the mock env and return the connection and stdout"""
+        conn = PYWBEMCLIFakedConnection(
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE)
+        server = pywbem.WBEMServer(conn)
+        del setup_scripts[:]
+        with captured_output() as captured:
+            conn.build_mockenv(server, mock_files, None, 'not-saved', True)
+        return conn, captured.stdout
+
+    def check_mockenv(conn):
+        """Check the classes and providers of the mock env"""
+        class_store = conn.cimrepository.get_class_store(
+            SIMPLE_V1_NEW_NAMESPACE)
+        assert class_store.object_exists('CIM_Foo')
+        assert class_store.object_exists('CIM_Extra')
+        # pylint: disable=protected-access
+        for ns, cln, pt, _ in SIMPLE_V1_NEW_EXP_PROVIDERS:
+            assert conn._provider_registry.get_registered_provider(
+                ns, pt, cln)
+
+    def layer_files():
+        """Return the layer files in the mock cache of the connection"""
+        return glob.glob(os.path.join(
+            str(tmp_path / 'mockcache'), '*.not-saved', 'layer*.pkl'))
+
+    conn, _ = build_mockenv()
+    assert setup_scripts == [layer_provider_script, layer_extra_script]
+    check_mockenv(conn)
+    assert len(layer_files()) == 1
+
+    # Only the changed last mock script is set up again
+    with open(layer_extra_script, 'a', encoding='utf-8') as fp:
+        fp.write('# changed\n')
+    conn, stdout = build_mockenv()
+    assert 'loaded from cache up to mock file ' \
+        f'{layer_provider_script}' in stdout
+    assert setup_scripts == [layer_extra_script]
+    check_mockenv(conn)
+
+    conn, stdout = build_mockenv()
+    assert 'has been loaded from cache' in stdout
+    assert setup_scripts == []
+    check_mockenv(conn)
+
+    # All mock scripts after a changed mock script are set up again
+    with open(layer_provider_script, 'a', encoding='utf-8') as fp:
+        fp.write('# changed\n')
+    conn, stdout = build_mockenv()
+    assert 'up to mock file' not in stdout
+    assert setup_scripts == [layer_provider_script, layer_extra_script]
+    check_mockenv(conn)
+    assert len(layer_files()) == 1
+
+
+def test_build_mockenv_lazy_load(monkeypatch, tmp_path):
+    """
+    Test that the object stores of a mock environment loaded from the mock
+    cache are unpickled from their sections of the mockenv pickle file when
+    they are used for the first time.
+    """
+    patch_mockcache_root_dir(monkeypatch, str(tmp_path / 'mockcache'))
+
+    def build_mockenv():
+        """Build the mock env and return the connection and stdout"""
+        conn = PYWBEMCLIFakedConnection(
+            default_namespace=SIMPLE_V1_NEW_NAMESPACE)
+        server = pywbem.WBEMServer(conn)
+        with captured_output() as captured:
+            conn.build_mockenv(server, SIMPLE_V1_NEW_MOCK_FILES, None,
+                               'not-saved', True)
+        return conn, captured.stdout
+
+    _, stdout = build_mockenv()
+    assert 'has been written to cache' in stdout
+    mockenv_file = glob.glob(os.path.join(
+        str(tmp_path / 'mockcache'), '*.not-saved', 'mockenv.pkl'))[0]
+    with open(mockenv_file, 'rb') as fp:
+        assert fp.read().startswith(_mockcache_file.MOCKCACHE_FILE_MAGIC)
+
+    conn, stdout = build_mockenv()
+    assert 'has been loaded from cache' in stdout
+    repo = conn.cimrepository
+    class_store = repo.get_class_store(SIMPLE_V1_NEW_NAMESPACE)
+    instance_store = repo.get_instance_store(SIMPLE_V1_NEW_NAMESPACE)
+    # pylint: disable=protected-access
+    assert isinstance(class_store, _mockcache_file._LazyObjectStore)
+    assert class_store._loader is not None
+    assert instance_store._loader is not None
+
+    assert class_store.object_exists('CIM_Foo')
+    assert class_store._loader is None
+    assert instance_store._loader is not None
+    assert instance_store.len() > 0
+    assert instance_store._loader is None
+
+    # Mock cache files written as a single pickle are still loaded
+    pickle_file = str(tmp_path / 'single.pkl')
+    with open(pickle_file, 'wb') as fp:
+        pickle.dump({'cimrepository': repo}, fp)
+    reader = _mockcache_file.MockCacheReader(pickle_file)
+    repo2 = reader.load()['cimrepository']
+    assert repo2.get_class_store(SIMPLE_V1_NEW_NAMESPACE).object_exists(
+        'CIM_Foo')
+
+
+@pytest.mark.parametrize(
+    "use_pull, limit, exp_count, exp_max_object_count, exp_closed", [
+        (True, None, 12, [5, 5, 5], False),
+        (True, 3, 3, [3], True),
+        (True, 7, 7, [5, 5], True),
+        (True, 12, 12, [5, 5, 5], False),
+        (False, 3, 3, [], False),
+    ])
+def test_pywbemcli_enumerate_limit(use_pull, limit, exp_count,
+                                   exp_max_object_count, exp_closed):
+    """
+    Test that the Limit parameter of PyWbemcliEnumerateInstances() stops
+    the pull operations after the limit and closes the enumeration context.
+    """
+    conn = PYWBEMCLIFakedConnection(default_namespace=SIMPLE_V1_NEW_NAMESPACE,
+                                    use_pull_operations=use_pull)
+    conn.compile_mof_file(os.path.join(SCRIPT_DIR, 'simple_mock_model.mof'))
+
+    max_object_counts = []
+    closed = []
+    orig_open = conn.OpenEnumerateInstances
+    orig_pull = conn.PullInstancesWithPath
+
+    def open_enum(*args, **kwargs):
+        max_object_counts.append(kwargs['MaxObjectCount'])
+        return orig_open(*args, **kwargs)
+
+    def pull(*args, **kwargs):
+        max_object_counts.append(kwargs['MaxObjectCount'])
+        return orig_pull(*args, **kwargs)
+
+    conn.OpenEnumerateInstances = open_enum
+    conn.PullInstancesWithPath = pull
+    conn.CloseEnumeration = closed.append
+
+    instances = conn.PyWbemcliEnumerateInstances(
+        'CIM_Foo', MaxObjectCount=5, Limit=limit)
+
+    assert len(instances) == exp_count
+    assert max_object_counts == exp_max_object_count
+    assert bool(closed) == exp_closed
+
+
+class PrefetchConn:
+    # pylint: disable=too-few-public-methods
+    """Connection for testing prefetched() that records its closing"""
+    closed = False
+
+    def close(self):
+        """Close the connection"""
+        self.closed = True
+
+
+def test_prefetched():
+    """
+    Test that prefetched() retrieves the objects in a background thread
+    ahead of the caller, passes exceptions through, and closes the generator
+    and the connection when the caller stops early.
+    """
+    produced = []
+    closed = []
+
+    def request(conn, num, fail=False):
+        """Generator for num objects that records its progress"""
+        assert isinstance(conn, PrefetchConn)
+        try:
+            for i in range(num):
+                produced.append(i)
+                yield i
+            if fail:
+                raise ValueError('failed')
+        finally:
+            closed.append(True)
+
+    conn = PrefetchConn()
+    assert list(prefetched(lambda c: request(c, 10), conn, 3)) == \
+        list(range(10))
+    assert closed and conn.closed
+
+    # The background thread retrieves up to 3 objects ahead of the caller
+    del produced[:]
+    del closed[:]
+    conn = PrefetchConn()
+    result = prefetched(lambda c: request(c, 100), conn, 3)
+    assert next(result) == 0
+    for _ in range(50):
+        if len(produced) >= 4:
+            break
+        time.sleep(0.1)
+    time.sleep(0.1)
+    assert 4 <= len(produced) <= 6
+    result.close()
+    assert closed and conn.closed
+    assert len(produced) <= 7
+
+    conn = PrefetchConn()
+    result = prefetched(lambda c: request(c, 2, fail=True), conn, 3)
+    assert next(result) == 0
+    assert next(result) == 1
+    with pytest.raises(ValueError):
+        next(result)
+    assert conn.closed
+
+
+def test_pywbemcli_prefetch():
+    """
+    Test that PyWbemcliPrefetch() executes the Iter... operation on a copy of
+    the connection if prefetch_pulls is True.
+    """
+    conn = PYWBEMCLIFakedConnection(default_namespace=SIMPLE_V1_NEW_NAMESPACE)
+    conn.compile_mof_file(os.path.join(SCRIPT_DIR, 'simple_mock_model.mof'))
+    request_conns = []
+
+    def request(req_conn):
+        request_conns.append(req_conn)
+        return req_conn.IterEnumerateInstancePaths('CIM_Foo', MaxObjectCount=2)
+
+    assert len(list(conn.PyWbemcliPrefetch(request, 2))) == 12
+    assert request_conns == [conn]
+
+    conn.prefetch_pulls = True
+    assert len(list(conn.PyWbemcliPrefetch(request, 2))) == 12
+    assert len(request_conns) == 2
+    assert request_conns[1] is not conn
+
+
+def test_pywbemcli_prefetch_statistics():
+    """
+    Test that the operations executed by PyWbemcliPrefetch() on a copy of
+    the connection are included in the statistics of the connection.
+    """
+    conn = PYWBEMCLIFakedConnection(default_namespace=SIMPLE_V1_NEW_NAMESPACE,
+                                    stats_enabled=True)
+    conn.compile_mof_file(os.path.join(SCRIPT_DIR, 'simple_mock_model.mof'))
+    conn.statistics.reset()
+    conn.prefetch_pulls = True
+
+    result = conn.PyWbemcliPrefetch(
+        lambda c: c.IterEnumerateInstancePaths('CIM_Foo', MaxObjectCount=2),
+        2)
+
+    assert len(list(result)) == 12
+    stats = {name: stat.count for name, stat in statistics_snapshot(conn)}
+    assert stats == {'EnumerateInstanceNames': 1}
+
+
+def test_cleanup_mock_caches(tmp_path):
+    """
+    Test that cleanup_mock_caches() removes the least recently used mock
+    caches except the current one until the size limit is met.
+    """
+    # Mock caches in the order of their last use, with 100 bytes each
+    cache_dirs = []
+    for i, name in enumerate(['current', 'old1', 'old2', 'recent']):
+        cache_dir = tmp_path / f'1234.{name}'
+        cache_dir.mkdir()
+        (cache_dir / 'mockenv.pkl').write_bytes(b'x' * 100)
+        os.utime(cache_dir, (1000 + i, 1000 + i))
+        cache_dirs.append(str(cache_dir))
+    current, old1, old2, recent = cache_dirs
+
+    assert cleanup_mock_caches(str(tmp_path), [current], max_size=400) == []
+
+    removed = cleanup_mock_caches(str(tmp_path), [current], max_size=250)
+    assert removed == [old1, old2]
+    assert sorted(os.listdir(tmp_path)) == ['1234.current', '1234.recent']
+
+    removed = cleanup_mock_caches(str(tmp_path), [current], max_size=0)
+    assert removed == [recent]
+    assert os.listdir(tmp_path) == ['1234.current']
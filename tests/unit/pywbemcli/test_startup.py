@@ -0,0 +1,84 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the startup of pywbemcli: The modules imported when the pywbemcli
+command starts.
+
+The time needed to import them is not tested here because timing measurements
+are not reliable on loaded test systems. It can be checked with the
+'--import-budget' option of tools/startup_benchmark.py.
+"""
+
+import sys
+import subprocess
+import pytest
+
+from pywbemtools.pywbemcli.pywbemcli import PYWBEMCLI_COMMANDS
+
+# Modules that must not be imported before a command is invoked
+LAZY_MODULES = ['click_repl', 'prompt_toolkit', 'pywbem_mock',
+                'unittest.mock'] + list(PYWBEMCLI_COMMANDS.values())
+
+
+def imported_modules(code):
+    """
+    Execute the Python code in a new Python process and return the set of
+    modules that were imported at its end.
+    """
+    code += '\nimport sys\nprint("\\n".join(sys.modules))\n'
+    out = subprocess.check_output([sys.executable, '-c', code], text=True)
+    return set(out.splitlines())
+
+
+def test_startup_lazy_modules():
+    """
+    Test that importing the pywbemcli entry point does not import the
+    command group modules, the interactive mode modules and pywbem_mock.
+    """
+    modules = imported_modules('import pywbemtools.pywbemcli.pywbemcli')
+    assert sorted(modules.intersection(LAZY_MODULES)) == []
+
+
+def test_startup_entry_point():
+    """
+    Test that importing the pywbemcli entry point (that sends the commands
+    with the --via-daemon general option to the daemon) does not import click
+    and pywbem.
+    """
+    modules = imported_modules('import pywbemtools.pywbemcli.__main__')
+    assert sorted(modules.intersection(['click', 'pywbem'])) == []
+
+
+@pytest.mark.parametrize(
+    "args, exp_modules", [
+        (['instance', '--help'], ['pywbemtools.pywbemcli._cmd_instance']),
+        (['class', 'get', '--help'], ['pywbemtools.pywbemcli._cmd_class']),
+        (['qualifier', '--help'], ['pywbemtools.pywbemcli._cmd_qualifier']),
+    ]
+)
+def test_startup_command_modules(args, exp_modules):
+    """
+    Test that invoking a command imports only the module of its command
+    group.
+    """
+    code = ('from pywbemtools.pywbemcli.pywbemcli import cli\n'
+            'try:\n'
+            f'    cli.main({args!r}, standalone_mode=False)\n'
+            'except SystemExit:\n'
+            '    pass\n')
+    modules = imported_modules(code)
+    assert sorted(modules.intersection(LAZY_MODULES)) == exp_modules
@@ -326,14 +326,16 @@ TEST_CASES = [
     ['Verify use of statistis reset.',
      {'general': ['--mock-server', SIMPLE_MOCK_FILE_PATH],
       # args not allowed in interactive mode
-      'stdin': ['class enumerate --di --no',
-                'class enumerate --di --no',
+      # Class requests are not used because repeated class requests are
+      # answered from the class store of the connection.
+      'stdin': ['instance enumerate CIM_Foo --no',
+                'instance enumerate CIM_Foo --no',
                 'statistics reset',
-                'class enumerate --di --no',
+                'instance enumerate CIM_Foo --no',
                 'statistics show', ],
       'cmdgrp': None,
       },
-     {'stdout': [r'EnumerateClassNames +1 '],
+     {'stdout': [r'OpenEnumerateInstancePaths +1 '],
       'rc': 0,
       'test': 'regex'},
      None, OK],
@@ -341,16 +343,57 @@ TEST_CASES = [
     ['Verify use of statistis reset does not disable statistics display.',
      {'general': ['--mock-server', SIMPLE_MOCK_FILE_PATH],
       # Should show statistics with count of 2 and with count of 1
-      'stdin': ['class enumerate  --di --no',
-                'class enumerate  --di --no',
+      'stdin': ['instance enumerate CIM_Foo --no',
+                'instance enumerate CIM_Foo --no',
                 'statistics show',
                 'statistics reset',
-                'class enumerate  --di --no',
+                'instance enumerate CIM_Foo --no',
+                'statistics show'],
+      'cmdgrp': None,
+      },
+     {'stdout': [r'OpenEnumerateInstancePaths +2 ',
+                 r'OpenEnumerateInstancePaths +1 '],
+      'rc': 0,
+      'test': 'regex'},
+     None, OK],
+
+    ['Verify that repeated class requests are answered from the class '
+     'store and are not counted in statistics.',
+     {'general': ['--mock-server', SIMPLE_MOCK_FILE_PATH],
+      'stdin': ['class get CIM_Foo',
+                'class get CIM_Foo',
                 'statistics show'],
       'cmdgrp': None,
       },
-     {'stdout': [r'EnumerateClassNames +2 ',
-                 r'EnumerateClassNames +1 '],
+     {'stdout': [r'GetClass +1 '],
+      'rc': 0,
+      'test': 'regex'},
+     None, OK],
+
+    ['Verify that repeated class requests are counted in statistics with '
+     '--no-class-store.',
+     {'general': ['--mock-server', SIMPLE_MOCK_FILE_PATH, '--no-class-store'],
+      'stdin': ['class get CIM_Foo',
+                'class get CIM_Foo',
+                'statistics show'],
+      'cmdgrp': None,
+      },
+     {'stdout': [r'GetClass +2 '],
+      'rc': 0,
+      'test': 'regex'},
+     None, OK],
+
+    ['Verify use of statistics reset with class requests and '
+     '--no-class-store.',
+     {'general': ['--mock-server', SIMPLE_MOCK_FILE_PATH, '--no-class-store'],
+      'stdin': ['class enumerate --di --no',
+                'class enumerate --di --no',
+                'statistics reset',
+                'class enumerate --di --no',
+                'statistics show', ],
+      'cmdgrp': None,
+      },
+     {'stdout': [r'EnumerateClassNames +1 '],
       'rc': 0,
       'test': 'regex'},
      None, OK],
@@ -0,0 +1,549 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _where_filter module and the evaluation of --where filters by
+the PyWbemcli... methods of PYWBEMCLIConnection.
+"""
+
+import pytest
+import pywbem
+import pywbem_mock
+
+from pywbemtools.pywbemcli._where_filter import WhereFilter
+from pywbemtools.pywbemcli._pywbemcli_operations import PYWBEMCLIConnection
+from pywbemtools.pywbemcli._pywbemcli_faked_connection import \
+    PYWBEMCLIFakedConnection
+
+MOF = """
+Qualifier Key : boolean = false,
+    Scope(property, reference),
+    Flavor(DisableOverride, ToSubclass);
+
+class CIM_Foo {
+    [Key] string InstanceID;
+    uint32 IntegerProp;
+    string Names[];
+};
+"""
+
+INSTANCES = [
+    pywbem.CIMInstance(
+        'CIM_Foo',
+        properties={'InstanceID': f'foo{i}',
+                    'IntegerProp': pywbem.CIMProperty(
+                        'IntegerProp', pywbem.Uint32(i) if i % 3 else None,
+                        type='uint32'),
+                    'Names': [f'name{i}', 'all']},
+        path=pywbem.CIMInstanceName('CIM_Foo',
+                                    keybindings={'InstanceID': f'foo{i}'}))
+    for i in range(10)]
+
+
+def match_ids(where, objects=None):
+    """Return the InstanceID of the instances that match the filter"""
+    if objects is None:
+        objects = INSTANCES
+    ids = []
+    for obj in objects:
+        if WhereFilter(where).match(obj):
+            path = obj if isinstance(obj, pywbem.CIMInstanceName) else obj.path
+            ids.append(path.keybindings['InstanceID'])
+    return ids
+
+
+@pytest.mark.parametrize(
+    "where, exp_ids", [
+        ("IntegerProp = 4", ['foo4']),
+        ("integerprop >= 7", ['foo7', 'foo8']),
+        ("IntegerProp < 3 OR InstanceID = 'foo9'", ['foo1', 'foo2', 'foo9']),
+        ("IntegerProp <> 1 AND IntegerProp != 2 AND IntegerProp < 5",
+         ['foo4']),
+        ("IntegerProp IS NULL", ['foo0', 'foo3', 'foo6', 'foo9']),
+        ("IntegerProp IS NOT NULL AND NOT IntegerProp > 2", ['foo1', 'foo2']),
+        # Comparisons with Null values are unknown, also when negated
+        ("NOT IntegerProp > 2", ['foo1', 'foo2']),
+        ("NOT (IntegerProp > 2 AND InstanceID = 'foo4')",
+         ['foo0', 'foo1', 'foo2', 'foo3', 'foo5', 'foo6', 'foo7', 'foo8',
+          'foo9']),
+        ("InstanceID =~ '[89]$'", ['foo8', 'foo9']),
+        ("InstanceID !~ '[1-8]' AND Blah IS NULL", ['foo0', 'foo9']),
+        # Array properties match if one of their elements matches
+        ("Names = 'name5'", ['foo5']),
+        ("Names = 'all' AND IntegerProp = 1", ['foo1']),
+        # Properties that do not exist are Null
+        ("Blah = 1", []),
+        # Values that cannot be compared are unknown
+        ("IntegerProp > 'a'", []),
+    ])
+def test_where_match(where, exp_ids):
+    """Test the evaluation of filter expressions on instances"""
+    assert match_ids(where) == exp_ids
+
+
+def test_where_match_paths():
+    """Test that the properties of instance paths are the key bindings"""
+    paths = [inst.path for inst in INSTANCES]
+    assert match_ids("InstanceID = 'foo3'", paths) == ['foo3']
+    assert match_ids("IntegerProp IS NULL", paths) == \
+        [f'foo{i}' for i in range(10)]
+
+
+@pytest.mark.parametrize(
+    "where, exp_fql, exp_client", [
+        ("IntegerProp = 4", 'IntegerProp = 4', None),
+        ("a <> 'x' AND (b != TRUE OR c IS NOT NULL) AND d >= 1.5",
+         'a <> "x" AND (b <> TRUE OR c IS NOT NULL) AND d >= 1.5', None),
+        ("a = 'it\\'s' or a = \"say \\\"hi\\\"\"",
+         'a = "it\'s" OR a = "say \\"hi\\""', None),
+        ("a =~ '^x' AND b < -3", 'b < -3', 'a =~ "^x"'),
+        ("a =~ '^x' AND b < 3 AND NOT c !~ 'y'", 'b < 3',
+         'a =~ "^x" AND NOT c !~ "y"'),
+        ("a =~ '^x' OR b < 3", None, 'a =~ "^x" OR b < 3'),
+    ])
+def test_where_split(where, exp_fql, exp_client):
+    """
+    Test the split of filter expressions into the DMTF:FQL filter query and
+    the parts evaluated by pywbemcli.
+    """
+    where_filter = WhereFilter(where)
+    assert where_filter.fql == exp_fql
+    assert where_filter.client_expression == exp_client
+
+
+def test_where_pushdown_query():
+    """Test the combination with the --filter-query option"""
+    where_filter = WhereFilter("a = 1 AND b =~ 'x'")
+    assert where_filter.pushdown_query(None, None) == ('a = 1', 'DMTF:FQL')
+    assert where_filter.pushdown_query('c = 2', None) == \
+        ('(c = 2) AND (a = 1)', 'DMTF:FQL')
+    assert where_filter.pushdown_query('c = 2', 'dmtf:fql') == \
+        ('(c = 2) AND (a = 1)', 'DMTF:FQL')
+    assert where_filter.pushdown_query('c = 2', 'WQL') is None
+    assert WhereFilter("b =~ 'x'").pushdown_query(None, None) is None
+
+
+@pytest.mark.parametrize(
+    "where, exp_msg", [
+        ("", "Expected property name at position 1"),
+        ("IntegerProp >", "Expected string, number, TRUE or FALSE at "
+                          "position 14"),
+        ("IntegerProp = NULL", "Comparison with NULL at position 15"),
+        ("(a = 1", "Expected ')' at position 7"),
+        ("a = 1 b = 2", "Expected AND, OR or end of expression at position 7"),
+        ("a IS 1", "Expected NULL at position 6"),
+        ("a ~ 1", "Invalid character at position 3"),
+        ("a = 'x", "Invalid character at position 5"),
+        ("a =~ 1", "The =~ operator requires a string"),
+        ("a =~ '('", "Invalid regular expression '('"),
+        ("5 = a", "Expected property name at position 1 but found '5'"),
+    ])
+def test_where_invalid(where, exp_msg):
+    """Test invalid filter expressions"""
+    with pytest.raises(ValueError) as exc_info:
+        WhereFilter(where)
+    assert str(exc_info.value).startswith(exp_msg)
+
+
+def create_connection(requests, use_pull=True, rejected_status=None):
+    """
+    Return a PYWBEMCLIConnection whose requests are executed by a mock
+    connection with the CIM_Foo instances. The operation name and
+    FilterQuery of each request is recorded in the list requests. Requests
+    with a FilterQuery are rejected with rejected_status if it is set.
+    """
+    fake = pywbem_mock.FakedWBEMConnection(
+        disable_pull_operations=use_pull is None)
+    fake.compile_mof_string(MOF, namespace='root/cimv2')
+    fake.add_cimobjects(INSTANCES, namespace='root/cimv2')
+
+    conn = PYWBEMCLIConnection('http://blah', use_pull_operations=use_pull)
+
+    def imethodcall(methodname, *args, **kwargs):
+        filter_query = kwargs.get('FilterQuery')
+        requests.append((methodname, filter_query))
+        if filter_query and rejected_status:
+            raise pywbem.CIMError(rejected_status, 'Filter not supported')
+        return fake._imethodcall(methodname, *args, **kwargs)
+
+    # pylint: disable=protected-access
+    conn._imethodcall = imethodcall
+    return conn
+
+
+def test_where_pushdown():
+    """
+    Test that the DMTF:FQL parts of the filter are passed to the WBEM server
+    with pull operations and the other parts are evaluated on the result.
+    """
+    requests = []
+    conn = create_connection(requests)
+
+    # The mock WBEM server ignores the filter query
+    where = WhereFilter("IntegerProp > 5")
+    insts = conn.PyWbemcliEnumerateInstances('CIM_Foo', namespace='root/cimv2',
+                                             Where=where)
+    assert len(insts) == 10
+    assert requests == [('OpenEnumerateInstances', 'IntegerProp > 5')]
+    assert where.report() == [
+        '--where: Passed to the WBEM server as DMTF:FQL filter query: '
+        'IntegerProp > 5']
+
+    del requests[:]
+    where = WhereFilter("IntegerProp > 5 AND InstanceID =~ '[1-7]'")
+    paths = conn.PyWbemcliEnumerateInstancePaths(
+        'CIM_Foo', namespace='root/cimv2', FilterQuery='IntegerProp < 9',
+        Where=where)
+    assert sorted(p.keybindings['InstanceID'] for p in paths) == \
+        [f'foo{i}' for i in range(1, 8)]
+    # The filter is evaluated on the instances, not on their paths
+    assert requests == [('OpenEnumerateInstances',
+                         '(IntegerProp < 9) AND (IntegerProp > 5)')]
+    assert where.report() == [
+        '--where: Passed to the WBEM server as DMTF:FQL filter query: '
+        'IntegerProp > 5',
+        '--where: Evaluated by pywbemcli: InstanceID =~ "[1-7]"']
+
+
+@pytest.mark.parametrize(
+    "use_pull, rejected_status, exp_requests, exp_error", [
+        (True, pywbem.CIM_ERR_FILTERED_ENUMERATION_NOT_SUPPORTED,
+         [('OpenEnumerateInstances', 'IntegerProp > 5'),
+          ('OpenEnumerateInstances', None)],
+         '(CIM_ERR_FILTERED_ENUMERATION_NOT_SUPPORTED)'),
+        (True, pywbem.CIM_ERR_INVALID_QUERY,
+         [('OpenEnumerateInstances', 'IntegerProp > 5'),
+          ('OpenEnumerateInstances', None)],
+         '(CIM_ERR_INVALID_QUERY)'),
+        # pywbem falls back to traditional operations, which do not support
+        # the filter query
+        (None, None,
+         [('OpenEnumerateInstances', 'IntegerProp > 5'),
+          ('EnumerateInstances', None)],
+         'FilterQuery'),
+        (False, None, [('EnumerateInstances', None)], None),
+    ])
+def test_where_pushdown_fallback(use_pull, rejected_status, exp_requests,
+                                 exp_error):
+    """
+    Test that the complete filter is evaluated by pywbemcli when the WBEM
+    server rejects the filter query or the pull operations are not used.
+    """
+    requests = []
+    conn = create_connection(requests, use_pull, rejected_status)
+    where = WhereFilter("IntegerProp > 5")
+    insts = conn.PyWbemcliEnumerateInstances('CIM_Foo', namespace='root/cimv2',
+                                             Where=where)
+    assert sorted(i['InstanceID'] for i in insts) == ['foo7', 'foo8']
+    assert requests == exp_requests
+
+    report = where.report()
+    if exp_error:
+        assert report[0].startswith(
+            '--where: The WBEM server rejected the filter query: ')
+        assert exp_error in report[0]
+        report = report[1:]
+    assert report == ['--where: Evaluated by pywbemcli: IntegerProp > 5']
+
+
+def test_where_pushdown_error():
+    """Test that other errors of the WBEM server are raised"""
+    requests = []
+    conn = create_connection(requests, True, pywbem.CIM_ERR_ACCESS_DENIED)
+    where = WhereFilter("IntegerProp > 5")
+    with pytest.raises(pywbem.CIMError):
+        conn.PyWbemcliEnumerateInstances('CIM_Foo', namespace='root/cimv2',
+                                         Where=where)
+
+
+def create_faked_connection(requests, rejected_status=None):
+    """
+    Return a PYWBEMCLIFakedConnection with the CIM_Foo instances that passes
+    the DMTF:FQL parts of --where filters to the mock WBEM server. The mock
+    WBEM server evaluates the FilterQuery of the open operations for
+    instances on the complete instances before they are projected to their
+    PropertyList, like a WBEM server that supports DMTF:FQL, or rejects it
+    with rejected_status if it is set. The operation name, PropertyList and
+    FilterQuery of each request is recorded in the list requests.
+    """
+    conn = PYWBEMCLIFakedConnection(default_namespace='root/cimv2',
+                                    use_pull_operations=True)
+    conn.where_pushdown = True
+    conn.compile_mof_string(MOF, namespace='root/cimv2')
+    conn.add_cimobjects(INSTANCES, namespace='root/cimv2')
+    fake_imethodcall = conn._imethodcall  # pylint: disable=protected-access
+
+    def imethodcall(methodname, *args, **kwargs):
+        filter_query = kwargs.get('FilterQuery')
+        property_list = kwargs.get('PropertyList')
+        requests.append((methodname, property_list, filter_query))
+        if not filter_query:
+            return fake_imethodcall(methodname, *args, **kwargs)
+        if rejected_status:
+            raise pywbem.CIMError(rejected_status, 'Filter not supported')
+        assert methodname.startswith('Open') and \
+            methodname.endswith('Instances')
+        kwargs.update(PropertyList=None, FilterQuery=None,
+                      FilterQueryLanguage=None, MaxObjectCount=1000)
+        result = fake_imethodcall(methodname, *args, **kwargs)
+        where = WhereFilter(filter_query)
+        names = [name.lower() for name in property_list or []]
+        insts = [inst for inst in result[0][2] if where.match(inst)]
+        for inst in insts:
+            for name in list(inst.properties):
+                if property_list is not None and name.lower() not in names:
+                    del inst.properties[name]
+        return [('IRETURNVALUE', {}, insts)] + result[1:]
+
+    # pylint: disable=protected-access
+    conn._imethodcall = imethodcall
+    return conn
+
+
+def test_where_pushdown_faked():
+    """
+    Test that the DMTF:FQL parts of the filter are evaluated by a mock WBEM
+    server that supports DMTF:FQL, and that the filter is evaluated on the
+    instances before they are projected to the property list.
+    """
+    requests = []
+    conn = create_faked_connection(requests)
+    where = WhereFilter("IntegerProp > 5")
+    insts = conn.PyWbemcliEnumerateInstances('CIM_Foo', Where=where)
+    assert [i['InstanceID'] for i in insts] == ['foo7', 'foo8']
+    assert requests == [('OpenEnumerateInstances', None, 'IntegerProp > 5')]
+
+    # The properties of the filter are requested and removed from the
+    # instances
+    del requests[:]
+    where = WhereFilter("IntegerProp > 5 AND InstanceID =~ '7$'")
+    insts = conn.PyWbemcliEnumerateInstances(
+        'CIM_Foo', PropertyList=['Names'], Where=where)
+    assert [i.path.keybindings['InstanceID'] for i in insts] == ['foo7']
+    assert list(insts[0].properties) == ['Names']
+    assert requests == [('OpenEnumerateInstances',
+                         ['Names', 'IntegerProp', 'InstanceID'],
+                         'IntegerProp > 5')]
+    assert where.report() == [
+        '--where: Passed to the WBEM server as DMTF:FQL filter query: '
+        'IntegerProp > 5',
+        '--where: Evaluated by pywbemcli: InstanceID =~ "7$"']
+
+    # Only the properties of the filter are requested for paths
+    del requests[:]
+    where = WhereFilter("IntegerProp > 5")
+    paths = conn.PyWbemcliEnumerateInstancePaths('CIM_Foo', Where=where)
+    assert [p.keybindings['InstanceID'] for p in paths] == ['foo7', 'foo8']
+    assert requests == [('OpenEnumerateInstances', ['IntegerProp'],
+                         'IntegerProp > 5')]
+
+
+@pytest.mark.parametrize(
+    "rejected_status", [
+        pywbem.CIM_ERR_NOT_SUPPORTED,
+        pywbem.CIM_ERR_FILTERED_ENUMERATION_NOT_SUPPORTED,
+    ])
+def test_where_pushdown_faked_fallback(rejected_status):
+    """
+    Test that the complete filter is evaluated by pywbemcli on the instances
+    before they are projected when the mock WBEM server rejects the filter
+    query.
+    """
+    requests = []
+    conn = create_faked_connection(requests, rejected_status)
+    where = WhereFilter("IntegerProp > 5")
+    insts = conn.PyWbemcliEnumerateInstances(
+        'CIM_Foo', PropertyList=['Names'], Where=where)
+    assert [i.path.keybindings['InstanceID'] for i in insts] == \
+        ['foo7', 'foo8']
+    assert [list(i.properties) for i in insts] == [['Names'], ['Names']]
+    assert requests == [
+        ('OpenEnumerateInstances', ['Names', 'IntegerProp'],
+         'IntegerProp > 5'),
+        ('OpenEnumerateInstances', ['Names', 'IntegerProp'], None)]
+    assert where.report()[1:] == \
+        ['--where: Evaluated by pywbemcli: IntegerProp > 5']
+
+
+def test_where_property_list():
+    """Test the property lists of requests whose instances are filtered"""
+    where = WhereFilter("integerprop > 5 OR NOT (InstanceID = 'foo1' AND "
+                        "IntegerProp IS NULL)")
+    assert where.property_names == ['integerprop', 'InstanceID']
+    assert where.request_property_list(None) is None
+    assert where.request_property_list([]) == ['integerprop', 'InstanceID']
+    assert where.request_property_list(['IntegerProp', 'Names']) == \
+        ['IntegerProp', 'Names', 'InstanceID']
+
+    insts = [inst.copy() for inst in INSTANCES[:2]]
+    assert [list(i.properties) for i in
+            where.projected((i for i in insts), None)] == \
+        [['InstanceID', 'IntegerProp', 'Names']] * 2
+    assert [list(i.properties) for i in
+            where.projected((i for i in insts), ['Names', 'INTEGERPROP'])] == \
+        [['IntegerProp', 'Names']] * 2
+
+
+@pytest.mark.parametrize(
+    "where", [
+        "IntegerProp > 5",
+        "IntegerProp > 5 AND InstanceID =~ '[1-7]'",
+        # Null values and properties that do not exist
+        "IntegerProp IS NULL",
+        "IntegerProp IS NOT NULL AND IntegerProp < 5",
+        "NOT IntegerProp > 2",
+        "NOT (IntegerProp > 2 AND InstanceID = 'foo4')",
+        "Missing IS NULL",
+        "Missing = 1 OR IntegerProp = 1",
+        "NOT Missing = 1",
+        # Property names are case-insensitive, string values are not
+        "integerprop >= 4 AND INSTANCEID <> 'foo7'",
+        "InstanceID = 'FOO7'",
+        "InstanceID = 'foo7' OR instanceid = 'Foo8'",
+        "names = 'all' AND IntegerProp < 3",
+        "Names = 'NAME2'",
+    ])
+@pytest.mark.parametrize(
+    "property_list", [None, [], ['Names'], ['instanceid', 'NAMES']])
+@pytest.mark.parametrize("names_only", [False, True])
+def test_where_pushdown_agrees(where, property_list, names_only):
+    """
+    Test that the result of a --where filter does not depend on whether its
+    DMTF:FQL parts are evaluated by the WBEM server or the complete filter
+    is evaluated by pywbemcli.
+    """
+    exp_ids = match_ids(where)
+    results = []
+    for where_pushdown in (True, False):
+        requests = []
+        conn = create_faked_connection(requests)
+        conn.where_pushdown = where_pushdown
+        where_filter = WhereFilter(where)
+        if names_only:
+            paths = conn.PyWbemcliEnumerateInstancePaths(
+                'CIM_Foo', Where=where_filter)
+            results.append(paths)
+        else:
+            insts = conn.PyWbemcliEnumerateInstances(
+                'CIM_Foo', PropertyList=property_list, Where=where_filter)
+            paths = [inst.path for inst in insts]
+            results.append([(inst.path, sorted(inst.properties))
+                            for inst in insts])
+            if property_list is not None:
+                exp_names = sorted(name.lower() for name in property_list)
+                assert all(sorted(name.lower() for name in inst.properties)
+                           == exp_names for inst in insts)
+        assert [p.keybindings['InstanceID'] for p in paths] == exp_ids
+        assert any(r[2] for r in requests) == \
+            (where_pushdown and where_filter.fql is not None)
+    assert results[0] == results[1]
+
+
+TYPED_INSTANCE = pywbem.CIMInstance(
+    'CIM_Typed',
+    properties=[
+        pywbem.CIMProperty('Count', pywbem.Uint16(5)),
+        pywbem.CIMProperty('Ratio', 0.5, type='real32'),
+        pywbem.CIMProperty('Enabled', True),
+        pywbem.CIMProperty('Name', 'abc'),
+        pywbem.CIMProperty('Created',
+                           pywbem.CIMDateTime('20260101120000.000000+000')),
+        pywbem.CIMProperty('Ref', pywbem.CIMInstanceName(
+            'CIM_Foo', keybindings={'InstanceID': 'foo1'},
+            namespace='root/cimv2'))])
+
+
+@pytest.mark.parametrize(
+    "where, exp_match", [
+        # Literals are converted to the CIM type of the property
+        ("Count = '5'", True),
+        ("Count > 4.5", True),
+        ("Ratio = 0.5", True),
+        ("Ratio < '1'", True),
+        ("Enabled = 'true'", True),
+        ("Enabled = FALSE", False),
+        ("Created > '20251231000000.000000+000'", True),
+        ("Created < '20251231000000.000000+000'", False),
+        ("Ref = 'root/cimv2:CIM_Foo.InstanceID=\"foo1\"'", True),
+        ("Ref = 'root/cimv2:CIM_Foo.InstanceID=\"foo2\"'", False),
+        ("Name >= 'abc'", True),
+        # Literals that cannot be converted are unknown
+        ("Name = 1", False),
+        ("NOT Name = 1", False),
+        ("Count = TRUE", False),
+        ("Created = 'yesterday'", False),
+        ("Enabled = 1", False),
+    ])
+def test_where_match_typed(where, exp_match):
+    """Test the comparison of literals with properties of CIM types"""
+    assert WhereFilter(where).match(TYPED_INSTANCE) is exp_match
+
+
+def test_where_match_compiled(monkeypatch):
+    """
+    Test that an expression is compiled once for each class, and that the
+    property names are case-insensitive for all objects of the class.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pywbemtools.pywbemcli import _where_filter
+
+    resolved = []
+
+    class CountingResolver(_where_filter._Resolver):
+        # pylint: disable=protected-access,too-few-public-methods
+        """Records the resolved property names"""
+
+        def resolve(self, name):
+            resolved.append((self.sample.classname, name))
+            return super().resolve(name)
+
+    monkeypatch.setattr(_where_filter, '_Resolver', CountingResolver)
+
+    where = WhereFilter("integerprop > 5 OR count = 5")
+    other = pywbem.CIMInstance(
+        'CIM_Foo', properties={'INTEGERPROP': pywbem.Uint32(7)})
+    objects = INSTANCES + [other, TYPED_INSTANCE, TYPED_INSTANCE]
+    assert [where.match(obj) for obj in objects] == \
+        [False] * 7 + [True, True, False, True, True, True]
+    assert resolved == [('CIM_Foo', 'integerprop'), ('CIM_Foo', 'count'),
+                        ('CIM_Typed', 'integerprop'), ('CIM_Typed', 'count')]
+
+
+def test_where_references():
+    """
+    Test the --where filter of the references and query methods of
+    PYWBEMCLIConnection.
+    """
+    requests = []
+    conn = create_connection(requests)
+    where = WhereFilter("IntegerProp = 1")
+    # The mock WBEM server ignores the filter query, and CIM_Foo has no
+    # references
+    result = conn.PyWbemcliReferenceInstances(
+        INSTANCES[1].path, namespace='root/cimv2', Where=where)
+    assert result == []
+    assert requests == [('OpenReferenceInstances', 'IntegerProp = 1')]
+
+    # Queries are filtered by pywbemcli
+    where = WhereFilter("IntegerProp >= 7")
+    conn.IterQueryInstances = \
+        lambda *args, **kwargs: pywbem.IterQueryInstancesReturn(
+            iter(INSTANCES))
+    insts = conn.PyWbemcliQueryInstances('WQL', 'SELECT * FROM CIM_Foo',
+                                         namespace='root/cimv2', Where=where)
+    assert [i['InstanceID'] for i in insts] == ['foo7', 'foo8']
+    assert where.report() == \
+        ['--where: Evaluated by pywbemcli: IntegerProp >= 7']
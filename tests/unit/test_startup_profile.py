@@ -0,0 +1,121 @@
+# (C) Copyright 2026 IBM Corp.
+# (C) Copyright 2026 Inova Development Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for _startup_profile.py module and for the hidden --profile-startup
+general option of pywbemcli and pywbemlistener.
+"""
+
+import os
+import sys
+import json
+import builtins
+import subprocess
+
+import pytest
+
+from pywbemtools._startup_profile import start_profile, stop_profile, \
+    profile_phase
+import pywbemtools._startup_profile
+
+TEST_DIR = os.path.dirname(__file__)
+SIMPLE_MOCK_FILE = os.path.join(TEST_DIR, 'pywbemcli', 'simple_mock_model.mof')
+
+
+def test_profile_phases(tmp_path):
+    """
+    Test the recording of nested phases and writing the profile.
+    """
+    profile_file = str(tmp_path / 'profile.json')
+    saved_import = builtins.__import__
+
+    @profile_phase('inner')
+    def inner():
+        with profile_phase('inner'):  # Nested use of the same phase
+            pass
+
+    # A module that is imported while the profile is recorded
+    sys.modules.pop('colorsys', None)
+
+    start_profile('tool')
+    with profile_phase('outer'):
+        inner()
+        inner()
+        # pylint: disable=import-outside-toplevel,unused-import
+        import colorsys  # noqa: F401
+    stop_profile(profile_file)
+
+    assert builtins.__import__ is saved_import
+    assert pywbemtools._startup_profile._PROFILE is None
+    with open(profile_file, encoding='utf-8') as fp:
+        profile = json.load(fp)
+
+    assert profile['tool'] == 'tool'
+    assert list(profile['phases']) == ['inner', 'outer']
+    inner_phase = profile['phases']['inner']
+    outer_phase = profile['phases']['outer']
+    assert inner_phase['count'] == 2
+    assert inner_phase['self_us'] == inner_phase['cumulative_us']
+    assert outer_phase['count'] == 1
+    assert outer_phase['cumulative_us'] >= inner_phase['cumulative_us']
+    assert outer_phase['self_us'] <= \
+        outer_phase['cumulative_us'] - inner_phase['cumulative_us'] + 2
+    assert profile['total_us'] >= outer_phase['cumulative_us']
+    assert [imp['module'] for imp in profile['imports']] == ['colorsys']
+
+
+def test_profile_phase_inactive():
+    """
+    Test that profile_phase() does nothing when no profile is recorded.
+    """
+    with profile_phase('phase'):
+        pass
+    assert pywbemtools._startup_profile._PROFILE is None
+
+
+@pytest.mark.parametrize(
+    "tool, args, exp_phases, exp_modules", [
+        ('pywbemcli',
+         ['-m', SIMPLE_MOCK_FILE, '-o', 'table', 'instance', 'enumerate',
+          'CIM_Foo'],
+         ['mockenv', 'mock_build', 'connect', 'command', 'display'],
+         ['pywbemtools.pywbemcli._cmd_instance',
+          'pywbemtools.pywbemcli._pywbemcli_faked_connection']),
+        ('pywbemlistener', ['list'], ['command'], []),
+    ]
+)
+def test_profile_startup_option(tmp_path, tool, args, exp_phases,
+                                exp_modules):
+    """
+    Test that the --profile-startup general option writes the profile with
+    the phases of the command and the modules imported by the command.
+    """
+    profile_file = str(tmp_path / 'profile.json')
+    module = f'pywbemtools.{tool}.{tool}'
+    code = (f'import sys; sys.argv[0] = {tool!r}; '
+            f'from {module} import cli; cli()')
+    subprocess.run(
+        [sys.executable, '-c', code, '--profile-startup', profile_file] + args,
+        stdout=subprocess.DEVNULL, check=True)
+
+    with open(profile_file, encoding='utf-8') as fp:
+        profile = json.load(fp)
+    assert profile['tool'] == tool
+    assert sorted(profile['phases']) == sorted(exp_phases)
+    modules = [imp['module'] for imp in profile['imports']
+               if imp['level'] == 0]
+    for exp_module in exp_modules:
+        assert exp_module in modules
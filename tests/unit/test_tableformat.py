@@ -23,7 +23,8 @@ import sys
 from io import StringIO
 import pytest
 
-from pywbemtools._output_formatting import format_table, fold_strings
+from pywbemtools._output_formatting import format_table, fold_strings, \
+    TableStream, table_stream_widths
 
 # pylint: disable=use-dict-literal
 
@@ -620,3 +621,80 @@ def test_format_table_cap(desc, kwargs, exp_table, exp_exc_type, condition):
 
         exp_table = '\n'.join(exp_table) + '\n'  # print() adds NL
         assert act_table == exp_table
+
+
+# A table with string cells as produced by the pywbemcli instance tables
+TABLE4_HEADERS = ['InstanceID', 'Count', 'key=\nName']
+TABLE4_ROWS = [
+    ['"inst1"', '1', '"a"'],
+    ['"inst22"', '', _TABLE3_FOLDED],
+    ['"inst333"', '12345 (twelve)', ''],
+    ['"i4"', '-7', '"abcdefghijklmnop"'],
+]
+
+
+def stream_table(rows, headers, table_format, title=None, sample_size=None,
+                 max_cell_width=None):
+    """
+    Return the table formatted with TableStream, with the column widths
+    determined from the first sample_size rows.
+    """
+    sample_rows = rows[:sample_size]
+    widths = table_stream_widths(headers, sample_rows, max_cell_width)
+    table = TableStream(headers, widths, table_format, title=title,
+                        sample_rows=sample_rows)
+    lines = [table.header()]
+    lines.extend(table.format_row(row) for row in rows)
+    if table.footer():
+        lines.append(table.footer())
+    return '\n'.join(lines)
+
+
+@pytest.mark.parametrize(
+    "table_format", ['plain', 'simple', 'psql', 'grid', 'table'])
+@pytest.mark.parametrize(
+    "rows, headers", [(TABLE3_ROWS, TABLE3_HEADERS),
+                      (TABLE4_ROWS, TABLE4_HEADERS),
+                      (TABLE4_ROWS[1:3], TABLE4_HEADERS),
+                      ([], TABLE4_HEADERS)])
+def test_table_stream_format_table(rows, headers, table_format):
+    """
+    Test that TableStream produces the same table as format_table() if the
+    column widths are determined from all rows.
+    """
+    # The code to be tested
+    act_table = stream_table(rows, headers, table_format, title='Title')
+
+    exp_table = format_table(rows, headers, title='Title',
+                             table_format=table_format)
+    assert act_table == exp_table
+
+
+def test_table_stream_fold():
+    """
+    Test that TableStream folds cells of rows after the sample that are wider
+    than their column, and that max_cell_width fixes the column widths.
+    """
+    # The code to be tested
+    act_table = stream_table(TABLE4_ROWS, TABLE4_HEADERS, 'psql',
+                             sample_size=1)
+
+    assert act_table.split('\n') == [
+        '+--------------+---------+--------+',
+        '| InstanceID   |   Count | key=   |',
+        '|              |         | Name   |',
+        '|--------------+---------+--------|',
+        '| "inst1"      |       1 | "a"    |',
+        '| "inst22"     |         | this   |',
+        '|              |         | is a   |',
+        '|              |         | folded |',
+        '|              |         | cell   |',
+        '| "inst333"    | 12345 ( |        |',
+        '|              | twelve) |        |',
+        '| "i4"         |      -7 | "abcde |',
+        '|              |         | fghijk |',
+        '|              |         | lmnop" |',
+        '+--------------+---------+--------+']
+
+    widths = table_stream_widths(TABLE4_HEADERS, [], max_cell_width=9)
+    assert widths == [12, 9, 9]
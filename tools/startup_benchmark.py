@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+"""
+Benchmark for the startup time of the pywbemcli and pywbemlistener commands.
+
+Runs a command multiple times and writes a JSON document with the median
+values of:
+
+* the elapsed time of the command,
+* the import times of the modules, as reported by the Python option
+  '-X importtime',
+* the times of the phases of the command execution (e.g. connections file
+  load, mock environment build or cache load, connect, command, display), as
+  recorded by the hidden general option --profile-startup.
+
+If a baseline JSON document from an earlier run of this script is specified,
+the results are compared with it and the script fails if the elapsed time,
+the total import time or the time of a phase has increased by more than the
+tolerance. This allows catching startup regressions between releases.
+
+If an import budget is specified, the script fails if the import time of the
+entry point module of the command without the import time of pywbem exceeds
+the budget, as a multiple of the time for starting the Python interpreter
+('python -c pass'). This allows checking the startup without a baseline,
+independent of the speed of the system.
+
+Examples:
+
+    tools/startup_benchmark.py pywbemcli -- --help
+    tools/startup_benchmark.py --runs 10 --output new.json pywbemcli -- \\
+        -m tests/unit/pywbemcli/simple_mock_model.mof class enumerate
+    tools/startup_benchmark.py --baseline old.json pywbemlistener -- list
+    tools/startup_benchmark.py --import-budget 4 pywbemcli -- --help
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+from statistics import median
+
+# Python code for invoking the entry point of each command, with sys.argv[0]
+# set to the command name as with the installed command.
+ENTRY_POINTS = {
+    'pywbemcli':
+        "import sys; sys.argv[0] = 'pywbemcli'; "
+        "from pywbemtools.pywbemcli.pywbemcli import cli; sys.exit(cli())",
+    'pywbemlistener':
+        "import sys; sys.argv[0] = 'pywbemlistener'; "
+        "from pywbemtools.pywbemlistener.pywbemlistener import main; "
+        "sys.exit(main())",
+}
+
+# Entry point module of each command, for the import budget
+ENTRY_MODULES = {
+    'pywbemcli': 'pywbemtools.pywbemcli.pywbemcli',
+    'pywbemlistener': 'pywbemtools.pywbemlistener.pywbemlistener',
+}
+
+IMPORTTIME_PREFIX = 'import time:'
+
+
+def parse_importtime(stderr):
+    """
+    Parse the output of the Python option '-X importtime' and return a list
+    of dictionaries with items 'module', 'level', 'self_us' and
+    'cumulative_us', in the order of the output. Other lines are ignored.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        try:
+            self_us, cumulative_us, name = \
+                line[len(IMPORTTIME_PREFIX):].split('|')
+            self_us = int(self_us)
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            continue  # The header line
+        module = name.strip()
+        level = (len(name.rstrip()) - len(module) - 1) // 2
+        imports.append({'module': module, 'level': level,
+                        'self_us': self_us, 'cumulative_us': cumulative_us})
+    return imports
+
+
+def run_command(tool, args):
+    """
+    Run the command once and return a dictionary with its results.
+    """
+    fd, profile_file = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        cmd = [sys.executable, '-X', 'importtime', '-c', ENTRY_POINTS[tool],
+               '--profile-startup', profile_file] + args
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, text=True, check=False)
+        wall_us = int((time.perf_counter() - start) * 1000000)
+        try:
+            with open(profile_file, encoding='utf-8') as fp:
+                profile = json.load(fp)
+        except ValueError:
+            profile = None  # Not written, e.g. for --help
+    finally:
+        os.remove(profile_file)
+
+    imports = parse_importtime(proc.stderr)
+    return {
+        'exit_code': proc.returncode,
+        'wall_us': wall_us,
+        'import_us': sum(imp['cumulative_us'] for imp in imports
+                         if imp['level'] == 0),
+        'imports': imports,
+        'profile': profile,
+    }
+
+
+def interpreter_startup_time(runs):
+    """
+    Return the median time in microseconds for starting a new Python process
+    that does nothing.
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        durations.append(time.perf_counter() - start)
+    return int(median(durations) * 1000000)
+
+
+def check_import_budget(result, factor, startup_us):
+    """
+    Check the import time of the entry point module of the command without
+    the import time of pywbem against the budget of factor times the
+    interpreter startup time, and return a list of messages if the budget is
+    exceeded.
+    """
+    modules = result['modules']
+    entry_us = modules[ENTRY_MODULES[result['tool']]]['cumulative_us']
+    overhead_us = entry_us - modules['pywbem']['cumulative_us']
+    budget_us = int(factor * startup_us)
+    if overhead_us <= budget_us:
+        return []
+    return [f"import time without pywbem: {overhead_us} us, budget "
+            f"{budget_us} us ({factor} x interpreter startup {startup_us} us)"]
+
+
+def summarize(tool, args, runs):
+    """
+    Return the JSON document with the median values of the runs.
+    """
+    phases = {}
+    modules = {}
+    for run in runs:
+        if run['profile']:
+            for name, phase in run['profile']['phases'].items():
+                phases.setdefault(name, []).append(phase['cumulative_us'])
+        for imp in run['imports']:
+            modules.setdefault(imp['module'], []).append(imp)
+
+    return {
+        'tool': tool,
+        'args': args,
+        'runs': len(runs),
+        'python_version': platform.python_version(),
+        'platform': sys.platform,
+        'exit_codes': sorted({run['exit_code'] for run in runs}),
+        'summary': {
+            'wall_us': int(median(run['wall_us'] for run in runs)),
+            'import_us': int(median(run['import_us'] for run in runs)),
+            'phases': {name: int(median(values))
+                       for name, values in phases.items()},
+        },
+        'modules': {
+            name: {
+                'level': imps[0]['level'],
+                'self_us': int(median(imp['self_us'] for imp in imps)),
+                'cumulative_us':
+                    int(median(imp['cumulative_us'] for imp in imps)),
+            } for name, imps in modules.items()},
+    }
+
+
+def compare(result, baseline, tolerance, min_delta_us):
+    """
+    Compare the summary of the result with the summary of the baseline and
+    return a list of messages for the values that have increased by more than
+    tolerance percent and more than min_delta_us microseconds.
+    """
+    values = [('wall_us', result['summary']['wall_us'],
+               baseline['summary']['wall_us']),
+              ('import_us', result['summary']['import_us'],
+               baseline['summary']['import_us'])]
+    for name, value in result['summary']['phases'].items():
+        if name in baseline['summary']['phases']:
+            values.append((f'phase {name}', value,
+                           baseline['summary']['phases'][name]))
+
+    regressions = []
+    for name, value, base_value in values:
+        if value > base_value * (1 + tolerance / 100.0) and \
+                value - base_value > min_delta_us:
+            regressions.append(
+                f"{name}: {value} us, baseline {base_value} us "
+                f"(+{(value - base_value) * 100.0 / base_value:.0f}%)")
+    return regressions
+
+
+def main():
+    """
+    Main function of the script.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the startup time of a pywbemtools command.")
+    parser.add_argument(
+        'tool', choices=sorted(ENTRY_POINTS),
+        help="The command to benchmark.")
+    parser.add_argument(
+        'args', nargs=argparse.REMAINDER,
+        help="Arguments of the command, after '--'.")
+    parser.add_argument(
+        '--runs', type=int, default=5,
+        help="Number of measured runs. Default: 5.")
+    parser.add_argument(
+        '--warmup', type=int, default=1,
+        help="Number of runs before the measured runs, e.g. to fill the mock "
+             "cache. Default: 1.")
+    parser.add_argument(
+        '--output', metavar='FILE',
+        help="Write the JSON document to FILE. Default: stdout.")
+    parser.add_argument(
+        '--baseline', metavar='FILE',
+        help="Compare with the JSON document of an earlier run in FILE and "
+             "fail if the startup has regressed.")
+    parser.add_argument(
+        '--tolerance', type=float, default=10.0, metavar='PERCENT',
+        help="Allowed increase of a time compared to the baseline, in "
+             "percent. Default: 10.")
+    parser.add_argument(
+        '--min-delta', type=int, default=5000, metavar='US',
+        help="Increases up to this number of microseconds are not "
+             "considered a regression. Default: 5000.")
+    parser.add_argument(
+        '--import-budget', type=float, metavar='FACTOR',
+        help="Fail if the import time of the entry point module without "
+             "pywbem exceeds FACTOR times the Python interpreter startup "
+             "time.")
+    options = parser.parse_args()
+
+    args = options.args
+    if args and args[0] == '--':
+        args = args[1:]
+
+    for _ in range(options.warmup):
+        run_command(options.tool, args)
+    runs = [run_command(options.tool, args) for _ in range(options.runs)]
+    result = summarize(options.tool, args, runs)
+
+    output = json.dumps(result, indent=2)
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as fp:
+            fp.write(output + '\n')
+    else:
+        print(output)
+
+    rc = 0
+    if options.baseline:
+        with open(options.baseline, encoding='utf-8') as fp:
+            baseline = json.load(fp)
+        regressions = compare(result, baseline, options.tolerance,
+                              options.min_delta)
+        if regressions:
+            print("Startup regressions compared to baseline "
+                  f"{options.baseline}:", file=sys.stderr)
+            for msg in regressions:
+                print(f"  {msg}", file=sys.stderr)
+            rc = 1
+    if options.import_budget is not None:
+        startup_us = interpreter_startup_time(options.runs)
+        exceeded = check_import_budget(result, options.import_budget,
+                                       startup_us)
+        if exceeded:
+            print("Import budget exceeded:", file=sys.stderr)
+            for msg in exceeded:
+                print(f"  {msg}", file=sys.stderr)
+            rc = 1
+    return rc
+
+
+if __name__ == '__main__':
+    sys.exit(main())